@@ -1,10 +1,26 @@
+import sys
+import time
 
-from PyQt5.QtCore import Qt, QSettings
+# profile startup: python Tagit.py --profile-startup[=budget in ms]
+# the profiler is created before importing the other modules to time them
+PROFILER = None
+if __name__ == '__main__':
+    for arg in sys.argv[1:]:
+        if arg.split('=')[0]=='--profile-startup':
+            _start = time.perf_counter()
+            from library.Profiler import Profiler
+            PROFILER = Profiler(_start, float(arg.split('=')[1]) if '=' in arg else None)
+
+from PyQt5.QtCore import (Qt, QObject, QModelIndex, QSettings, QThread, QTimer, QFileSystemWatcher,
+    pyqtSignal)
 from PyQt5.QtWidgets import (QApplication, QWidget, QMainWindow, 
-    QTabWidget, QDockWidget, QMessageBox, QSplitter)
+    QTabWidget, QDockWidget, QMessageBox, QSplitter, QProgressBar)
 
 import os
-import pickle
+import tempfile
+import threading
+from functools import partial
+from contextlib import nullcontext
 
 from views.MainMenu import MainMenu
 from views.GroupTreeView import GroupTreeView
@@ -16,32 +32,257 @@ from models.GroupModel import GroupModel
 from models.TagModel import TagModel
 from models.ItemModel import ItemModel
 
+from library.Storage import Storage, openStorage, createStorage, loadData
+from library.Journal import Journal
+from library.ColumnStorage import LazyItems
+from library.IndexCache import IndexCache, countGroups, countTags
+from library.History import History
+from library.FileLock import FileLock
+from library.Core import rowRanges
+from library.SQLiteStorage import SQLiteStorage
+from library.ChangeFeed import ChangeFeed
+from library.Federation import Federation
+from library.Merge import Merge
+from library.Interchange import Exporter, Importer
+from library.StaticSite import StaticSite
+from library.Integrity import Integrity
+from library.Catalog import Catalog
+from library.RpcServer import RpcServer, LibraryService, RpcError, selectRows
+from library.Trace import TraceRecorder
+
+
+class SaveThread(QThread):
+    '''write snapshot of project data to database in background'''
+
+    progress = pyqtSignal(int, int) # done, total
+
+    def __init__(self, storage, filename, data, changes=None, origins=None, parent=None):
+        '''
+           :param storage: storage engine of current database, or None to create a new one
+           :param filename: database filename
+           :param data, changes, origins: see Storage.save()
+        '''
+        super(SaveThread, self).__init__(parent)
+        self.storage = storage
+        self.filename = filename
+        self.data = data
+        self.changes = changes
+        self.origins = origins
+        self.autosave = False
+        self.lock = None # lock of new database when saving as
+        self.history = None # history store of database, a new one is used if None
+        self.snapshot = None # id of snapshot written to history store
+        self.error = None
+
+    def run(self):
+        try:
+            if self.storage is None:
+                self.storage = createStorage(self.filename, self.data, self.origins, self.progress.emit)
+            else:
+                self.storage.setProgress(self.progress.emit)
+                self.storage.save(self.data, self.changes, self.origins)
+        except Exception as e:
+            self.error = e
+        else:
+            self.cacheIndexes()
+            self.commitHistory()
+        finally:
+            if self.storage:
+                self.storage.setProgress(None)
+            self.data = self.changes = self.origins = None # release snapshot
+
+    def cacheIndexes(self):
+        '''indexes of saved data for opening it next time:
+           items in group UNREFERENCED are those with invalid source path
+        '''
+        items = self.data[Storage.KEY_ITEM]
+        indexes = {
+            'groups' : countGroups(items),
+            'tags'   : countTags(items),
+            'invalid': [i for i, item in enumerate(items) if item[ItemModel.GROUP]==GroupModel.UNREFERENCED]
+        }
+        cache = IndexCache(self.filename)
+        try:
+            cache.save(cache.fingerprint(self.storage), indexes)
+        except OSError:
+            pass # it's rebuilt next time
+
+    def commitHistory(self):
+        '''write snapshot of saved data to history store, only the changed items are serialized
+           and the changed chunks are stored
+        '''
+        history = self.history or History(self.filename)
+        try:
+            self.snapshot = history.commit(self.data, self.origins, self.changes)
+            history.prune()
+        except OSError:
+            pass # database is saved anyway
+
+
+class LoadThread(QThread):
+    '''load project data from database in background, and recover unsaved changes'''
+
+    def __init__(self, database, journal, parent=None):
+        '''
+           :param journal: journal of database, or None if it's opened read-only
+        '''
+        super(LoadThread, self).__init__(parent)
+        self.database = database
+        self.journal = journal
+        self.storage = None
+        self.data = None
+        self.count = 0 # count of recovered records
+        self.fingerprint = None
+        self.indexes = None # indexes cached for unchanged database
+        self.error = None
+
+    def run(self):
+        try:
+            self.storage = openStorage(self.database)
+            data = self.storage.load()
+            if Storage.APP_NAME not in data:
+                raise ValueError('Invalid database: {0}'.format(self.database))
+            if self.journal and self.journal.hasRecords():
+                data, self.count = self.journal.recover(data)
+            else:
+                cache = IndexCache(self.database)
+                self.fingerprint = cache.fingerprint(self.storage)
+                self.indexes = cache.load(self.fingerprint)
+            self.data = data
+        except Exception as e:
+            self.error = e
+            if self.storage:
+                self.storage.close()
+                self.storage = None
+
+
+class Invoker(QObject):
+    '''run function in the thread of this object, e.g. GUI thread, and wait for the result'''
+
+    requested = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super(Invoker, self).__init__(parent)
+        self.requested.connect(self._run) # queued connection for other threads
+
+    def invoke(self, func, *args):
+        if QThread.currentThread() is self.thread():
+            return func(*args)
+        # deferred: concurrent.futures pulls in logging, which costs about 10 ms of startup in
+        # --profile-startup, while requests are served only if the server is started
+        from concurrent.futures import Future
+        future = Future()
+        self.requested.emit((future, func, args))
+        return future.result()
+
+    def _run(self, request):
+        future, func, args = request
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+
 class MainWindow(QMainWindow):
 
-    APP_NAME = 'Tagit'
+    APP_NAME = Storage.APP_NAME
     APP_VERSION = '0.5'
-    KEY_GROUP = 'groups'
-    KEY_TAG = 'tags'
-    KEY_ITEM = 'items'
-    KEY_SETTING = 'settings'
+    KEY_GROUP = Storage.KEY_GROUP
+    KEY_TAG = Storage.KEY_TAG
+    KEY_ITEM = Storage.KEY_ITEM
+    KEY_SETTING = Storage.KEY_SETTING
+    KEY_ID = Storage.KEY_ID
+
+    BATCH = 2000 # count of items loaded each time when loading progressively
 
-    def __init__(self):
+    def __init__(self, progressive=False, profiler=None, setting=None):
+        '''
+           :param progressive: show window before loading last database, which is loaded
+                    in background and items are appended in batches
+           :param profiler: library.Profiler.Profiler timing startup stages
+           :param setting: QSettings of application, user settings by default, e.g. a
+                    separate one when replaying trace so user settings are not changed
+        '''
         super(MainWindow, self).__init__()
+        self._profiler = profiler
+
+        # storage engine of current database
+        self._storage = None
+
+        # journal recording unsaved changes of current database
+        self._journal = None
+        self._recovered = False
+
+        # saving in background
+        self._saveThread = None
+        self._saveFailed = False
+
+        # loading progressively
+        self._loadThread = None
+        self._loadingItems = None
+
+        # snapshot opened read-only: (database, snapshot id)
+        self._snapshot = None
+
+        # history store committed by saving, which keeps items of the latest snapshot
+        self._historyStore = None
+
+        # databases mounted read-only at once, see library.Federation
+        self._federation = None
+
+        # lock of current database: it's opened read-only if locked by another instance,
+        # and changes saved by that instance are reloaded when the file is changed
+        self._lock = None
+        self._readOnly = False
+        self._watcher = None
+        self._reloadTimer = None
+        self._replaced = False # database file is replaced rather than updated
+
+        # local JSON-RPC server: reading requests are served against a snapshot of
+        # models, which is taken again once models are changed
+        self._server = None
+        self._serverSnapshot = None
+        self._serverVersion = 0
+        self._serverLock = None # snapshot is taken by one connection thread at a time
+
+        # workload trace of current database, see library.Trace, and the trace
+        # requested while database is loaded in background, which is started then
+        self._trace = None
+        self._traceFile = None
+
+        # index cache of current database:
+        # - status of source paths loaded from cache, applied when items are loaded
+        # - or cache to build when source paths are checked: [IndexCache, fingerprint, counts, rows version]
+        self._cachedReferences = None
+        self._indexCache = None
 
         # whole views
-        self.setupViews()
+        with self.profile('setup views'):
+            self.setupViews()
+        self.setting = setting or QSettings('dothinking', 'tagit')
 
-        # menu and toolbox
-        self.createMainMenu()
+        # autosave after a quiet period of editing
+        self.setupAutosave()
 
-        # init data: last saved database
-        self.setting = QSettings('dothinking', 'tagit')
-        filename = self.setting.value('database')
-        self.initData(filename)
+        # local server is started on request
+        self.setupServer()
+
+        # menu and toolbox
+        with self.profile('main menu'):
+            self.createMainMenu()
 
         # status bar
         self.createStatusBar()
 
+        # init data: last saved database
+        filename = self.setting.value('database')
+        with self.profile('init data'):
+            if progressive and filename and os.path.exists(filename):
+                self.initDataProgressively(filename)
+            else:
+                self.initData(filename)
+                self.showDatabaseStatus()
+
         # window
         self.setTitle()
         self.resize(1000,800)
@@ -68,29 +309,96 @@ class MainWindow(QMainWindow):
     def database(self):
         return self._database 
 
+    def readOnly(self):
+        '''current database is locked by another instance'''
+        return self._readOnly
+
+    def snapshot(self):
+        '''(database, snapshot id) if a snapshot is opened'''
+        return self._snapshot
+
+    def federation(self):
+        '''Federation of mounted databases, None if a database is opened'''
+        return self._federation
+
+    def trace(self):
+        '''library.Trace.TraceRecorder if operations are being recorded'''
+        return self._trace
+
+    def history(self):
+        '''history store of current database, or database of opened snapshot'''
+        database = self._snapshot[0] if self._snapshot else self._database
+        return History(database) if database else None
+
+    def historyStore(self, database):
+        '''history store to commit snapshots of database when it's saved'''
+        if self._historyStore is None or self._historyStore.database!=database:
+            self._historyStore = History(database)
+        return self._historyStore
+
+    def profile(self, name):
+        '''context timing a startup stage when profiling'''
+        return self._profiler.measure(name) if self._profiler else nullcontext()
+
     # ----------------------------------------------
     # --------------- data operation ---------------
     # ----------------------------------------------
+    def _resetSession(self):
+        '''release everything bound to current database before another one is opened,
+           it's reloaded or the window is closed
+        '''
+        self.waitForSaving()
+        self.stopLoading()
+        self.closeJournal()
+        self.closeStorage()
+        self.unlockDatabase()
+
+        # clients and trace are bound to the data they're served or recorded on
+        self.stopServer()
+        self.stopTrace()
+
+        # items of history store are out of date
+        self._historyStore = None
+        self._snapshot = self._federation = None
+
     def initData(self, database=None):
         '''load data from specified database, init default if failed.
            two failing situations:
            - database is not specified -> init by default and return true
            - specified but is invalid  -> init by default but return false
+           legacy pickle database is migrated to SQLite when loaded,
+           and unsaved changes are recovered from journal if exist.
         '''
+        self._resetSession()
+
         ok = True
         if database and os.path.exists(database):
             # load database
             try:
-                with open(database, 'rb') as f:
-                    data = pickle.load(f)
+                storage = openStorage(database)
+                data = storage.load()
             except Exception as e:
                 ok = False
             else:
                 if self.APP_NAME in data: # valid database
                     self._database = database
-                    self._initData(data)
+                    self._storage = storage
+                    if self.lockDatabase(database):
+                        data, count = self.openJournal(database, data)
+                    else:
+                        count = 0 # journal belongs to the instance writing database
+                    if count:
+                        self._initData(data)
+                    else:
+                        cache = IndexCache(database)
+                        fingerprint = cache.fingerprint(storage)
+                        self._initData(data, fingerprint=fingerprint, indexes=cache.load(fingerprint))
+                    self.attachJournal()
+                    if count:
+                        self.statusBar().showMessage('{0} unsaved changes are recovered.'.format(count))
                     return ok
                 else:
+                    storage.close()
                     ok = False
 
         # init by default if load data from database failed
@@ -99,8 +407,351 @@ class MainWindow(QMainWindow):
 
         return ok
         
-    def _initData(self, data={}):
-        '''load data from database'''
+    def initDataProgressively(self, database):
+        '''load data from database in background, then append items in batches,
+           so that the window is shown before loading.
+           groups and tags are initialized at first, then items, and source paths
+           of items are checked at last.
+        '''
+        self._resetSession()
+
+        # empty views before loading
+        self._database = None
+        self._initData()
+        self.statusBar().showMessage('Loading database - {0} ...'.format(database))
+
+        journal = self.createJournal(database) if self.lockDatabase(database) else None
+        thread = LoadThread(database, journal, self)
+        thread.finished.connect(partial(self.slot_loadingFinished, thread))
+        self._loadThread = thread
+        thread.start()
+
+    def slot_loadingFinished(self, thread):
+        '''init views with loaded data'''
+        if thread is not self._loadThread:
+            return
+        self._loadThread = None
+
+        if thread.error:
+            self.unlockDatabase()
+            self.statusBar().showMessage('Invalid database for Tagit project - {0}'.format(thread.database))
+            self.startPendingTrace()
+            return
+
+        self._database = thread.database
+        self._storage = thread.storage
+        self._journal = thread.journal
+        if thread.count:
+            # rows are changed out of models, so rewrite all next time
+            self._storage.invalidate()
+            self._recovered = True
+
+        self._initData(thread.data, progressive=True, fingerprint=thread.fingerprint, indexes=thread.indexes)
+
+    def slot_loadItems(self):
+        '''append next batch of items'''
+        if self._loadingItems is None:
+            return
+
+        items, position, ids = self._loadingItems
+        rows = items[position:position+self.BATCH]
+        self.itemsTableView.model().sourceModel().loadRows(rows, ids and ids[position:position+self.BATCH])
+        position += len(rows)
+        self._loadingItems = (items, position, ids)
+        self.progressBar.setMaximum(max(len(items), 1))
+        self.progressBar.setValue(position)
+
+        if position<len(items):
+            QTimer.singleShot(0, self.slot_loadItems)
+        else:
+            self.finishLoading()
+
+    def finishLoading(self):
+        '''append all items left, then start recording changes and check source paths'''
+        if self._loadingItems is None:
+            return
+
+        items, position, ids = self._loadingItems
+        self._loadingItems = None
+        itemModel = self.itemsTableView.model().sourceModel()
+        itemModel.loadRows(items[position:], ids and ids[position:])
+        self.progressBar.hide()
+
+        # counters of group/tag are initialized with all items already
+        self.attachJournal()
+        self.checkReferences(background=True)
+        self.showDatabaseStatus()
+        self.startPendingTrace()
+
+        if self._profiler:
+            self._profiler.mark('items loaded')
+
+    def stopLoading(self):
+        '''cancel loading progressively'''
+        thread, self._loadThread = self._loadThread, None
+        if thread:
+            thread.wait()
+            if thread.storage:
+                thread.storage.close()
+        self._loadingItems = None
+        self.progressBar.hide()
+
+    def changeFeed(self):
+        '''change feed of current database, None if it's not recorded, e.g. columnar database'''
+        self.waitForSaving()
+        self.finishLoading()
+        return ChangeFeed(self._storage) if isinstance(self._storage, SQLiteStorage) else None
+
+    def applyChanges(self, filename):
+        '''apply changes exported from another copy of current database, then reload it.
+           unsaved changes are discarded.
+           :return: (count of applied fields, count of fields changed locally later, header),
+                    or None if change feed is not supported
+        '''
+        feed = self.changeFeed()
+        if not feed or self._readOnly:
+            return None
+        res = feed.apply(filename)
+        selected = self.itemsTableView.selectedIds()
+        self.initData(self._database)
+        self.itemsTableView.selectIds(selected)
+        self.showDatabaseStatus()
+        return res
+
+    def openSnapshot(self, database, snapshot):
+        '''open snapshot of database read-only: it's not associated with any database,
+           so the database is not affected unless it's saved as the database explicitly.
+           :return: False if failed to load the snapshot
+        '''
+        history = History(database)
+        try:
+            data = history.load(snapshot)
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self._resetSession()
+
+        self._database = None
+        self._initData(data)
+        self._snapshot = (database, snapshot)
+        self.setTitle()
+
+        # changes since this snapshot
+        latest = history.latest()
+        if latest and latest!=snapshot:
+            changes = history.diff(snapshot, latest)
+            added, removed = changes[self.KEY_ITEM]
+            msg = 'Snapshot {0}: {1} items added, {2} items removed in the latest snapshot'.format(
+                snapshot, len(added), len(removed))
+        else:
+            msg = 'Snapshot {0}: the latest snapshot'.format(snapshot)
+        self.statusBar().showMessage(msg)
+
+        return True
+
+    def openLibraries(self, databases):
+        '''mount several databases read-only: they're loaded in parallel, and each one is
+           shown as a top level group. they're not affected unless saved as a new database.
+           :return: False if any database is invalid
+        '''
+        federation = Federation(databases)
+        try:
+            data = federation.load()
+        except Exception:
+            return False
+
+        self._resetSession()
+
+        self._database = None
+        self._initData(data)
+        self._federation = federation
+        self.setTitle()
+        self.statusBar().showMessage('{0} items in {1} libraries are loaded.'.format(
+            len(data[self.KEY_ITEM]), len(databases)))
+
+        return True
+
+    def mergeLibrary(self, database, policy='keep'):
+        '''merge items of another database into current project: they're joined by
+           source path, groups and tags are matched by name. see library.Merge.
+           :param policy: conflict policy of joined items, see Merge.POLICIES
+           :return: join result, see Merge.join()
+        '''
+        self.finishLoading()
+        other = loadData(database)
+        if self.APP_NAME not in other:
+            raise ValueError('Invalid database: {0}'.format(database))
+
+        groupModel = self.groupsTreeView.model()
+        tagModel = self.tagsTableView.model()
+        itemModel = self.itemsTableView.model().sourceModel()
+        merge = Merge(groupModel.serialize(save=False)[GroupModel.CHILDREN], tagModel.serialize(save=False),
+                        itemModel.dataList, policy)
+        res = merge.join(other, groupModel.nextKey, tagModel.nextKey)
+
+        groupModel.appendGroups(res['groups'])
+        tagModel.appendRows(res['tags'])
+        with itemModel.transaction():
+            itemModel.updateRows(res['updated'])
+            itemModel.appendRows(res['inserted'])
+
+        self.statusBar().showMessage('{0} items merged, {1} items appended, {2} fields conflicted.'.format(
+            len(res['updated']), len(res['inserted']), res['conflicts']))
+        return res
+
+    def exportCatalog(self, filename):
+        '''write groups, tags and items to JSON Lines or CSV file row by row
+           :return: count of items
+        '''
+        self.finishLoading()
+        exporter = Exporter(self.groupsTreeView.model().serialize(save=False)[GroupModel.CHILDREN],
+                            self.tagsTableView.model().serialize(save=False))
+        return exporter.export(filename, self.itemsTableView.model().sourceModel().dataList)
+
+    def publishCatalog(self, folder):
+        '''write static HTML catalog with search index to folder, only changed files are
+           rewritten if it's published before, see library.StaticSite
+           :return: (count of written files, count of unchanged files, count of removed files)
+        '''
+        self.finishLoading()
+        title = os.path.splitext(os.path.basename(self._database))[0] if self._database else 'untitled'
+        site = StaticSite(folder, 'Tagit - {0}'.format(title))
+        sourceModel = self.itemsTableView.model().sourceModel()
+        return site.generate(self.groupsTreeView.model().serialize(save=False)[GroupModel.CHILDREN],
+                            self.tagsTableView.model().serialize(save=False),
+                            sourceModel.dataList, sourceModel.table.ids)
+
+    def importCatalog(self, filename, ids=None):
+        '''append items in JSON Lines or CSV file in batches, where groups and tags are
+           created by name if not exist
+           :param ids: ids of imported items, e.g. replayed from trace, new ids are taken if None
+           :return: count of items
+        '''
+        self.finishLoading()
+        groupModel = self.groupsTreeView.model()
+        tagModel = self.tagsTableView.model()
+        itemModel = self.itemsTableView.model().sourceModel()
+        importer = Importer(groupModel.serialize(save=False)[GroupModel.CHILDREN], tagModel.serialize(save=False),
+                            groupModel.nextKey, tagModel.nextKey)
+        total = importer.check(filename) # nothing is imported from an invalid file
+
+        def appendNew():
+            groups, tags = importer.takeNew()
+            groupModel.appendGroups(groups)
+            tagModel.appendRows(tags)
+
+        count, start = 0, itemModel.rowCount()
+        for items in importer.read(filename, self.BATCH):
+            appendNew()
+            itemModel.appendRows(items, ids and ids[count:count+len(items)])
+            count += len(items)
+            self.statusBar().showMessage('Importing {0}/{1} items ...'.format(count, total))
+            QApplication.processEvents()
+        appendNew() # groups/tags defined after the last item
+        self.record('importCatalog', filename=os.path.abspath(filename),
+                    ids=[itemModel.itemId(row) for row in range(start, itemModel.rowCount())] if self._trace else None)
+
+        self.statusBar().showMessage('{0} items are imported.'.format(count))
+        return count
+
+    def checkIntegrity(self, repair=False):
+        '''check keys referenced by items, duplicated keys and key counters, see library.Integrity
+           :param repair: repair the issues if True
+           :return: issues found, see Integrity.report()
+        '''
+        self.finishLoading()
+        groupModel = self.groupsTreeView.model()
+        tagModel = self.tagsTableView.model()
+        itemModel = self.itemsTableView.model().sourceModel()
+        integrity = Integrity(groupModel.serialize(save=False)[GroupModel.CHILDREN], tagModel.serialize(save=False),
+                                {'groups': groupModel.currentKey(), 'tags': tagModel.currentKey()})
+        repaired = dict(integrity.check(itemModel.dataList, repair))
+        report = integrity.report()
+        if not repair or not report:
+            return report
+
+        # items keep the first keys, then duplicated keys are replaced
+        itemModel.updateRows(repaired)
+        seen = set()
+        def renumber(parent):
+            for row in range(groupModel.rowCount(parent)):
+                index = groupModel.index(row, GroupModel.KEY, parent)
+                key = index.data()
+                if not 0<key<10 and key in seen:
+                    groupModel.setData(index, integrity.nextGroupKey())
+                seen.add(index.data())
+                renumber(index.siblingAtColumn(GroupModel.NAME))
+        renumber(QModelIndex())
+
+        seen = set()
+        for row in range(tagModel.rowCount()):
+            index = tagModel.index(row, TagModel.KEY)
+            if index.data() in seen:
+                tagModel.setData(index, integrity.nextTagKey())
+            seen.add(index.data())
+
+        groupModel.reserveKey(integrity.largestGroup)
+        tagModel.reserveKey(integrity.largestTag)
+
+        # counters of groups/tags: keys are renumbered
+        itemModel.recount()
+        return report
+
+    def checkReferences(self, background=False):
+        '''check source paths of loaded items. status cached for unchanged database is applied
+           first, then paths are checked in background, since files may be changed outside
+           :param background: check in background thread
+        '''
+        # source paths are checked by the instance writing database
+        if self._readOnly:
+            self._cachedReferences = self._indexCache = None
+            return
+
+        itemModel = self.itemsTableView.model().sourceModel()
+        cached, self._cachedReferences = self._cachedReferences, None
+        if cached is not None:
+            paths = itemModel.values(ItemModel.PATH)
+            invalid = [False] * len(paths)
+            for row in cached:
+                invalid[row] = True
+            itemModel.updateReferences(paths, invalid)
+            background = True
+
+        # cache is built with the status of these rows
+        if self._indexCache:
+            self._indexCache[3] = itemModel.rowsVersion()
+
+        if background:
+            itemModel.refreshInBackground()
+        else:
+            itemModel.refresh()
+
+    def slot_referencesChecked(self, version, invalid):
+        '''build index cache of loaded database when source paths are checked first time'''
+        pending, self._indexCache = self._indexCache, None
+        if not pending:
+            return
+
+        cache, fingerprint, counts, rows_version = pending
+        itemModel = self.itemsTableView.model().sourceModel()
+        if version!=rows_version or len(invalid)!=itemModel.rowCount():
+            return # rows are changed or checking is interrupted
+
+        rows = [i for i, path_invalid in enumerate(invalid) if path_invalid]
+        if counts.get('invalid')==rows:
+            return # cached already
+        counts['invalid'] = rows
+        try:
+            cache.save(fingerprint, counts)
+        except OSError:
+            pass
+
+    def _initData(self, data={}, progressive=False, fingerprint=None, indexes=None):
+        '''load data from database
+           :param progressive: items are appended in batches if True
+           :param fingerprint: content fingerprint of database, see IndexCache
+           :param indexes: indexes cached for database with fingerprint, built if None
+        '''
         # set window title      
         self.setTitle()
         self.groupsTreeView.setFocus()
@@ -112,6 +763,7 @@ class MainWindow(QMainWindow):
             groups = []
         tags = data.get(self.KEY_TAG, [])
         items = data.get(self.KEY_ITEM, [])
+        ids = data.get(self.KEY_ID)
 
         # settings
         settings = data.get(self.KEY_SETTING, {})
@@ -122,16 +774,44 @@ class MainWindow(QMainWindow):
 
         # init groups tree view 
         self.groupsTreeView.setup(groups, selected_group)
-        self.groupsTreeView.model().updateItems(items)
+        self.groupsTreeView.model().updateItems(items, indexes and indexes['groups'])
         self.groupsTreeView.setColumnHidden(GroupModel.KEY, True)
 
         # init tags table view
         self.tagsTableView.setup(tags, selected_tag)
-        self.tagsTableView.model().updateItems(items)
+        self.tagsTableView.model().updateItems(items, indexes and indexes['tags'])
         self.tagsTableView.setColumnHidden(TagModel.KEY, True) # hide first column -> key
 
-        # init items table view
-        self.itemsTableView.setup(items)
+        # status of source paths is cached for unchanged database, otherwise build cache
+        # when they're checked: counters are taken before checking, as data in database
+        if indexes:
+            # checked again in background, and the cache is updated if they're changed
+            self._cachedReferences = indexes['invalid']
+            self._indexCache = [IndexCache(self._database), fingerprint, dict(indexes), None] if fingerprint else None
+        elif fingerprint:
+            counts = {
+                'groups': dict(self.groupsTreeView.model().counts), # counters are updated in place
+                'tags'  : dict(self.tagsTableView.model().counts)
+            }
+            self._cachedReferences = None
+            self._indexCache = [IndexCache(self._database), fingerprint, counts, None]
+        else:
+            self._cachedReferences = self._indexCache = None
+
+        # init items table view: lazy items are loaded when accessed already
+        if progressive and not isinstance(items, LazyItems):
+            self.itemsTableView.setup([], refresh=False)
+            self._loadingItems = (items, 0, ids)
+            self.progressBar.setValue(0)
+            self.progressBar.show()
+            QTimer.singleShot(0, self.slot_loadItems)
+        elif progressive:
+            self.itemsTableView.setup(items, refresh=False, ids=ids)
+            self._loadingItems = (items, len(items), None)
+            QTimer.singleShot(0, self.finishLoading)
+        else:
+            self.itemsTableView.setup(items, refresh=False, ids=ids)
+            self.checkReferences()
         self.itemsTableView.setColumnHidden(ItemModel.GROUP, True)
         self.itemsTableView.setColumnHidden(ItemModel.TAGS, True)
         self.itemsTableView.setColumnHidden(ItemModel.PATH, True)
@@ -146,6 +826,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         '''default method called when trying to close the app'''
         if self.main_menu.maybeSave():
+            self._resetSession()
             event.accept()
         else:
             event.ignore()
@@ -153,13 +834,215 @@ class MainWindow(QMainWindow):
     def saveRequired(self):
         '''saving is required if anything is changed'''
         return (
-            self.groupsTreeView.model().saveRequired() 
+            self._recovered
+            or self._saveFailed
+            or self.groupsTreeView.model().saveRequired() 
             or self.tagsTableView.model().saveRequired()
             or self.itemsTableView.model().sourceModel().saveRequired()
             )
 
-    def serialize(self, filename):
-        '''save project data to database'''
+    def closeStorage(self):
+        '''release storage engine of current database'''
+        if self._storage:
+            self._storage.close()
+            self._storage = None
+
+    def lockDatabase(self, database):
+        '''lock database for writing, or open it read-only and watch changes saved by
+           the instance holding the lock
+           :return: True if locked
+        '''
+        self.unlockDatabase()
+        lock = FileLock(database)
+        try:
+            locked = lock.acquire()
+        except OSError: # e.g. read-only folder
+            locked = False
+
+        if locked:
+            self._lock = lock
+        else:
+            self._readOnly = True
+            self.watchDatabase(database)
+        return locked
+
+    def unlockDatabase(self):
+        '''release lock of current database, or stop watching it if opened read-only'''
+        if self._lock:
+            self._lock.release()
+            self._lock = None
+        self._readOnly = False
+        self.watchDatabase(None)
+
+    def watchDatabase(self, database):
+        '''reload changes when database is saved by another instance
+           :param database: database to watch, or None to stop watching
+        '''
+        if self._watcher is None:
+            if database is None:
+                return
+            self._watcher = QFileSystemWatcher(self)
+            self._watcher.fileChanged.connect(self.slot_databaseChanged)
+            # a saving changes the file several times
+            self._reloadTimer = QTimer(self)
+            self._reloadTimer.setSingleShot(True)
+            self._reloadTimer.timeout.connect(self.reloadChanges)
+
+        self._reloadTimer.stop()
+        self._replaced = False
+        if self._watcher.files():
+            self._watcher.removePaths(self._watcher.files())
+        if database:
+            self._watcher.addPath(database)
+
+    def slot_databaseChanged(self, filename):
+        # file replaced by another instance is not watched any more
+        if filename not in self._watcher.files():
+            self._replaced = True
+            if os.path.exists(filename):
+                self._watcher.addPath(filename)
+        self._reloadTimer.start(500)
+
+    def reloadChanges(self):
+        '''apply rows saved by another instance to models, rather than resetting views.
+           all data is reloaded if changes are not recorded by database, e.g. columnar database.
+        '''
+
+        if not self._readOnly or not self._database:
+            return
+        if self._loadThread or self._loadingItems is not None:
+            self._reloadTimer.start(500) # try again after loading
+            return
+        if self._replaced or not isinstance(self._storage, SQLiteStorage):
+            if not os.path.exists(self._database):
+                self._reloadTimer.start(500) # being replaced
+                return
+            selected = self.itemsTableView.selectedIds()
+            self.initData(self._database)
+            self.itemsTableView.selectIds(selected)
+            self.statusBar().showMessage('Database is reloaded since it is saved by another instance.')
+            return
+
+        itemModel = self.itemsTableView.model().sourceModel()
+        try:
+            changes = self._storage.loadChanges(itemModel.dataList, itemModel.itemRow)
+        except Exception: # e.g. database is being written
+            self._reloadTimer.start(500)
+            return
+
+        # groups/tags are reset only if their structure is changed
+        groups = changes[self.KEY_GROUP]
+        if groups is not None and not self.groupsTreeView.model().reloadGroups(groups[GroupModel.CHILDREN]):
+            selected = [index.siblingAtColumn(GroupModel.KEY).data() for index in self.groupsTreeView.selectedIndexes()]
+            self.groupsTreeView.setup(groups[GroupModel.CHILDREN], selected[0] if selected else GroupModel.ALLGROUPS)
+        tags = changes[self.KEY_TAG]
+        if tags is not None and not self.tagsTableView.model().reloadTags(tags):
+            selected = [index.siblingAtColumn(TagModel.KEY).data() for index in self.tagsTableView.selectedIndexes()]
+            self.tagsTableView.setup(tags, selected[0] if selected else TagModel.NOTAG)
+
+        # items: updated in place, then removed from bottom to top, and inserted at the end.
+        # they're found by id rather than scanning rows
+        updated, inserted, removed = changes[self.KEY_ITEM]
+        itemModel.reloadRows({itemModel.itemRow(self._storage.itemId(item)): values for item, values in updated})
+        rows = [itemModel.itemRow(uid) for uid in removed]
+        for start, count in reversed(rowRanges(row for row in rows if row>=0)):
+            itemModel.unloadRows(start, count) # consecutive rows are removed at a time
+        itemModel.loadRows(inserted, [self._storage.itemId(item) for item in inserted])
+        if updated or inserted or removed:
+            self._historyStore = None # reloaded rows are not known by history store
+
+        # counters of groups/tags: reloaded rows are not published as changes
+        if groups is not None or tags is not None or updated or inserted or removed:
+            itemModel.recount()
+            self.statusBar().showMessage('{0} items updated, {1} inserted, {2} removed by another instance.'.format(
+                len(updated), len(inserted), len(removed)))
+
+    def createJournal(self, database):
+        '''journal recording mutations of models for specified database'''
+        # default rows are managed by models rather than stored in database
+        defaults = {
+            self.KEY_GROUP: (len(self.groupsTreeView.model().defaultGroups), 
+                                lambda group: 0<group[GroupModel.KEY]<10),
+            self.KEY_TAG  : (len(self.tagsTableView.model().defaultTags),
+                                lambda tag: tag[TagModel.KEY]==TagModel.NOTAG)
+        }
+        return Journal(database, partial(loadData, database), defaults)
+
+    def openJournal(self, database, data):
+        '''journal of specified database, and replay unsaved changes on loaded data
+           :return: (data, count of replayed records)
+        '''
+        self._journal = self.createJournal(database)
+        self._recovered = False
+
+        if not self._journal.hasRecords():
+            return data, 0
+
+        data, count = self._journal.recover(data)
+
+        # rows are changed out of models, so rewrite all next time
+        self._storage.invalidate()
+        self._recovered = True
+
+        return data, count
+
+    def attachJournal(self):
+        '''record mutations of models to journal'''
+        journal = self._journal
+        self.groupsTreeView.model().setJournal(journal.writer(self.KEY_GROUP) if journal else None)
+        self.tagsTableView.model().setJournal(journal.writer(self.KEY_TAG) if journal else None)
+        self.itemsTableView.model().sourceModel().setJournal(journal.writer(self.KEY_ITEM) if journal else None)
+
+    def closeJournal(self):
+        '''stop recording and discard records, e.g. changes are saved or discarded'''
+        if self._journal:
+            self._journal.clear()
+            self._journal = None
+        self._recovered = False
+        self._saveFailed = False
+        self.attachJournal()
+
+    def serialize(self, filename, autosave=False):
+        '''save project data to database in background:
+           a snapshot of models is taken here, so that editing could go on while saving.
+           only rows changed since last saving are written to current database,
+           while all data is written when saving as a new database.
+           :return: True if saving is started, see waitForSaving() for the result
+        '''
+        # one saving at a time, and all items should be loaded
+        self.waitForSaving()
+        self.finishLoading()
+        if self._loadThread:
+            return False
+        if filename==self._database:
+            self.record('save', autosave=autosave)
+
+        # new database should not be opened by another instance
+        lock = None
+        if filename!=self._database or self._readOnly:
+            lock = FileLock(filename)
+            try:
+                locked = lock.acquire()
+            except OSError:
+                locked = False
+            if not locked:
+                msg = "Could not save current project to\n {0},\nwhich is opened by another instance.".format(filename)
+                if autosave:
+                    self.statusBar().showMessage(msg.replace('\n', ''))
+                else:
+                    QMessageBox.critical(None, "Error", msg)
+                return False
+
+        # rows changed since last saving
+        if self._storage and filename==self._database and not self._readOnly:
+            changes = {
+                self.KEY_GROUP: self.groupsTreeView.model().changes(),
+                self.KEY_TAG  : self.tagsTableView.model().changes(),
+                self.KEY_ITEM : self.itemsTableView.model().sourceModel().changes()
+            }
+        else:
+            changes = None
+
         # current group
         for index in self.groupsTreeView.selectedIndexes():
             selected_group = index.siblingAtColumn(GroupModel.KEY).data()
@@ -174,12 +1057,15 @@ class MainWindow(QMainWindow):
         else:
             selected_tag = TagModel.NOTAG
 
-        # collect all data
+        # snapshot of all data: items are copied, while the model rows identify them
+        itemModel = self.itemsTableView.model().sourceModel()
+        origins = itemModel.serialize(save=False)
         data = {
             self.APP_NAME   : self.APP_VERSION,
-            self.KEY_GROUP  : self.groupsTreeView.model().serialize(),
-            self.KEY_TAG    : self.tagsTableView.model().serialize(),
-            self.KEY_ITEM   : self.itemsTableView.model().sourceModel().serialize(),
+            self.KEY_GROUP  : self.groupsTreeView.model().snapshot(),
+            self.KEY_TAG    : self.tagsTableView.model().snapshot(),
+            self.KEY_ITEM   : itemModel.snapshot(),
+            self.KEY_ID     : itemModel.table.ids[:],
             self.KEY_SETTING: {
                 'selected_group': selected_group,
                 'selected_tag': selected_tag,
@@ -187,21 +1073,299 @@ class MainWindow(QMainWindow):
                 'dock_area': self.dockWidgetArea(self.dockProperty)
             },
         }
+        self._recovered = False
+        self._saveFailed = False
 
-        # dump pickle file
-        try:
-            with open(filename, 'wb') as f:
-                pickle.dump(data, f)
-        except Exception as e:
-            QMessageBox.critical(None, "Error", "Could not save current project to\n {0}.".format(filename))
-        else:
-            self._database = filename
-            self.setting.setValue('database', filename)
-            self.setTitle()
-            self.statusBar().showMessage('File saved.')
+        # records until now are included in the snapshot
+        if self._journal:
+            self._journal.rotate()
+
+        # write database in background
+        storage = None if changes is None else self._storage
+        thread = SaveThread(storage, filename, data, changes, origins, self)
+        thread.autosave = autosave
+        thread.lock = lock
+        thread.history = self.historyStore(filename)
+        thread.progress.connect(self.slot_savingProgress)
+        thread.finished.connect(partial(self.slot_savingFinished, thread))
+        self._saveThread = thread
+
+        self.statusBar().showMessage('Saving ...')
+        self.progressBar.setValue(0)
+        self.progressBar.show()
+        thread.start()
+
+        return True
+
+    def waitForSaving(self):
+        '''block until current saving is finished
+           :return: True if saved successfully
+        '''
+        thread = self._saveThread
+        if not thread:
             return True
+        thread.wait()
+        return self.slot_savingFinished(thread)
+
+    def slot_savingProgress(self, done, total):
+        if self._saveThread:
+            self.progressBar.setMaximum(max(total, 1))
+            self.progressBar.setValue(done)
+
+    def slot_savingFinished(self, thread):
+        '''update database status when saving is finished'''
+        # finished already, e.g. waitForSaving()
+        if thread is not self._saveThread:
+            return thread.error is None
+        self._saveThread = None
+        self.progressBar.hide()
+
+        filename = thread.filename
+        if thread.error:
+            if thread.lock:
+                thread.lock.release()
+            # changes tracked by models are cleared already
+            if self._storage:
+                self._storage.invalidate()
+            self._historyStore = None
+            if self._journal:
+                self._journal.restore()
+            self._saveFailed = True
+            msg = "Could not save current project to\n {0}.".format(filename)
+            if thread.autosave:
+                self.statusBar().showMessage(msg.replace('\n', ''))
+            else:
+                QMessageBox.critical(None, "Error", msg)
+            return False
+
+        if thread.storage is not self._storage:
+            self.closeStorage()
+            self._storage = thread.storage
+
+        # saved as new database
+        if thread.lock:
+            self.unlockDatabase()
+            self._lock = thread.lock
+
+        # records made since the snapshot are kept for saved database
+        if self._journal and filename==self._database:
+            self._journal.commit()
+        else:
+            journal = self.createJournal(filename)
+            journal.clear() # records left by another session are out of date
+            if self._journal:
+                self._journal.commit()
+                self._journal.moveTo(journal)
+            self._journal = journal
+            self.attachJournal()
+
+        self._database = filename
+        self._snapshot = self._federation = None
+        self.setting.setValue('database', filename)
+        self.setTitle()
+        self.statusBar().showMessage('File autosaved.' if thread.autosave else 'File saved.')
+        return True
+
+    # ----------------------------------------------
+    # --------------- local server ---------------
+    # ----------------------------------------------
+    def setupServer(self):
+        '''invalidate snapshot served to clients whenever models are changed'''
+        self._invoker = Invoker(self)
+        self._serverLock = threading.Lock()
+        for model in (self.groupsTreeView.model(), self.tagsTableView.model(),
+                        self.itemsTableView.model().sourceModel()):
+            for signal in (model.dataChanged, model.rowsInserted, model.rowsRemoved,
+                            model.rowsMoved, model.layoutChanged, model.modelReset):
+                signal.connect(self.slot_serverDataChanged)
+
+    def serverAddress(self):
+        '''address listened by local server, None if it's not running'''
+        return self._server.address if self._server else None
+
+    def startServer(self, address=None):
+        '''serve current project to local clients over JSON-RPC, see library.RpcServer
+           :param address: Unix socket path or (host, port), next to database by default
+           :return: address listened
+        '''
+        self.stopServer()
+        if address is None:
+            address = RpcServer.defaultAddress(self._database or os.path.join(tempfile.gettempdir(), 'tagit'))
+        service = LibraryService(self.serverSnapshot,
+                                lambda method, params: self._invoker.invoke(self.serveRequest, method, params))
+        self._server = RpcServer(address, service)
+        try:
+            return self._server.start()
+        except OSError:
+            self._server = None
+            raise
+
+    def stopServer(self):
+        if self._server:
+            self._server.stop()
+            self._server = None
+        self._serverSnapshot = None
+
+    def slot_serverDataChanged(self):
+        self._serverVersion += 1
+        self._serverSnapshot = None
+
+    def serverSnapshot(self):
+        '''(version, Catalog) of current models for reading requests in connection threads:
+           only references to rows are taken in GUI thread, then they're copied and indexed
+           in connection thread, which is repeated if models are changed meanwhile
+        '''
+        with self._serverLock:
+            snapshot = self._serverSnapshot # may be reset in GUI thread at any time
+            while snapshot is None:
+                version, data = self._invoker.invoke(self._serverData)
+                data[self.KEY_ITEM] = [[name, group, tags[:] if tags else tags, path, date, notes]
+                                        for name, group, tags, path, date, notes in data[self.KEY_ITEM]]
+                catalog = Catalog.fromData(data)
+                catalog.filename = self._database
+                snapshot = self._invoker.invoke(self._keepServerSnapshot, (version, catalog))
+            return snapshot
 
-        return False
+    def _serverData(self):
+        '''(version, data) with shallow copy of items, which are copied by serverSnapshot()'''
+        self.finishLoading()
+        table = self.itemsTableView.model().sourceModel().table
+        return self._serverVersion, {
+            self.KEY_GROUP: self.groupsTreeView.model().serialize(save=False),
+            self.KEY_TAG  : [tag[:] for tag in self.tagsTableView.model().serialize(save=False)],
+            self.KEY_ITEM : table.serialize(save=False),
+            self.KEY_ID   : table.ids[:],
+            self.KEY_SETTING: {}
+        }
+
+    def _keepServerSnapshot(self, snapshot):
+        '''keep snapshot if models are not changed since its data is taken, otherwise None'''
+        if snapshot[0]!=self._serverVersion:
+            return None
+        self._serverSnapshot = snapshot
+        return snapshot
+
+    def serveRequest(self, method, params):
+        '''apply writing request of local client in GUI thread, through the item view,
+           so it's recorded in journal and could be saved as editing by hand
+           :return: {'items': count of specified items}
+        '''
+        if self._readOnly or self._snapshot or self._federation:
+            raise RpcError(RpcError.INVALID_REQUEST, 'Library is opened read-only.')
+
+        # resolve items, groups and tags against the live tables of models
+        self.finishLoading()
+        live = Catalog.fromTables(self.groupsTreeView.model().tree, self.tagsTableView.model().table,
+                                    self.itemsTableView.model().sourceModel().table)
+
+        if method=='import':
+            group = live.groupKey(str(params['group'])) if params.get('group') is not None else GroupModel.UNGROUPED
+            tags = [live.tagKey(tag) for tag in params.get('tags', [])] or [TagModel.NOTAG]
+            date = time.strftime('%Y-%m-%d', time.localtime(time.time()))
+            rows = []
+            for path in params['paths']:
+                path = os.path.abspath(path)
+                rows.append((os.path.basename(path.rstrip(os.sep)) or path, group, tags[:], path, date, ''))
+            self.itemsTableView.appendItems(rows)
+            return {'items': len(rows)}
+
+        rows = selectRows(live, params, self._serverVersion)
+        if method=='move':
+            group = live.groupKey(str(params['to']))
+            if group==GroupModel.ALLGROUPS:
+                raise RpcError(RpcError.INVALID_PARAMS, 'Items can not be moved to group: {0}'.format(params['to']))
+            self.itemsTableView.moveItems(rows, group)
+        else: # tag: one notification for all tags
+            with self.itemsTableView.model().sourceModel().transaction():
+                for tag in params.get('add', []):
+                    self.itemsTableView.attachTag(rows, live.tagKey(tag))
+                for tag in params.get('remove', []):
+                    self.itemsTableView.removeTag(rows, live.tagKey(tag))
+        return {'items': len(rows)}
+
+    # ----------------------------------------------
+    # --------------- workload trace ---------------
+    # ----------------------------------------------
+    def startTrace(self, filename):
+        '''record operations on current data to trace file until another database
+           is opened, see TagitReplay.py for replaying it
+        '''
+        # started when items are loaded, since the header and ids are taken from them
+        if self._loadThread is not None:
+            self._traceFile = filename
+            return
+
+        self.finishLoading()
+        self.stopTrace()
+        self._trace = TraceRecorder(filename, {
+            self.APP_NAME: self.APP_VERSION,
+            'database' : self._database,
+            'items'    : self.itemsTableView.model().sourceModel().rowCount()
+        })
+        self.itemsTableView.trace = self._trace
+
+    def startPendingTrace(self):
+        '''start trace requested while database is loaded in background'''
+        filename, self._traceFile = self._traceFile, None
+        if filename:
+            self.startTrace(filename)
+
+    def stopTrace(self):
+        if self._trace:
+            self._trace.close()
+            self._trace = None
+            self.itemsTableView.trace = None
+
+    def record(self, op, **args):
+        '''record operation to trace if it's recording'''
+        if self._trace:
+            self._trace.record(op, **args)
+
+    # ----------------------------------------------
+    # --------------- autosave ---------------
+    # ----------------------------------------------
+    def setupAutosave(self):
+        '''restart autosave timer whenever models are changed'''
+        self.autosaveTimer = QTimer(self)
+        self.autosaveTimer.setSingleShot(True)
+        self.autosaveTimer.timeout.connect(self.autosave)
+        self._autosaveInterval = int(self.setting.value('autosave', 0))
+
+        for model in (self.groupsTreeView.model(), self.tagsTableView.model(),
+                        self.itemsTableView.model().sourceModel()):
+            for signal in (model.dataChanged, model.rowsInserted, model.rowsRemoved,
+                            model.rowsMoved, model.layoutChanged):
+                signal.connect(self.slot_modelChanged)
+
+    def autosaveInterval(self):
+        return self._autosaveInterval
+
+    def setAutosaveInterval(self, seconds):
+        '''save current database automatically when nothing is changed in specified seconds,
+           disabled if seconds=0
+        '''
+        self._autosaveInterval = seconds
+        self.setting.setValue('autosave', seconds)
+        self.autosaveTimer.stop()
+        if seconds:
+            self.slot_modelChanged()
+
+    def slot_modelChanged(self):
+        if self._autosaveInterval:
+            self.autosaveTimer.start(self._autosaveInterval*1000)
+
+    def autosave(self):
+        '''save current database if anything is changed'''
+        # new database is not saved automatically since the filename is unknown
+        if not self._database or self._readOnly or not self.saveRequired():
+            return
+
+        # try again after current saving
+        if self._saveThread:
+            self.slot_modelChanged()
+            return
+
+        self.serialize(self._database, autosave=True)
 
     # ----------------------------------------------
     # --------------- user interface ---------------
@@ -211,15 +1375,19 @@ class MainWindow(QMainWindow):
 
         # left widgets
         self.tabWidget = QTabWidget()
-        self.groupsTreeView = GroupTreeView(['Group', 'Key']) # groups tree view        
-        self.tagsTableView = TagTableView(['KEY', 'TAG', 'COLOR']) # tags table view
+        with self.profile('GroupTreeView'):
+            self.groupsTreeView = GroupTreeView(['Group', 'Key']) # groups tree view        
+        with self.profile('TagTableView'):
+            self.tagsTableView = TagTableView(['KEY', 'TAG', 'COLOR']) # tags table view
         self.tabWidget.addTab(self.groupsTreeView, "Groups")
         self.tabWidget.addTab(self.tagsTableView, "Tags")
 
 
         # central widgets: reference item table widget
         headers = ['Item Title', 'Group', 'Tags', 'Path', 'Create Date', 'Notes']
-        self.itemsTableView = ItemTableView(headers, self.tabWidget) 
+        with self.profile('ItemTableView'):
+            self.itemsTableView = ItemTableView(headers, self.tabWidget) 
+        self.itemsTableView.model().sourceModel().referencesChecked.connect(self.slot_referencesChecked)
 
         # arranged views
         splitter = QSplitter()        
@@ -231,7 +1399,8 @@ class MainWindow(QMainWindow):
 
         # dock widgets
         # it has not been added to main window util called by addDockWidget() explicitly
-        propWidget = PropertyWidget(self.itemsTableView)
+        with self.profile('PropertyWidget'):
+            propWidget = PropertyWidget(self.itemsTableView)
         self.dockProperty = QDockWidget(self.tr("Properties"),self)
         self.dockProperty.setWidget(propWidget)
 
@@ -247,12 +1416,29 @@ class MainWindow(QMainWindow):
 
     def setTitle(self):
         '''set window title'''
-        title = self._database if self._database else 'untitled.dat'
+        if self._snapshot:
+            title = '{0} @ {1} (read-only)'.format(*self._snapshot)
+        elif self._federation:
+            title = '{0} (read-only)'.format(' + '.join(self._federation.names()))
+        elif self._readOnly:
+            title = '{0} (read-only)'.format(self._database)
+        else:
+            title = self._database if self._database else 'untitled.dat'
         self.setWindowTitle("Tagit - {0}".format(title))
 
     def createStatusBar(self):
+        # progress of loading/saving in background
+        self.progressBar = QProgressBar()
+        self.progressBar.setMaximumWidth(200)
+        self.progressBar.setTextVisible(False)
+        self.progressBar.hide()
+        self.statusBar().addPermanentWidget(self.progressBar)
+
+    def showDatabaseStatus(self):
         if self._database:
             msg = 'loading database successfully - {0}'.format(self._database)
+            if self._recovered:
+                msg += ' (unsaved changes are recovered)'
         else:
             msg = 'New database'
         self.statusBar().showMessage(msg)
@@ -260,9 +1446,23 @@ class MainWindow(QMainWindow):
 
 if __name__ == '__main__':
 
-    import sys
+    with PROFILER.measure('QApplication') if PROFILER else nullcontext():
+        app = QApplication(sys.argv)
+    with PROFILER.measure('MainWindow') if PROFILER else nullcontext():
+        mainWin = MainWindow(progressive=True, profiler=PROFILER)
+    with PROFILER.measure('show') if PROFILER else nullcontext():
+        mainWin.show()
+
+    # record operations: python Tagit.py --record-trace=trace.jsonl
+    for arg in sys.argv[1:]:
+        if arg.startswith('--record-trace='):
+            mainWin.startTrace(arg.split('=', 1)[1])
+
+    # report when event loop starts, i.e. the window is painted
+    if PROFILER:
+        def report():
+            PROFILER.stop()
+            PROFILER.report()
+        QTimer.singleShot(0, report)
 
-    app = QApplication(sys.argv)
-    mainWin = MainWindow()
-    mainWin.show()
     sys.exit(app.exec_())
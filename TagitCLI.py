@@ -0,0 +1,186 @@
+# command line interface of Tagit: batch operations on a database without GUI,
+# so Qt is never imported here. e.g.
+#   python TagitCLI.py library.dat query --group Papers/Physics --tag Todo
+#   python TagitCLI.py library.dat add ~/papers/a.pdf --group Papers --tag Todo
+#   python TagitCLI.py library.dat import ~/papers --recursive
+#   python TagitCLI.py library.dat tag --text einstein --add Relativity --remove Todo
+#   python TagitCLI.py library.dat move --tag Relativity --to Papers/Physics
+#   python TagitCLI.py library.dat duplicated
+#   python TagitCLI.py library.dat unreferenced
+#   python TagitCLI.py library.dat stats
+# database opened by Tagit is locked, so commands changing it fail in that case.
+#
+
+import os
+import sys
+import json
+import argparse
+
+from library.Catalog import Catalog
+
+
+# ---------------------------------------------------
+# commands
+# ---------------------------------------------------
+def selectedRows(catalog, args):
+    '''rows of items filtered by the common selecting options'''
+    group = catalog.groupKey(args.group) if args.group else None
+    tag = catalog.tagKey(args.tag) if args.tag else None
+    return catalog.select(group, tag, args.text)
+
+
+def query(catalog, args):
+    rows = selectedRows(catalog, args)
+    if args.limit:
+        rows = rows[:args.limit]
+    for row in rows:
+        record = catalog.itemRecord(row)
+        if args.json:
+            print(json.dumps(record, ensure_ascii=False))
+        else:
+            print('\t'.join([record['name'], record['group'], record['path']]))
+
+
+def add(catalog, args):
+    group = catalog.groupKey(args.group) if args.group else catalog.UNGROUPED
+    tags = [catalog.tagKey(tag, create=True) for tag in args.tags]
+    rows = catalog.appendItems(args.paths, group, tags)
+    return '{0} items are added.'.format(len(rows))
+
+
+def importPaths(catalog, args):
+    '''add files and folders under directory, hidden ones are skipped'''
+    paths = []
+    if args.recursive:
+        for root, dirs, files in os.walk(args.directory):
+            dirs[:] = sorted(name for name in dirs if not name.startswith('.'))
+            paths.extend(os.path.join(root, name) for name in sorted(files) if not name.startswith('.'))
+    else:
+        paths = [os.path.join(args.directory, name) for name in sorted(os.listdir(args.directory)) if not name.startswith('.')]
+
+    # source paths referenced already
+    if not args.all:
+        existing = {item[catalog.PATH] for item in catalog.items}
+        paths = [path for path in paths if os.path.abspath(path) not in existing]
+
+    args.paths = paths
+    return add(catalog, args)
+
+
+def tag(catalog, args):
+    rows = selectedRows(catalog, args)
+    count = 0
+    if args.add:
+        count += catalog.attachTags(rows, [catalog.tagKey(name, create=True) for name in args.add])
+    if args.remove:
+        count += catalog.removeTags(rows, [catalog.tagKey(name) for name in args.remove])
+    return '{0} items are changed.'.format(count)
+
+
+def move(catalog, args):
+    group = catalog.groupKey(args.to)
+    if group==catalog.ALLGROUPS:
+        raise KeyError('Items can not be moved to group: {0}'.format(args.to))
+    count = catalog.moveItems(selectedRows(catalog, args), group)
+    return '{0} items are moved.'.format(count)
+
+
+def duplicated(catalog, args):
+    count = catalog.checkDuplicated()
+    return '{0} items are changed, {1} items are duplicated.'.format(
+        count, len(catalog.select(catalog.DUPLICATED)))
+
+
+def unreferenced(catalog, args):
+    count = catalog.checkReferences()
+    return '{0} items are changed, {1} items are unreferenced.'.format(
+        count, len(catalog.select(catalog.UNREFERENCED)))
+
+
+def stats(catalog, args):
+    res = catalog.statistics()
+    groups = {catalog.groupName(key): count for key, count in res['groups'].items()}
+    tags = {catalog.tagName(key) or str(key): count for key, count in res['tags'].items() if key!=catalog.NOTAG}
+    if args.json:
+        print(json.dumps({'items': res['items'], 'groups': groups, 'tags': tags}, ensure_ascii=False))
+        return
+
+    print('items\t{0}'.format(res['items']))
+    for name, count in sorted(groups.items()):
+        print('group\t{0}\t{1}'.format(name, count))
+    for name, count in sorted(tags.items()):
+        print('tag\t{0}\t{1}'.format(name, count))
+
+
+# ---------------------------------------------------
+# arguments
+# ---------------------------------------------------
+def parser():
+    res = argparse.ArgumentParser(prog='tagit', description='Batch operations on Tagit database.')
+    res.add_argument('database', help='database file')
+    commands = res.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    def command(name, func, help, writable=False, selecting=False):
+        sub = commands.add_parser(name, help=help)
+        sub.set_defaults(func=func, writable=writable)
+        if selecting:
+            sub.add_argument('-g', '--group', help='group key, name of default group or path like A/B, including sub-groups')
+            sub.add_argument('-t', '--tag', help='tag key or name')
+            sub.add_argument('-s', '--text', help='text in name or path, case insensitive')
+        return sub
+
+    sub = command('query', query, 'list items', selecting=True)
+    sub.add_argument('-n', '--limit', type=int, default=0, help='count of items to list')
+    sub.add_argument('--json', action='store_true', help='list as JSON Lines')
+
+    for name, func, help in (('add', add, 'add items referencing paths'),
+                             ('import', importPaths, 'add items under directory')):
+        sub = command(name, func, help, writable=True)
+        if func is add:
+            sub.add_argument('paths', nargs='+', help='source paths')
+        else:
+            sub.add_argument('directory', help='source directory')
+            sub.add_argument('-r', '--recursive', action='store_true', help='import files in sub-directories')
+            sub.add_argument('-a', '--all', action='store_true', help='import paths referenced already also')
+        sub.add_argument('-g', '--group', help='group of new items, Ungrouped by default')
+        sub.add_argument('-t', '--tag', dest='tags', action='append', default=[], help='tag of new items, created if not exists')
+
+    sub = command('tag', tag, 'attach/remove tags of items', writable=True, selecting=True)
+    sub.add_argument('--add', action='append', default=[], help='tag to attach, created if not exists')
+    sub.add_argument('--remove', action='append', default=[], help='tag to remove')
+
+    sub = command('move', move, 'move items to group', writable=True, selecting=True)
+    sub.add_argument('--to', required=True, help='target group')
+
+    command('duplicated', duplicated, 'move duplicated items to group Duplicated', writable=True)
+    command('unreferenced', unreferenced, 'move items with invalid source path to group Unreferenced', writable=True)
+
+    sub = command('stats', stats, 'count items by group and tag')
+    sub.add_argument('--json', action='store_true', help='print as JSON')
+
+    return res
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    if not os.path.isfile(args.database):
+        print('tagit: database not found: {0}'.format(args.database), file=sys.stderr)
+        return 1
+
+    try:
+        with Catalog(args.database, readOnly=not args.writable) as catalog:
+            msg = args.func(catalog, args)
+            if args.writable:
+                catalog.save()
+    except (KeyError, ValueError, OSError) as e:
+        print('tagit: {0}'.format(e.args[0] if isinstance(e, KeyError) else e), file=sys.stderr)
+        return 1
+
+    if msg:
+        print(msg)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
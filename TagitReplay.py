@@ -0,0 +1,190 @@
+# replay workload trace recorded by Tagit, i.e. python Tagit.py --record-trace=trace.jsonl,
+# against a copy of the database without showing the window, and report latency of each
+# operation, so that a real session becomes a repeatable benchmark. e.g.
+#   python TagitReplay.py trace.jsonl
+#   python TagitReplay.py trace.jsonl --database library.dat --repeat 3 --verbose
+# the database recorded in trace is used by default; it's copied to a temporary folder,
+# together with its index cache, so the original one is never changed.
+#
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+
+# headless by default
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QItemSelectionModel, QSettings
+from PyQt5.QtWidgets import QApplication
+
+from library.Trace import readTrace, report
+
+
+class Replayer(object):
+    '''apply operations of trace to main window through the same entries as user'''
+
+    def __init__(self, window):
+        self.window = window
+        self.app = QApplication.instance()
+
+    def run(self, operations, verbose=False):
+        '''replay operations in order
+           :return: [(op, seconds), ...] for replayed operations
+        '''
+        latencies = []
+        for operation in operations:
+            op = operation['op']
+            handler = getattr(self, 'op_{0}'.format(op), None)
+            if handler is None:
+                print('skip unknown operation: {0}'.format(op), file=sys.stderr)
+                continue
+
+            t = time.perf_counter()
+            ok = handler(operation)
+            self.app.processEvents() # queued signals, e.g. refreshing views
+            seconds = time.perf_counter() - t
+            if ok is False:
+                print('skip operation at {0:.3f}s: {1}'.format(operation['t'], op), file=sys.stderr)
+                continue
+
+            latencies.append((op, seconds))
+            if verbose:
+                print('{0:10.3f} {1:<14} {2:9.1f} ms'.format(operation['t'], op, seconds*1000))
+        return latencies
+
+    def itemRows(self, operation):
+        '''source rows of items recorded by ids, None if any of them is not found'''
+        model = self.window.itemsView().model().sourceModel()
+        rows = [model.itemRow(uid) for uid in operation['ids']]
+        return None if any(row<0 for row in rows) else rows
+
+    # ---------------------------------------------------
+    # operations, see library.Trace
+    # ---------------------------------------------------
+    def op_filterGroup(self, operation):
+        view = self.window.groupsView()
+        index = view.model().getIndexByKey(operation['group'])
+        if not index.isValid():
+            return False
+        self.window.tabViews().setCurrentIndex(0)
+        view.selectionModel().setCurrentIndex(index, QItemSelectionModel.ClearAndSelect|QItemSelectionModel.Rows)
+        view.selectionModel().select(index, QItemSelectionModel.ClearAndSelect|QItemSelectionModel.Rows)
+
+    def op_filterTag(self, operation):
+        view = self.window.tagsView()
+        index = view.model().getIndexByKey(operation['tag'])
+        if not index.isValid():
+            return False
+        self.window.tabViews().setCurrentIndex(1)
+        view.selectionModel().setCurrentIndex(index, QItemSelectionModel.ClearAndSelect|QItemSelectionModel.Rows)
+        view.selectionModel().select(index, QItemSelectionModel.ClearAndSelect|QItemSelectionModel.Rows)
+
+    def op_search(self, operation):
+        self.window.main_menu.searchEdit.setText(operation['text'])
+
+    def op_move(self, operation):
+        rows = self.itemRows(operation)
+        if rows is None:
+            return False
+        self.window.itemsView().moveItems(rows, operation['group'])
+
+    def op_attachTag(self, operation):
+        rows = self.itemRows(operation)
+        if rows is None:
+            return False
+        self.window.itemsView().attachTag(rows, operation['tag'])
+
+    def op_removeTag(self, operation):
+        rows = self.itemRows(operation)
+        if rows is None:
+            return False
+        self.window.itemsView().removeTag(rows, operation['tag'])
+
+    def op_import(self, operation):
+        self.window.itemsView().appendItems(operation['items'], operation.get('ids'))
+
+    def op_importCatalog(self, operation):
+        if not os.path.isfile(operation['filename']):
+            return False
+        self.window.importCatalog(operation['filename'], operation.get('ids'))
+
+    def op_save(self, operation):
+        if not self.window.serialize(self.window.database()):
+            return False
+        return self.window.waitForSaving()
+
+
+def copyDatabase(database, folder):
+    '''copy database and its index cache to folder
+       :return: path of the copy
+    '''
+    res = os.path.join(folder, os.path.basename(database))
+    shutil.copy2(database, res)
+    if os.path.isfile(database + '.cache'):
+        shutil.copy2(database + '.cache', res + '.cache')
+    return res
+
+
+def parser():
+    res = argparse.ArgumentParser(prog='TagitReplay', description='Replay workload trace recorded by Tagit.')
+    res.add_argument('trace', help='trace file, see python Tagit.py --record-trace=trace.jsonl')
+    res.add_argument('-d', '--database', help='database to replay against, the one recorded in trace by default')
+    res.add_argument('-n', '--repeat', type=int, default=1, help='replay times, each on a fresh copy of database')
+    res.add_argument('-v', '--verbose', action='store_true', help='print latency of each operation')
+    res.add_argument('--json', action='store_true', help='print latencies as JSON')
+    return res
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    try:
+        header, operations = readTrace(args.trace)
+    except (OSError, ValueError) as e:
+        print('replay: {0}'.format(e), file=sys.stderr)
+        return 1
+
+    database = args.database or header.get('database')
+    if not database or not os.path.isfile(database):
+        print('replay: database not found: {0}'.format(database), file=sys.stderr)
+        return 1
+
+    from Tagit import MainWindow # imported after environment is set
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    latencies = []
+    for _ in range(max(args.repeat, 1)):
+        with tempfile.TemporaryDirectory() as folder:
+            # separate settings, so the last database and autosave of user are not changed
+            setting = QSettings(os.path.join(folder, 'tagit.ini'), QSettings.IniFormat)
+            window = MainWindow(setting=setting)
+
+            t = time.perf_counter()
+            if not window.initData(copyDatabase(database, folder)):
+                print('replay: invalid database: {0}'.format(database), file=sys.stderr)
+                return 1
+            latencies.append(('open', time.perf_counter()-t))
+
+            count = window.itemsView().model().sourceModel().rowCount()
+            if count!=header.get('items'):
+                print('replay: {0} items in database while {1} items when recorded, items may not be found'.format(
+                        count, header.get('items')), file=sys.stderr)
+
+            latencies.extend(Replayer(window).run(operations, args.verbose))
+            window.waitForSaving()
+            window.closeJournal()
+            window.closeStorage()
+            window.unlockDatabase()
+
+    if args.json:
+        print(json.dumps([[op, round(seconds*1000, 3)] for op, seconds in latencies]))
+    else:
+        print('\n'.join(report(latencies)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
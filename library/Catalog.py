@@ -0,0 +1,291 @@
+# project data of a database edited without GUI, e.g. by command line interface:
+# the same core tables as the GUI models, working on the loaded data in place:
+#   - select items by group (including sub-groups), tag and text
+#   - append items, attach/remove tags, move items to group
+#   - check duplicated items and invalid source paths
+# changed rows are tracked, so that only they're written back to database.
+#
+
+import os
+import time
+
+from .Storage import Storage, openStorage
+from .FileLock import FileLock
+from .Core import GroupTree, TagTable, ItemTable, checkPaths
+
+
+class Catalog(object):
+    '''groups, tags and items of a database'''
+
+    # columns of item
+    NAME, GROUP, TAGS, PATH, DATE, NOTES = range(6)
+
+    # default groups and tag
+    ALLGROUPS, UNGROUPED, UNREFERENCED, DUPLICATED, TRASH = range(1, 6)
+    NOTAG = 0
+
+    def __init__(self, filename, readOnly=True):
+        '''open database, which is locked unless it's opened read-only'''
+        self.filename = filename
+        self.readOnly = readOnly
+
+        self._lock = None
+        if not readOnly:
+            self._lock = FileLock(filename)
+            if not self._lock.acquire():
+                raise OSError('Database is opened by another instance: {0}'.format(filename))
+
+        try:
+            self._storage = openStorage(filename)
+            self.data = self._storage.load()
+            if Storage.APP_NAME not in self.data:
+                raise ValueError('Invalid database: {0}'.format(filename))
+        except Exception:
+            self.close()
+            raise
+
+        self._setup()
+
+    @classmethod
+    def fromData(cls, data):
+        '''read-only catalog of project data in memory, e.g. a snapshot of GUI models'''
+        catalog = cls.__new__(cls)
+        catalog.filename, catalog.readOnly = None, True
+        catalog._lock, catalog._storage = None, None
+        catalog.data = data
+        catalog._setup()
+        return catalog
+
+    @classmethod
+    def fromTables(cls, groupTree, tagTable, itemTable):
+        '''read-only catalog working on tables in place, e.g. the live tables of GUI models,
+           so nothing is copied or indexed again
+        '''
+        catalog = cls.__new__(cls)
+        catalog.filename, catalog.readOnly = None, True
+        catalog._lock, catalog._storage = None, None
+        catalog.data = None
+        catalog.groupTree, catalog.tagTable, catalog.itemTable = groupTree, tagTable, itemTable
+        catalog._setupGroups()
+        return catalog
+
+    def _setup(self):
+        self.groupTree = GroupTree(['Group', 'Key'])
+        self.groupTree.setup(self.data[Storage.KEY_GROUP][2])
+        self.tagTable = TagTable()
+        self.tagTable.setup(self.data[Storage.KEY_TAG])
+        self.itemTable = ItemTable()
+        self.itemTable.setup(self.data[Storage.KEY_ITEM], self.data.get(Storage.KEY_ID))
+        self._setupGroups()
+
+    def _setupGroups(self):
+        self.items = self.itemTable.rows
+
+        # key -> group node
+        self._groups = {}
+        def walk(node):
+            for child in node.childItems:
+                self._groups[child.data(GroupTree.KEY)] = child
+                walk(child)
+        walk(self.groupTree.root)
+
+    def close(self):
+        if getattr(self, '_storage', None):
+            self._storage.close()
+            self._storage = None
+        if self._lock:
+            self._lock.release()
+            self._lock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # --------------------------------------------------------------
+    # groups and tags
+    # --------------------------------------------------------------
+    def groupName(self, key):
+        '''path of names from top level group, e.g. Papers/Physics'''
+        names, node = [], self._groups.get(key)
+        while node is not None and node is not self.groupTree.root:
+            names.insert(0, node.data(GroupTree.NAME))
+            node = node.parent()
+        return '/'.join(names)
+
+    def groupKey(self, group):
+        '''key of group specified by key, name of default group or path of names'''
+        if str(group).isdigit() and int(group) in self._groups:
+            return int(group)
+
+        for key, node in self._groups.items():
+            if GroupTree.isDefault(node) and node.data(GroupTree.NAME).lower()==group.lower():
+                return key
+
+        node = self.groupTree.root
+        for name in (name for name in group.split('/') if name):
+            for child in node.childItems:
+                if child.data(GroupTree.NAME)==name and not GroupTree.isDefault(child):
+                    node = child
+                    break
+            else:
+                raise KeyError('Group not found: {0}'.format(group))
+        if node is self.groupTree.root:
+            raise KeyError('Group not found: {0}'.format(group))
+        return node.data(GroupTree.KEY)
+
+    def subGroups(self, key):
+        '''keys of group and all its sub-groups'''
+        node = self._groups.get(key)
+        return node.keys() if node else [key]
+
+    def tagName(self, key):
+        row = self.tagTable.row(key)
+        return self.tagTable.rows[row][TagTable.NAME] if row>=0 else None
+
+    def tagKey(self, tag, create=False):
+        '''key of tag specified by key or name, new tag is created if create=True'''
+        for key, name, _ in self.tagTable.rows[1:]:
+            if name==tag or str(key)==str(tag):
+                return key
+        if not create:
+            raise KeyError('Tag not found: {0}'.format(tag))
+
+        key = self.tagTable.keys.next()
+        self.tagTable.append([[key, tag, '#000000']])
+        return key
+
+    # --------------------------------------------------------------
+    # items
+    # --------------------------------------------------------------
+    def select(self, group=None, tag=None, text=None):
+        '''rows of items filtered by group key, tag key and text in name or path'''
+        groups = None if group in (None, self.ALLGROUPS) else set(self.subGroups(group))
+        text = text.lower() if text else None
+
+        # only items in groups are checked, see ItemTable.groupRows()
+        candidates = range(len(self.items)) if groups is None else self.itemTable.groupRows(groups)
+
+        rows = []
+        for row in candidates:
+            item = self.items[row]
+            if tag is not None and tag not in (item[self.TAGS] or []):
+                continue
+            if text and text not in item[self.NAME].lower() and text not in item[self.PATH].lower():
+                continue
+            rows.append(row)
+        return rows
+
+    def itemRecord(self, row):
+        '''item with names of group and tags: {id, name, group, tags, path, date, notes}'''
+        name, group, tags, path, date, notes = self.items[row]
+        return {
+            'id'   : self.itemTable.id(row),
+            'name' : name,
+            'group': self.groupName(group),
+            'tags' : [self.tagName(tag) for tag in tags or [] if tag!=self.NOTAG],
+            'path' : path,
+            'date' : date,
+            'notes': notes
+        }
+
+    def appendItems(self, paths, group=UNGROUPED, tags=None):
+        '''append items referencing paths, named by filename
+           :return: rows of new items
+        '''
+        date = time.strftime('%Y-%m-%d', time.localtime(time.time()))
+        start = len(self.items)
+        rows = []
+        for path in paths:
+            path = os.path.abspath(path)
+            rows.append([os.path.basename(path.rstrip(os.sep)) or path, group, list(tags or [self.NOTAG]), path, date, ''])
+        self.itemTable.append(rows)
+        return list(range(start, len(self.items)))
+
+    def attachTags(self, rows, tags):
+        '''attach tags to items, default tag is dropped
+           :return: count of changed items
+        '''
+        count = 0
+        for row in rows:
+            item = self.items[row]
+            item_tags = [tag for tag in (item[self.TAGS] or []) if tag!=self.NOTAG]
+            new_tags = item_tags + [tag for tag in tags if tag not in item_tags and tag!=self.NOTAG]
+            if new_tags!=list(item[self.TAGS] or []):
+                count += self._updateItem(row, self.TAGS, new_tags or [self.NOTAG])
+        return count
+
+    def removeTags(self, rows, tags):
+        '''remove tags from items, default tag is attached if no tags left'''
+        count = 0
+        for row in rows:
+            item = self.items[row]
+            new_tags = [tag for tag in (item[self.TAGS] or []) if tag not in tags] or [self.NOTAG]
+            count += self._updateItem(row, self.TAGS, new_tags)
+        return count
+
+    def moveItems(self, rows, group):
+        '''move items to group'''
+        return sum(self._updateItem(row, self.GROUP, group) for row in rows)
+
+    def checkDuplicated(self):
+        '''move duplicated items, i.e. same name and path, to group DUPLICATED,
+           see ItemTable.checkDuplicated()
+           :return: count of changed items
+        '''
+        return sum(self._updateItem(row, self.GROUP, group) for row, group in self.itemTable.checkDuplicated())
+
+    def checkReferences(self):
+        '''move items with invalid source path to UNREFERENCED, and valid ones back
+           to UNGROUPED, see ItemTable.checkReferences()
+           :return: count of changed items
+        '''
+        paths = self.itemTable.values(self.PATH)
+        changes = self.itemTable.checkReferences(paths, checkPaths(paths))
+        return sum(self._updateItem(row, self.GROUP, group) for row, group in changes)
+
+    def statistics(self):
+        '''counts of items in total and by group/tag:
+           {'items': n, 'groups': {key: n}, 'tags': {key: n}}
+        '''
+        groups, tags = {}, {}
+        for item in self.items:
+            groups[item[self.GROUP]] = groups.get(item[self.GROUP], 0) + 1
+            for tag in item[self.TAGS] or []:
+                tags[tag] = tags.get(tag, 0) + 1
+        return {'items': len(self.items), 'groups': groups, 'tags': tags}
+
+    def _updateItem(self, row, col, value):
+        '''set value of item in place, since the rows identify items in storage
+           :return: 1 if it's changed, otherwise 0
+        '''
+        if self.items[row][col]==value:
+            return 0
+        self.itemTable.updateData(row, col, value)
+        return 1
+
+    # --------------------------------------------------------------
+    # saving
+    # --------------------------------------------------------------
+    def isModified(self):
+        return self.itemTable.saveRequired() or self.tagTable.saveRequired()
+
+    def save(self):
+        '''write changed items and tags to database'''
+        if self.readOnly:
+            raise OSError('Database is opened read-only: {0}'.format(self.filename))
+        if not self.isModified():
+            return
+
+        changes = {
+            Storage.KEY_GROUP: ([], []),
+            Storage.KEY_TAG  : self.tagTable.changes(),
+            Storage.KEY_ITEM : self.itemTable.changes()
+        }
+        self.data[Storage.KEY_TAG] = self.tagTable.serialize()
+        self.data[Storage.KEY_ITEM] = self.itemTable.serialize()
+        self.data[Storage.KEY_ID] = self.itemTable.ids
+
+        # items of columnar database are rewritten entirely
+        self._storage.save(self.data, changes, origins=self.items)
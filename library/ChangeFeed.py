@@ -0,0 +1,227 @@
+# change feed of SQLite database:
+# fields changed by each saving are recorded with increasing sequence number, see
+# SQLiteStorage. changes after a sequence number are exported to a compact file,
+# which is applied to another copy of the database, so that the copies are
+# synchronized with the changes only.
+#
+# exported file: gzip compressed JSON lines
+#   - header: {'version', 'origin', 'since', 'last', 'synced'}
+#   - record: [seq, time, origin, kind, uid, field, value]
+#
+# watermarks in info table of database, updated when changes are applied:
+#   - synced:<origin>   the last sequence number of origin applied here, exported in
+#                       header as 'synced' to tell origin what it has sent already
+#   - received:<origin> the last local sequence number applied by origin, taken from
+#                       'synced' of its header, and exported after it next time
+#
+# conflicts are resolved per field: the later change wins, i.e. a field is updated
+# only if it's not changed locally after the exported change. a deleted row wins
+# over the changes of its fields.
+#
+
+import json
+import gzip
+
+from .SQLiteStorage import SQLiteStorage
+
+
+class ChangeFeed(object):
+    '''export/apply changes of a SQLite database'''
+
+    VERSION = 1
+    EXTENSION = '.tagd'
+
+    def __init__(self, storage):
+        '''
+           :param storage: SQLiteStorage of database
+        '''
+        self._storage = storage
+
+    def last(self):
+        '''sequence number of the latest change'''
+        return self._storage.lastChange()
+
+    def synced(self):
+        '''the last sequence number of each origin whose changes are applied: {origin: seq}'''
+        return self._watermarks('synced')
+
+    def lastSynced(self, origin=None):
+        '''the last local sequence number already applied by origin, i.e. the changes after
+           it are new to origin. the least one of all known origins if origin is None.
+        '''
+        received = self._watermarks('received')
+        if origin is not None:
+            return received.get(origin, 0)
+        origins = set(received) | set(self.synced())
+        return min(received.get(origin, 0) for origin in origins) if origins else 0
+
+    def _watermarks(self, kind):
+        prefix = '{0}:'.format(kind)
+        rows = self._storage.connection().execute('SELECT name, value FROM info WHERE name LIKE ?', (prefix+'%',))
+        return {name[len(prefix):]: int(value) for name, value in rows}
+
+    def export(self, filename, since=None):
+        '''write changes after sequence number since to file
+           :param since: sequence number, changes not applied by any known origin are exported if None
+           :return: (count of changes, sequence number of the last change)
+        '''
+        if since is None:
+            since = self.lastSynced()
+        conn = self._storage.connection()
+        records = conn.execute('SELECT seq, time, origin, kind, uid, field, value FROM changes '
+                                'WHERE seq>? ORDER BY seq', (since,)).fetchall()
+        last = records[-1][0] if records else since
+        header = {'version': self.VERSION, 'origin': SQLiteStorage.origin(), 'since': since, 'last': last,
+                    'synced': self.synced()}
+
+        with gzip.open(filename, 'wt', encoding='utf-8') as f:
+            f.write('{0}\n'.format(json.dumps(header)))
+            for seq, t, origin, kind, uid, field, value in records:
+                # value is JSON already
+                f.write('[{0},{1},{2},{3},{4},{5},{6}]\n'.format(
+                    seq, json.dumps(t), json.dumps(origin), json.dumps(kind), json.dumps(uid), json.dumps(field), value))
+
+        return len(records), last
+
+    @classmethod
+    def read(cls, filename):
+        '''header and records of exported file'''
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get('version')!=cls.VERSION:
+                raise ValueError('Invalid change feed: {0}'.format(filename))
+            records = [json.loads(line) for line in f if line.strip()]
+        return header, records
+
+    def apply(self, filename):
+        '''apply exported changes to database, and record them in the change feed with
+           the original time and origin.
+           :return: (count of applied fields, count of fields changed locally later, header)
+        '''
+        header, records = self.read(filename)
+
+        # the latest change of each field in file
+        latest = {}
+        for _, t, origin, kind, uid, field, value in records:
+            key = (kind, uid, field)
+            if key not in latest or (t, origin)>latest[key][:2]:
+                latest[key] = (t, origin, value)
+
+        # fields of each row, parents (groups) and tags are applied before items
+        rows = {SQLiteStorage.GROUP: {}, SQLiteStorage.TAG: {}, SQLiteStorage.ITEM: {}}
+        for (kind, uid, field), change in latest.items():
+            rows[kind].setdefault(uid, {})[field] = change
+
+        conn = self._storage.connection()
+        applied, conflicts = [], 0
+        with conn: # transaction
+            keys = {
+                SQLiteStorage.GROUP: dict(conn.execute('SELECT uid, key FROM groups')),
+                SQLiteStorage.TAG  : dict(conn.execute('SELECT uid, key FROM tags')),
+                SQLiteStorage.ITEM : dict(conn.execute('SELECT uid, id FROM items'))
+            }
+            for kind in (SQLiteStorage.GROUP, SQLiteStorage.TAG, SQLiteStorage.ITEM):
+                for uid, fields in rows[kind].items():
+                    accepted = {}
+                    for field, (t, origin, value) in fields.items():
+                        local = self._localChange(conn, kind, uid, field)
+                        if local and local>=(t, origin):
+                            conflicts += local!=(t, origin) # not an echo of applied change
+                            continue
+                        accepted[field] = (t, origin, value)
+
+                    # deleted locally
+                    if uid not in keys[kind] and self._localChange(conn, kind, uid, SQLiteStorage.DELETED):
+                        continue
+
+                    if accepted and self._applyRow(conn, kind, uid, accepted, keys):
+                        applied.extend((t, origin, kind, uid, field, json.dumps(value))
+                                        for field, (t, origin, value) in accepted.items())
+
+            conn.executemany('INSERT INTO changes (time, origin, kind, uid, field, value) VALUES (?, ?, ?, ?, ?, ?)', applied)
+            origin = header['origin']
+            conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)', ('synced:{0}'.format(origin), str(header['last'])))
+            received = header.get('synced', {}).get(SQLiteStorage.origin())
+            if received is not None: # files may be applied out of order
+                conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)',
+                    ('received:{0}'.format(origin), str(max(received, self.lastSynced(origin)))))
+
+        # rows are changed out of storage
+        self._storage.invalidate()
+        return len(applied), conflicts, header
+
+    @staticmethod
+    def _localChange(conn, kind, uid, field):
+        '''(time, origin) of the latest local change of field'''
+        row = conn.execute('SELECT time, origin FROM changes WHERE kind=? AND uid=? AND field=? '
+                            'ORDER BY time DESC, origin DESC LIMIT 1', (kind, uid, field)).fetchone()
+        return tuple(row) if row else None
+
+    @staticmethod
+    def _key(keys, kind, uid):
+        '''local key of group/tag uid, default ones are identified by key directly'''
+        if uid is None:
+            return None
+        if uid in keys[kind]:
+            return keys[kind][uid]
+        return int(uid) if uid.isdigit() else None
+
+    def _applyRow(self, conn, kind, uid, fields, keys):
+        '''update fields of row with uid, create it if not exists.
+           :return: False if nothing is changed, e.g. row to delete doesn't exist
+        '''
+        values = {field: value for field, (_, _, value) in fields.items()}
+        key = keys[kind].get(uid)
+
+        if SQLiteStorage.DELETED in values:
+            if key is None:
+                return False
+            if kind==SQLiteStorage.GROUP:
+                conn.execute('DELETE FROM groups WHERE key=?', (key,))
+            elif kind==SQLiteStorage.TAG:
+                conn.execute('DELETE FROM tags WHERE key=?', (key,))
+                conn.execute('DELETE FROM item_tags WHERE tag=?', (key,))
+            else:
+                conn.execute('DELETE FROM items WHERE id=?', (key,))
+                conn.execute('DELETE FROM item_tags WHERE item=?', (key,))
+            del keys[kind][uid]
+            return True
+
+        if kind==SQLiteStorage.GROUP:
+            if key is None:
+                key = max(conn.execute('SELECT IFNULL(MAX(key), 9) FROM groups').fetchone()[0], 9) + 1
+                conn.execute('INSERT INTO groups (key, uid) VALUES (?, ?)', (key, uid))
+                keys[kind][uid] = key
+            if 'parent' in values:
+                values['parent'] = self._key(keys, SQLiteStorage.GROUP, values['parent'])
+            columns = [(field, value) for field, value in values.items() if field in SQLiteStorage.GROUP_FIELDS]
+            table, primary = 'groups', 'key'
+
+        elif kind==SQLiteStorage.TAG:
+            if key is None:
+                key = conn.execute('SELECT IFNULL(MAX(key), 0) FROM tags').fetchone()[0] + 1
+                conn.execute('INSERT INTO tags (key, uid) VALUES (?, ?)', (key, uid))
+                keys[kind][uid] = key
+            columns = [(field, value) for field, value in values.items() if field in SQLiteStorage.TAG_FIELDS]
+            table, primary = 'tags', 'key'
+
+        else:
+            if key is None:
+                key = conn.execute('INSERT INTO items (uid) VALUES (?)', (uid,)).lastrowid
+                keys[kind][uid] = key
+            if 'group' in values:
+                values['grp'] = self._key(keys, SQLiteStorage.GROUP, values.pop('group'))
+            if 'tags' in values:
+                tags = [self._key(keys, SQLiteStorage.TAG, tag) for tag in values.pop('tags')]
+                conn.execute('DELETE FROM item_tags WHERE item=?', (key,))
+                conn.executemany('INSERT INTO item_tags VALUES (?, ?, ?)',
+                    [(key, i, tag) for i, tag in enumerate(tag for tag in tags if tag is not None)])
+            columns = [(field, value) for field, value in values.items()
+                            if field in ('name', 'grp', 'path', 'date', 'notes')]
+            table, primary = 'items', 'id'
+
+        if columns:
+            conn.execute('UPDATE {0} SET {1} WHERE {2}=?'.format(
+                table, ', '.join('{0}=?'.format(field) for field, _ in columns), primary),
+                [value for _, value in columns] + [key])
+        return True
@@ -0,0 +1,358 @@
+# chunked columnar storage engine:
+# items are stored column by column and split into compressed chunks, so that
+# the file could be mapped into memory and only the chunks required are decoded
+#
+# file structure:
+#   MAGIC | chunks ... | header (JSON) | header offset (uint64) | header size (uint32) | MAGIC
+#
+# chunk of each column (zlib compressed):
+#   - fixed width column (group, date, id): values array
+#   - heap column (name, path, notes, tags): offsets array (count+1) | values heap,
+#     offsets of string are counted by characters, so the whole heap is decoded at once
+#
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+from array import array
+
+from .Storage import Storage
+
+
+class ColumnStorage(Storage):
+
+    MAGIC = b'TAGITCOL'
+    VERSION = 1
+    EXTENSION = '.tagc'
+    CHUNK_SIZE = 4096 # rows in each chunk
+    TRAILER = struct.Struct('<QI')
+
+    # columns of item, and ids of items stored as the last column if exist
+    NAME, GROUP, TAGS, PATH, DATE, NOTES, ID = range(7)
+
+    NULL_GROUP = -2**31 # group is not specified
+
+    def __init__(self, filename):
+        super(ColumnStorage, self).__init__(filename)
+        self._items = None # lazy items loaded last time
+
+    @staticmethod
+    def isValid(filename):
+        try:
+            with open(filename, 'rb') as f:
+                return f.read(len(ColumnStorage.MAGIC))==ColumnStorage.MAGIC
+        except OSError:
+            return False
+
+    def load(self):
+        '''items are loaded lazily: rows are decoded when they're accessed'''
+        self._items = LazyItems(self.filename)
+        data = self._items.header['meta']
+        data[self.KEY_ITEM] = self._items
+        ids = self._items.ids()
+        if ids is not None:
+            data[self.KEY_ID] = ids
+        return data
+
+    def loadHeader(self):
+        '''header only, the mapping is released at once'''
+        items = LazyItems(self.filename)
+        items.release()
+        return items.header['meta']
+
+    def iterItems(self):
+        '''items are decoded chunk by chunk from a new mapping, key of row is its position'''
+        items = LazyItems(self.filename)
+        try:
+            yield from enumerate(items.chunks())
+        finally:
+            items.release()
+
+    def contentVersion(self):
+        '''checksum of header, which records offsets of all chunks and the other data'''
+        with open(self.filename, 'rb') as f:
+            f.seek(-(len(self.MAGIC)+self.TRAILER.size), os.SEEK_END)
+            offset, length = self.TRAILER.unpack(f.read(self.TRAILER.size))
+            f.seek(offset)
+            return zlib.crc32(f.read(length))
+
+    def save(self, data, changes=None, origins=None):
+        '''all data is rewritten since the chunks are immutable'''
+        items = data.get(self.KEY_ITEM, [])
+        ids = data.get(self.KEY_ID)
+        if ids is not None and len(ids)!=len(items):
+            ids = None
+        meta = {key: value for key, value in data.items() if key not in (self.KEY_ITEM, self.KEY_ID)}
+
+        tmp_filename = '{0}.tmp'.format(self.filename)
+        with open(tmp_filename, 'wb') as f:
+            f.write(self.MAGIC)
+            count = 6 if ids is None else 7
+            columns = {col: [] for col in range(count)}
+            date_width = max((len(self._encode(row[self.DATE])) for row in items), default=0)
+            id_width = max((len(self._encode(uid)) for uid in ids or []), default=0)
+            for start in range(0, len(items), self.CHUNK_SIZE):
+                rows = items[start:start+self.CHUNK_SIZE]
+                for col in range(count):
+                    if col==self.ID:
+                        chunk = self._encodeFixed(ids[start:start+self.CHUNK_SIZE], id_width)
+                    else:
+                        chunk = self._encodeChunk(rows, col, date_width)
+                    buf = zlib.compress(chunk)
+                    columns[col].append((f.tell(), len(buf)))
+                    f.write(buf)
+                self.reportProgress(start+len(rows), len(items))
+
+            header = json.dumps({
+                'version': self.VERSION,
+                'byteorder': sys.byteorder,
+                'rows': len(items),
+                'chunk': self.CHUNK_SIZE,
+                'dateWidth': date_width,
+                'idWidth': id_width,
+                'columns': [columns[col] for col in range(count)],
+                'meta': meta
+            }).encode('utf-8')
+            offset = f.tell()
+            f.write(header)
+            f.write(self.TRAILER.pack(offset, len(header)))
+            f.write(self.MAGIC)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # the mapped file is to be replaced
+        if self._items is not None:
+            self._items.materialize()
+            self._items.release()
+        os.replace(tmp_filename, self.filename)
+
+    @staticmethod
+    def _encode(value):
+        return (value or '').encode('utf-8')
+
+    @classmethod
+    def _encodeFixed(cls, values, width):
+        return b''.join(cls._encode(value).ljust(width, b'\x00') for value in values)
+
+    @classmethod
+    def _encodeChunk(cls, rows, col, date_width):
+        '''encode values of specified column'''
+        if col==cls.GROUP:
+            return array('i', (cls.NULL_GROUP if row[col] is None else row[col] for row in rows)).tobytes()
+
+        if col==cls.DATE:
+            return cls._encodeFixed((row[col] for row in rows), date_width)
+
+        # heap: offsets + values
+        if col==cls.TAGS:
+            values = array('i', (tag for row in rows for tag in (row[col] or [])))
+            sizes = (len(row[col] or []) for row in rows)
+        else:
+            values = ''.join(row[col] or '' for row in rows).encode('utf-8')
+            sizes = (len(row[col] or '') for row in rows) # count of characters
+
+        offsets = array('I', [0])
+        for size in sizes:
+            offsets.append(offsets[-1]+size)
+        return offsets.tobytes() + (values.tobytes() if col==cls.TAGS else values)
+
+
+class LazyItems(list):
+    '''items list mapped from columnar database:
+       unloaded row is represented by its row number in database, which is decoded
+       to a list [name, group, [tags], path, date, notes] when it's accessed
+    '''
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # header
+        size = len(ColumnStorage.MAGIC)
+        offset, length = ColumnStorage.TRAILER.unpack_from(self._map, len(self._map)-size-ColumnStorage.TRAILER.size)
+        self.header = json.loads(self._map[offset:offset+length].decode('utf-8'))
+        self._chunkSize = self.header['chunk']
+        self._swap = self.header['byteorder']!=sys.byteorder
+
+        # decoded values: (col, chunk) -> values list of column
+        self._columns = {}
+        # decoded rows: chunk -> rows list
+        self._rows = {}
+        self._count = self.header['rows'] # rows not loaded yet
+
+        super(LazyItems, self).__init__(range(self._count))
+        if not self._count:
+            self.release()
+
+    def release(self):
+        '''close mapped file when all rows are loaded'''
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+        self._columns = {}
+        self._rows = {}
+
+    # --------------------------------------------------------------
+    # decoding
+    # --------------------------------------------------------------
+    def _decodeColumn(self, col, chunk):
+        '''decompress and decode values in chunk of specified column'''
+        offset, length = self.header['columns'][col][chunk]
+        buf = zlib.decompress(self._map[offset:offset+length])
+        rows = min(self._chunkSize, self.header['rows']-chunk*self._chunkSize)
+
+        if col==ColumnStorage.GROUP:
+            values = array('i', buf)
+            if self._swap: values.byteswap()
+            return [None if group==ColumnStorage.NULL_GROUP else group for group in values.tolist()]
+
+        if col in (ColumnStorage.DATE, ColumnStorage.ID):
+            width = self.header['dateWidth' if col==ColumnStorage.DATE else 'idWidth']
+            return [buf[i:i+width].rstrip(b'\x00').decode('utf-8') for i in range(0, rows*width, width)]
+
+        # heap column
+        offsets = array('I', buf[:4*(rows+1)])
+        if self._swap: offsets.byteswap()
+        offsets = offsets.tolist()
+
+        if col==ColumnStorage.TAGS:
+            values = array('i', buf[4*(rows+1):])
+            if self._swap: values.byteswap()
+            values = values.tolist()
+        else:
+            values = buf[4*(rows+1):].decode('utf-8') # offsets are counted by characters
+
+        return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def _column(self, col, chunk):
+        '''decoded values of column in specified chunk'''
+        key = (col, chunk)
+        if key not in self._columns:
+            self._columns[key] = self._decodeColumn(col, chunk)
+        return self._columns[key]
+
+    def _chunk(self, chunk):
+        '''decoded rows in specified chunk'''
+        if chunk not in self._rows:
+            columns = [self._columns.pop((col, chunk), None) or self._decodeColumn(col, chunk) for col in range(6)]
+            self._rows[chunk] = [list(row) for row in zip(*columns)]
+        return self._rows[chunk]
+
+    def _load(self, index):
+        '''decode row at specified position'''
+        row = super(LazyItems, self).__getitem__(index)
+        if isinstance(row, int):
+            chunk, i = divmod(row, self._chunkSize)
+            row = self._chunk(chunk)[i]
+            super(LazyItems, self).__setitem__(index, row)
+            self._discard(1)
+        return row
+
+    def _unloaded(self, index):
+        '''count of rows not loaded at specified position or slice'''
+        rows = super(LazyItems, self).__getitem__(index)
+        if isinstance(index, slice):
+            return sum(isinstance(row, int) for row in rows)
+        return int(isinstance(rows, int))
+
+    def _discard(self, count):
+        '''count of rows not loaded are loaded, removed or replaced'''
+        if count:
+            self._count -= count
+            if not self._count:
+                self.release()
+
+    def discardRanges(self, ranges):
+        '''rows in ranges [(start, count), ...] are going to be removed out of list methods,
+           e.g. by removeRanges()
+        '''
+        self._discard(sum(self._unloaded(slice(start, start+count)) for start, count in ranges))
+
+    def chunks(self):
+        '''rows in database order decoded chunk by chunk, which are not kept by this list'''
+        for chunk in range(len(self.header['columns'][0]) if self.header['rows'] else 0):
+            yield from (list(row) for row in zip(*(self._decodeColumn(col, chunk) for col in range(6))))
+
+    def materialize(self):
+        '''decode all rows, chunks are decoded in parallel'''
+        if not self._count:
+            return
+
+        # deferred: concurrent.futures pulls in logging, which costs about 10 ms of startup in
+        # --profile-startup
+        from concurrent.futures import ThreadPoolExecutor
+
+        keys = [(col, chunk) for chunk in range(len(self.header['columns'][0])) for col in range(6)
+                    if chunk not in self._rows and (col, chunk) not in self._columns]
+        with ThreadPoolExecutor() as executor:
+            for key, values in zip(keys, executor.map(lambda key: self._decodeColumn(*key), keys)):
+                self._columns[key] = values
+
+        for i in range(len(self)):
+            self._load(i)
+
+    def value(self, index, col):
+        '''value at specified position and column, without decoding the whole row'''
+        row = super(LazyItems, self).__getitem__(index)
+        if not isinstance(row, int):
+            return row[col]
+
+        # decoded values are taken by the rows when the chunk is decoded, so the same
+        # tags list is returned even if it's edited in place
+        chunk, i = divmod(row, self._chunkSize)
+        if chunk in self._rows:
+            return self._load(index)[col]
+        return self._column(col, chunk)[i]
+
+    def column(self, col):
+        '''values of specified column, only this column is decoded for rows not loaded'''
+        return [self.value(i, col) for i in range(len(self))]
+
+    def ids(self):
+        '''ids of items in database order, None if they're not stored'''
+        if len(self.header['columns'])<=ColumnStorage.ID:
+            return None
+        if not self.header['rows']:
+            return []
+        res = []
+        for chunk in range(len(self.header['columns'][ColumnStorage.ID])):
+            res.extend(self._decodeColumn(ColumnStorage.ID, chunk))
+        return res
+
+    # --------------------------------------------------------------
+    # list methods
+    # --------------------------------------------------------------
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self):
+        self.materialize()
+        return super(LazyItems, self).__iter__()
+
+    def pop(self, index=-1):
+        self._load(index)
+        return super(LazyItems, self).pop(index)
+
+    def __delitem__(self, index):
+        count = self._unloaded(index)
+        super(LazyItems, self).__delitem__(index)
+        self._discard(count)
+
+    def __setitem__(self, index, value):
+        count = self._unloaded(index)
+        super(LazyItems, self).__setitem__(index, value)
+        self._discard(count)
+
+    def clear(self):
+        count = self._count
+        super(LazyItems, self).clear()
+        self._discard(count)
+
+    def __reduce__(self):
+        return (list, (list(self),))
@@ -0,0 +1,877 @@
+# core data of Tagit without Qt: groups tree, tags and items with the operations
+# on them, so that they're used by GUI models, command line interface, or pickled
+# to worker processes and benchmarked without QApplication:
+#   - GroupTree: tree of GroupNode, key allocation, changes since last saving
+#   - Table    : rows of tags/items, changes since last saving
+#   - TagTable : tags with default tag and key allocation
+#   - ItemTable: items with stable ids, duplicated check and source path refresh
+# Qt models are adapters over them, emitting signals around the operations.
+#
+# mutations are recorded with callable journal(op, *args), which is not pickled.
+#
+
+import os
+import uuid
+
+from .ColumnStorage import LazyItems
+
+
+class KeyCounter(object):
+    '''unique keys of groups/tags: the largest key taken so far'''
+
+    def __init__(self, start=0):
+        self.start = start
+        self._currentKey = start
+
+    def reset(self):
+        self._currentKey = self.start
+
+    def current(self):
+        '''the last key taken'''
+        return self._currentKey
+
+    def reserve(self, key):
+        '''keys up to specified key are taken, e.g. loaded or referenced by items already'''
+        if self._currentKey < key:
+            self._currentKey = key
+
+    def next(self):
+        '''next key for new group/tag'''
+        self._currentKey += 1
+        return self._currentKey
+
+
+class Recorder(object):
+    '''common part of tree and table: saving status and journal'''
+
+    def __init__(self):
+        # require saving if any changes are made
+        self._saveRequired = False
+
+        # callable recording mutations: journal(op, *args)
+        self._journal = None
+
+    def __getstate__(self):
+        '''journal is bound to files of current process'''
+        state = dict(self.__dict__)
+        state['_journal'] = None
+        return state
+
+    def saveRequired(self):
+        return self._saveRequired
+
+    def setJournal(self, journal=None):
+        '''record each mutation with callable journal(op, *args)'''
+        self._journal = journal
+
+    def record(self, op, *args):
+        '''record mutation to journal if exists'''
+        if self._journal:
+            self._journal(op, *args)
+
+
+# --------------------------------------------------------------
+# groups
+# --------------------------------------------------------------
+class TreeNode(object):
+    def __init__(self, data, parent=None):
+        '''
+           :param data: column contents of tree item, e.g. [name, description]
+        '''
+        self.itemData = data
+        self.parentItem = parent
+        self.childItems = []
+
+    def columnCount(self):
+        '''count of columns'''
+        return len(self.itemData)
+
+    def data(self, column):
+        '''get data of current item at specified column'''
+        return self.itemData[column]
+
+    def parent(self):
+        '''get parent'''
+        return self.parentItem
+
+    def child(self, row):
+        '''get child item at position=row'''
+        return self.childItems[row]
+
+    def childCount(self):
+        '''count of child items'''
+        return len(self.childItems)
+
+    def childNumber(self):
+        '''get position in parent tree item'''
+        if self.parentItem != None:
+            return self.parentItem.childItems.index(self)
+        return 0
+
+
+class GroupNode(TreeNode):
+    '''group in tree: [name, key]'''
+
+    NAME, KEY = range(2)
+
+    def keys(self):
+        '''all keys including children'''
+        groups = [self.itemData[GroupNode.KEY]]
+        for item in self.childItems:
+            groups.extend(item.keys())
+        return groups
+
+    def path(self):
+        '''rows from top level to this node'''
+        path, node = [], self
+        while node.parentItem is not None:
+            path.insert(0, node.childNumber())
+            node = node.parentItem
+        return path
+
+    def insertChildren(self, position, count, columns):
+        '''insert children with specified columns at sprcified position
+        :param position: position to insert children
+        :param count: count of inserting items
+        :param columns: count of columns of the inserting item
+        '''
+        # check range
+        if position < 0 or position > len(self.childItems):
+            return False
+
+        for i in range(count):
+            data = [None for v in range(columns)] # None by default
+            self.childItems.insert(position, GroupNode(data, self))
+
+        return True
+
+    def removeChildren(self, position, count):
+        '''remove children from given position'''
+        if position < 0 or position + count > len(self.childItems):
+            return False
+
+        for row in range(count):
+            self.childItems.pop(position)
+
+        return True
+
+    def setData(self, column, value):
+        '''edit data at given column'''
+        if column < 0 or column >= len(self.itemData):
+            return False
+        else:
+            self.itemData[column] = value
+            return True
+
+    def reset(self):
+        '''remove all child items'''
+        self.childItems = []
+
+    def serialize(self):
+        '''store data'''
+        res = self.itemData[:] # copy
+        # ignore default group
+        res.append([child.serialize() for child in self.childItems if child.itemData[GroupNode.KEY]>9])
+
+        return res # key, name, children
+
+
+class GroupTree(Recorder):
+    '''groups tree with default groups ahead of user groups:
+       - root item: header
+       - default item: 1=<key<10
+       - user defined item: key>=10
+    '''
+
+    NAME, KEY = GroupNode.NAME, GroupNode.KEY
+
+    # default groups
+    ALLGROUPS, UNGROUPED, UNREFERENCED, DUPLICATED, TRASH = range(1,6)
+    DEFAULT_GROUPS = [['All Groups', ALLGROUPS, [
+        ['Ungrouped', UNGROUPED, []],
+        ['Unreferenced', UNREFERENCED, []],
+        ['Duplicated', DUPLICATED, []],
+        ['Trash', TRASH, []]
+    ]]]
+
+    def __init__(self, header):
+        '''
+           :param header: header of tree, e.g. ['Group', 'Key']
+        '''
+        super(GroupTree, self).__init__()
+        self.root = GroupNode(header)
+        self.keys = KeyCounter(9)
+        self.resetChanges()
+
+    def setup(self, groups=[]):
+        '''reset tree with default groups and user groups
+           :param groups: children of root, [[name, key, [children]], ...]
+        '''
+        self.keys.reset()
+        self._saveRequired = False
+        self.root.reset()
+        self.resetChanges()
+        self._build(self.DEFAULT_GROUPS, self.root, True)
+        self._build(groups, self.root)
+
+    def _build(self, groups, parent, default=False):
+        '''append nodes of groups to parent,
+           default group (0<key<10) is ignored unless default=True
+        '''
+        for name, key, children in groups:
+            # default group should not exist in user data
+            if not default and 0<key<10:
+                continue
+
+            parent.insertChildren(parent.childCount(), 1, parent.columnCount())
+            self.keys.reserve(key)
+            node = parent.child(parent.childCount()-1)
+            node.setData(self.NAME, name)
+            node.setData(self.KEY, key)
+            self._build(children, node, default)
+
+    def reload(self, groups):
+        '''names of groups changed in groups loaded from database
+           :param groups: children of root, [[name, key, [children]], ...]
+           :return: [(node, new name), ...], or None if groups are inserted, removed or moved
+        '''
+        names = []
+        def collect(children, parent):
+            user_nodes = [node for node in parent.childItems if node.data(self.KEY)>9]
+            if len(user_nodes)!=len(children):
+                return False
+            for node, (name, key, sub_children) in zip(user_nodes, children):
+                if node.data(self.KEY)!=key or not collect(sub_children, node):
+                    return False
+                if node.data(self.NAME)!=name:
+                    names.append((node, name))
+            return True
+
+        return names if collect(groups, self.root) else None
+
+    def find(self, key, parent=None):
+        '''node with specified key, None if not found'''
+        for node in (parent or self.root).childItems:
+            if node.data(self.KEY)==key:
+                return node
+            res = self.find(key, node)
+            if res is not None:
+                return res
+        return None
+
+    @staticmethod
+    def isDefault(node):
+        '''default group: 0<key<10'''
+        key = node.data(GroupTree.KEY)
+        return key is None or 0<key<10
+
+    # --------------------------------------------------------------
+    # editing
+    # --------------------------------------------------------------
+    def insertChildren(self, parent, position, count):
+        '''insert empty groups under parent node'''
+        if not parent.insertChildren(position, count, self.root.columnCount()):
+            return False
+        self._saveRequired = True
+        for node in parent.childItems[position:position+count]:
+            self._dirtyGroups[id(node)] = node
+        self.record('insert', parent.path(), position, count)
+        return True
+
+    def removeChildren(self, parent, position, count):
+        '''remove groups under parent node, with all sub-groups'''
+        keys = [key for node in parent.childItems[position:position+count] for key in node.keys()]
+        if not parent.removeChildren(position, count):
+            return False
+        self._saveRequired = True
+        self._removedKeys.update(keys)
+        self.record('remove', parent.path(), position, count)
+        return True
+
+    def setData(self, node, column, value):
+        '''edit group'''
+        if not node.setData(column, value):
+            return False
+        self._saveRequired = True
+        self._dirtyGroups[id(node)] = node
+        self.record('set', node.path(), column, value)
+        return True
+
+    # --------------------------------------------------------------
+    # saving
+    # --------------------------------------------------------------
+    def resetChanges(self):
+        '''clear groups changed since last saving'''
+        self._dirtyGroups = {} # id(node) -> node
+        self._removedKeys = set()
+
+    def changes(self):
+        '''keys of groups changed since last saving: (inserted or modified keys, removed keys)'''
+        dirty = [node.data(self.KEY) for node in self._dirtyGroups.values()]
+        dirty = [key for key in dirty if key is not None and key not in self._removedKeys]
+        return dirty, list(self._removedKeys)
+
+    def serialize(self, save=True):
+        '''[header..., [children]]'''
+        if save:
+            self._saveRequired = False # saved
+            self.resetChanges()
+        return self.root.serialize()
+
+
+# --------------------------------------------------------------
+# tags and items
+# --------------------------------------------------------------
+class Table(Recorder):
+    '''rows of table: [[...], [...], ...]'''
+
+    def __init__(self, columns):
+        '''
+           :param columns: count of columns
+        '''
+        super(Table, self).__init__()
+        self.columns = columns
+        self.rows = []
+
+        # rows changed since last saving
+        self.resetChanges()
+
+        # increased when rows are inserted, removed or moved,
+        # so that the row positions obtained before could be checked
+        self.version = 0
+
+    def setup(self, rows=[]):
+        self.rows = rows
+        self.resetChanges()
+        self.version += 1
+
+    def load(self, rows):
+        '''append rows loaded from database, which are not changes to be saved'''
+        self.rows.extend(rows)
+        self.version += 1
+
+    def reload(self, rows):
+        '''replace values of rows loaded from database, which are not changes to be saved
+           :param rows: {row position: values}
+        '''
+        for row, values in rows.items():
+            self.rows[row][:] = values # row object is kept, which is identified by storage
+
+    def unload(self, position, count=1):
+        '''remove rows deleted from database, which are not changes to be saved'''
+        del self.rows[position:position+count]
+        self.version += 1
+
+    # --------------------------------------------------------------
+    # editing
+    # --------------------------------------------------------------
+    def value(self, row, col):
+        return self.rows[row][col]
+
+    def updateData(self, row, col, value):
+        '''set value of a cell'''
+        self.rows[row][col] = value
+        self.markDirty(self.rows[row])
+        self.record('set', row, col, value)
+        self._saveRequired = True
+
+    def append(self, rows):
+        '''append rows with values, recorded as one mutation'''
+        for row in rows:
+            self.rows.append(row)
+            self.markDirty(row)
+        self.version += 1
+        self.record('append', rows)
+        self._saveRequired = True
+
+    def update(self, rows):
+        '''update changed cells of rows
+           :param rows: {row position: values}
+        '''
+        for row, values in rows.items():
+            for col, value in enumerate(values):
+                if self.rows[row][col]!=value:
+                    self.updateData(row, col, value)
+
+    def insert(self, position, count=1):
+        '''insert empty rows at given position
+           :return: position where rows are inserted
+        '''
+        position = min(max(position, 0), len(self.rows))
+        for i in range(count):
+            row = [None for col in range(self.columns)]
+            self.rows.insert(position, row)
+            self.markDirty(row)
+        self.version += 1
+        self.record('insert', position, count, self.columns)
+        self._saveRequired = True
+        return position
+
+    def remove(self, position, count=1):
+        '''remove rows at position'''
+        self._discard(self.rows[position:position+count])
+        del self.rows[position:position+count]
+        self.version += 1
+        self.record('remove', position, count)
+        self._saveRequired = True
+
+    def removeMany(self, positions):
+        '''remove rows at positions in one pass, which is linear however they're scattered,
+           and recorded as one mutation
+           :param positions: row positions in any order
+           :return: ranges of removed rows, see rowRanges()
+        '''
+        ranges = rowRanges(positions)
+        if not ranges:
+            return ranges
+        for start, count in ranges:
+            self._discard(self.rows[start:start+count])
+        removeRanges(self.rows, ranges)
+        self.version += 1
+        self.record('removeMany', ranges)
+        self._saveRequired = True
+        return ranges
+
+    def _discard(self, rows):
+        '''removed rows to be deleted from database'''
+        for row in rows:
+            self._dirtyRows.pop(id(row), None)
+            self._removedRows[id(row)] = row
+
+    def move(self, sourceRow, count, destinationChild):
+        '''move rows to the position before row destinationChild'''
+        rows = self.rows[sourceRow:sourceRow+count]
+        dest = self.rows[destinationChild]
+        del self.rows[sourceRow:sourceRow+count]
+
+        dest_row = self.rows.index(dest)
+        self.rows[dest_row:dest_row] = rows
+        self.version += 1
+        self.record('move', sourceRow, count, destinationChild)
+        self._saveRequired = True
+
+    # --------------------------------------------------------------
+    # saving
+    # --------------------------------------------------------------
+    def resetChanges(self):
+        '''clear rows changed since last saving'''
+        # id(row) -> row
+        self._dirtyRows = {}
+        self._removedRows = {}
+
+    def markDirty(self, row):
+        '''mark row data as inserted or modified'''
+        self._dirtyRows[id(row)] = row
+
+    def changes(self):
+        '''rows changed since last saving: (inserted or modified rows, removed rows)'''
+        return list(self._dirtyRows.values()), list(self._removedRows.values())
+
+    def serialize(self, save=True):
+        if save:
+            self._saveRequired = False # saved
+            self.resetChanges()
+        return [row for row in self.rows]
+
+    def snapshot(self):
+        '''copy of serialized rows, which is not affected by editing later'''
+        return [row[:] for row in self.serialize()]
+
+
+class TagTable(Table):
+    '''tags [key, name, color], where the first row is default tag'''
+
+    KEY, NAME, COLOR = range(3)
+    NOTAG = 0
+
+    DEFAULT_TAGS = [[NOTAG, 'Untagged', '#000000']]
+
+    def __init__(self):
+        super(TagTable, self).__init__(3)
+        # key=0 is the default tag, so common tag starts from key=1
+        self.keys = KeyCounter(TagTable.NOTAG)
+        self.rows = self.DEFAULT_TAGS[:]
+
+    def setup(self, tags=[]):
+        '''default tag followed by user tags'''
+        self.keys.reset()
+        self._saveRequired = False
+        rows = self.DEFAULT_TAGS[:] # copy
+        for tag in tags:
+            # ignore default tag from user data
+            if tag[self.KEY]==self.NOTAG:
+                continue
+            self.keys.reserve(tag[self.KEY])
+            rows.append(tag)
+        super(TagTable, self).setup(rows)
+
+    def row(self, key):
+        '''row of tag with specified key, -1 if not found'''
+        for i, (tag_key, *_) in enumerate(self.rows):
+            if tag_key == key:
+                return i
+        return -1
+
+    def reload(self, tags):
+        '''update tags loaded from database
+           :return: (changed rows, appended tags), or None if tags are removed or reordered
+        '''
+        tags = [tag for tag in tags if tag[self.KEY]!=self.NOTAG]
+        rows = self.rows[1:] # the first row is default tag
+        if len(tags)<len(rows) or any(tag[self.KEY]!=row[self.KEY] for tag, row in zip(tags, rows)):
+            return None
+
+        changed = []
+        for i, (tag, row) in enumerate(zip(tags, rows), start=1):
+            if tag!=row:
+                row[:] = tag
+                changed.append(i)
+
+        appended = tags[len(rows):]
+        for tag in appended:
+            self.keys.reserve(tag[self.KEY])
+        return changed, appended
+
+    def changes(self):
+        '''keys of tags changed since last saving: (inserted or modified keys, removed keys)'''
+        dirty, removed = super(TagTable, self).changes()
+        return [tag[self.KEY] for tag in dirty], [tag[self.KEY] for tag in removed]
+
+    def serialize(self, save=True):
+        '''user tags only'''
+        rows = super(TagTable, self).serialize(save)
+        return [row for row in rows if row[self.KEY]>self.NOTAG]
+
+
+class ItemTable(Table):
+    '''items [name, group, [tags], path, date, notes], which might be lazy items
+       loaded from columnar database.
+
+       each item has a unique id stored in database, which is kept when the item is
+       edited, moved or reloaded, so the same item is found without scanning rows:
+       ids[row] is the id of row, and the index id -> row is updated along with rows
+
+       changes of group/tags membership made by editing are published to callable
+       listener(op, *args), so that counters are updated by the changes only:
+         - ('group', uid, old group, new group)
+         - ('tags', uid, [added tags], [removed tags])
+         - ('insert', [(uid, group, [tags]), ...])
+         - ('remove', [(uid, group, [tags]), ...])
+       rows loaded, reloaded or unloaded from database are not published.
+
+       items of each group are indexed by id, i.e. posting lists group -> {id}, which is
+       built when it's used first time and then updated along with any change of group,
+       so items of a group are found without scanning all items, see groupRows().
+    '''
+
+    NAME, GROUP, TAGS, PATH, DATE, NOTES = range(6)
+
+    def __init__(self):
+        super(ItemTable, self).__init__(6)
+        self.ids = []
+        self._index = {} # id -> row position
+        self._stale = None # positions from this row are updated when they're looked up
+        self._listener = None
+        self._groups = None # group -> {id}, None until it's required
+
+    def __getstate__(self):
+        state = super(ItemTable, self).__getstate__()
+        state['_listener'] = None
+        return state
+
+    def setListener(self, listener=None):
+        '''publish changes of group/tags membership with callable listener(op, *args)'''
+        self._listener = listener
+
+    def _publish(self, op, *args):
+        if self._listener:
+            self._listener(op, *args)
+
+    def _members(self, positions):
+        '''(uid, group, tags) of rows at positions'''
+        return [(self.ids[row], self.value(row, self.GROUP), list(self.value(row, self.TAGS) or [])) for row in positions]
+
+    @staticmethod
+    def newId():
+        '''same form as uid of rows in SQLite database'''
+        return uuid.uuid4().hex
+
+    def id(self, row):
+        return self.ids[row]
+
+    def row(self, uid):
+        '''row of item with specified id, -1 if not found'''
+        if self._stale is not None:
+            for i in range(self._stale, len(self.ids)):
+                self._index[self.ids[i]] = i
+            self._stale = None
+        return self._index.get(uid, -1)
+
+    def groupRows(self, groups):
+        '''rows of items in groups in ascending order, found by index without scanning items
+           :param groups: keys of groups, sub-groups are not included
+        '''
+        if self._groups is None:
+            self._groups = {}
+            for uid, group in zip(self.ids, self.values(self.GROUP)):
+                self._groups.setdefault(group, set()).add(uid)
+        rows = []
+        for group in set(groups):
+            rows.extend(self.row(uid) for uid in self._groups.get(group, ()))
+        return sorted(rows)
+
+    def _join(self, positions):
+        '''index rows at positions by their groups'''
+        if self._groups is not None:
+            for row in positions:
+                self._groups.setdefault(self.value(row, self.GROUP), set()).add(self.ids[row])
+
+    def _leave(self, positions):
+        '''drop rows at positions from index, before they're removed or changed'''
+        if self._groups is not None:
+            for row in positions:
+                members = self._groups.get(self.value(row, self.GROUP))
+                if members:
+                    members.discard(self.ids[row])
+
+    def _appendIds(self, count, ids=None):
+        '''ids of rows appended to the end: given ids are kept unless missing or taken
+           already, e.g. the same database is mounted twice
+           :return: ids of appended rows
+        '''
+        position = len(self.ids)
+        for i in range(count):
+            uid = ids[i] if ids and i<len(ids) else None
+            if not uid or uid in self._index:
+                uid = self.newId()
+            self.ids.append(uid)
+            self._index[uid] = position + i
+        return self.ids[position:]
+
+    def _reindex(self, start=0):
+        '''positions of rows from start are changed, which are updated in the next lookup,
+           so rows removed or moved in a batch of operations are reindexed once
+        '''
+        if start<len(self.ids):
+            self._stale = start if self._stale is None else min(self._stale, start)
+
+    def _removeIds(self, position, count):
+        for uid in self.ids[position:position+count]:
+            del self._index[uid]
+        del self.ids[position:position+count]
+        self._reindex(position)
+
+    def setup(self, rows=[], ids=None):
+        '''
+           :param ids: ids of rows loaded from database, new ids are taken if None
+        '''
+        super(ItemTable, self).setup(rows)
+        self.ids, self._index, self._stale = [], {}, None
+        self._groups = None
+        self._appendIds(len(rows), ids)
+
+    def load(self, rows, ids=None):
+        position = len(self.ids)
+        super(ItemTable, self).load(rows)
+        self._appendIds(len(rows), ids)
+        self._join(range(position, len(self.ids)))
+
+    def reload(self, rows):
+        self._leave(rows)
+        super(ItemTable, self).reload(rows)
+        self._join(rows)
+
+    def unload(self, position, count=1):
+        self._leave(range(position, position+count))
+        super(ItemTable, self).unload(position, count)
+        self._removeIds(position, count)
+
+    def updateData(self, row, col, value):
+        if col==self.GROUP:
+            old = self.value(row, col)
+            self._leave([row])
+            super(ItemTable, self).updateData(row, col, value)
+            self._join([row])
+            if old!=value:
+                self._publish('group', self.ids[row], old, value)
+
+        elif col==self.TAGS and self._listener:
+            old = self.value(row, col)
+            super(ItemTable, self).updateData(row, col, value)
+            old, value = old or [], value or []
+            added, removed = [tag for tag in value if tag not in old], [tag for tag in old if tag not in value]
+            if added or removed:
+                self._publish('tags', self.ids[row], added, removed)
+
+        else:
+            super(ItemTable, self).updateData(row, col, value)
+
+    def append(self, rows, ids=None):
+        '''ids of new rows are recorded also, so they're same when recovered'''
+        position = len(self.ids)
+        super(ItemTable, self).append(rows)
+        self.record('ids', position, self._appendIds(len(rows), ids))
+        self._join(range(position, len(self.ids)))
+        if self._listener and rows:
+            self._publish('insert', self._members(range(position, len(self.ids))))
+
+    def insert(self, position, count=1):
+        position = super(ItemTable, self).insert(position, count)
+        ids = [self.newId() for i in range(count)]
+        self.ids[position:position] = ids
+        self._index.update((uid, position) for uid in ids)
+        self._reindex(position)
+        if self._groups is not None:
+            self._groups.setdefault(None, set()).update(ids)
+        self.record('ids', position, ids)
+        if self._listener:
+            self._publish('insert', [(uid, None, []) for uid in ids])
+        return position
+
+    def remove(self, position, count=1):
+        members = self._members(range(position, position+count)) if self._listener else None
+        self._leave(range(position, position+count))
+        super(ItemTable, self).remove(position, count)
+        self._removeIds(position, count)
+        if members:
+            self._publish('remove', members)
+
+    def removeMany(self, positions):
+        positions = sorted(set(positions))
+        if self._listener:
+            members = self._members(positions)
+        self._leave(positions)
+        ranges = super(ItemTable, self).removeMany(positions)
+        if ranges:
+            for start, count in ranges:
+                for uid in self.ids[start:start+count]:
+                    del self._index[uid]
+            removeRanges(self.ids, ranges)
+            self._reindex(ranges[0][0])
+            if self._listener:
+                self._publish('remove', members)
+        return ranges
+
+    def move(self, sourceRow, count, destinationChild):
+        super(ItemTable, self).move(sourceRow, count, destinationChild)
+        moveIds(self.ids, sourceRow, count, destinationChild)
+        self._reindex(min(sourceRow, destinationChild))
+
+    def value(self, row, col):
+        '''read single value directly, so that lazy loaded row needn't to be decoded entirely'''
+        if isinstance(self.rows, LazyItems):
+            return self.rows.value(row, col)
+        return self.rows[row][col]
+
+    def values(self, col):
+        '''values of specified column for all items'''
+        if isinstance(self.rows, LazyItems):
+            return self.rows.column(col)
+        return [row[col] for row in self.rows]
+
+    def snapshot(self):
+        '''tags list is copied also since it's edited in place'''
+        return [[name, group, tags[:] if tags else tags, path, date, notes]
+                    for name, group, tags, path, date, notes in self.serialize()]
+
+    def checkDuplicated(self):
+        '''groups to change so that duplicated items are in group DUPLICATED:
+           - items with same name and source path are duplicated
+           - items in TRASH group needn't to be considered
+           - items in DUPLICATED group already should also be checked, since the duplicated
+             one may be removed to TRASH manually, so they're taken as UNGROUPED first
+           :return: [(row, group), ...]
+        '''
+        groups = self.values(self.GROUP)
+        keys = list(zip(self.values(self.NAME), self.values(self.PATH)))
+
+        # count of items with same name and path, except the ones in TRASH
+        counts = {}
+        for group, key in zip(groups, keys):
+            if group!=GroupTree.TRASH:
+                counts[key] = counts.get(key, 0) + 1
+
+        changes = []
+        for row, (group, key) in enumerate(zip(groups, keys)):
+            if group==GroupTree.TRASH:
+                continue
+            new_group = GroupTree.DUPLICATED if counts[key]>1 else \
+                (GroupTree.UNGROUPED if group==GroupTree.DUPLICATED else group)
+            if new_group!=group:
+                changes.append((row, new_group))
+        return changes
+
+    def checkReferences(self, paths, invalid):
+        '''groups to change according to status of source path:
+           - if path is invalid but group is not (UNREFERENCED or TRASH), move group to UNREFERENCED
+           - if path is valid but group is UNREFERENCED, move group to UNGROUPED
+           :param paths: source path of each item when it's checked
+           :param invalid: whether each path is invalid, see checkPaths()
+           :return: [(row, group), ...]
+        '''
+        groups, current_paths = self.values(self.GROUP), self.values(self.PATH)
+        changes = []
+        for i, (group, path, checked_path, path_invalid) in enumerate(zip(groups, current_paths, paths, invalid)):
+
+            # path is edited after checked
+            if path!=checked_path:
+                continue
+
+            if path_invalid:
+                if group not in (GroupTree.UNREFERENCED, GroupTree.TRASH):
+                    changes.append((i, GroupTree.UNREFERENCED))
+
+            elif group==GroupTree.UNREFERENCED:
+                changes.append((i, GroupTree.UNGROUPED))
+
+        return changes
+
+
+def rowRanges(rows):
+    '''contiguous ranges of distinct rows: [(start, count), ...] in ascending order'''
+    ranges = []
+    for row in sorted(set(rows)):
+        if ranges and ranges[-1][0]+ranges[-1][1]==row:
+            ranges[-1][1] += 1
+        else:
+            ranges.append([row, 1])
+    return [tuple(r) for r in ranges]
+
+
+def removeRanges(values, ranges):
+    '''remove ranges of values in place in one pass: the kept ones are moved forward
+       with list methods, so that lazy items are not decoded
+       :param ranges: [(start, count), ...] in ascending order, see rowRanges()
+    '''
+    if not ranges:
+        return
+    if isinstance(values, LazyItems):
+        values.discardRanges(ranges)
+    write = ranges[0][0]
+    ends = [start for start, count in ranges[1:]] + [len(values)]
+    for (start, count), end in zip(ranges, ends):
+        kept = list.__getitem__(values, slice(start+count, end))
+        list.__setitem__(values, slice(write, write+len(kept)), kept)
+        write += len(kept)
+    list.__delitem__(values, slice(write, None))
+
+
+def moveIds(ids, sourceRow, count, destinationChild):
+    '''move ids in place as rows are moved by Table.move()'''
+    moved = ids[sourceRow:sourceRow+count]
+    del ids[sourceRow:sourceRow+count]
+    position = destinationChild-count if destinationChild>sourceRow else destinationChild
+    ids[position:position] = moved
+
+
+def checkPaths(paths, interrupted=None):
+    '''whether each source path is invalid, i.e. not empty and not exists. it's a plain
+       function of picklable arguments, so it could be run in worker process
+       :param interrupted: callable returning True to stop checking, then the checked ones are returned
+    '''
+    invalid = []
+    for path in paths:
+        if interrupted and interrupted():
+            break
+        invalid.append(bool(path) and not os.path.exists(path))
+    return invalid
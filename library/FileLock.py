@@ -0,0 +1,59 @@
+# advisory lock of database:
+# the instance holding the lock writes the database, while the other instances
+# open it read-only. the lock is released when the lock file is closed, e.g. the
+# instance exits unexpectedly.
+#
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock(object):
+    '''exclusive lock on database.lock'''
+
+    def __init__(self, database):
+        self.database = database
+        self.filename = '{0}.lock'.format(database)
+        self._file = None
+
+    def locked(self):
+        '''whether the lock is held by this instance'''
+        return self._file is not None
+
+    def acquire(self):
+        '''try to lock without blocking
+           :return: False if it's locked by another instance
+        '''
+        if self._file is not None:
+            return True
+
+        f = open(self.filename, 'a+b')
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            f.close()
+            return False
+
+        self._file = f
+        return True
+
+    def release(self):
+        '''unlock, the lock file is kept since another instance might be waiting for it'''
+        f, self._file = self._file, None
+        if f is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            f.close()
@@ -0,0 +1,330 @@
+# versioned snapshots of a database:
+# each saving writes a snapshot to the history store of the database, where groups,
+# tags and items are serialized to lines and split into content-addressed chunks.
+# a chunk ends at a line decided by its content rather than position, so consecutive
+# snapshots share the chunks not edited, and two snapshots are compared by the
+# different chunks only.
+# lines of items are kept in memory after committing, so that the next snapshot of
+# the same store serializes and hashes only the items saved since then.
+#
+# store structure:
+#   database.history/
+#     objects/ab/cdef...    zlib compressed chunk, named by hash of its lines
+#     snapshots/<id>.json   manifest: {'id', 'time', 'meta', 'counts', 'groups', 'tags', 'items', 'ids'},
+#                           groups/tags/items/ids are lists of chunk hash
+#
+# serialized lines (JSON):
+#   - group: [name, key, parent key], in depth-first order
+#   - tag  : [key, name, color]
+#   - item : [name, group, [tags], path, date, notes]
+#   - id   : stable id of item in the same order, so items keep their ids when
+#            the snapshot is opened or restored
+#
+
+import os
+import json
+import time
+import zlib
+import hashlib
+
+from .Storage import Storage
+
+
+class History(object):
+    '''snapshots store of a database'''
+
+    KEYS = (Storage.KEY_GROUP, Storage.KEY_TAG, Storage.KEY_ITEM)
+
+    # lines in chunk: a chunk ends at line with crc32 & MASK==0, i.e. 512 lines on average
+    MIN_LINES = 32
+    MAX_LINES = 4096
+    MASK = 0x1FF
+
+    MAX_SNAPSHOTS = 50 # older snapshots are pruned
+
+    def __init__(self, database):
+        self.database = database
+        self.path = '{0}.history'.format(database)
+        self._objects = os.path.join(self.path, 'objects')
+        self._snapshots = os.path.join(self.path, 'snapshots')
+
+        # items of the latest snapshot committed by this object:
+        # (snapshot id, {id(origin row): (line, boundary)}, {ids of lines in chunk: hash}, ids, ids chunks)
+        self._cache = None
+
+    def exists(self):
+        return os.path.isdir(self._snapshots)
+
+    # --------------------------------------------------------------
+    # snapshots
+    # --------------------------------------------------------------
+    def snapshots(self):
+        '''manifests of all snapshots without chunk lists, oldest first:
+           [{'id', 'time', 'counts'}, ...]
+        '''
+        res = []
+        for snapshot in self._ids():
+            try:
+                manifest = self.manifest(snapshot)
+            except (OSError, ValueError):
+                continue
+            res.append({key: manifest[key] for key in ('id', 'time', 'counts')})
+        return res
+
+    def latest(self):
+        '''id of the latest snapshot, None if no snapshots'''
+        ids = self._ids()
+        return ids[-1] if ids else None
+
+    def manifest(self, snapshot):
+        with open(self._manifestFile(snapshot), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def commit(self, data, origins=None, changes=None):
+        '''write snapshot of project data, see Storage.load() for the structure
+           :param origins, changes: model rows which items are copied from, and rows changed
+                since last saving, see Storage.save(). items not changed since the snapshot
+                committed last time by this object are not serialized again.
+           :return: id of the new snapshot, or None if nothing is changed since the latest one
+        '''
+        groups = data.get(Storage.KEY_GROUP, [None, None, []])
+        items = data.get(Storage.KEY_ITEM, [])
+        lines = {
+            Storage.KEY_GROUP: self._groupLines(groups),
+            Storage.KEY_TAG  : self._lines(data.get(Storage.KEY_TAG, []))
+        }
+        chunks = {key: [self._writeChunk(chunk) for chunk in self._split(lines[key])] for key in lines}
+
+        # cache is valid if the latest snapshot is written by this object
+        cache = self._cache if self._cache and origins is not None and changes is not None and \
+                    self._cache[0]==self.latest() else None
+        self._cache = None # kept only if this snapshot is committed
+        dirty = {id(row) for row in changes[Storage.KEY_ITEM][0]} if cache else None
+        rows, item_chunks = self._itemChunks(items, origins, cache, dirty)
+        chunks[Storage.KEY_ITEM] = list(item_chunks.values())
+
+        ids = data.get(Storage.KEY_ID)
+        ids_chunks = None
+        if ids and len(ids)==len(items):
+            ids_chunks = cache[4] if cache and cache[3]==ids else \
+                [self._writeChunk(chunk) for chunk in self._split(self._lines(ids))]
+            chunks[Storage.KEY_ID] = ids_chunks
+        meta = {
+            Storage.APP_NAME   : data.get(Storage.APP_NAME),
+            'root'             : groups[:2],
+            Storage.KEY_SETTING: data.get(Storage.KEY_SETTING, {})
+        }
+
+        # unchanged, e.g. autosave without editing
+        latest = self.latest()
+        if latest:
+            try:
+                manifest = self.manifest(latest)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get('meta')==meta and all(manifest.get(key)==chunks.get(key) for key in self.KEYS+(Storage.KEY_ID,)):
+                self._cache = (latest, rows, item_chunks, ids and ids[:], ids_chunks) if origins is not None else None
+                return None
+
+        now = time.time()
+        snapshot = '{0}-{1:06d}'.format(time.strftime('%Y%m%d-%H%M%S', time.localtime(now)), int(now%1*1e6))
+        manifest = {
+            'id'    : snapshot,
+            'time'  : now,
+            'meta'  : meta,
+            'counts': {
+                Storage.KEY_GROUP: len(lines[Storage.KEY_GROUP]),
+                Storage.KEY_TAG  : len(lines[Storage.KEY_TAG]),
+                Storage.KEY_ITEM : len(items)
+            }
+        }
+        manifest.update(chunks)
+
+        os.makedirs(self._snapshots, exist_ok=True)
+        self._writeFile(self._manifestFile(snapshot), json.dumps(manifest).encode('utf-8'))
+        self._cache = (snapshot, rows, item_chunks, ids and ids[:], ids_chunks) if origins is not None else None
+        return snapshot
+
+    def _itemChunks(self, items, origins, cache, dirty):
+        '''split lines of items into chunks and store them
+           :param cache: items of the latest snapshot, see __init__(), None to serialize all items
+           :param dirty: ids of origin rows changed since the latest snapshot
+           :return: ({id(origin row): (line, boundary)}, {ids of lines in chunk: chunk hash})
+        '''
+        old_rows, old_chunks = (cache[1], cache[2]) if cache else ({}, {})
+        rows, chunks = {}, {}
+
+        chunk = []
+        def close():
+            # lines of old rows are alive until here, so ids of lines identify chunks
+            key = tuple(id(line) for line in chunk)
+            chunks[key] = old_chunks.get(key) or self._writeChunk(chunk)
+            chunk.clear()
+
+        for i, item in enumerate(items):
+            origin = id(origins[i]) if origins is not None else i
+            entry = None if cache is None or origin in dirty else old_rows.get(origin)
+            if entry is None:
+                line = self._lines([item])[0]
+                entry = (line, not zlib.crc32(line) & self.MASK)
+            rows[origin] = entry
+            chunk.append(entry[0])
+            if len(chunk)>=self.MAX_LINES or (len(chunk)>=self.MIN_LINES and entry[1]):
+                close()
+        if chunk:
+            close()
+        return rows, chunks
+
+    def reset(self):
+        '''forget items of the latest snapshot, e.g. rows are reloaded out of saving'''
+        self._cache = None
+
+    def load(self, snapshot):
+        '''project data of specified snapshot, with same structure as Storage.load()'''
+        manifest = self.manifest(snapshot)
+        meta = manifest['meta']
+        groups, tags, items = [[json.loads(line) for line in self._readLines(manifest[key])] for key in self.KEYS]
+        data = {
+            Storage.APP_NAME   : meta[Storage.APP_NAME],
+            Storage.KEY_GROUP  : meta['root'] + [self._groupTree(groups)],
+            Storage.KEY_TAG    : tags,
+            Storage.KEY_ITEM   : items,
+            Storage.KEY_SETTING: meta[Storage.KEY_SETTING]
+        }
+
+        # ids are not stored by snapshots written before, so new ids are taken then
+        if manifest.get(Storage.KEY_ID):
+            data[Storage.KEY_ID] = [json.loads(line) for line in self._readLines(manifest[Storage.KEY_ID])]
+        return data
+
+    def diff(self, snapshot, other):
+        '''changes from snapshot to other: {key: (added, removed)} for groups, tags and items,
+           where added/removed are lists of serialized rows, see module notes.
+           a modified row is removed and then added, and chunks shared by both snapshots
+           are not read at all.
+        '''
+        manifests = self.manifest(snapshot), self.manifest(other)
+        res = {}
+        for key in self.KEYS:
+            old, new = manifests[0][key], manifests[1][key]
+            old_set, new_set = set(old), set(new)
+            old_lines = self._count(self._readLines(c for c in old if c not in new_set))
+            new_lines = self._count(self._readLines(c for c in new if c not in old_set))
+            added = [json.loads(line) for line, n in new_lines.items() for _ in range(n-old_lines.get(line, 0))]
+            removed = [json.loads(line) for line, n in old_lines.items() for _ in range(n-new_lines.get(line, 0))]
+            res[key] = (added, removed)
+        return res
+
+    def remove(self, snapshot):
+        '''remove manifest of snapshot, the chunks are removed by prune()'''
+        os.remove(self._manifestFile(snapshot))
+
+    def prune(self, keep=None):
+        '''remove snapshots except the latest ones, then chunks not referenced any more
+           :param keep: count of snapshots to keep, MAX_SNAPSHOTS by default
+        '''
+        keep = self.MAX_SNAPSHOTS if keep is None else keep
+        ids = self._ids()
+        if len(ids)<=keep:
+            return
+        for snapshot in ids[:len(ids)-keep]:
+            self.remove(snapshot)
+
+        # chunks referenced by the rest snapshots
+        referenced = set()
+        for snapshot in ids[len(ids)-keep:]:
+            manifest = self.manifest(snapshot)
+            for key in self.KEYS:
+                referenced.update(manifest[key])
+            referenced.update(manifest.get(Storage.KEY_ID, []))
+
+        for folder in (os.listdir(self._objects) if os.path.isdir(self._objects) else []):
+            for name in os.listdir(os.path.join(self._objects, folder)):
+                if folder+name not in referenced:
+                    os.remove(os.path.join(self._objects, folder, name))
+
+    # --------------------------------------------------------------
+    # serializing
+    # --------------------------------------------------------------
+    @staticmethod
+    def _lines(rows):
+        return [json.dumps(row, ensure_ascii=False, separators=(',', ':')).encode('utf-8') for row in rows]
+
+    @classmethod
+    def _groupLines(cls, groups):
+        '''groups tree [name, key, children] -> lines [name, key, parent key]'''
+        rows = []
+        def walk(children, parent):
+            for name, key, sub_children in children:
+                rows.append([name, key, parent])
+                walk(sub_children, key)
+        walk(groups[2], None)
+        return cls._lines(rows)
+
+    @staticmethod
+    def _groupTree(rows):
+        '''rows [name, key, parent key] in depth-first order -> children of root'''
+        nodes, children = {}, []
+        for name, key, parent in rows:
+            nodes[key] = [name, key, []]
+            (nodes[parent][2] if parent in nodes else children).append(nodes[key])
+        return children
+
+    @staticmethod
+    def _count(lines):
+        counts = {}
+        for line in lines:
+            counts[line] = counts.get(line, 0) + 1
+        return counts
+
+    # --------------------------------------------------------------
+    # chunks
+    # --------------------------------------------------------------
+    @classmethod
+    def _split(cls, lines):
+        '''split lines into chunks at content defined boundaries'''
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk)>=cls.MAX_LINES or (len(chunk)>=cls.MIN_LINES and not zlib.crc32(line) & cls.MASK):
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _objectFile(self, key):
+        return os.path.join(self._objects, key[:2], key[2:])
+
+    def _writeChunk(self, lines):
+        '''store chunk if not exists, return its hash'''
+        buf = b'\n'.join(lines)
+        key = hashlib.blake2b(buf, digest_size=20).hexdigest()
+        filename = self._objectFile(key)
+        if not os.path.exists(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            self._writeFile(filename, zlib.compress(buf))
+        return key
+
+    def _readLines(self, keys):
+        for key in keys:
+            with open(self._objectFile(key), 'rb') as f:
+                yield from zlib.decompress(f.read()).split(b'\n')
+
+    # --------------------------------------------------------------
+    # files
+    # --------------------------------------------------------------
+    def _ids(self):
+        if not self.exists():
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(self._snapshots) if name.endswith('.json'))
+
+    def _manifestFile(self, snapshot):
+        return os.path.join(self._snapshots, '{0}.json'.format(snapshot))
+
+    @staticmethod
+    def _writeFile(filename, buf):
+        '''write to a temporary file first, so partial file is never left'''
+        tmp_filename = '{0}.tmp'.format(filename)
+        with open(tmp_filename, 'wb') as f:
+            f.write(buf)
+        os.replace(tmp_filename, filename)
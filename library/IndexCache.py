@@ -0,0 +1,106 @@
+# sidecar cache of indexes derived from items:
+# count of items in each group/tag and items with invalid source path, so that
+# they're loaded directly rather than computed item by item when an unchanged
+# database is opened again. source paths are not covered by the fingerprint,
+# so the cached status is only shown until they're checked again in background.
+#
+
+import os
+import json
+import hashlib
+
+
+class IndexCache(object):
+    '''database.cache: indexes of database with specified content fingerprint'''
+
+    VERSION = 1
+    BLOCK_SIZE = 1024*1024
+
+    # columns of item
+    GROUP, TAGS = 1, 2
+
+    def __init__(self, database):
+        self.filename = '{0}.cache'.format(database)
+        self.database = database
+
+    def fingerprint(self, storage=None):
+        '''key of database content: size and modified time of file, with content version
+           reported by storage, see Storage.contentVersion(), so the file is not read.
+           the whole content is hashed only if version is not supported.
+        '''
+        version = None
+        if storage is not None:
+            try:
+                version = storage.contentVersion()
+            except (OSError, ValueError):
+                pass
+        if version is None:
+            return self._hash()
+        stat = os.stat(self.database)
+        return '{0}:{1}:{2}'.format(stat.st_size, stat.st_mtime_ns, version)
+
+    def _hash(self):
+        '''hash of database content'''
+        h = hashlib.blake2b(digest_size=20)
+        with open(self.database, 'rb') as f:
+            for block in iter(lambda: f.read(self.BLOCK_SIZE), b''):
+                h.update(block)
+        return h.hexdigest()
+
+    def load(self, fingerprint):
+        '''indexes stored for database with specified fingerprint, None if not matched:
+           {'groups': {key: count}, 'tags': {key: count}, 'invalid': [row, ...]}
+        '''
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if cache.get('version')!=self.VERSION or cache.get('fingerprint')!=fingerprint:
+            return None
+
+        return {
+            'groups' : {key: count for key, count in cache['groups']},
+            'tags'   : {key: count for key, count in cache['tags']},
+            'invalid': cache['invalid']
+        }
+
+    def save(self, fingerprint, indexes):
+        '''store indexes for database with specified fingerprint, see load()'''
+        cache = {
+            'version'    : self.VERSION,
+            'fingerprint': fingerprint,
+            'groups'     : list(indexes['groups'].items()),
+            'tags'       : list(indexes['tags'].items()),
+            'invalid'    : indexes['invalid']
+        }
+        tmp_filename = '{0}.tmp'.format(self.filename)
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_filename, self.filename)
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+
+def countGroups(items):
+    '''count of items in each group: {key: count}'''
+    # group column is decoded only for lazy items
+    groups = items.column(IndexCache.GROUP) if hasattr(items, 'column') else (item[IndexCache.GROUP] for item in items)
+    counts = {}
+    for group in groups:
+        counts[group] = counts.get(group, 0) + 1
+    return counts
+
+
+def countTags(items):
+    '''count of items attached with each tag: {key: count}'''
+    # tags column is decoded only for lazy items
+    tags = items.column(IndexCache.TAGS) if hasattr(items, 'column') else (item[IndexCache.TAGS] for item in items)
+    counts = {}
+    for keys in tags:
+        for tag in set(keys or []):
+            counts[tag] = counts.get(tag, 0) + 1
+    return counts
@@ -0,0 +1,201 @@
+# referential integrity of project data:
+#   - orphan group: item in a group which doesn't exist
+#   - orphan tag  : item attached with a tag which doesn't exist
+#   - duplicated group/tag key
+#   - key counter lower than the largest key in use, so a new group/tag would
+#     take the key referenced by items already
+# items are checked one by one in a single pass with set lookups, so that they
+# are streamed from database, and repaired in batches at the same time:
+#   - orphan group -> ungrouped
+#   - orphan tags are removed
+#   - duplicated key is replaced with a new key, items keep the first one
+#   - key counter is raised to the largest key in use
+#
+
+from itertools import chain
+
+from .Storage import Storage, openStorage
+from .FileLock import FileLock
+
+
+class Integrity(object):
+    '''check and repair integrity of groups, tags and items'''
+
+    # columns of item
+    GROUP, TAGS = 1, 2
+
+    NOTAG = 0
+    UNGROUPED = 2
+    DEFAULT_GROUPS = range(1, 10) # keys of default groups
+
+    def __init__(self, groups, tags, counters=None):
+        '''
+           :param groups: children of root group, [[name, key, children], ...]
+           :param tags: [[key, name, color], ...]
+           :param counters: current key of groups and tags, e.g. {'groups': 20, 'tags': 10},
+                    the largest defined keys by default, as the models are initialized
+        '''
+        self.groups = groups
+        self.tags = tags
+
+        # keys defined
+        self.groupKeys, self.duplicatedGroups = set(), []
+        def walk(children):
+            for name, key, sub_children in children:
+                if key in self.groupKeys:
+                    self.duplicatedGroups.append(key)
+                self.groupKeys.add(key)
+                walk(sub_children)
+        walk(groups)
+
+        self.tagKeys, self.duplicatedTags = {self.NOTAG}, []
+        for key, *_ in tags:
+            if key in self.tagKeys and key!=self.NOTAG:
+                self.duplicatedTags.append(key)
+            self.tagKeys.add(key)
+
+        counters = counters or {}
+        self.groupCounter = counters.get('groups', max(self.groupKeys, default=9))
+        self.tagCounter = counters.get('tags', max(self.tagKeys))
+
+        # issues found in items: row -> orphan key/keys
+        self.orphanGroups = {}
+        self.orphanTags = {}
+
+        # largest keys in use, including the ones referenced by items
+        self.largestGroup = max(self.groupKeys, default=9)
+        self.largestTag = max(self.tagKeys)
+
+    def check(self, items, repair=False):
+        '''check items one by one
+           :param items: iterable of items, e.g. rows streamed from database
+           :param repair: yield repaired items if True, otherwise yield nothing
+           :return: generator of (row, repaired item) for items to repair
+        '''
+        for row, item in enumerate(items):
+            item = self.checkItem(row, item, repair)
+            if item is not None:
+                yield row, item
+
+    def checkItem(self, row, item, repair=False):
+        '''check an item identified by row, e.g. position or key of row in database
+           :return: repaired item if repair is True and issues are found, otherwise None
+        '''
+        group, tags = item[self.GROUP], item[self.TAGS] or []
+
+        # referenced keys
+        if group is not None and group>self.largestGroup:
+            self.largestGroup = group
+        for tag in tags:
+            if tag>self.largestTag:
+                self.largestTag = tag
+
+        orphan_group = group is not None and group not in self.groupKeys and group not in self.DEFAULT_GROUPS
+        orphan_tags = [tag for tag in tags if tag not in self.tagKeys]
+        if orphan_group:
+            self.orphanGroups[row] = group
+        if orphan_tags:
+            self.orphanTags[row] = orphan_tags
+
+        if not repair or not (orphan_group or orphan_tags):
+            return None
+        item = list(item)
+        if orphan_group:
+            item[self.GROUP] = self.UNGROUPED
+        if orphan_tags:
+            item[self.TAGS] = [tag for tag in tags if tag in self.tagKeys] or [self.NOTAG]
+        return item
+
+    def report(self):
+        '''issues found so far: {name: issue}, empty if nothing is wrong'''
+        res = {}
+        if self.orphanGroups:
+            res['orphan groups'] = self.orphanGroups
+        if self.orphanTags:
+            res['orphan tags'] = self.orphanTags
+        if self.duplicatedGroups:
+            res['duplicated groups'] = self.duplicatedGroups
+        if self.duplicatedTags:
+            res['duplicated tags'] = self.duplicatedTags
+        if self.groupCounter<self.largestGroup:
+            res['group counter'] = (self.groupCounter, self.largestGroup)
+        if self.tagCounter<self.largestTag:
+            res['tag counter'] = (self.tagCounter, self.largestTag)
+        return res
+
+    def repairGroups(self):
+        '''groups tree with duplicated keys replaced by new keys'''
+        seen = set()
+        def walk(children):
+            res = []
+            for name, key, sub_children in children:
+                if key in seen:
+                    key = self.nextGroupKey()
+                seen.add(key)
+                res.append([name, key, walk(sub_children)])
+            return res
+        return walk(self.groups)
+
+    def repairTags(self):
+        '''tags with duplicated keys replaced by new keys'''
+        seen, res = set(), []
+        for tag in self.tags:
+            tag = list(tag)
+            if tag[0] in seen:
+                tag[0] = self.nextTagKey()
+            seen.add(tag[0])
+            res.append(tag)
+        return res
+
+    def nextGroupKey(self):
+        '''new key after all keys in use'''
+        self.largestGroup += 1
+        self.groupCounter = self.largestGroup
+        return self.largestGroup
+
+    def nextTagKey(self):
+        self.largestTag += 1
+        self.tagCounter = self.largestTag
+        return self.largestTag
+
+
+def checkDatabase(filename, repair=False):
+    '''check integrity of database, and write the repaired rows if required
+       :return: issues found, see Integrity.report(), where items are identified by keys
+                of rows in database, see Storage.iterItems()
+    '''
+    # database opened by Tagit is repaired there
+    lock = FileLock(filename)
+    if repair and not lock.acquire():
+        raise OSError('Database is opened by another instance: {0}'.format(filename))
+
+    storage = openStorage(filename)
+    try:
+        data = storage.loadHeader()
+        if Storage.APP_NAME not in data:
+            raise ValueError('Invalid database: {0}'.format(filename))
+        groups = data[Storage.KEY_GROUP]
+        integrity = Integrity(groups[2], data[Storage.KEY_TAG])
+
+        # items are streamed from database, and the repaired ones are written in the meantime.
+        # they're identified by keys of storage rows, see Storage.iterItems()
+        def repaired():
+            for key, item in storage.iterItems():
+                item = integrity.checkItem(key, item, repair)
+                if item is not None:
+                    yield key, item
+
+        items = repaired()
+        first = next(items, None) # all items are checked if nothing is to be repaired
+        if first is not None:
+            storage.update(chain([first], items))
+
+        # keys are renumbered after all items are checked, so that items keep the first keys
+        report = integrity.report()
+        if repair and (integrity.duplicatedGroups or integrity.duplicatedTags):
+            storage.update(groups=groups[:2]+[integrity.repairGroups()] if integrity.duplicatedGroups else None,
+                           tags=integrity.repairTags() if integrity.duplicatedTags else None)
+        return report
+    finally:
+        storage.close()
+        lock.release()
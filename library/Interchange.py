@@ -0,0 +1,292 @@
+# interchange files: JSON Lines and CSV written/read row by row, so that they're
+# produced or consumed by other tools incrementally.
+# groups and tags are referenced by name rather than key, which is valid within
+# a database only:
+#   - group: path of names from top level group, e.g. ['Papers', 'Physics'].
+#            default groups are '*Unreferenced', '*Duplicated' and '*Trash',
+#            while an ungrouped item has an empty path
+#   - tags : names of tags
+#
+# records of each row:
+#   - JSON Lines: {"type": "group", "name": name, "parent": [names]}
+#                 {"type": "tag", "name": name, "color": color}
+#                 {"type": "item", "name": name, "group": [names], "tags": [names],
+#                  "path": path, "date": date, "notes": notes}
+#   - CSV: columns type, name, group, tags, path, date, notes, color, where names
+#          of group path and tags are JSON arrays, e.g. ["Papers", "Physics"], so
+#          names containing any separator are kept. group of group row is its
+#          parent. names joined with '/' and ';' are accepted also when reading,
+#          e.g. written by other tools.
+# the whole file is checked before importing, so nothing is imported from an
+# invalid file.
+#
+
+import os
+import csv
+import json
+
+
+class Interchange(object):
+    '''common definitions of exporter and importer'''
+
+    JSONL, CSV = '.jsonl', '.csv'
+    FORMATS = (JSONL, CSV)
+
+    GROUP, TAG, ITEM = 'group', 'tag', 'item'
+    COLUMNS = ('type', 'name', 'group', 'tags', 'path', 'date', 'notes', 'color')
+    GROUP_SEP, TAG_SEP = '/', ';'
+
+    # default groups: key -> name
+    UNGROUPED = 2
+    DEFAULT_GROUPS = {3: '*Unreferenced', 4: '*Duplicated', 5: '*Trash'}
+    NOTAG = 0
+
+    # columns of item
+    NAME, GROUP_KEY, TAGS, PATH, DATE, NOTES = range(6)
+
+    @classmethod
+    def format(cls, filename):
+        '''file format by extension'''
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in cls.FORMATS:
+            raise ValueError('Unsupported file format: {0}'.format(filename))
+        return ext
+
+    @staticmethod
+    def userGroups(groups):
+        '''groups without default ones, i.e. 0<key<10, which are referenced by name above'''
+        for name, key, children in groups:
+            if not 0<key<10:
+                yield name, key, children
+
+
+class Exporter(Interchange):
+    '''write groups, tags and items to file row by row'''
+
+    def __init__(self, groups, tags):
+        '''
+           :param groups: children of root group, [[name, key, children], ...]
+           :param tags: [[key, name, color], ...]
+        '''
+        self.groups = groups
+        self.tags = tags
+
+        # key -> path of names
+        self._groupPaths = {key: [name] for key, name in self.DEFAULT_GROUPS.items()}
+        def walk(children, path):
+            for name, key, sub_children in self.userGroups(children):
+                self._groupPaths[key] = path + [name]
+                walk(sub_children, path + [name])
+        walk(groups, [])
+        self._tagNames = {key: name for key, name, _ in tags}
+
+    def export(self, filename, items):
+        '''write to JSON Lines or CSV file by extension of filename
+           :param items: iterable of items, e.g. a generator reading database
+           :return: count of items
+        '''
+        fmt = self.format(filename)
+        count = 0
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            write = self._jsonWriter(f) if fmt==self.JSONL else self._csvWriter(f)
+            for record in self.records(items):
+                write(record)
+                count += record['type']==self.ITEM
+        return count
+
+    def records(self, items):
+        '''records of groups, tags and then items'''
+        def walk(children, path):
+            for name, key, sub_children in self.userGroups(children):
+                yield {'type': self.GROUP, 'name': name, 'parent': path}
+                yield from walk(sub_children, path + [name])
+        yield from walk(self.groups, [])
+
+        for key, name, color in self.tags:
+            if key!=self.NOTAG:
+                yield {'type': self.TAG, 'name': name, 'color': color}
+
+        for item in items:
+            yield {
+                'type' : self.ITEM,
+                'name' : item[self.NAME],
+                'group': self._groupPaths.get(item[self.GROUP_KEY], []),
+                'tags' : [self._tagNames[tag] for tag in (item[self.TAGS] or []) if tag in self._tagNames],
+                'path' : item[self.PATH],
+                'date' : item[self.DATE],
+                'notes': item[self.NOTES]
+            }
+
+    @staticmethod
+    def _jsonWriter(f):
+        def write(record):
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+        return write
+
+    def _csvWriter(self, f):
+        writer = csv.writer(f)
+        writer.writerow(self.COLUMNS)
+        def write(record):
+            group = record.get('parent') if record['type']==self.GROUP else record.get('group')
+            writer.writerow([
+                record['type'],
+                record['name'],
+                json.dumps(group or [], ensure_ascii=False),
+                json.dumps(record.get('tags', []), ensure_ascii=False),
+                record.get('path'),
+                record.get('date'),
+                record.get('notes'),
+                record.get('color')
+            ])
+        return write
+
+
+class Importer(Interchange):
+    '''read records from file and convert to items in batches, where groups and tags
+       are mapped to existing keys by name, or created with new keys
+    '''
+
+    BATCH = 5000
+
+    def __init__(self, groups, tags, groupKey, tagKey):
+        '''
+           :param groups: children of root group, [[name, key, children], ...]
+           :param tags: [[key, name, color], ...]
+           :param groupKey, tagKey: callable returning next key of group/tag
+        '''
+        self._groupKey = groupKey
+        self._tagKey = tagKey
+
+        # path of names -> key
+        self._groups = {(name,): key for key, name in self.DEFAULT_GROUPS.items()}
+        def walk(children, path):
+            for name, key, sub_children in self.userGroups(children):
+                self._groups[path+(name,)] = key
+                walk(sub_children, path+(name,))
+        walk(groups, ())
+        self._tags = {name: key for key, name, _ in tags}
+
+        # created since last batch
+        self.newGroups = [] # [(parent key or None, name, key), ...]
+        self.newTags = []   # [[key, name, color], ...]
+
+    def read(self, filename, batch=BATCH):
+        '''items in batches: groups/tags created before a batch are collected in
+           newGroups/newTags, which should be taken before the batch is used
+        '''
+        fmt = self.format(filename)
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            records = self._jsonRecords(f) if fmt==self.JSONL else self._csvRecords(f)
+            items = []
+            for record in records:
+                kind = record.get('type', self.ITEM)
+                if kind==self.GROUP:
+                    self.groupKey(list(record.get('parent') or []) + [record['name']])
+                elif kind==self.TAG:
+                    self.tagKey(record['name'], record.get('color'))
+                elif kind==self.ITEM:
+                    items.append(self.item(record))
+                    if len(items)>=batch:
+                        yield items
+                        items = []
+            if items:
+                yield items
+
+    def check(self, filename):
+        '''check all records before importing, so that an invalid file is not imported partially
+           :return: count of items
+        '''
+        fmt = self.format(filename)
+        count = 0
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            records = self._jsonRecords(f) if fmt==self.JSONL else self._csvRecords(f)
+            for i, record in enumerate(records, start=1):
+                if not self._isValid(record):
+                    raise ValueError('Invalid record {0} in {1}'.format(i, filename))
+                count += record.get('type', self.ITEM)==self.ITEM
+        return count
+
+    def _isValid(self, record):
+        if not isinstance(record, dict):
+            return False
+        if record.get('type', self.ITEM) in (self.GROUP, self.TAG) and not isinstance(record.get('name'), str):
+            return False
+        names = (record.get(key) for key in ('parent', 'group', 'tags'))
+        return all(value is None or isinstance(value, list) and all(isinstance(name, str) for name in value) for value in names)
+
+    def takeNew(self):
+        '''(new groups, new tags) created since last calling'''
+        groups, self.newGroups = self.newGroups, []
+        tags, self.newTags = self.newTags, []
+        return groups, tags
+
+    def item(self, record):
+        '''item values of record'''
+        tags = [self.tagKey(name) for name in record.get('tags') or []]
+        return [
+            record.get('name') or '',
+            self.groupKey(record.get('group') or []),
+            tags or [self.NOTAG],
+            record.get('path') or '',
+            record.get('date') or '',
+            record.get('notes') or ''
+        ]
+
+    def groupKey(self, path):
+        '''key of group with path of names, created with parent groups if not exist'''
+        path = tuple(name for name in path if name)
+        if not path:
+            return self.UNGROUPED
+        key = self._groups.get(path)
+        if key is None:
+            parent = self.groupKey(path[:-1]) if len(path)>1 else None
+            key = self._groupKey()
+            self._groups[path] = key
+            self.newGroups.append((parent, path[-1], key))
+        return key
+
+    def tagKey(self, name, color=None):
+        '''key of tag with name, created if not exists'''
+        key = self._tags.get(name)
+        if key is None:
+            key = self._tagKey()
+            self._tags[name] = key
+            self.newTags.append([key, name, color or '#000000'])
+        return key
+
+    @staticmethod
+    def _jsonRecords(f):
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+    @staticmethod
+    def _names(value, sep):
+        '''names in JSON array, or joined with separator'''
+        value = value or ''
+        if value.startswith('['):
+            try:
+                return json.loads(value)
+            except ValueError:
+                pass
+        return [name for name in value.split(sep) if name]
+
+    def _csvRecords(self, f):
+        rows = csv.DictReader(f)
+        try:
+            for row in rows:
+                group = self._names(row.get('group'), self.GROUP_SEP)
+                record = {
+                    'type' : row.get('type') or self.ITEM,
+                    'name' : row.get('name'),
+                    'tags' : self._names(row.get('tags'), self.TAG_SEP),
+                    'path' : row.get('path'),
+                    'date' : row.get('date'),
+                    'notes': row.get('notes'),
+                    'color': row.get('color')
+                }
+                record['parent' if record['type']==self.GROUP else 'group'] = group
+                yield record
+        except csv.Error as e:
+            raise ValueError('Invalid CSV file: {0}'.format(e))
@@ -0,0 +1,360 @@
+# append-only journal of model mutations:
+# each mutation is recorded when it happens, so that unsaved changes could be
+# recovered by replaying the journal on top of the last snapshot
+#
+
+import os
+import json
+import pickle
+import threading
+from functools import partial
+
+from .Storage import Storage
+from .Core import moveIds, removeRanges
+
+
+class Journal(object):
+    '''journal files next to database:
+       - database.journal: records since last snapshot, one JSON list per line,
+            e.g. ['items', 'set', row, column, value]
+       - database.journal.compacting: records being folded into checkpoint
+       - database.journal.saving: records before the snapshot being saved to database
+       - database.checkpoint: snapshot of database with compacted records applied
+    '''
+
+    THRESHOLD = 4*1024*1024 # compact journal when file size exceeds this value
+
+    def __init__(self, database, loader, defaults={}, threshold=THRESHOLD):
+        '''
+           :param database: database filename
+           :param loader: callable returning project data of database, called from a worker thread
+           :param defaults: default rows of each model, see replay()
+           :param threshold: journal size to trigger compaction
+        '''
+        self.filename = '{0}.journal'.format(database)
+        self.compactingFilename = '{0}.journal.compacting'.format(database)
+        self.savingFilename = '{0}.journal.saving'.format(database)
+        self.checkpointFilename = '{0}.checkpoint'.format(database)
+
+        self._loader = loader
+        self._defaults = defaults
+        self._threshold = threshold
+
+        self._file = None
+        self._size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._cancelled = False
+        self._suspended = False
+        self._saving = False
+
+    def writer(self, model):
+        '''callable recording mutations of specified model: writer(op, *args)'''
+        return partial(self.append, model)
+
+    def append(self, model, op, *args):
+        '''append a record'''
+        if self._suspended:
+            return
+
+        line = '{0}\n'.format(json.dumps([model, op] + list(args)))
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.filename, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush() # survive crash of the application
+            self._size += len(line)
+
+        if self._size > self._threshold:
+            self.compact()
+
+    def suspend(self, suspended=True):
+        '''stop recording, e.g. the mutations are not made by user'''
+        self._suspended = suspended
+
+    def hasRecords(self):
+        '''any unsaved changes exist'''
+        return any(os.path.exists(filename) for filename in
+            (self.filename, self.compactingFilename, self.savingFilename, self.checkpointFilename))
+
+    def recover(self, data):
+        '''project data with journal replayed on top of it
+           :param data: project data loaded from database
+           :return: (data, count of replayed records)
+        '''
+        if os.path.exists(self.checkpointFilename):
+            with open(self.checkpointFilename, 'rb') as f:
+                data = pickle.load(f)
+
+        count = 0
+        for filename in (self.compactingFilename, self.savingFilename, self.filename):
+            records = self.read(filename)
+            replay(data, records, self._defaults)
+            count += len(records)
+
+        return data, count
+
+    @staticmethod
+    def read(filename):
+        '''records in journal file, broken record written when crashed is ignored'''
+        records = []
+        if not os.path.exists(filename):
+            return records
+
+        with open(filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        return records
+
+    def _closeFile(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _concat(target, sources):
+        '''append records in sources to target file, then remove sources'''
+        sources = [filename for filename in sources if os.path.exists(filename)]
+        if not sources:
+            return
+
+        if not os.path.exists(target) and len(sources)==1:
+            os.replace(sources[0], target)
+            return
+
+        with open(target, 'a', encoding='utf-8') as dst:
+            for filename in sources:
+                with open(filename, 'r', encoding='utf-8') as src:
+                    dst.write(src.read())
+        for filename in sources:
+            os.remove(filename)
+
+    # --------------------------------------------------------------
+    # saving in background
+    # --------------------------------------------------------------
+    def rotate(self):
+        '''snapshot is taken to save: move records until now aside,
+           they're removed once the snapshot is saved, see commit()
+        '''
+        self.wait()
+        with self._lock:
+            self._closeFile()
+            self._concat(self.savingFilename, (self.compactingFilename, self.filename))
+            self._size = 0
+            self._saving = True
+
+    def commit(self):
+        '''snapshot is saved: records before it are out of date'''
+        with self._lock:
+            for filename in (self.savingFilename, self.checkpointFilename):
+                if os.path.exists(filename):
+                    os.remove(filename)
+            self._saving = False
+
+    def restore(self):
+        '''failed to save snapshot: put records back ahead of the ones made since then'''
+        with self._lock:
+            self._closeFile()
+            tmp_filename = '{0}.tmp'.format(self.filename)
+            self._concat(tmp_filename, (self.savingFilename, self.filename))
+            if os.path.exists(tmp_filename):
+                os.replace(tmp_filename, self.filename)
+            self._size = os.path.getsize(self.filename) if os.path.exists(self.filename) else 0
+            self._saving = False
+
+    def moveTo(self, journal):
+        '''move records to journal of another database, e.g. saved as a new database'''
+        with self._lock:
+            self._closeFile()
+            if os.path.exists(self.filename):
+                os.replace(self.filename, journal.filename)
+            journal._size, self._size = self._size, 0
+
+    # --------------------------------------------------------------
+    # compaction
+    # --------------------------------------------------------------
+    def compact(self):
+        '''fold current records into checkpoint in background'''
+        with self._lock:
+            # checkpoint is removed once snapshot is saved
+            if self._saving:
+                return
+
+            if self._thread and self._thread.is_alive():
+                return
+
+            # rotate journal: new records are appended to a new file.
+            # left by failed compaction or saving are folded together
+            self._closeFile()
+            self._concat(self.compactingFilename, (self.savingFilename, self.filename))
+            self._size = 0
+
+            self._cancelled = False
+            self._thread = threading.Thread(target=self._compact, daemon=True)
+            self._thread.start()
+
+    def _compact(self):
+        '''replay rotated records on top of last snapshot, then save as new checkpoint'''
+        if os.path.exists(self.checkpointFilename):
+            with open(self.checkpointFilename, 'rb') as f:
+                data = pickle.load(f)
+        else:
+            data = self._loader()
+
+        replay(data, self.read(self.compactingFilename), self._defaults)
+
+        if self._cancelled:
+            return
+
+        tmp_filename = '{0}.tmp'.format(self.checkpointFilename)
+        with open(tmp_filename, 'wb') as f:
+            pickle.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.checkpointFilename)
+        os.remove(self.compactingFilename)
+
+    def wait(self, cancel=False):
+        '''wait for compaction finished'''
+        self._cancelled = cancel
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        '''stop recording, but keep records'''
+        self.wait()
+        with self._lock:
+            self._closeFile()
+
+    def clear(self):
+        '''remove all records, e.g. changes are saved or discarded'''
+        self.wait(cancel=True)
+        self.close()
+        for filename in (self.filename, self.compactingFilename, self.savingFilename, self.checkpointFilename):
+            if os.path.exists(filename):
+                os.remove(filename)
+        self._size = 0
+        self._saving = False
+
+
+# --------------------------------------------------------------
+# replay records on project data
+# --------------------------------------------------------------
+def replay(data, records, defaults={}):
+    '''apply records to project data in place
+       :param data: project data, see Storage.load()
+       :param records: journal records [model, op, *args]
+       :param defaults: default rows of each model, {model: (count, isDefault)}:
+                - count: count of default rows ahead of model rows
+                - isDefault: callable checking whether a row in data is ignored by model
+    '''
+    groups = data.setdefault(Storage.KEY_GROUP, [None, None, []])
+
+    # rows of each model: default rows are managed by model rather than stored in database,
+    # so replace them with placeholders ahead of model rows, to keep rows position same as
+    # the models when they were recorded
+    tables = {}
+    for model, rows in ((Storage.KEY_GROUP, groups[2]),
+                        (Storage.KEY_TAG, data.get(Storage.KEY_TAG, [])),
+                        (Storage.KEY_ITEM, data.get(Storage.KEY_ITEM, []))):
+        count, isDefault = defaults.get(model, (0, None))
+        tables[model] = [None]*count + [row for row in rows if not (isDefault and isDefault(row))]
+
+    # ids of items are moved along with items, missing ones are taken when loaded into model
+    ids = data.get(Storage.KEY_ID)
+    ids = list(ids) if ids and len(ids)==len(tables[Storage.KEY_ITEM]) else [None]*len(tables[Storage.KEY_ITEM])
+
+    for model, op, *args in records:
+        if model==Storage.KEY_GROUP:
+            _replayTree(tables[model], op, *args)
+        else:
+            _replayTable(tables[model], op, *args)
+            if model==Storage.KEY_ITEM:
+                _replayIds(ids, op, *args)
+
+    groups[2] = tables[Storage.KEY_GROUP][defaults.get(Storage.KEY_GROUP, (0, None))[0]:]
+    data[Storage.KEY_TAG] = tables[Storage.KEY_TAG][defaults.get(Storage.KEY_TAG, (0, None))[0]:]
+    data[Storage.KEY_ITEM] = tables[Storage.KEY_ITEM][defaults.get(Storage.KEY_ITEM, (0, None))[0]:]
+    data[Storage.KEY_ID] = ids[defaults.get(Storage.KEY_ITEM, (0, None))[0]:]
+
+    return data
+
+
+def _replayTable(rows, op, *args):
+    '''same operations as TableModel'''
+    if op=='set':
+        row, col, value = args
+        rows[row][col] = value
+
+    elif op=='insert':
+        position, count, columns = args
+        rows[position:position] = [[None for col in range(columns)] for i in range(count)]
+
+    elif op=='append':
+        rows.extend(list(row) for row in args[0])
+
+    elif op=='remove':
+        position, count = args
+        del rows[position:position+count]
+
+    elif op=='removeMany':
+        removeRanges(rows, args[0])
+
+    elif op=='move':
+        sourceRow, count, destinationChild = args
+        moved = rows[sourceRow:sourceRow+count]
+        dest = rows[destinationChild]
+        del rows[sourceRow:sourceRow+count]
+        dest_row = rows.index(dest)
+        rows[dest_row:dest_row] = moved
+
+
+def _replayIds(ids, op, *args):
+    '''same operations as ItemTable on ids of items'''
+    if op=='ids':
+        position, values = args
+        ids[position:position+len(values)] = values
+
+    elif op=='insert':
+        position, count, columns = args
+        ids[position:position] = [None]*count
+
+    elif op=='append':
+        ids.extend([None]*len(args[0]))
+
+    elif op=='remove':
+        position, count = args
+        del ids[position:position+count]
+
+    elif op=='removeMany':
+        removeRanges(ids, args[0])
+
+    elif op=='move':
+        moveIds(ids, *args)
+
+
+def _replayTree(children, op, path, *args):
+    '''same operations as GroupModel: tree item is [name, key, children]'''
+    # parent: path from top level rows
+    for row in path[:-1]:
+        children = children[row][2]
+
+    if op=='set':
+        col, value = args
+        children[path[-1]][col] = value
+        return
+
+    if path:
+        children = children[path[-1]][2]
+
+    if op=='insert':
+        position, count = args
+        children[position:position] = [[None, None, []] for i in range(count)]
+
+    elif op=='remove':
+        position, count = args
+        del children[position:position+count]
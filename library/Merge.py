@@ -0,0 +1,186 @@
+# merge another database into current project:
+# items are joined by normalized source path with a hash table built over current
+# items, so merging n current items and m other items is O(n+m). items with a
+# duplicated path are joined in order one to one.
+#   - groups are matched by name under the same parent, tags by name; the others
+#     are new groups/tags with keys from the key counters of current project
+#   - joined items are merged field by field, where tags are united and other
+#     fields are resolved by the conflict policy
+#   - items not joined are appended
+#
+
+import os
+
+
+class Merge(object):
+    '''join items of another database to current items by source path'''
+
+    # conflict policy: which value wins when both items have a field set
+    KEEP    = 'keep'     # current item
+    REPLACE = 'replace'  # merged item
+    NEWER   = 'newer'    # item with later date, current item if same date
+    POLICIES = (KEEP, REPLACE, NEWER)
+
+    # columns of item
+    NAME, GROUP, TAGS, PATH, DATE, NOTES = range(6)
+
+    NOTAG = 0
+    UNGROUPED = 2
+
+    def __init__(self, groups, tags, items, policy=KEEP):
+        '''
+           :param groups: children of root group, [[name, key, children], ...]
+           :param tags: [[key, name, color], ...]
+           :param items: current items, which are not changed by merging
+           :param policy: conflict policy, see POLICIES
+        '''
+        if policy not in self.POLICIES:
+            raise ValueError('Invalid conflict policy: {0}'.format(policy))
+        self.groups = groups
+        self.tags = tags
+        self.items = items
+        self.policy = policy
+
+    @staticmethod
+    def normalizePath(path):
+        '''key of source path: same file referenced in different ways has same key'''
+        if not path:
+            return None
+        if path[0]=='~':
+            path = os.path.expanduser(path)
+        return os.path.normcase(os.path.normpath(path))
+
+    def join(self, other, groupKey, tagKey):
+        '''merge project data of other database, see Storage.load()
+           :param groupKey, tagKey: callable returning next key of group/tag
+           :return: {
+                'groups'   : new groups [(parent key or None, name, key), ...] in depth-first order,
+                'tags'     : new tags [[key, name, color], ...],
+                'updated'  : {row of current item: merged values},
+                'inserted' : items to append,
+                'conflicts': count of fields with different values in both items
+            }
+        '''
+        new_groups, group_keys = self._joinGroups(other.get('groups', [None, None, []])[2], groupKey)
+        new_tags, tag_keys = self._joinTags(other.get('tags', []), tagKey)
+
+        # hash table of current items: path -> rows, the k-th item with a path in
+        # other database is joined with the k-th current item with that path
+        index, normalize = {}, self.normalizePath
+        for row, item in enumerate(self.items):
+            path = normalize(item[self.PATH])
+            if path is not None:
+                index.setdefault(path, []).append(row)
+        joined = {} # path -> count of joined rows
+
+        updated, inserted, conflicts = {}, [], 0
+        for item in other.get('items', []):
+            item = list(item)
+            group = item[self.GROUP]
+            if group is not None and not 0<group<10:
+                item[self.GROUP] = group_keys.get(group, self.UNGROUPED)
+            item[self.TAGS] = [tag_keys[tag] for tag in (item[self.TAGS] or []) if tag in tag_keys]
+
+            path = normalize(item[self.PATH])
+            rows = index.get(path)
+            k = joined.get(path, 0)
+            if not rows or k>=len(rows):
+                inserted.append(item)
+                continue
+
+            joined[path] = k + 1
+            row = rows[k]
+            values, n = self._mergeItem(self.items[row], item)
+            conflicts += n
+            if values!=list(self.items[row]):
+                updated[row] = values
+
+        return {
+            'groups'   : new_groups,
+            'tags'     : new_tags,
+            'updated'  : updated,
+            'inserted' : inserted,
+            'conflicts': conflicts
+        }
+
+    def _joinGroups(self, children, groupKey):
+        '''match groups by name under same parent
+           :return: (new groups, {other key: current key})
+        '''
+        names = {} # (parent key, name) -> key
+        def walk(children, parent):
+            for name, key, sub_children in children:
+                names[(parent, name)] = key
+                walk(sub_children, key)
+        walk(self.groups, None)
+
+        new_groups, keys = [], {}
+        def join(children, parent):
+            for name, key, sub_children in children:
+                if 0<key<10: # default group
+                    continue
+                current = names.get((parent, name))
+                if current is None:
+                    current = groupKey()
+                    names[(parent, name)] = current
+                    new_groups.append((parent, name, current))
+                keys[key] = current
+                join(sub_children, current)
+        join(children, None)
+
+        return new_groups, keys
+
+    def _joinTags(self, tags, tagKey):
+        '''match tags by name
+           :return: (new tags, {other key: current key})
+        '''
+        names = {name: key for key, name, _ in self.tags}
+        new_tags, keys = [], {self.NOTAG: self.NOTAG}
+        for key, name, color in tags:
+            if key==self.NOTAG:
+                continue
+            if name not in names:
+                names[name] = tagKey()
+                new_tags.append([names[name], name, color])
+            keys[key] = names[name]
+        return new_tags, keys
+
+    def _mergeItem(self, current, other):
+        '''merge fields of joined items
+           :return: (merged values, count of conflicting fields)
+        '''
+        values, conflicts = list(current), 0
+
+        # other item wins if conflicted
+        if self.policy==self.REPLACE:
+            prefer_other = True
+        elif self.policy==self.NEWER:
+            prefer_other = (other[self.DATE] or '')>(current[self.DATE] or '')
+        else:
+            prefer_other = False
+
+        for col in (self.NAME, self.GROUP, self.DATE, self.NOTES):
+            value, other_value = current[col], other[col]
+            if self._isEmpty(col, other_value) or value==other_value:
+                continue
+            if self._isEmpty(col, value):
+                values[col] = other_value
+                continue
+            conflicts += 1
+            if prefer_other:
+                values[col] = other_value
+
+        # tags: united, default tag is dropped if any tag is attached
+        tags = list(current[self.TAGS] or [])
+        tags.extend(tag for tag in other[self.TAGS] if tag not in tags)
+        if len(tags)>1 and self.NOTAG in tags:
+            tags.remove(self.NOTAG)
+        values[self.TAGS] = tags
+
+        return values, conflicts
+
+    def _isEmpty(self, col, value):
+        '''value not set, ungrouped item is taken as group not set'''
+        if col==self.GROUP:
+            return value is None or value==self.UNGROUPED
+        return value is None or value==''
@@ -0,0 +1,156 @@
+# startup profiler:
+# time of importing each module and creating each widget, so that startup
+# regressions could be found, e.g. python Tagit.py --profile-startup
+#
+
+import sys
+import time
+from contextlib import contextmanager
+
+
+class Profiler(object):
+    '''collect import time of modules and time of named stages since start'''
+
+    def __init__(self, start=None, budget=None):
+        '''
+           :param start: perf_counter() when the application starts
+           :param budget: expected startup time in milliseconds, warn if it's exceeded
+        '''
+        self.start = start or time.perf_counter()
+        self.budget = budget
+
+        # imports: [name, total seconds, self seconds, depth]
+        # modules imported before profiler is created are counted as a whole, e.g. this package
+        before = self.elapsed()
+        self._imports = [['(before profiling)', before, before, 0]]
+        self._stack = [] # imports in progress: [record, children seconds]
+
+        # stages: (name, seconds, elapsed since start)
+        self._stages = []
+        self._depth = 0
+
+        self._finder = _ImportFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self):
+        '''stop timing imports'''
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def elapsed(self):
+        '''seconds since start'''
+        return time.perf_counter() - self.start
+
+    @contextmanager
+    def importing(self, name):
+        '''time of importing a module, excluding the nested imports for self time'''
+        record = [name, 0.0, 0.0, len(self._stack)]
+        self._imports.append(record)
+        self._stack.append([record, 0.0])
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - t
+            _, children = self._stack.pop()
+            record[1] += seconds
+            record[2] += seconds - children
+            if self._stack:
+                self._stack[-1][1] += seconds
+
+    @contextmanager
+    def measure(self, name):
+        '''time of a startup stage, e.g. creating a widget'''
+        depth = self._depth
+        self._depth += 1
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self._stages.append(('{0}{1}'.format('  '*depth, name), time.perf_counter()-t, self.elapsed()))
+
+    def mark(self, name, file=sys.stderr):
+        '''print time since start when something is done, e.g. all data is loaded'''
+        print('[startup] {0}: {1:.1f} ms'.format(name, self.elapsed()*1000), file=file)
+
+    def report(self, count=30, file=sys.stderr):
+        '''print the slowest imports and all stages'''
+        total = self.elapsed()
+        imports = sorted(self._imports, key=lambda record: record[2], reverse=True)
+
+        lines = ['[startup] imports (top {0} by self time, ms):'.format(count),
+                 '    {0:>8} {1:>8}  {2}'.format('self', 'total', 'module')]
+        for name, seconds, self_seconds, depth in imports[:count]:
+            lines.append('    {0:8.1f} {1:8.1f}  {2}'.format(self_seconds*1000, seconds*1000, name))
+        top_level = sum(seconds for _, seconds, _, depth in self._imports if depth==0)
+        lines.append('    {0} modules, {1:.1f} ms'.format(len(self._imports), top_level*1000))
+
+        lines.append('[startup] stages (ms):')
+        lines.append('    {0:>8} {1:>8}  {2}'.format('time', 'at', 'stage'))
+        for name, seconds, at in sorted(self._stages, key=lambda stage: stage[2]-stage[1]):
+            lines.append('    {0:8.1f} {1:8.1f}  {2}'.format(seconds*1000, at*1000, name))
+
+        lines.append('[startup] total: {0:.1f} ms'.format(total*1000))
+        if self.budget and total*1000>self.budget:
+            lines.append('[startup] WARNING: exceeds budget {0} ms'.format(self.budget))
+
+        print('\n'.join(lines), file=file)
+
+
+class _ImportFinder(object):
+    '''meta path finder wrapping loaders found by the other finders with a timer'''
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, name, self.profiler)
+        return spec
+
+
+class _TimedLoader(object):
+    '''loader proxy: time of creating and executing module,
+       e.g. extension module is loaded when it's created
+    '''
+
+    def __init__(self, loader, name, profiler):
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+        self._context = None
+
+    def create_module(self, spec):
+        self._context = self._profiler.importing(self._name)
+        self._context.__enter__()
+        try:
+            return self._loader.create_module(spec)
+        except BaseException:
+            self._finish(*sys.exc_info())
+            raise
+
+    def exec_module(self, module):
+        try:
+            self._loader.exec_module(module)
+        except BaseException:
+            self._finish(*sys.exc_info())
+            raise
+        self._finish(None, None, None)
+
+    def _finish(self, *exc_info):
+        context, self._context = self._context, None
+        if context:
+            context.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
@@ -0,0 +1,234 @@
+# JSON-RPC 2.0 server exposing a live library to local clients, e.g. editor plugins
+# and scripts, while it's opened in Tagit:
+#   - transport: Unix domain socket, or TCP on localhost if Unix socket is not
+#     supported, one JSON message per line in both directions
+#   - each connection is served by its own thread, so clients are concurrent;
+#     requests of a connection are answered in order, so they could be pipelined
+#   - batch request, i.e. a JSON array of requests, is supported
+#
+# methods of LibraryService:
+#   info   {}                                   -> {version, items, database}
+#   groups {}                                   -> [{key, name, parent}, ...]
+#   tags   {}                                   -> [{key, name, color}, ...]
+#   query  {group, tag, text, offset, limit}    -> {version, total, items: [{row, id, ...}, ...]}
+#   tag    {selector..., add: [tags], remove: [tags]} -> {items}
+#   move   {selector..., to: group}             -> {items}
+#   import {paths: [path], group, tags: [tags]} -> {items}
+# where selector is group/tag/text as query, ids of items, or rows with version of
+# the query they come from. ids are stable, i.e. they're valid after the library is
+# changed or reopened. groups are specified by key, name of default group or path of
+# names like A/B; tags by key or name.
+#
+# reading methods run in connection thread against a snapshot of the library, which
+# is not changed any more, so they're consistent and don't block the GUI. writing
+# methods are passed to the library owner, e.g. applied in GUI thread.
+#
+
+import os
+import json
+import socket
+import socketserver
+import threading
+
+
+class RpcError(Exception):
+    '''error responded to client'''
+
+    PARSE_ERROR      = -32700
+    INVALID_REQUEST  = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS   = -32602
+    INTERNAL_ERROR   = -32603
+
+    def __init__(self, code, message):
+        super(RpcError, self).__init__(message)
+        self.code = code
+        self.message = message
+
+
+class LibraryService(object):
+    '''methods of a library: reads against snapshot, writes through the owner'''
+
+    READS = ('info', 'groups', 'tags', 'query')
+    WRITES = ('tag', 'move', 'import')
+
+    def __init__(self, snapshot, write):
+        '''
+           :param snapshot: callable returning (version, Catalog of a snapshot of the library)
+           :param write: callable write(method, params) applying writing method and returning
+                the result, e.g. it's run in GUI thread
+        '''
+        self._snapshot = snapshot
+        self._write = write
+
+    def call(self, method, params):
+        if method in self.WRITES:
+            return self._write(method, params)
+        if method in self.READS:
+            version, catalog = self._snapshot()
+            return getattr(self, method)(version, catalog, params)
+        raise RpcError(RpcError.METHOD_NOT_FOUND, 'Method not found: {0}'.format(method))
+
+    def info(self, version, catalog, params):
+        return {'version': version, 'items': len(catalog.items), 'database': catalog.filename}
+
+    def groups(self, version, catalog, params):
+        res = []
+        def walk(node, parent):
+            for child in node.childItems:
+                key = child.data(child.KEY)
+                res.append({'key': key, 'name': child.data(child.NAME), 'parent': parent})
+                walk(child, key)
+        walk(catalog.groupTree.root, None)
+        return res
+
+    def tags(self, version, catalog, params):
+        return [{'key': key, 'name': name, 'color': color} for key, name, color in catalog.tagTable.rows]
+
+    def query(self, version, catalog, params):
+        rows = selectRows(catalog, params, version)
+        offset, limit = params.get('offset', 0), params.get('limit')
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset<0:
+            raise RpcError(RpcError.INVALID_PARAMS, 'Invalid offset.')
+        if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit<0):
+            raise RpcError(RpcError.INVALID_PARAMS, 'Invalid limit.')
+        page = rows[offset:offset+limit] if limit else rows[offset:]
+        items = []
+        for row in page:
+            record = catalog.itemRecord(row)
+            record['row'] = row
+            items.append(record)
+        return {'version': version, 'total': len(rows), 'items': items}
+
+
+def selectRows(catalog, params, version=None):
+    '''rows of items specified by params:
+       - ids: ids of items, the ones not exist are ignored
+       - rows: rows of items in the query with version, which should be current version
+       - or group, tag and text, see Catalog.select()
+    '''
+    if 'ids' in params:
+        rows = (catalog.itemTable.row(uid) for uid in params['ids'])
+        return sorted({row for row in rows if row>=0})
+
+    if 'rows' in params:
+        if version is not None and params.get('version')!=version:
+            raise RpcError(RpcError.INVALID_PARAMS, 'Library is changed since version {0}, query again.'.format(params.get('version')))
+        rows = params['rows']
+        if any(not isinstance(row, int) or not 0<=row<len(catalog.items) for row in rows):
+            raise RpcError(RpcError.INVALID_PARAMS, 'Invalid rows.')
+        return sorted(set(rows))
+
+    group = catalog.groupKey(str(params['group'])) if params.get('group') is not None else None
+    tag = catalog.tagKey(params['tag']) if params.get('tag') is not None else None
+    return catalog.select(group, tag, params.get('text'))
+
+
+class RpcServer(object):
+    '''serve JSON-RPC requests of local clients in background threads'''
+
+    def __init__(self, address, service):
+        '''
+           :param address: path of Unix socket, or (host, port) of TCP socket
+           :param service: object handling requests: call(method, params)
+        '''
+        self.address = address
+        self.service = service
+        self._server = None
+        self._thread = None
+
+    @staticmethod
+    def defaultAddress(database):
+        '''Unix socket next to database, or any free port on localhost'''
+        if hasattr(socket, 'AF_UNIX'):
+            return '{0}.sock'.format(database)
+        return ('127.0.0.1', 0)
+
+    def isRunning(self):
+        return self._server is not None
+
+    def start(self):
+        '''listen in background thread
+           :return: address listened, e.g. the actual port
+        '''
+        server = self
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    response = server.handle(line)
+                    if response is not None:
+                        self.wfile.write(response.encode('utf-8') + b'\n')
+                        self.wfile.flush()
+
+        if isinstance(self.address, str):
+            class Server(socketserver.ThreadingUnixStreamServer):
+                daemon_threads = True
+            if os.path.exists(self.address): # left by a crashed instance
+                os.remove(self.address)
+            self._server = Server(self.address, Handler)
+            os.chmod(self.address, 0o600) # current user only
+        else:
+            class Server(socketserver.ThreadingTCPServer):
+                daemon_threads = True
+                allow_reuse_address = True
+            self._server = Server(self.address, Handler)
+            self.address = self._server.server_address[:2]
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.address
+
+    def stop(self):
+        if not self._server:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server, self._thread = None, None
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.remove(self.address)
+
+    def handle(self, message):
+        '''response of a request or batch request, None for notifications
+           :param message: JSON text
+        '''
+        try:
+            request = json.loads(message)
+        except ValueError:
+            return json.dumps(self._error(None, RpcError(RpcError.PARSE_ERROR, 'Parse error')))
+
+        if isinstance(request, list):
+            if not request:
+                return json.dumps(self._error(None, RpcError(RpcError.INVALID_REQUEST, 'Empty batch')))
+            responses = [res for res in map(self._call, request) if res is not None]
+            return json.dumps(responses, ensure_ascii=False) if responses else None
+
+        response = self._call(request)
+        return None if response is None else json.dumps(response, ensure_ascii=False)
+
+    def _call(self, request):
+        if not isinstance(request, dict) or request.get('jsonrpc')!='2.0' or not isinstance(request.get('method'), str):
+            return self._error(None, RpcError(RpcError.INVALID_REQUEST, 'Invalid request'))
+
+        rid, notification = request.get('id'), 'id' not in request
+        params = request.get('params', {})
+        try:
+            if not isinstance(params, dict):
+                raise RpcError(RpcError.INVALID_PARAMS, 'Params should be an object.')
+            result = self.service.call(request['method'], params)
+        except RpcError as e:
+            res = self._error(rid, e)
+        except (KeyError, ValueError, TypeError) as e:
+            res = self._error(rid, RpcError(RpcError.INVALID_PARAMS, e.args[0] if e.args else str(e)))
+        except Exception as e:
+            res = self._error(rid, RpcError(RpcError.INTERNAL_ERROR, str(e)))
+        else:
+            res = {'jsonrpc': '2.0', 'id': rid, 'result': result}
+        return None if notification else res
+
+    @staticmethod
+    def _error(rid, error):
+        return {'jsonrpc': '2.0', 'id': rid, 'error': {'code': error.code, 'message': error.message}}
+
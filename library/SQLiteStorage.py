@@ -0,0 +1,648 @@
+# SQLite storage engine:
+# groups, tags, items and item-tag links are stored in separated tables,
+# so that only rows changed since last saving are written
+#
+# each row has a uid shared by all copies of the database, and the fields changed
+# by each saving are appended to table changes with increasing sequence number,
+# see ChangeFeed for synchronizing copies with them
+#
+
+import json
+import time
+import sqlite3
+import platform
+import uuid
+
+from .Storage import Storage
+
+
+class SQLiteStorage(Storage):
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS info (
+            name TEXT PRIMARY KEY,
+            value TEXT);
+        CREATE TABLE IF NOT EXISTS groups (
+            key INTEGER PRIMARY KEY,
+            name TEXT,
+            parent INTEGER,
+            position INTEGER,
+            uid TEXT);
+        CREATE TABLE IF NOT EXISTS tags (
+            key INTEGER PRIMARY KEY,
+            name TEXT,
+            color TEXT,
+            position INTEGER,
+            uid TEXT);
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            grp INTEGER,
+            path TEXT,
+            date TEXT,
+            notes TEXT,
+            uid TEXT);
+        CREATE INDEX IF NOT EXISTS items_uid ON items (uid);
+        CREATE TABLE IF NOT EXISTS item_tags (
+            item INTEGER,
+            position INTEGER,
+            tag INTEGER,
+            PRIMARY KEY (item, position)) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            time REAL,
+            origin TEXT,
+            kind TEXT,
+            uid TEXT,
+            field TEXT,
+            value TEXT);
+        CREATE INDEX IF NOT EXISTS changes_field ON changes (kind, uid, field);
+    '''
+
+    # kind of rows in change feed
+    GROUP, TAG, ITEM = 'group', 'tag', 'item'
+
+    # fields in change feed: group/tags of item and parent of group are referred by uid
+    GROUP_FIELDS = ('name', 'parent', 'position')
+    TAG_FIELDS = ('name', 'color', 'position')
+    ITEM_FIELDS = ('name', 'group', 'tags', 'path', 'date', 'notes')
+    DELETED = 'deleted'
+
+    HEADER = b'SQLite format 3\x00'
+
+    BATCH = 10000 # count of items written between progress reports
+
+    def __init__(self, filename):
+        super(SQLiteStorage, self).__init__(filename)
+        self._conn = None
+
+        # rows stored in database:
+        # - items: id(row) -> primary key, row objects are the ones loaded/saved last time
+        # - groups: key -> (name, parent, position)
+        # - tags: key -> (name, color, position)
+        self._itemIds = {}
+        self._groupRows = {}
+        self._tagRows = {}
+
+        # uid of rows: id(row) -> uid for items, key -> uid for groups/tags
+        self._itemUids = {}
+        self._groupUids = {}
+        self._tagUids = {}
+
+        # change feed records of current saving: (kind, uid, field, value)
+        self._feed = []
+
+        # sequence number of the latest change when it's loaded
+        self._seq = 0
+
+        # whether the mapping above is consistent with database
+        self._synced = False
+
+    @staticmethod
+    def isValid(filename):
+        try:
+            with open(filename, 'rb') as f:
+                return f.read(len(SQLiteStorage.HEADER))==SQLiteStorage.HEADER
+        except OSError:
+            return False
+
+    def connection(self):
+        '''connect to database when required'''
+        if self._conn is None:
+            # saving runs in background thread, while loading in main thread
+            self._conn = sqlite3.connect(self.filename, check_same_thread=False)
+            self._upgrade(self._conn)
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _upgrade(conn):
+        '''add uid to rows of database created by previous version, see groupUid() and tagUid()
+           for uid of default groups/tags
+        '''
+        random = 'lower(hex(randomblob(16)))'
+        uids = {
+            'groups': 'CASE WHEN key<10 THEN CAST(key AS TEXT) ELSE {0} END'.format(random),
+            'tags'  : 'CASE WHEN key=0 THEN CAST(key AS TEXT) ELSE {0} END'.format(random),
+            'items' : random
+        }
+        with conn:
+            for table, uid in uids.items():
+                columns = [row[1] for row in conn.execute('PRAGMA table_info({0})'.format(table))]
+                if columns and 'uid' not in columns:
+                    conn.execute('ALTER TABLE {0} ADD COLUMN uid TEXT'.format(table))
+                    conn.execute('UPDATE {0} SET uid={1}'.format(table, uid))
+
+    @staticmethod
+    def newUid():
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def defaultUid(key):
+        '''uid of default group/tag, which is same for all databases'''
+        return str(key)
+
+    @staticmethod
+    def origin():
+        '''where changes are made'''
+        return platform.node()
+
+    def invalidate(self):
+        self._synced = False
+
+    def itemId(self, row):
+        '''uid of item row'''
+        return self._itemUids.get(id(row))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # --------------------------------------------------------------
+    # loading
+    # --------------------------------------------------------------
+    def load(self):
+        try:
+            conn = self.connection()
+        except sqlite3.OperationalError: # e.g. locked
+            raise
+        except sqlite3.DatabaseError as e: # e.g. file is not a database
+            raise ValueError('Invalid database: {0}'.format(self.filename)) from e
+
+        # rows saved later are loaded by loadChanges()
+        self._seq = self.lastChange()
+
+        info = dict(conn.execute('SELECT name, value FROM info'))
+        if self.APP_NAME not in info:
+            return {}
+
+        items = self._loadItems(conn)
+        data = {
+            self.APP_NAME   : info[self.APP_NAME],
+            self.KEY_GROUP  : self._loadGroups(conn, json.loads(info.get('root', '[null, null]'))),
+            self.KEY_TAG    : self._loadTags(conn),
+            self.KEY_ITEM   : items,
+            self.KEY_ID     : [self._itemUids[id(row)] for row in items],
+            self.KEY_SETTING: json.loads(info.get(self.KEY_SETTING, '{}'))
+        }
+        self._synced = True
+
+        return data
+
+    def loadHeader(self):
+        '''project data except items, which are not loaded'''
+        conn = self.connection()
+        info = dict(conn.execute('SELECT name, value FROM info'))
+        if self.APP_NAME not in info:
+            return {}
+        return {
+            self.APP_NAME   : info[self.APP_NAME],
+            self.KEY_GROUP  : self._loadGroups(conn, json.loads(info.get('root', '[null, null]'))),
+            self.KEY_TAG    : self._loadTags(conn),
+            self.KEY_SETTING: json.loads(info.get(self.KEY_SETTING, '{}'))
+        }
+
+    def iterItems(self, size=BATCH):
+        '''items are read page by page in order of primary key, which is the key of row.
+           no statement is active between pages, so rows could be updated meanwhile.
+        '''
+        conn = self.connection()
+        last = 0
+        while True:
+            rows = conn.execute('SELECT id, name, grp, path, date, notes FROM items WHERE id>? ORDER BY id LIMIT ?',
+                                (last, size)).fetchall()
+            if not rows:
+                break
+            tags = {}
+            for item, tag in conn.execute('SELECT item, tag FROM item_tags WHERE item>=? AND item<=? ORDER BY item, position',
+                                            (rows[0][0], rows[-1][0])):
+                tags.setdefault(item, []).append(tag)
+            for item_id, name, group, path, date, notes in rows:
+                yield item_id, [name, group, tags.get(item_id, []), path, date, notes]
+            last = rows[-1][0]
+
+    def lastChange(self):
+        '''sequence number of the latest change'''
+        conn = self.connection()
+        return conn.execute('SELECT IFNULL(MAX(seq), 0) FROM changes').fetchone()[0]
+
+    def contentVersion(self):
+        '''the latest change recorded by change feed'''
+        try:
+            return self.lastChange()
+        except sqlite3.Error:
+            return None
+
+    def loadChanges(self, items, index=None):
+        '''rows saved since they're loaded last time, e.g. by another instance
+           :param items: current items loaded from this database
+           :param index: callable returning position of item with uid in items, or -1 if
+                    not found, e.g. ItemTable.row(); items are scanned if None
+           :return: {KEY_GROUP: groups tree, or None if not changed,
+                     KEY_TAG: tags, or None if not changed,
+                     KEY_ITEM: (updated, inserted, removed)}
+                - updated: [(row in items, values loaded from database), ...]
+                - inserted: new rows in order of database
+                - removed: uid of items which are deleted from database
+        '''
+        conn = self.connection()
+        last = self.lastChange()
+        records = conn.execute('SELECT DISTINCT kind, uid FROM changes WHERE seq>? AND seq<=?',
+                                (self._seq, last)).fetchall()
+        self._seq = last
+
+        kinds = {kind for kind, _ in records}
+        res = {self.KEY_GROUP: None, self.KEY_TAG: None, self.KEY_ITEM: ([], [], [])}
+        if self.GROUP in kinds:
+            root = conn.execute('SELECT value FROM info WHERE name=?', ('root',)).fetchone()
+            res[self.KEY_GROUP] = self._loadGroups(conn, json.loads(root[0] if root else '[null, null]'))
+        if self.TAG in kinds:
+            res[self.KEY_TAG] = self._loadTags(conn)
+
+        uids = {uid for kind, uid in records if kind==self.ITEM}
+        if not uids:
+            return res
+
+        if index is None:
+            rows = {self._itemUids[id(row)]: row for row in items if id(row) in self._itemUids}
+        else:
+            rows = {uid: items[index(uid)] for uid in uids if index(uid)>=0}
+        values = self._loadItemsByUid(conn, uids)
+        updated, inserted, removed = res[self.KEY_ITEM]
+        for uid in uids:
+            row = rows.get(uid)
+            if uid not in values:
+                if row is not None:
+                    removed.append(uid)
+                    self._itemIds.pop(id(row), None)
+                    self._itemUids.pop(id(row), None)
+            elif row is None:
+                item_id, new = values[uid]
+                inserted.append((item_id, new))
+                self._itemIds[id(new)] = item_id
+                self._itemUids[id(new)] = uid
+            else:
+                updated.append((row, values[uid][1]))
+        inserted[:] = [row for _, row in sorted(inserted, key=lambda item: item[0])]
+
+        return res
+
+    def _loadItemsByUid(self, conn, uids, size=500):
+        '''items with specified uid: uid -> (primary key, [name, group, [tags], path, date, notes])'''
+        uids = list(uids)
+        res = {}
+        for start in range(0, len(uids), size):
+            batch = uids[start:start+size]
+            rows = conn.execute('SELECT id, name, grp, path, date, notes, uid FROM items WHERE uid IN ({0})'.format(
+                        ','.join('?'*len(batch))), batch).fetchall()
+            tags = {}
+            for item, tag in conn.execute('SELECT item, tag FROM item_tags WHERE item IN ({0}) ORDER BY item, position'.format(
+                        ','.join('?'*len(rows))), [row[0] for row in rows]):
+                tags.setdefault(item, []).append(tag)
+            for item_id, name, group, path, date, notes, uid in rows:
+                res[uid] = (item_id, [name, group, tags.get(item_id, []), path, date, notes])
+        return res
+
+    def _loadGroups(self, conn, root):
+        '''groups tree: [name, key, [children]]'''
+        self._groupRows = {}
+        nodes, rows = {}, []
+        self._groupUids = {}
+        for key, name, parent, position, uid in conn.execute(
+                'SELECT key, name, parent, position, uid FROM groups ORDER BY parent, position'):
+            nodes[key] = [name, key, []]
+            rows.append((key, parent))
+            self._groupRows[key] = (name, parent, position)
+            self._groupUids[key] = uid
+
+        # attach to parent in order of position
+        children = []
+        for key, parent in rows:
+            if parent is None:
+                children.append(nodes[key])
+            elif parent in nodes:
+                nodes[parent][2].append(nodes[key])
+
+        return root + [children]
+
+    def _loadTags(self, conn):
+        '''tags list: [key, name, color]'''
+        rows = conn.execute('SELECT key, name, color, uid FROM tags ORDER BY position').fetchall()
+        tags = [[key, name, color] for key, name, color, _ in rows]
+        self._tagRows = {key: (name, color, i) for i, (key, name, color) in enumerate(tags)}
+        self._tagUids = {key: uid for key, _, _, uid in rows}
+        return tags
+
+    def _loadItems(self, conn):
+        '''items list: [name, group, [tags], path, date, notes]'''
+        tags = {}
+        for item, tag in conn.execute('SELECT item, tag FROM item_tags ORDER BY item, position'):
+            tags.setdefault(item, []).append(tag)
+
+        self._itemIds, self._itemUids = {}, {}
+        items = []
+        for item_id, name, group, path, date, notes, uid in conn.execute(
+                'SELECT id, name, grp, path, date, notes, uid FROM items ORDER BY id'):
+            row = [name, group, tags.get(item_id, []), path, date, notes]
+            items.append(row)
+            self._itemIds[id(row)] = item_id
+            self._itemUids[id(row)] = uid
+
+        return items
+
+    # --------------------------------------------------------------
+    # saving
+    # --------------------------------------------------------------
+    def save(self, data, changes=None, origins=None):
+        # rewrite all if rows in database are unknown
+        if not self._synced:
+            changes = None
+
+        groups = data.get(self.KEY_GROUP, [None, None, []])
+        tags = data.get(self.KEY_TAG, [])
+        items = data.get(self.KEY_ITEM, [])
+        settings = data.get(self.KEY_SETTING, {})
+
+        conn = self.connection()
+        self._feed = []
+        try:
+            with conn: # transaction
+                # changes are recorded since the database is created
+                recording = conn.execute('SELECT 1 FROM info WHERE name=?', (self.APP_NAME,)).fetchone() is not None
+
+                conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)', (self.APP_NAME, data[self.APP_NAME]))
+                conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)', ('root', json.dumps(groups[:2])))
+                conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)', (self.KEY_SETTING, json.dumps(settings)))
+
+                old_items = None
+                if changes is None:
+                    # rows before rewriting, so that only the changed fields are recorded
+                    self._loadRows(conn)
+                    old_items = self._loadItemRows(conn) if recording else None
+                    for table in ('groups', 'tags', 'items', 'item_tags'):
+                        conn.execute('DELETE FROM {0}'.format(table))
+                    self._itemIds = {}
+
+                self._saveGroups(conn, groups, *(changes or {}).get(self.KEY_GROUP, (None, [])), rewrite=changes is None)
+                self._saveTags(conn, tags, *(changes or {}).get(self.KEY_TAG, (None, [])), rewrite=changes is None)
+                self._saveItems(conn, items, origins or items, *(changes or {}).get(self.KEY_ITEM, (None, [])),
+                                old_items=old_items, ids=data.get(self.KEY_ID))
+
+                if recording and self._feed:
+                    now, origin = time.time(), self.origin()
+                    conn.executemany('INSERT INTO changes (time, origin, kind, uid, field, value) VALUES (?, ?, ?, ?, ?, ?)',
+                        ((now, origin, kind, uid, field, value) for kind, uid, field, value in self._feed))
+        except Exception:
+            self.invalidate()
+            raise
+        else:
+            self._synced = True
+        finally:
+            self._feed = []
+
+    def update(self, items=(), groups=None, tags=None):
+        '''items are written in batches in a single transaction, and recorded to change feed'''
+        conn = self.connection()
+        self._feed = []
+        try:
+            with conn: # transaction
+                recording = conn.execute('SELECT 1 FROM info WHERE name=?', (self.APP_NAME,)).fetchone() is not None
+                if groups is not None or tags is not None:
+                    self._loadRows(conn)
+                if groups is not None:
+                    conn.execute('INSERT OR REPLACE INTO info VALUES (?, ?)', ('root', json.dumps(groups[:2])))
+                    self._saveGroups(conn, groups, None, [], rewrite=True)
+                if tags is not None:
+                    self._saveTags(conn, tags, None, [], rewrite=True)
+
+                batch = []
+                for row in items:
+                    batch.append(row)
+                    if len(batch)>=self.BATCH:
+                        self._updateItems(conn, batch)
+                        batch = []
+                self._updateItems(conn, batch)
+
+                if recording and self._feed:
+                    now, origin = time.time(), self.origin()
+                    conn.executemany('INSERT INTO changes (time, origin, kind, uid, field, value) VALUES (?, ?, ?, ?, ?, ?)',
+                        ((now, origin, kind, uid, field, value) for kind, uid, field, value in self._feed))
+        except Exception:
+            self.invalidate()
+            raise
+        finally:
+            self._feed = []
+
+    def _updateItems(self, conn, rows):
+        '''write items in place: [(primary key, item), ...]'''
+        if not rows:
+            return
+        olds = {}
+        for start in range(0, len(rows), 500):
+            keys = [item_id for item_id, _ in rows[start:start+500]]
+            marks = ','.join('?'*len(keys))
+            for item_id, name, group, path, date, notes, uid in conn.execute(
+                    'SELECT id, name, grp, path, date, notes, uid FROM items WHERE id IN ({0})'.format(marks), keys):
+                olds[item_id] = (uid, [name, group, path, date, notes, []])
+            for item, tag in conn.execute('SELECT item, tag FROM item_tags WHERE item IN ({0}) ORDER BY item, position'.format(marks), keys):
+                olds[item][1][5].append(tag)
+
+        rows = [(item_id, row) for item_id, row in rows if item_id in olds]
+        for item_id, row in rows:
+            uid, old = olds[item_id]
+            self._recordItem(uid, old, row)
+        conn.executemany('UPDATE items SET name=?, grp=?, path=?, date=?, notes=? WHERE id=?',
+            ((row[0], row[1], row[3], row[4], row[5], item_id) for item_id, row in rows))
+        conn.executemany('DELETE FROM item_tags WHERE item=?', ((item_id,) for item_id, _ in rows))
+        conn.executemany('INSERT INTO item_tags VALUES (?, ?, ?)',
+            ((item_id, i, tag) for item_id, row in rows for i, tag in enumerate(row[2] or [])))
+
+    def _loadRows(self, conn):
+        '''groups/tags stored in database with uid'''
+        self._groupRows, self._tagRows = {}, {}
+        for key, name, parent, position, uid in conn.execute('SELECT key, name, parent, position, uid FROM groups'):
+            self._groupRows[key] = (name, parent, position)
+            self._groupUids[key] = uid
+        for key, name, color, position, uid in conn.execute('SELECT key, name, color, position, uid FROM tags'):
+            self._tagRows[key] = (name, color, position)
+            self._tagUids[key] = uid
+
+    def _loadItemRows(self, conn):
+        '''items stored in database: uid -> (name, group, path, date, notes, [tags])'''
+        tags = {}
+        for item, tag in conn.execute('SELECT item, tag FROM item_tags ORDER BY item, position'):
+            tags.setdefault(item, []).append(tag)
+        return {uid: (name, group, path, date, notes, tags.get(item_id, []))
+            for item_id, name, group, path, date, notes, uid in conn.execute(
+                'SELECT id, name, grp, path, date, notes, uid FROM items')}
+
+    # --------------------------------------------------------------
+    # change feed
+    # --------------------------------------------------------------
+    def record(self, kind, uid, field, value):
+        '''record changed field of current saving'''
+        self._feed.append((kind, uid, field, json.dumps(value)))
+
+    def groupUid(self, key):
+        '''uid of group key, default groups (key<10) have same uid in all databases'''
+        if key is None:
+            return None
+        if key not in self._groupUids:
+            self._groupUids[key] = self.defaultUid(key) if key<10 else self.newUid()
+        return self._groupUids[key]
+
+    def tagUid(self, key):
+        '''uid of tag key, default tag (key=0) has same uid in all databases'''
+        if key not in self._tagUids:
+            self._tagUids[key] = self.defaultUid(key) if key==0 else self.newUid()
+        return self._tagUids[key]
+
+    def _recordItem(self, uid, old, new):
+        '''record changed fields of item
+           :param old: (name, group, path, date, notes, [tags]) stored in database, None if it's new
+           :param new: item row [name, group, [tags], path, date, notes]
+        '''
+        name, group, tags, path, date, notes = new[:6]
+        values = (name, group, path, date, notes, list(tags or []))
+        for field, i in (('name', 0), ('group', 1), ('tags', 5), ('path', 2), ('date', 3), ('notes', 4)):
+            if old is None or old[i]!=values[i]:
+                if field=='group':
+                    value = self.groupUid(group)
+                elif field=='tags':
+                    value = [self.tagUid(tag) for tag in values[i]]
+                else:
+                    value = values[i]
+                self.record(self.ITEM, uid, field, value)
+
+    def _saveGroups(self, conn, root, dirty, removed, rewrite=False):
+        '''write groups with key in dirty, or moved to another parent/position.
+           :param dirty: keys of modified groups, all groups if None
+           :param removed: keys of removed groups
+           :param rewrite: all groups are removed from database already
+        '''
+        # current structure
+        rows = {}
+        def walk(children, parent):
+            for i, (name, key, sub_children) in enumerate(children):
+                rows[key] = (name, parent, i)
+                walk(sub_children, key)
+        walk(root[2], None)
+
+        # removed groups, or not in rows when rewriting all
+        removed = set(removed) | (set(self._groupRows)-set(rows) if rewrite else set())
+        for key in removed:
+            if self._groupRows.pop(key, None):
+                conn.execute('DELETE FROM groups WHERE key=?', (key,))
+                self.record(self.GROUP, self.groupUid(key), self.DELETED, True)
+
+        dirty = set(rows) if dirty is None else set(dirty)
+        values = []
+        for key, row in rows.items():
+            old = self._groupRows.get(key)
+            if rewrite or key in dirty or old!=row:
+                uid = self.groupUid(key)
+                values.append((key, *row, uid))
+                self._groupRows[key] = row
+                for field, old_value, value in zip(self.GROUP_FIELDS, old or (None,)*3, row):
+                    if old is None or old_value!=value:
+                        self.record(self.GROUP, uid, field, self.groupUid(value) if field=='parent' else value)
+        conn.executemany('INSERT OR REPLACE INTO groups VALUES (?, ?, ?, ?, ?)', values)
+
+    def _saveTags(self, conn, tags, dirty, removed, rewrite=False):
+        '''write tags with key in dirty, or moved to another position.
+           :param dirty: keys of modified tags, all tags if None
+           :param removed: keys of removed tags
+           :param rewrite: all tags are removed from database already
+        '''
+        keys = {tag[0] for tag in tags}
+        removed = set(removed) | (set(self._tagRows)-keys if rewrite else set())
+        for key in removed:
+            if self._tagRows.pop(key, None) is not None:
+                conn.execute('DELETE FROM tags WHERE key=?', (key,))
+                self.record(self.TAG, self.tagUid(key), self.DELETED, True)
+
+        dirty = None if dirty is None else set(dirty)
+        values = []
+        for position, (key, name, color) in enumerate(tags):
+            old, row = self._tagRows.get(key), (name, color, position)
+            if rewrite or dirty is None or key in dirty or old!=row:
+                uid = self.tagUid(key)
+                values.append((key, *row, uid))
+                self._tagRows[key] = row
+                for field, old_value, value in zip(self.TAG_FIELDS, old or (None,)*3, row):
+                    if old is None or old_value!=value:
+                        self.record(self.TAG, uid, field, value)
+        conn.executemany('INSERT OR REPLACE INTO tags VALUES (?, ?, ?, ?, ?)', values)
+
+    def _saveItems(self, conn, items, origins, dirty, removed, old_items=None, ids=None):
+        '''write items changed since last saving.
+           :param origins: model rows identifying items, see Storage.save()
+           :param dirty: inserted or modified rows in origins, all items if None
+           :param removed: removed rows
+           :param old_items: items in database before rewriting all, see _loadItemRows()
+           :param ids: ids of items taken by model, which are stored as uid
+        '''
+        if ids is not None and len(ids)!=len(origins):
+            ids = None
+        removed_ids = []
+        for row in removed:
+            if id(row) in self._itemIds:
+                removed_ids.append((self._itemIds.pop(id(row)),))
+                self.record(self.ITEM, self._itemUids.pop(id(row)), self.DELETED, True)
+        conn.executemany('DELETE FROM items WHERE id=?', removed_ids)
+        conn.executemany('DELETE FROM item_tags WHERE item=?', removed_ids)
+
+        # rewrite all: assign primary keys in order directly
+        if dirty is None:
+            uids = ids or [self._itemUids.get(id(row)) or self.newUid() for row in origins]
+            self._itemIds = {id(row): i for i, row in enumerate(origins, start=1)}
+            self._itemUids = {id(row): uid for row, uid in zip(origins, uids)}
+            for start in range(0, len(items), self.BATCH):
+                rows = list(enumerate(items[start:start+self.BATCH], start=start+1))
+                conn.executemany('INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((i, row[0], row[1], row[3], row[4], row[5], uids[i-1]) for i, row in rows))
+                conn.executemany('INSERT INTO item_tags VALUES (?, ?, ?)',
+                    ((i, j, tag) for i, row in rows for j, tag in enumerate(row[2] or [])))
+                if old_items is not None:
+                    for i, row in rows:
+                        self._recordItem(uids[i-1], old_items.pop(uids[i-1], None), row)
+                self.reportProgress(start+len(rows), len(items))
+
+            # items not saved any more
+            for uid in (old_items or {}):
+                self.record(self.ITEM, uid, self.DELETED, True)
+            return
+
+        # values of dirty rows are read from the copied items
+        values = {id(origin): row for origin, row in zip(origins, items)}
+        newIds = None # id(row) -> id taken by model for new rows
+        for n, origin in enumerate(dirty, start=1):
+            row = values[id(origin)]
+            name, group, tags, path, date, notes = row[:6]
+            item_id = self._itemIds.get(id(origin))
+            if item_id is None:
+                if ids and newIds is None:
+                    newIds = {id(origin): uid for origin, uid in zip(origins, ids)}
+                uid = newIds[id(origin)] if newIds else self.newUid()
+                cursor = conn.execute('INSERT INTO items (name, grp, path, date, notes, uid) VALUES (?, ?, ?, ?, ?, ?)',
+                    (name, group, path, date, notes, uid))
+                item_id = cursor.lastrowid
+                self._itemIds[id(origin)] = item_id
+                self._itemUids[id(origin)] = uid
+                self._recordItem(uid, None, row)
+            else:
+                uid = self._itemUids[id(origin)]
+                old = conn.execute('SELECT name, grp, path, date, notes FROM items WHERE id=?', (item_id,)).fetchone()
+                old_tags = [tag for tag, in conn.execute('SELECT tag FROM item_tags WHERE item=? ORDER BY position', (item_id,))]
+                self._recordItem(uid, tuple(old)+(old_tags,) if old else None, row)
+                conn.execute('UPDATE items SET name=?, grp=?, path=?, date=?, notes=? WHERE id=?',
+                    (name, group, path, date, notes, item_id))
+                conn.execute('DELETE FROM item_tags WHERE item=?', (item_id,))
+
+            conn.executemany('INSERT INTO item_tags VALUES (?, ?, ?)',
+                [(item_id, i, tag) for i, tag in enumerate(tags or [])])
+
+            if not n % self.BATCH:
+                self.reportProgress(n, len(dirty))
+        self.reportProgress(len(dirty), len(dirty))
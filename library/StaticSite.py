@@ -0,0 +1,330 @@
+# static catalog of project: browsable HTML pages and a client-side search index,
+# which are published to a file share and opened without any server.
+#
+# site structure:
+#   index.html          groups tree and tags list
+#   items.html          list of listing pages
+#   items-<hex>.html    listing of items with same id prefix, where <hex> is the utf-8
+#                       hex of the first characters of id, see bucketWidth()
+#   search.html         search page, loading only the shards required by a query
+#   search/t-<hex>.js   shard of search index: tokens with same prefix -> item ids,
+#                       where <hex> is the utf-8 hex of the first PREFIX characters.
+#                       items in a group/tag are indexed with token group:<key>/tag:<key>,
+#                       which has its own shard
+#   search/d-<hex>.js   item id -> name for items listed in items-<hex>.html, for
+#                       displaying results
+#   manifest.json       hash of each generated file
+#
+# items are identified by stable ids in search index and anchors of listing pages, and
+# listed by id prefix rather than position, so inserting or removing an item changes
+# only its listing page and shards, while the pages of the other items are kept.
+#
+# shards are JavaScript calling a callback rather than JSON, since pages opened
+# from file system are not allowed to fetch files.
+#
+# files are written only if their content is changed since last generating, and
+# files not generated any more are removed, according to the manifest.
+#
+
+import os
+import re
+import json
+import html
+import hashlib
+
+
+class StaticSite(object):
+    '''generate static catalog of groups, tags and items in a folder'''
+
+    PAGE_SIZE = 200  # items per listing page on average
+    PREFIX = 2       # characters of token prefix deciding the shard
+    MANIFEST = 'manifest.json'
+
+    # columns of item
+    NAME, GROUP, TAGS, PATH, DATE, NOTES = range(6)
+    NOTAG = 0
+    DEFAULT_GROUPS = {2: 'Ungrouped', 3: 'Unreferenced', 4: 'Duplicated', 5: 'Trash'}
+
+    def __init__(self, folder, title='Tagit Catalog'):
+        self.folder = folder
+        self.title = title
+
+    def generate(self, groups, tags, items, ids=None):
+        '''write the site
+           :param groups: children of root group, [[name, key, children], ...]
+           :param tags: [[key, name, color], ...]
+           :param items: [[name, group, [tags], path, date, notes], ...]
+           :param ids: stable ids of items, positions are taken if None
+           :return: (count of written files, count of unchanged files, count of removed files)
+        '''
+        ids = [str(uid) for uid in ids] if ids is not None and len(ids)==len(items) else \
+                [str(i) for i in range(len(items))]
+
+        self._groupNames = dict(self.DEFAULT_GROUPS)
+        def walk(children, path):
+            for name, key, sub_children in children:
+                self._groupNames[key] = '/'.join(path + [name])
+                walk(sub_children, path + [name])
+        walk(groups, [])
+        self._tagNames = {key: name for key, name, _ in tags if key!=self.NOTAG}
+
+        # items listed by id prefix
+        self._width = self.bucketWidth(len(items))
+        buckets = {} # bucket -> [(id, item)]
+        for uid, item in zip(ids, items):
+            buckets.setdefault(self._bucket(uid), []).append((uid, item))
+
+        files = {}
+        files['index.html'] = self._indexPage(groups, tags, items)
+        files['search.html'] = self._searchPage()
+        files['items.html'] = self._listingPage(buckets)
+        for bucket, rows in buckets.items():
+            files['items-{0}.html'.format(bucket)] = self._itemsPage(rows)
+        files.update(self._searchIndex(items, ids, buckets))
+
+        return self._write(files)
+
+    def bucketWidth(self, count):
+        '''characters of id prefix deciding the listing page of item: PAGE_SIZE items per
+           page on average for random hex ids, e.g. uuid. it's kept until count of items
+           grows or shrinks by a factor of 16.
+        '''
+        width = 1
+        while 16**width*self.PAGE_SIZE<count:
+            width += 1
+        return width
+
+    def _bucket(self, uid):
+        return uid[:self._width].encode('utf-8').hex()
+
+    # --------------------------------------------------------------
+    # pages
+    # --------------------------------------------------------------
+    def _html(self, title, body, script=''):
+        return (
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            '<title>{0}</title>\n<style>{1}</style>\n{2}</head>\n<body>\n'
+            '<p><a href="index.html">Groups &amp; Tags</a> | <a href="items.html">Items</a> | '
+            '<a href="search.html">Search</a></p>\n<h1>{0}</h1>\n{3}\n</body>\n</html>\n'
+        ).format(html.escape(title), self.STYLE, script, body)
+
+    def _indexPage(self, groups, tags, items):
+        group_counts, tag_counts = {}, {}
+        for item in items:
+            group_counts[item[self.GROUP]] = group_counts.get(item[self.GROUP], 0) + 1
+            for tag in set(item[self.TAGS] or []):
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+
+        def tree(children):
+            if not children:
+                return ''
+            lines = ['<ul>']
+            for name, key, sub_children in children:
+                lines.append('<li><a href="search.html#group:{0}">{1}</a> ({2}){3}</li>'.format(
+                    key, html.escape(name), group_counts.get(key, 0), tree(sub_children)))
+            lines.append('</ul>')
+            return '\n'.join(lines)
+
+        # default groups are listed after user groups, even if they're in groups tree
+        groups = [group for group in groups if not 0<group[1]<10]
+        default = [[name, key, []] for key, name in self.DEFAULT_GROUPS.items()]
+        tag_lines = ['<li><span class="tag" style="background:{0}"></span>'
+                     '<a href="search.html#tag:{1}">{2}</a> ({3})</li>'.format(
+                        html.escape(color or ''), key, html.escape(name), tag_counts.get(key, 0))
+                     for key, name, color in tags if key!=self.NOTAG]
+        body = '<p>{0} items</p>\n<h2>Groups</h2>\n{1}\n{2}\n<h2>Tags</h2>\n<ul>\n{3}\n</ul>'.format(
+            len(items), tree(groups), tree(default), '\n'.join(tag_lines))
+        return self._html(self.title, body)
+
+    def _listingPage(self, buckets):
+        lines = ['<li><a href="items-{0}.html">{1}</a> ({2})</li>'.format(
+                    bucket, html.escape(rows[0][0][:self._width]), len(rows)) for bucket, rows in sorted(buckets.items())]
+        body = '<p>Items by prefix of id</p>\n<ul class="nav">\n{0}\n</ul>'.format('\n'.join(lines))
+        return self._html('{0} - items'.format(self.title), body)
+
+    def _itemsPage(self, items):
+        '''listing of items in a bucket: [(id, item), ...]'''
+        rows = []
+        for uid, item in items:
+            path = item[self.PATH] or ''
+            link = '<a href="{0}">{1}</a>'.format(html.escape(self._fileUrl(path)), html.escape(path)) if path else ''
+            rows.append('<tr id="item-{0}"><td>{1}</td><td>{2}</td><td>{3}</td><td>{4}</td><td>{5}</td><td>{6}</td></tr>'.format(
+                html.escape(uid), html.escape(item[self.NAME] or ''),
+                html.escape(self._groupNames.get(item[self.GROUP], '')),
+                html.escape(', '.join(self._tagNames[tag] for tag in (item[self.TAGS] or []) if tag in self._tagNames)),
+                link, html.escape(item[self.DATE] or ''), html.escape(item[self.NOTES] or '')))
+
+        body = ('<table>\n<tr><th>Title</th><th>Group</th><th>Tags</th>'
+                '<th>Path</th><th>Date</th><th>Notes</th></tr>\n{0}\n</table>').format('\n'.join(rows))
+        prefix = items[0][0][:self._width]
+        return self._html('{0} - items {1}'.format(self.title, prefix), body)
+
+    def _searchPage(self):
+        body = ('<p><input id="query" size="60" placeholder="words or prefixes of 2+ characters"> '
+                '<span id="count"></span></p>\n<ol id="results"></ol>')
+        script = '<script>\nvar WIDTH = {0}, PREFIX = {1};\n{2}</script>\n'.format(
+                    self._width, self.PREFIX, self.SEARCH_SCRIPT)
+        return self._html('{0} - search'.format(self.title), body, script)
+
+    @staticmethod
+    def _fileUrl(path):
+        path = os.path.abspath(path).replace(os.sep, '/')
+        return 'file://' + (path if path.startswith('/') else '/'+path)
+
+    # --------------------------------------------------------------
+    # search index
+    # --------------------------------------------------------------
+    @classmethod
+    def tokens(cls, text):
+        '''lower case words of text'''
+        return re.findall(r'\w+', (text or '').lower())
+
+    def _searchIndex(self, items, ids, buckets):
+        '''shards of tokens and names of items'''
+        shards = {} # shard -> {token: [ids]}
+        def add(token, shard, i):
+            postings = shards.setdefault(shard, {}).setdefault(token, [])
+            if not postings or postings[-1]!=i:
+                postings.append(i)
+
+        for i, item in zip(ids, items):
+            text = ' '.join([
+                item[self.NAME] or '', item[self.NOTES] or '', os.path.basename(item[self.PATH] or ''),
+                self._groupNames.get(item[self.GROUP], '')] +
+                [self._tagNames.get(tag, '') for tag in (item[self.TAGS] or [])])
+            for token in self.tokens(text):
+                if len(token)>=self.PREFIX:
+                    add(token, token[:self.PREFIX], i)
+            add('group:{0}'.format(item[self.GROUP]), 'group:{0}'.format(item[self.GROUP]), i)
+            for tag in set(item[self.TAGS] or []):
+                add('tag:{0}'.format(tag), 'tag:{0}'.format(tag), i)
+
+        files = {}
+        for shard, postings in shards.items():
+            key = shard.encode('utf-8').hex()
+            files['search/t-{0}.js'.format(key)] = 'tagitShard("{0}", {1});\n'.format(
+                key, json.dumps(postings, sort_keys=True, ensure_ascii=False, separators=(',', ':')))
+
+        # names of items in each listing page
+        for bucket, rows in buckets.items():
+            names = {uid: item[self.NAME] or '' for uid, item in rows}
+            files['search/d-{0}.js'.format(bucket)] = 'tagitDocs("{0}", {1});\n'.format(
+                bucket, json.dumps(names, sort_keys=True, ensure_ascii=False, separators=(',', ':')))
+        return files
+
+    # --------------------------------------------------------------
+    # files
+    # --------------------------------------------------------------
+    def _write(self, files):
+        '''write changed files and remove stale ones according to manifest'''
+        manifest_file = os.path.join(self.folder, self.MANIFEST)
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+
+        written = unchanged = 0
+        hashes = {}
+        for name, content in files.items():
+            buf = content.encode('utf-8')
+            hashes[name] = hashlib.blake2b(buf, digest_size=16).hexdigest()
+            filename = os.path.join(self.folder, name)
+            if manifest.get(name)==hashes[name] and os.path.exists(filename):
+                unchanged += 1
+                continue
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            with open(filename, 'wb') as f:
+                f.write(buf)
+            written += 1
+
+        removed = 0
+        for name in manifest:
+            filename = os.path.join(self.folder, name)
+            if name not in hashes and os.path.exists(filename):
+                os.remove(filename)
+                removed += 1
+
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(hashes, f, sort_keys=True, indent=0)
+
+        return written, unchanged, removed
+
+    STYLE = (
+        'body{font-family:sans-serif;margin:1em 2em}'
+        'table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:2px 6px;text-align:left}'
+        '.tag{display:inline-block;width:10px;height:10px;margin-right:4px}'
+    )
+
+    # shards are loaded by script elements, and cached once loaded
+    SEARCH_SCRIPT = r'''
+var loaded = {}, pending = {};
+function load(file, key) {
+    if (loaded[key] !== undefined) return Promise.resolve(loaded[key]);
+    if (!pending[key]) pending[key] = new Promise(function (resolve) {
+        var s = document.createElement('script');
+        s.src = file;
+        s.onerror = function () { loaded[key] = null; resolve(null); };
+        pending[key + ':resolve'] = resolve;
+        document.head.appendChild(s);
+    });
+    return pending[key];
+}
+function done(key, value) {
+    loaded[key] = value;
+    var resolve = pending[key + ':resolve'];
+    if (resolve) resolve(value);
+}
+function tagitShard(key, postings) { done('t-' + key, postings); }
+function tagitDocs(key, names) { done('d-' + key, names); }
+function hex(text) {
+    return Array.from(new TextEncoder().encode(text)).map(function (b) {
+        return b.toString(16).padStart(2, '0'); }).join('');
+}
+function bucket(id) { return hex(Array.from(id).slice(0, WIDTH).join('')); }
+function ids(token) {
+    var shard = token.indexOf(':') > 0 ? token : Array.from(token).slice(0, PREFIX).join('');
+    var key = hex(shard);
+    return load('search/t-' + key + '.js', 't-' + key).then(function (postings) {
+        var res = new Set();
+        if (!postings) return res;
+        Object.keys(postings).forEach(function (t) {
+            if (t === token || (token.indexOf(':') < 0 && t.startsWith(token)))
+                postings[t].forEach(function (i) { res.add(i); });
+        });
+        return res;
+    });
+}
+function search(query) {
+    var tokens = query.indexOf(':') > 0 ? [query.trim()] :
+        (query.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || []).filter(function (t) { return Array.from(t).length >= PREFIX; });
+    var results = document.getElementById('results'), count = document.getElementById('count');
+    if (!tokens.length) { results.innerHTML = ''; count.textContent = ''; return; }
+    Promise.all(tokens.map(ids)).then(function (sets) {
+        var found = Array.from(sets[0]).filter(function (i) {
+            return sets.every(function (s) { return s.has(i); }); });
+        count.textContent = found.length + ' items';
+        var shown = found.slice(0, 500), buckets = Array.from(new Set(shown.map(bucket)));
+        return Promise.all(buckets.map(function (b) { return load('search/d-' + b + '.js', 'd-' + b); })).then(function () {
+            results.innerHTML = '';
+            shown.forEach(function (i) {
+                var name = (loaded['d-' + bucket(i)] || {})[i];
+                if (name === undefined) return;
+                var li = document.createElement('li'), a = document.createElement('a');
+                a.href = 'items-' + bucket(i) + '.html#item-' + encodeURIComponent(i);
+                a.textContent = name;
+                li.appendChild(a);
+                results.appendChild(li);
+            });
+        });
+    });
+}
+window.addEventListener('DOMContentLoaded', function () {
+    var input = document.getElementById('query'), timer = null;
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        timer = setTimeout(function () { search(input.value); }, 200);
+    });
+    if (location.hash) { input.value = decodeURIComponent(location.hash.slice(1)); search(input.value); }
+});
+'''
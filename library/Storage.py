@@ -0,0 +1,196 @@
+# storage engines for Tagit database:
+# load/save project data {groups, tags, items, settings}
+#
+
+import os
+import pickle
+
+
+class Storage(object):
+    '''base class for storage engine of a database file'''
+
+    APP_NAME = 'Tagit'
+    KEY_GROUP = 'groups'
+    KEY_TAG = 'tags'
+    KEY_ITEM = 'items'
+    KEY_SETTING = 'settings'
+    KEY_ID = 'ids' # stable id of each item, optional
+
+    def __init__(self, filename):
+        self.filename = filename
+
+        # callable reporting saving progress: progress(done, total)
+        self._progress = None
+
+    @staticmethod
+    def isValid(filename):
+        '''check whether the file could be loaded by this engine'''
+        raise NotImplementedError
+
+    def load(self):
+        '''load project data: {APP_NAME: version, KEY_GROUP: ..., KEY_TAG: ..., KEY_ITEM: ..., KEY_SETTING: ...},
+           and KEY_ID: [id of each item] if ids are stored
+        '''
+        raise NotImplementedError
+
+    def save(self, data, changes=None, origins=None):
+        '''save project data
+           :param data: whole project data with same structure as load()
+           :param changes: rows changed since last saving for each model, e.g.
+                    {KEY_GROUP: (dirty, removed), KEY_TAG: (dirty, removed), KEY_ITEM: (dirty, removed)},
+                    all data is rewritten if None
+           :param origins: model rows which items in data are copied from, e.g. a snapshot is
+                    saved in background. items are identified by these rows across savings,
+                    and dirty/removed item rows in changes refer to them.
+           ids of items in data[KEY_ID] are stored if supported, otherwise new ids are taken.
+        '''
+        raise NotImplementedError
+
+    def loadHeader(self):
+        '''project data except items, e.g. for checking items streamed by iterItems()'''
+        data = self.load()
+        data.pop(self.KEY_ITEM, None)
+        data.pop(self.KEY_ID, None)
+        return data
+
+    def iterItems(self):
+        '''stream items in order of load(): (key, item), where key identifies the row
+           in database, see update(). all items are loaded by default.
+        '''
+        return enumerate(self.load().get(self.KEY_ITEM, []))
+
+    def update(self, items=(), groups=None, tags=None):
+        '''write the specified rows in place, while the others are kept
+           :param items: iterable of (key, item) replacing items, see iterItems(). it's
+                    consumed while writing, so it could be streamed by iterItems()
+           :param groups, tags: replace all groups/tags if not None
+           all data is loaded and rewritten by default.
+        '''
+        data = self.load()
+        for key, item in items:
+            data[self.KEY_ITEM][key][:] = item
+        if groups is not None:
+            data[self.KEY_GROUP] = groups
+        if tags is not None:
+            data[self.KEY_TAG] = tags
+        self.invalidate()
+        self.save(data)
+
+    def itemId(self, row):
+        '''stored id of item row loaded/saved by this engine, None if unknown'''
+        return None
+
+    def contentVersion(self):
+        '''cheap token changed whenever content is saved, e.g. for keying caches,
+           None if it's not supported, then content should be hashed instead
+        '''
+        return None
+
+    def setProgress(self, progress=None):
+        '''report saving progress with callable progress(done, total)'''
+        self._progress = progress
+
+    def reportProgress(self, done, total):
+        if self._progress:
+            self._progress(done, total)
+
+    def invalidate(self):
+        '''changes are lost, e.g. failed to save, so rewrite all data next time'''
+        pass
+
+    def close(self):
+        '''release resources of this engine'''
+        pass
+
+
+class PickleStorage(Storage):
+    '''legacy storage: the whole project data is dumped by pickle'''
+
+    @staticmethod
+    def isValid(filename):
+        try:
+            with open(filename, 'rb') as f:
+                return f.read(1)==b'\x80' # pickle protocol>=2
+        except OSError:
+            return False
+
+    def load(self):
+        with open(self.filename, 'rb') as f:
+            try:
+                return pickle.load(f)
+            except (pickle.UnpicklingError, EOFError) as e:
+                raise ValueError('Invalid database: {0}'.format(self.filename)) from e
+
+    def save(self, data, changes=None, origins=None):
+        with open(self.filename, 'wb') as f:
+            pickle.dump(data, f)
+
+
+def openStorage(filename):
+    '''storage engine for an existing database.
+       legacy pickle database is migrated to SQLite once, and the original
+       file is kept as a backup: filename.bak
+    '''
+    from .SQLiteStorage import SQLiteStorage
+    from .ColumnStorage import ColumnStorage
+
+    if SQLiteStorage.isValid(filename):
+        return SQLiteStorage(filename)
+
+    if ColumnStorage.isValid(filename):
+        return ColumnStorage(filename)
+
+    # legacy database
+    data = PickleStorage(filename).load()
+    if Storage.APP_NAME not in data:
+        raise ValueError('Invalid database: {0}'.format(filename))
+
+    storage = createStorage(filename, data)
+    storage.close()
+    return storage
+
+
+def createStorage(filename, data, origins=None, progress=None):
+    '''create new database with project data, existing file is replaced.
+       data is written to a temporary file first, so the original file remains if failed.
+       columnar database is created if filename ends with ColumnStorage.EXTENSION,
+       otherwise SQLite database.
+       see Storage.save() and Storage.setProgress() for origins and progress.
+    '''
+    from .SQLiteStorage import SQLiteStorage
+    from .ColumnStorage import ColumnStorage
+
+    if os.path.splitext(filename)[1].lower()==ColumnStorage.EXTENSION:
+        storage = ColumnStorage(filename)
+        storage.setProgress(progress)
+        storage.save(data, origins=origins)
+        return storage
+
+    tmp_filename = '{0}.tmp'.format(filename)
+    if os.path.exists(tmp_filename):
+        os.remove(tmp_filename)
+
+    storage = SQLiteStorage(tmp_filename)
+    storage.setProgress(progress)
+    try:
+        storage.save(data, origins=origins)
+    finally:
+        storage.close()
+
+    # keep legacy database as backup
+    if PickleStorage.isValid(filename):
+        os.replace(filename, '{0}.bak'.format(filename))
+    os.replace(tmp_filename, filename)
+
+    # data is written already, so the row mapping is still valid
+    storage.filename = filename
+    return storage
+
+
+def loadData(filename):
+    '''load project data from an existing database'''
+    storage = openStorage(filename)
+    try:
+        return storage.load()
+    finally:
+        storage.close()
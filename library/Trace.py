@@ -0,0 +1,87 @@
+# workload trace: high-level operations of a session are recorded with their arguments
+# and timestamps, so that they could be replayed against a copy of the database as a
+# repeatable benchmark, see TagitReplay.py. JSON Lines file:
+#   {"Tagit": version, "database": path, "items": count, "start": epoch seconds}
+#   {"t": seconds since start, "op": name, ...arguments}
+#   ...
+# operations:
+#   filterGroup {group}, filterTag {tag}, search {text}
+#   move {ids, group}, attachTag {ids, tag}, removeTag {ids, tag}
+#   import {items, ids}, importCatalog {filename, ids}, save {}
+# items are recorded by their stable ids, which are the same when the trace is replayed
+# against the database it's recorded on; ids of imported items are recorded also, so
+# that they're taken again when replayed.
+#
+
+import json
+import time
+
+
+class TraceRecorder(object):
+    '''append operations to trace file, each is flushed so a crashed session is kept'''
+
+    def __init__(self, filename, header):
+        '''
+           :param header: dict describing the session, e.g. database and count of items
+        '''
+        self.filename = filename
+        self._start = time.perf_counter()
+        self._file = open(filename, 'w', encoding='utf-8')
+        header = dict(header)
+        header['start'] = time.time()
+        self._write(header)
+
+    def record(self, op, **args):
+        if not self._file:
+            return
+        args['t'] = round(time.perf_counter()-self._start, 6)
+        args['op'] = op
+        self._write(args)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+
+def readTrace(filename):
+    '''(header, [operations]) of trace file'''
+    with open(filename, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records or 'op' in records[0]:
+        raise ValueError('Invalid trace file: {0}'.format(filename))
+    return records[0], records[1:]
+
+
+def summarize(latencies):
+    '''statistics of latencies by operation
+       :param latencies: [(op, seconds), ...]
+       :return: [(op, count, total, mean, median, p95, max), ...] in milliseconds,
+                sorted by total time
+    '''
+    groups = {}
+    for op, seconds in latencies:
+        groups.setdefault(op, []).append(seconds*1000)
+
+    res = []
+    for op, values in groups.items():
+        values.sort()
+        n = len(values)
+        res.append((op, n, sum(values), sum(values)/n, values[n//2],
+                    values[min(n-1, int(n*0.95))], values[-1]))
+    return sorted(res, key=lambda stats: stats[2], reverse=True)
+
+
+def report(latencies):
+    '''lines of latency table by operation'''
+    lines = ['{0:<14} {1:>6} {2:>10} {3:>9} {4:>9} {5:>9} {6:>9}'.format(
+                'operation', 'count', 'total', 'mean', 'median', 'p95', 'max')]
+    for op, count, total, mean, median, p95, slowest in summarize(latencies):
+        lines.append('{0:<14} {1:>6} {2:10.1f} {3:9.1f} {4:9.1f} {5:9.1f} {6:9.1f}'.format(
+                op, count, total, mean, median, p95, slowest))
+    lines.append('(milliseconds)')
+    return lines
@@ -0,0 +1,16 @@
+from . import Storage
+from . import SQLiteStorage
+from . import ColumnStorage
+from . import Journal
+from . import IndexCache
+from . import History
+from . import ChangeFeed
+from . import FileLock
+from . import Federation
+from . import Merge
+from . import Interchange
+from . import Integrity
+from . import StaticSite
+from . import Catalog
+from . import Core
+from . import RpcServer
\ No newline at end of file
@@ -1,72 +1,11 @@
 # model for group tree view
-# an editable tree based on simple TreeModel
+# an editable tree based on simple TreeModel, adapting core groups tree
 
 from PyQt5.QtCore import QModelIndex, Qt
-from models.TreeModel import TreeItem, TreeModel
+from models.TreeModel import TreeModel
+from library.IndexCache import countGroups
+from library.Core import GroupTree
 
-class GroupItem(TreeItem):
-
-    def __init__(self, data, parent=None):
-        '''       
-        :param data: columns of tree
-        :param parent: parent item
-        '''
-        super(GroupItem, self).__init__(data, parent)
-
-
-    def keys(self):
-        '''all keys including children'''
-        groups = [self.itemData[GroupModel.KEY]]
-        for item in self.childItems:
-            groups.extend(item.keys())
-        return groups
-
-    def insertChildren(self, position, count, columns):
-        '''insert children with specified columns at sprcified position
-        :param position: position to insert children
-        :param count: count of inserting items
-        :param columns: count of columns of the inserting item
-        '''
-        # check range
-        if position < 0 or position > len(self.childItems): 
-            return False
-
-        for i, row in enumerate(range(count)):
-            data = [None for v in range(columns)] # None by default
-            item = GroupItem(data, self)
-            self.childItems.insert(position, item)
-        
-        return True
-
-    def removeChildren(self, position, count):
-        '''remove children from given position'''
-        if position < 0 or position + count > len(self.childItems):
-            return False
-
-        for row in range(count):
-            self.childItems.pop(position)
-
-        return True
-
-    def setData(self, column, value):
-        '''edit data at given column'''
-        if column < 0 or column >= len(self.itemData):
-            return False
-        else:
-            self.itemData[column] = value
-            return True
-
-    def reset(self):
-        '''remove all child items'''
-        self.childItems = []
-
-    def serialize(self):
-        '''store data'''
-        res = self.itemData[:] # copy
-        # ignore default group
-        res.append([child.serialize() for child in self.childItems if child.itemData[GroupModel.KEY]>9])
-
-        return res # key, name, children
 
 class GroupModel(TreeModel):
 
@@ -87,28 +26,19 @@ class GroupModel(TreeModel):
            :param parent: parent object
         '''         
         # init model with root item only
-        rootItem = GroupItem(header) # root item
-        super(GroupModel, self).__init__(rootItem, parent)
-
-        self.defaultGroups = [['All Groups', GroupModel.ALLGROUPS, [
-            ['Ungrouped', GroupModel.UNGROUPED, []],
-            ['Unreferenced', GroupModel.UNREFERENCED, []],
-            ['Duplicated', GroupModel.DUPLICATED, []],
-            ['Trash', GroupModel.TRASH, []]
-        ]]]
+        self.tree = GroupTree(header)
+        super(GroupModel, self).__init__(self.tree.root, parent)
 
-        self.initData()
+        self.defaultGroups = GroupTree.DEFAULT_GROUPS
 
+        # count of items in total and in each group: {key: count}
+        self.total = 0
+        self.counts = {}
 
-    def initData(self):
-        # key for each item
-        self._currentKey = 9
-        # require saving if True
-        self._saveRequired = False  
-        # reference item count for each group
-        self.referenceList = []
-        # clear all groups first
-        self.rootItem.reset()
+        # count of items in each group including sub-groups {key: total}, and nodes
+        # {key: node}, which are rolled up when the tree is changed, see subtotal()
+        self._totals = None
+        self._nodes = {}
 
     def setup(self, items=[]):
         '''setup model data for generating the tree
@@ -118,45 +48,154 @@ class GroupModel(TreeModel):
         # reset data within beginResetModel() and endResetModel(),
         # so that these model data could be updated explicitly
         self.beginResetModel()        
-        self.initData()
-        self._setupData(self.defaultGroups, self.rootItem, True)
-        self._setupData(items, self.rootItem)
+        self.total = 0
+        self.counts = {}
+        self._totals = None
+        self.tree.setup(items)
         self.endResetModel()
 
-    def updateItems(self, items):
-        '''items for counting'''
-        self.referenceList = items
+    def updateItems(self, items, counts=None):
+        '''items for counting
+           :param counts: count of items in each group {key: count}, e.g. loaded from
+                    index cache, counted from items if None
+        '''
+        self.total = len(items)
+        self.counts = countGroups(items) if counts is None else dict(counts)
+        self._totals = None
+
+    def _rollup(self):
+        '''total of each group summed up post-order, so each group is visited once'''
+        self._totals, self._nodes = {}, {}
+        def walk(node):
+            key = node.data(GroupModel.KEY)
+            total = self.counts.get(key, 0) + sum(walk(child) for child in node.childItems)
+            self._totals[key], self._nodes[key] = total, node
+            return total
+        for node in self.rootItem.childItems:
+            walk(node)
+
+    def subtotal(self, key):
+        '''count of items in group and its sub-groups'''
+        if key==GroupModel.ALLGROUPS:
+            return self.total
+        if self._totals is None:
+            self._rollup()
+        return self._totals.get(key, 0)
+
+    def updateCounts(self, changes):
+        '''update counters with changes of items, and the groups with changed count
+           are repainted, see library.Core.ItemTable
+           :return: False if counters are rebuilt, i.e. the whole tree is changed
+        '''
+        keys = {}
+        def add(key, n):
+            self.counts[key] = self.counts.get(key, 0) + n
+            keys[key] = keys.get(key, 0) + n
+
+        for op, *args in changes:
+            if op=='group':
+                uid, old, new = args
+                add(old, -1)
+                add(new, 1)
+            elif op in ('insert', 'remove'):
+                n = 1 if op=='insert' else -1
+                for uid, group, tags in args[0]:
+                    add(group, n)
+                self.total += n*len(args[0])
+                keys.setdefault(GroupModel.ALLGROUPS, 0)
+            elif op=='reset':
+                self.updateItems(args[0])
+                return False
+
+        # count of group is shown with its parents, so the changes are added to totals
+        # of them, unless totals are rolled up from the new counts
+        rollup = self._totals is None
+        if rollup:
+            self._rollup()
+        nodes = {}
+        for key, n in keys.items():
+            node = self._nodes.get(key)
+            while node is not None and node is not self.rootItem:
+                if not rollup:
+                    self._totals[node.data(GroupModel.KEY)] += n
+                nodes[id(node)] = node
+                node = node.parent()
+        for node in nodes.values():
+            index = self.createIndex(node.childNumber(), GroupModel.NAME, node)
+            self.dataChanged.emit(index, index)
+        return True
 
-    def _setupData(self, items, parent, default=False):
-        '''setup model data for generating the tree
-           :param items: list raw data for child items of parent, e.g.
-                        [[name, key, [children]], ..., []]
-           :param parent: parent item
-           :param default: if not default, :param items: should be checked ->
-                        0<key<10 is invalid, so these items should be ignored
+    def reloadGroups(self, items):
+        '''update names of groups loaded from database, e.g. saved by another instance
+           :param items: children of root, [[name, key, [children]], ...]
+           :return: False if groups are inserted, removed or moved, which requires setup()
         '''
-        for name, key, children in items:
+        names = self.tree.reload(items)
+        if names is None:
+            return False
 
-            # default group should not exist in user data 
-            if not default and 0<key<10:
-                continue
+        for item, name in names:
+            item.setData(GroupModel.NAME, name)
+            index = self.createIndex(item.childNumber(), GroupModel.NAME, item)
+            self.dataChanged.emit(index, index)
+        return True
 
-            # append item
-            parent.insertChildren(parent.childCount(), 1, parent.columnCount())
-            if self._currentKey < key:
-                self._currentKey = key
-            # set data
-            currentItem = parent.child(parent.childCount()-1)            
-            currentItem.setData(GroupModel.NAME, name)
-            currentItem.setData(GroupModel.KEY, key)
+    def currentKey(self):
+        '''the last key taken'''
+        return self.tree.keys.current()
 
-            # setup child items
-            self._setupData(children, currentItem, default)
+    def reserveKey(self, key):
+        '''keys up to specified key are taken, e.g. referenced by items already'''
+        self.tree.keys.reserve(key)
 
     def nextKey(self):
         '''next key for new item of this model'''
-        self._currentKey += 1
-        return self._currentKey
+        return self.tree.keys.next()
+
+    def appendGroups(self, groups):
+        '''append groups as the last children of their parents, e.g. merged from another
+           database. nodes are looked up by key once, and new groups under an existing
+           parent are inserted at a time with their sub-groups.
+           :param groups: [(parent key, name, key), ...], where parent key is None for top
+                level group, and new parent group is ahead of its children
+        '''
+        nodes = {None: self.rootItem} # key -> node
+        def walk(node):
+            for child in node.childItems:
+                nodes[child.data(GroupModel.KEY)] = child
+                walk(child)
+        walk(self.rootItem)
+
+        # new groups under each existing parent: {parent key: [[name, key, children], ...]}
+        top, children = {}, {}
+        for parentKey, name, key in groups:
+            group = [name, key, []]
+            children[key] = group[2]
+            if parentKey in children:
+                children[parentKey].append(group)
+            else:
+                top.setdefault(parentKey, []).append(group)
+
+        for parentKey, subgroups in top.items():
+            parent = nodes.get(parentKey, self.rootItem)
+            index = QModelIndex() if parent is self.rootItem else \
+                        self.createIndex(parent.childNumber(), GroupModel.NAME, parent)
+            position = parent.childCount()
+            self.beginInsertRows(index, position, position+len(subgroups)-1)
+            self._appendChildren(parent, subgroups)
+            self._totals = None
+            self.endInsertRows()
+
+    def _appendChildren(self, parent, groups):
+        '''append groups [[name, key, children], ...] to parent node'''
+        position = parent.childCount()
+        self.tree.insertChildren(parent, position, len(groups))
+        for node, (name, key, children) in zip(parent.childItems[position:], groups):
+            self.tree.setData(node, GroupModel.NAME, name)
+            self.tree.setData(node, GroupModel.KEY, key)
+            self.tree.keys.reserve(key)
+            if children:
+                self._appendChildren(node, children)
 
     def isDefaultGroup(self, index):
         '''default item: 0<key<10'''
@@ -166,7 +205,31 @@ class GroupModel(TreeModel):
         return 0<key<10
 
     def saveRequired(self):
-        return self._saveRequired
+        return self.tree.saveRequired()
+
+    def resetChanges(self):
+        '''clear groups changed since last saving'''
+        self.tree.resetChanges()
+
+    def changes(self):
+        '''keys of groups changed since last saving: (inserted or modified keys, removed keys)'''
+        return self.tree.changes()
+
+    def setJournal(self, journal=None):
+        '''record each mutation with callable journal(op, *args)'''
+        self.tree.setJournal(journal)
+
+    def record(self, op, *args):
+        '''record mutation to journal if exists'''
+        self.tree.record(op, *args)
+
+    def getPath(self, index):
+        '''rows from top level to the item with specified index'''
+        path = []
+        while index.isValid():
+            path.insert(0, index.row())
+            index = index.parent()
+        return path
 
     def getIndexByKey(self, key, parent=QModelIndex()):
         '''get ModelIndex with specified key in the associated object'''
@@ -197,9 +260,11 @@ class GroupModel(TreeModel):
 
     def serialize(self, save=True):
         '''store raw data'''
-        if save:
-            self._saveRequired = False # saved
-        return self.rootItem.serialize()
+        return self.tree.serialize(save)
+
+    def snapshot(self):
+        '''serialized tree is a copy already'''
+        return self.serialize()
 
     # --------------------------------------------------------------
     # ------------ default methods requiring overloaded ------------
@@ -243,15 +308,8 @@ class GroupModel(TreeModel):
         # displaying
         if role == Qt.DisplayRole:
             if col == GroupModel.NAME:
-                keys, name = group.keys(), group.data(col)
-                count = 0 # count
-
-                if GroupModel.ALLGROUPS in keys:
-                    count = len(self.referenceList)
-                else:                
-                    for item in self.referenceList:
-                        if item[1] in keys:
-                            count += 1
+                name = group.data(col)
+                count = self.subtotal(group.data(GroupModel.KEY))
                 return '{0} ({1})'.format(name, count) if count else name
             else:
                 return group.data(col)
@@ -270,41 +328,33 @@ class GroupModel(TreeModel):
             return False
 
         # edit item
-        item = self.getItem(index)
-        result = item.setData(index.column(), value)
+        result = self.tree.setData(self.getItem(index), index.column(), value)
 
         # emit signal if successed
         if result:
-            self._saveRequired = True
+            if index.column()==GroupModel.KEY:
+                self._totals = None
             self.dataChanged.emit(index, index)
 
         return result
 
     def insertRows(self, position, rows, parent=QModelIndex()):
         '''insert rows'''
-        parentItem = self.getItem(parent)
         self.beginInsertRows(parent, position, position + rows - 1)
-        success = parentItem.insertChildren(position, rows, self.rootItem.columnCount())
+        success = self.tree.insertChildren(self.getItem(parent), position, rows)
+        self._totals = None
         self.endInsertRows()
 
-        # flag for saving model
-        if success:
-            self._saveRequired = True
-
         return success
     
     def removeRows(self, position, rows, parent=QModelIndex()):
         '''remove rows starting from given position'''
         
         self.beginRemoveRows(parent, position, position+rows-1)
-        parentItem = self.getItem(parent)
-        success = parentItem.removeChildren(position, rows)
+        success = self.tree.removeChildren(self.getItem(parent), position, rows)
+        self._totals = None
         self.endRemoveRows()
 
-        # flag for saving model
-        if success:
-            self._saveRequired = True           
-
         return success
 
     # implement drop methods
@@ -1,9 +1,10 @@
 # model, delegate for Tags table view
 # 
 
-import os
+from functools import partial
+from contextlib import contextmanager
 
-from PyQt5.QtCore import (QSortFilterProxyModel, QModelIndex, Qt, QPointF, QMimeData)
+from PyQt5.QtCore import (QSortFilterProxyModel, QModelIndex, Qt, QPointF, QMimeData, QThread, pyqtSignal)
 from PyQt5.QtGui import QPainter, QColor
 from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
 
@@ -11,13 +12,36 @@ from models.TableModel import TableModel
 from models.TagModel import TagModel
 from models.GroupModel import GroupModel
 
+from library.Core import ItemTable, checkPaths
+
 
 class ItemModel(TableModel):
 
     NAME, GROUP, TAGS, PATH, DATE, NOTES = range(6)
 
+    referencesChecked = pyqtSignal(int, list) # rows version, whether each path is invalid
+
+    # changes of group/tags membership, see library.Core.ItemTable, which are emitted when
+    # they're made, or at a time when transaction is committed. ('reset', items) if items
+    # are loaded from database, so counters should be rebuilt, see recount()
+    itemsChanged = pyqtSignal(list)
+
     def __init__(self, headers, parent=None):        
-        super(ItemModel, self).__init__(headers, parent)
+        super(ItemModel, self).__init__(headers, parent, ItemTable())
+
+        # checking source paths in background
+        self._refreshThread = None
+
+        # transaction: depth of nested transactions, rows to append and
+        # range of updated rows, which are notified when it's committed
+        self._transaction = 0
+        self._pendingRows = []
+        self._pendingIds = []
+        self._changedRange = None
+        self._changes = []
+
+        # publish changes made to items
+        self.table.setListener(self._publish)
 
     def flags(self, index):
         '''item status'''
@@ -26,34 +50,227 @@ class ItemModel(TableModel):
 
         return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
 
-    def setup(self, items=[]):
+    def data(self, index, role=Qt.DisplayRole):
+        '''read single value directly, so that lazy loaded row needn't to be decoded entirely'''
+        if role != Qt.DisplayRole and role != Qt.EditRole:
+            return None
+
+        if not self.checkIndex(index):
+            return None
+
+        return self.table.value(index.row(), index.column())
+
+    def values(self, col):
+        '''values of specified column for all items'''
+        return self.table.values(col)
+
+    def itemId(self, row):
+        '''stable id of item at row, see library.Core.ItemTable'''
+        return self.table.id(row)
+
+    def itemRow(self, uid):
+        '''row of item with specified id, -1 if not found'''
+        return self.table.row(uid)
+
+    def groupRows(self, groups):
+        '''rows of items in groups, found by the index of group members, see library.Core.ItemTable'''
+        return self.table.groupRows(groups)
+
+    def setup(self, items=[], refresh=True, ids=None):
         '''setup model data:
            it is convenient to reset data after the model is created
+           :param refresh: check source paths, see refresh()
+           :param ids: ids of items loaded from database, new ids are taken if None
         '''
+        self.stopRefreshing()
+
         self.beginResetModel()
-        self.dataList = items
+        self.table.setup(items, ids)
         self.endResetModel()
 
-        self.refresh() # correct items with invalid source path
+        if refresh:
+            self.refresh() # correct items with invalid source path
         
 
+    def loadRows(self, rows, ids=None):
+        '''append rows loaded from database with their ids, see TableModel.loadRows()'''
+        if not rows:
+            return
+        position = len(self.dataList)
+        self.beginInsertRows(QModelIndex(), position, position+len(rows)-1)
+        self.table.load(rows, ids)
+        self.endInsertRows()
+
+    # --------------------------------------------------------------
+    # transaction: bulk mutations notified with single signals
+    # --------------------------------------------------------------
+    def beginTransaction(self):
+        '''start batching mutations, which could be nested:
+           - cells set by setData()/updateRows() are changed in place without signals
+           - rows appended by appendRows() are held until commit
+           so that proxy models are not re-sorted or re-filtered for each of them
+        '''
+        self._transaction += 1
+
+    def commitTransaction(self):
+        '''end batching: one dataChanged signal for the range of updated rows, then
+           one rowsInserted signal for all new rows, when the outermost one is committed
+        '''
+        self._transaction -= 1
+        if not self._transaction:
+            self._flush()
+
+    @contextmanager
+    def transaction(self):
+        '''with model.transaction(): ... between beginTransaction() and commitTransaction()'''
+        self.beginTransaction()
+        try:
+            yield self
+        finally:
+            self.commitTransaction()
+
+    def inTransaction(self):
+        return self._transaction>0
+
+    def _flush(self):
+        '''notify updated rows and insert pending rows'''
+        changed, self._changedRange = self._changedRange, None
+        if changed:
+            first, last = changed[0], min(changed[1], len(self.dataList)-1)
+            if first<=last:
+                self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.headers)-1))
+
+        rows, self._pendingRows = self._pendingRows, []
+        ids, self._pendingIds = self._pendingIds, []
+        if rows:
+            self._appendRows(rows, ids)
+
+        changes, self._changes = self._changes, []
+        if changes:
+            self.itemsChanged.emit(changes)
+
+    def _publish(self, *change):
+        '''changes are collected in transaction, otherwise emitted immediately'''
+        self._changes.append(change)
+        if not self._transaction:
+            changes, self._changes = self._changes, []
+            self.itemsChanged.emit(changes)
+
+    def recount(self):
+        '''request rebuilding counters, e.g. rows are reloaded from database'''
+        self._publish('reset', self.dataList)
+
+    def _changed(self, first, last):
+        if self._changedRange:
+            first, last = min(first, self._changedRange[0]), max(last, self._changedRange[1])
+        self._changedRange = (first, last)
+
+    # structural changes in transaction: pending signals are emitted ahead of them,
+    # so the row positions in signals are always valid
+    def beginInsertRows(self, parent, first, last):
+        self._flush()
+        super(ItemModel, self).beginInsertRows(parent, first, last)
+
+    def beginRemoveRows(self, parent, first, last):
+        self._flush()
+        super(ItemModel, self).beginRemoveRows(parent, first, last)
+
+    def beginMoveRows(self, sourceParent, sourceFirst, sourceLast, destinationParent, destinationChild):
+        self._flush()
+        return super(ItemModel, self).beginMoveRows(sourceParent, sourceFirst, sourceLast, destinationParent, destinationChild)
+
+    def beginResetModel(self):
+        self._flush()
+        super(ItemModel, self).beginResetModel()
+
+    def setData(self, index, value, role=Qt.EditRole):
+        '''cell is set without signal in transaction'''
+        if not self._transaction:
+            return super(ItemModel, self).setData(index, value, role)
+
+        if role != Qt.EditRole or not self.checkIndex(index):
+            return False
+        self.table.updateData(index.row(), index.column(), value)
+        self._changed(index.row(), index.row())
+        return True
+
+    def updateRows(self, rows):
+        if not self._transaction:
+            return super(ItemModel, self).updateRows(rows)
+
+        if rows:
+            self.table.update(rows)
+            self._changed(min(rows), max(rows))
+
+    def appendRows(self, rows, ids=None):
+        '''rows are held until commit in transaction, so they're not found by row position until then
+           :param ids: ids of rows, e.g. replayed from trace, new ids are taken if None
+        '''
+        ids = list(ids or [])[:len(rows)]
+        ids.extend(None for i in range(len(rows)-len(ids)))
+        if not self._transaction:
+            return self._appendRows(rows, ids)
+        self._pendingRows.extend(rows)
+        self._pendingIds.extend(ids)
+
+    def _appendRows(self, rows, ids):
+        if not rows:
+            return
+        position = len(self.dataList)
+        self.beginInsertRows(QModelIndex(), position, position+len(rows)-1)
+        self.table.append(rows, ids)
+        self.endInsertRows()
+
     def refresh(self):
         '''check invalid source path'''
-        # update source path status:
-        # if path is invalid but group is not (UNREFERENCED or TRASH), move group to UNREFERENCED
-        # if path is valid but group is UNREFERENCED, move group to UNGROUPED
-        self.layoutAboutToBeChanged.emit()
-        for i, (_,group,_,path,*_) in enumerate(self.dataList):
-
-            if path and not os.path.exists(path):
-                if self.dataList[i][ItemModel.GROUP] not in (GroupModel.UNREFERENCED, GroupModel.TRASH):
-                    self.dataList[i][ItemModel.GROUP] = GroupModel.UNREFERENCED
-                    self._saveRequired = True
-                
-            elif group==GroupModel.UNREFERENCED:                
-                self.dataList[i][ItemModel.GROUP] = GroupModel.UNGROUPED
-                self._saveRequired = True
-        self.layoutChanged.emit() # update table view
+        self.stopRefreshing()
+        # only path is required, so the other columns are not loaded for lazy items
+        paths = self.values(ItemModel.PATH)
+        self.updateReferences(paths, checkPaths(paths))
+
+    def refreshInBackground(self):
+        '''check source paths in background thread, then update items in main thread'''
+        self.stopRefreshing()
+        thread = ReferenceThread(self.values(ItemModel.PATH), self.table.version, self)
+        thread.finished.connect(partial(self._refreshFinished, thread))
+        self._refreshThread = thread
+        thread.start()
+
+    def isRefreshing(self):
+        return self._refreshThread is not None
+
+    def stopRefreshing(self):
+        thread, self._refreshThread = self._refreshThread, None
+        if thread:
+            thread.requestInterruption()
+            thread.wait()
+
+    def _refreshFinished(self, thread):
+        if thread is not self._refreshThread:
+            return
+        self._refreshThread = None
+
+        # row positions are changed during checking
+        if thread.version!=self.table.version:
+            self.refreshInBackground()
+        else:
+            self.updateReferences(thread.paths, thread.invalid)
+
+    def updateReferences(self, paths, invalid):
+        '''update group of items according to status of source path:
+           - if path is invalid but group is not (UNREFERENCED or TRASH), move group to UNREFERENCED
+           - if path is valid but group is UNREFERENCED, move group to UNGROUPED
+           :param paths: source path of each item when it's checked
+           :param invalid: whether each path is invalid
+        '''
+        changes = self.table.checkReferences(paths, invalid)
+
+        # views are updated only if any group is updated
+        with self.transaction():
+            for i, group in changes:
+                self.setData(self.index(i, ItemModel.GROUP), group)
+
+        self.referencesChecked.emit(self.table.version, list(invalid))
 
     def checkDuplicated(self):
         '''move duplicated items to group DUPLICATED.
@@ -61,34 +278,10 @@ class ItemModel(TableModel):
            - items in DUPLICATED group already should also be checked,
                 since the duplicated one may be reomved to TRASH manually
         '''
-        self.layoutAboutToBeChanged.emit()
-
-        # check items in DUPLICATED group -> move all these items to UNGROUPED
-        # then the really duplicated items will be found and move to DUPLICATED group again,
-        # while the certain item no more be duplicated has already been moved to UNGROUPED in ths step
-        for item in self.dataList:
-            if item[ItemModel.GROUP] == GroupModel.DUPLICATED:
-                item[ItemModel.GROUP] = GroupModel.UNGROUPED        
-
-        # items not in TRASH
-        common_items = [item for item in self.dataList 
-                            if item[ItemModel.GROUP] != GroupModel.TRASH]
-
-        # name, path map for searching cretia
-        name_source_maps = [(name, source) for (name,_,_,source,*_) in common_items]
-
-        # find duplicated (count>1) 
-        duplicated = [data for (name_source, data) in zip(name_source_maps, common_items)             
-            if name_source_maps.count(name_source)>1]
-
-        # move found items to DUPLICATED group    
-        for item in duplicated:
-            item[ItemModel.GROUP] = GroupModel.DUPLICATED
-
-        if duplicated:
-            self._saveRequired = True
-
-        self.layoutChanged.emit() # update table view
+        changes = self.table.checkDuplicated()
+        with self.transaction():
+            for i, group in changes:
+                self.setData(self.index(i, ItemModel.GROUP), group)
 
     def mimeTypes(self):
         return ['tagit-item']
@@ -101,6 +294,23 @@ class ItemModel(TableModel):
         return mimedata
 
  
+class ReferenceThread(QThread):
+    '''check source paths of items in background'''
+
+    def __init__(self, paths, version, parent=None):
+        '''
+           :param paths: source path of each item
+           :param version: rows version of model when paths are collected
+        '''
+        super(ReferenceThread, self).__init__(parent)
+        self.paths = paths
+        self.version = version
+        self.invalid = []
+
+    def run(self):
+        self.invalid = checkPaths(self.paths, self.isInterruptionRequested)
+
+
 class SortFilterProxyModel(QSortFilterProxyModel):
 
     def __init__(self, parent=None):
@@ -118,9 +328,12 @@ class SortFilterProxyModel(QSortFilterProxyModel):
         '''filter with group and tag'''
 
         # always filtered by searching text
-        name = self.sourceModel().index(sourceRow, ItemModel.NAME, sourceParent).data()
-        path = self.sourceModel().index(sourceRow, ItemModel.PATH, sourceParent).data()
-        text_filter = self.filterRegExp().indexIn(name)>=0 or self.filterRegExp().indexIn(path)>=0
+        if self.filterRegExp().isEmpty():
+            text_filter = True
+        else:
+            name = self.sourceModel().index(sourceRow, ItemModel.NAME, sourceParent).data()
+            path = self.sourceModel().index(sourceRow, ItemModel.PATH, sourceParent).data()
+            text_filter = self.filterRegExp().indexIn(name)>=0 or self.filterRegExp().indexIn(path)>=0
 
         # filtered by group
         if self.filterKeyColumn() == ItemModel.GROUP:
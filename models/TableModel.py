@@ -3,23 +3,38 @@
 
 from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+from library.Core import Table, rowRanges
+
 
 class TableModel(QAbstractTableModel):
-    def __init__(self, headers, parent=None):        
+    '''adapter of core table: rows, changes and journal are managed by library.Core.Table,
+       while this model emits signals around the operations
+    '''
+    # rows scattered in more ranges than this are removed with one model reset rather
+    # than signals of each range: each signal costs proxy model a pass over its mapping,
+    # while reset costs a full re-sort
+    RESET_RANGES = 1000
+
+    def __init__(self, headers, parent=None, table=None):
         super(TableModel, self).__init__(parent)
         self.headers = headers
-        # data in table: [[...], [...], ...]
-        self.dataList = []
+        self.table = table or Table(len(headers))
+
+    @property
+    def dataList(self):
+        '''data in table: [[...], [...], ...]'''
+        return self.table.rows
 
-        # require saving if any changes are made
-        self._saveRequired = False    
+    @dataList.setter
+    def dataList(self, rows):
+        self.table.rows = rows
  
     def setup(self, items=[]):
         '''setup model data:
            it is convenient to reset data after the model is created
         '''
         self.beginResetModel()
-        self.dataList = items        
+        self.table.setup(items)
         self.endResetModel()
 
     def checkIndex(self, index):
@@ -36,12 +51,97 @@ class TableModel(QAbstractTableModel):
         return True
 
     def saveRequired(self):
-        return self._saveRequired
+        return self.table.saveRequired()
+
+    def rowsVersion(self):
+        '''increased when rows are inserted, removed or moved,
+           so that the row positions obtained before could be checked
+        '''
+        return self.table.version
+
+    def loadRows(self, rows):
+        '''append rows loaded from database, e.g. loading in batches.
+           they're not changes to be saved
+        '''
+        if not rows:
+            return
+        position = len(self.dataList)
+        self.beginInsertRows(QModelIndex(), position, position+len(rows)-1)
+        self.table.load(rows)
+        self.endInsertRows()
+
+    def reloadRows(self, rows):
+        '''replace values of rows with the ones loaded from database, e.g. saved by another
+           instance. they're not changes to be saved
+           :param rows: {row position: values}
+        '''
+        if not rows:
+            return
+        self.table.reload(rows)
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.headers)-1))
+
+    def unloadRows(self, position, rows=1):
+        '''remove rows deleted from database, e.g. by another instance.
+           they're not changes to be saved
+        '''
+        self.beginRemoveRows(QModelIndex(), position, position+rows-1)
+        self.table.unload(position, rows)
+        self.endRemoveRows()
+
+    def appendRows(self, rows):
+        '''append rows with values, e.g. merged from another database.
+           they're recorded as one mutation rather than inserting and setting each cell
+        '''
+        if not rows:
+            return
+        position = len(self.dataList)
+        self.beginInsertRows(QModelIndex(), position, position+len(rows)-1)
+        self.table.append(rows)
+        self.endInsertRows()
+
+    def updateRows(self, rows):
+        '''update values of a batch of rows, and emit one dataChanged signal for them
+           :param rows: {row position: values}
+        '''
+        if not rows:
+            return
+        self.table.update(rows)
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), len(self.headers)-1))
+
+    def resetChanges(self):
+        '''clear rows changed since last saving'''
+        self.table.resetChanges()
+
+    def markDirty(self, row):
+        '''mark row data as inserted or modified'''
+        self.table.markDirty(row)
+
+    def changes(self):
+        '''rows changed since last saving: (inserted or modified rows, removed rows)'''
+        return self.table.changes()
+
+    def setJournal(self, journal=None):
+        '''record each mutation with callable journal(op, *args)'''
+        self.table.setJournal(journal)
+
+    def record(self, op, *args):
+        '''record mutation to journal if exists'''
+        self.table.record(op, *args)
+
+    def updateData(self, row, col, value):
+        '''set data without emitting signal, e.g. updating a batch of rows
+           between layoutAboutToBeChanged() and layoutChanged()
+        '''
+        self.table.updateData(row, col, value)
 
     def serialize(self, save=True):
-        if save:
-            self._saveRequired = False # saved
-        return [item for item in self.dataList]
+        return self.table.serialize(save)
+
+    def snapshot(self):
+        '''copy of serialized rows, which is not affected by editing later,
+           e.g. saving in background
+        '''
+        return self.table.snapshot()
 
     
     # --------------------------------------------------------------
@@ -86,11 +186,9 @@ class TableModel(QAbstractTableModel):
         if not self.checkIndex(index):
             return False
 
-        row, col = index.row(), index.column()
-        self.dataList[row][col] = value
+        self.table.updateData(index.row(), index.column(), value)
 
         # emit signal if successed
-        self._saveRequired = True
         self.dataChanged.emit(index, index)
 
         return True
@@ -111,14 +209,9 @@ class TableModel(QAbstractTableModel):
             position = len(self.dataList)
 
         self.beginInsertRows(parent, position, position+rows-1)
-        for row in range(rows):
-            data = [None for col in range(len(self.headers))]
-            self.dataList.insert(position, data)
+        self.table.insert(position, rows)
         self.endInsertRows()
 
-        # flag for saving model
-        self._saveRequired = True
-
         return True
  
     def removeRows(self, position, rows=1, parent=QModelIndex()):
@@ -129,15 +222,29 @@ class TableModel(QAbstractTableModel):
             rows = len(self.dataList) - position
 
         self.beginRemoveRows(parent, position, position+rows-1)
-        for row in range(rows):
-            self.dataList.pop(position)
+        self.table.remove(position, rows)
         self.endRemoveRows()
 
-        # flag for saving model
-        self._saveRequired = True
-
         return True
 
+    def removeRowsAt(self, positions):
+        '''remove rows at positions in any order, e.g. items in Trash: rows are merged into
+           contiguous ranges, which are removed from bottom to top with signals of each range,
+           or in one pass with a model reset if there are too many ranges
+           :return: count of removed rows
+        '''
+        ranges = rowRanges(row for row in positions if 0<=row<len(self.dataList))
+        if len(ranges)>self.RESET_RANGES:
+            self.beginResetModel()
+            self.table.removeMany([row for start, count in ranges for row in range(start, start+count)])
+            self.endResetModel()
+        else:
+            for start, count in reversed(ranges):
+                self.beginRemoveRows(QModelIndex(), start, start+count-1)
+                self.table.remove(start, count)
+                self.endRemoveRows()
+        return sum(count for start, count in ranges)
+
     def moveRows(self, sourceParent, sourceRow, count, destinationParent, destinationChild):
         '''moves count rows starting with the given sourceRow under parent sourceParent 
            to row destinationChild under parent destinationParent.
@@ -149,23 +256,9 @@ class TableModel(QAbstractTableModel):
         if sourceRow<=destinationChild<=sourceRow+count:
             return True
 
-        # rows to be moved
-        rows = self.dataList[sourceRow:sourceRow+count]
-        dest = self.dataList[destinationChild]
-
         # move rows in the same table
         self.beginMoveRows(sourceParent, sourceRow, sourceRow+count-1, sourceParent, destinationChild)
-        # remove rows in original position
-        for row in range(count):
-            self.dataList.pop(sourceRow)
-
-        # insert to destination position
-        dest_row = self.dataList.index(dest)
-        for row in rows[::-1]:
-            self.dataList.insert(dest_row, row)
+        self.table.move(sourceRow, count, destinationChild)
         self.endMoveRows()
 
-        # flag for saving model
-        self._saveRequired = True
-
         return True
@@ -3,9 +3,11 @@
 
 from PyQt5.QtCore import QModelIndex, Qt, QSize, QMimeData
 from PyQt5.QtGui import QColor
-from PyQt5.QtWidgets import QStyledItemDelegate, QStyle, QColorDialog
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
 
 from .TableModel import TableModel
+from library.IndexCache import countTags
+from library.Core import TagTable
 
 class TagModel(TableModel):
 
@@ -14,71 +16,97 @@ class TagModel(TableModel):
     NOTAG = 0
 
     def __init__(self, headers, parent=None):        
-        super(TagModel, self).__init__(headers, parent)
+        super(TagModel, self).__init__(headers, parent, TagTable())
 
-        self.defaultTags = [[TagModel.NOTAG, 'Untagged', '#000000']]
-
-        self.initData()
-
-    def initData(self):
-        # key for each item
-        # key=0 is the default item: untagged
-        # so common item starts from key=1
-        self._currentKey = 0
-
-        # item count for each group
-        self.itemsList = []
-
-        # reset all tags
-        self.dataList = self.defaultTags[:] # copy
+        self.defaultTags = TagTable.DEFAULT_TAGS
 
+        # count of items attached with each tag: {key: count}
+        self.counts = {}
 
     def getIndexByKey(self, key):
         '''get ModelIndex with specified key in the associated object'''
-        for i, (tag_key, *_) in enumerate(self.dataList):
-            if tag_key == key:
-                return self.index(i, TagModel.NAME)
-        return QModelIndex()
+        row = self.table.row(key)
+        return self.index(row, TagModel.NAME) if row>=0 else QModelIndex()
 
  
     def setup(self, tags=[]):
         '''setup model data:
            it is convenient to reset data after the model is created
         ''' 
-        # reset data
-        self.initData()       
+        self.counts = {}
 
         # reset model data
         self.beginResetModel()
-        for tag in tags:
-            key = tag[TagModel.KEY]
-            # ignore default tag from user data
-            if key==TagModel.NOTAG:
-                continue
-            # current key
-            if self._currentKey<key:
-                self._currentKey = key
-            self.dataList.append(tag)     
+        self.table.setup(tags)
         self.endResetModel()
 
-    def updateItems(self, items):
-        '''items for counting'''
-        self.itemsList = items
+    def reloadTags(self, tags):
+        '''update tags loaded from database, e.g. saved by another instance
+           :return: False if tags are removed or reordered, which requires setup()
+        '''
+        res = self.table.reload(tags)
+        if res is None:
+            return False
+
+        changed, appended = res
+        for i in changed:
+            self.dataChanged.emit(self.index(i, 0), self.index(i, len(self.headers)-1))
+        self.loadRows(appended)
+        return True
+
+    def updateItems(self, items, counts=None):
+        '''items for counting
+           :param counts: count of items attached with each tag {key: count}, e.g.
+                    loaded from index cache, counted from items if None
+        '''
+        self.counts = countTags(items) if counts is None else dict(counts)
+
+    def updateCounts(self, changes):
+        '''update counters with changes of items, and the tags with changed count are
+           repainted, see library.Core.ItemTable
+           :return: False if counters are rebuilt, i.e. the whole table is changed
+        '''
+        keys = set()
+        def add(tags, n):
+            for key in tags:
+                self.counts[key] = self.counts.get(key, 0) + n
+                keys.add(key)
+
+        for op, *args in changes:
+            if op=='tags':
+                uid, added, removed = args
+                add(added, 1)
+                add(removed, -1)
+            elif op in ('insert', 'remove'):
+                for uid, group, tags in args[0]:
+                    add(tags, 1 if op=='insert' else -1)
+            elif op=='reset':
+                self.updateItems(args[0])
+                return False
+
+        for key in keys:
+            row = self.table.row(key)
+            if row>=0:
+                index = self.index(row, TagModel.NAME)
+                self.dataChanged.emit(index, index)
+        return True
+
+    def currentKey(self):
+        '''the last key taken'''
+        return self.table.keys.current()
+
+    def reserveKey(self, key):
+        '''keys up to specified key are taken, e.g. referenced by items already'''
+        self.table.keys.reserve(key)
 
     def nextKey(self):
         '''next key for new item of this model'''
-        self._currentKey += 1
-        return self._currentKey 
+        return self.table.keys.next()
 
     def isDefaultTag(self, index):
         '''first row is default item -> No Tag'''
         return index.row()==TagModel.NOTAG
 
-    def serialize(self, save=True):
-        if save:
-            self._saveRequired = False # saved
-        return [item for item in self.dataList if item[TagModel.KEY]>TagModel.NOTAG]
-
     # --------------------------------------------------------------
     # reimplemented methods
     # --------------------------------------------------------------
@@ -109,10 +137,7 @@ class TagModel(TableModel):
             if col == TagModel.NAME:
                 key = self.dataList[row][TagModel.KEY] # KEY, NAME, COLOR
                 name = self.dataList[row][TagModel.NAME]
-                count = 0
-                for item in self.itemsList:
-                    if key in item[2]: # 2=>TAGS
-                        count += 1
+                count = self.counts.get(key, 0)
                 return '{0} ({1})'.format(name, count) if count else name
             else:
                 return self.dataList[row][col]
@@ -198,6 +223,7 @@ class TagDelegate(QStyledItemDelegate):
     def setModelData(self, editor, model, index):
         '''set model data after editing'''        
         if index.column() == TagModel.COLOR:
+            from PyQt5.QtWidgets import QColorDialog # imported when it's used for the first time
             color = QColorDialog.getColor(QColor(index.data()))
             if color.isValid():
                 model.setData(index, color.name())
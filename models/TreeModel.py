@@ -3,42 +3,6 @@
 from PyQt5.QtCore import (QAbstractItemModel, QModelIndex, Qt)
 
 
-class TreeItem(object):
-    def __init__(self, data, parent=None):
-        '''
-           :param data: column contents of tree item, e.g. [name, description]
-        '''        
-        self.itemData = data
-        self.parentItem = parent
-        self.childItems = []
-
-    def columnCount(self):
-        '''count of columns'''
-        return len(self.itemData)
-
-    def data(self, column):
-        '''get data of current item at specified column'''
-        return self.itemData[column]
-
-    def parent(self):
-        '''get parent'''
-        return self.parentItem
-
-    def child(self, row):
-        '''get child item at position=row'''
-        return self.childItems[row]
-
-    def childCount(self):
-        '''count of child items'''
-        return len(self.childItems)
-
-    def childNumber(self):
-        '''get position in parent tree item'''
-        if self.parentItem != None:
-            return self.parentItem.childItems.index(self)
-        return 0
-
-
 class TreeModel(QAbstractItemModel):
     def __init__(self, rootItem, parent=None):        
         '''init model with a root item only, model data could be setup
@@ -0,0 +1,58 @@
+# shared fixtures: a small library written to database files under temporary folder
+#
+
+import os
+import sys
+import time
+
+import pytest
+
+# headless Qt for tests of models and views
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from library.Storage import Storage, createStorage
+
+
+def libraryData(count=50):
+    '''project data: groups A/B and C, tags red and blue, items spread over them'''
+    groups = [['A', 10, [['B', 11, []]]], ['C', 12, []]]
+    tags = [[1, 'red', '#ff0000'], [2, 'blue', '#0000ff']]
+    items = [['item_{0}'.format(i), (2, 10, 11, 12)[i%4], [(0, 1, 2)[i%3]],
+              '/path/of/item_{0}'.format(i), '2020-01-01', ''] for i in range(count)]
+    return {
+        Storage.APP_NAME   : '0.5',
+        Storage.KEY_GROUP  : ['Group', 'Key', groups],
+        Storage.KEY_TAG    : tags,
+        Storage.KEY_ITEM   : items,
+        Storage.KEY_SETTING: {}
+    }
+
+
+@pytest.fixture
+def data():
+    return libraryData()
+
+
+@pytest.fixture
+def database(tmp_path, data):
+    '''SQLite database of data'''
+    filename = str(tmp_path / 'library.dat')
+    createStorage(filename, data).close()
+    return filename
+
+
+@pytest.fixture(scope='session')
+def app():
+    '''application of GUI tests'''
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def waitFor(app, condition, timeout=10.0):
+    end = time.time() + timeout
+    while not condition():
+        assert time.time()<end, 'timeout'
+        app.processEvents()
+        time.sleep(0.01)
@@ -0,0 +1,44 @@
+# columnar database: rows are decoded lazily, and the mapped file is closed once no
+# row is left to decode
+#
+
+import pytest
+
+from library.Storage import Storage, createStorage
+from library.ColumnStorage import LazyItems
+from library.Core import rowRanges, removeRanges
+
+
+@pytest.fixture
+def columnar(tmp_path, data):
+    filename = str(tmp_path / 'library.tagc')
+    createStorage(filename, data).close()
+    return filename
+
+
+def test_rows_decoded_when_accessed(columnar, data):
+    items = LazyItems(columnar)
+    assert items[3]==data[Storage.KEY_ITEM][3]
+    assert items.value(7, 0)==data[Storage.KEY_ITEM][7][0]
+    assert list(items)==data[Storage.KEY_ITEM]
+    assert items._map is None # all rows are decoded
+
+
+def test_removed_rows_are_not_decoded(columnar, data):
+    items = LazyItems(columnar)
+    rows = data[Storage.KEY_ITEM]
+    del items[0:5]
+    del items[-1]
+    items[0] = ['replaced', 2, [], '', '', '']
+    assert items._map is not None
+    assert items[1:]==rows[6:-1]
+    assert items._map is None
+
+
+def test_rows_removed_in_place(columnar, data):
+    items = LazyItems(columnar)
+    removeRanges(items, rowRanges(range(0, 50, 2)))
+    assert items._map is not None
+    assert items.column(0)==['item_{0}'.format(i) for i in range(1, 50, 2)]
+    items.materialize()
+    assert items._map is None
@@ -0,0 +1,78 @@
+# snapshots of history store: stored by chunks, loaded with stable ids of items
+#
+
+from library.Storage import Storage, createStorage, loadData
+from library.History import History
+
+
+def withIds(data):
+    data[Storage.KEY_ID] = ['uid{0:04d}'.format(i) for i in range(len(data[Storage.KEY_ITEM]))]
+    return data
+
+
+def test_snapshot_keeps_ids(tmp_path, data):
+    history = History(str(tmp_path / 'library.dat'))
+    snapshot = history.commit(withIds(data))
+    res = history.load(snapshot)
+    assert res[Storage.KEY_ITEM]==data[Storage.KEY_ITEM]
+    assert res[Storage.KEY_ID]==data[Storage.KEY_ID]
+    assert res[Storage.KEY_GROUP]==data[Storage.KEY_GROUP]
+
+    # nothing changed
+    assert history.commit(data) is None
+
+
+def test_restored_snapshot_keeps_ids(tmp_path, data):
+    '''snapshot saved as database, i.e. rollback, has the same ids'''
+    history = History(str(tmp_path / 'library.dat'))
+    snapshot = history.commit(withIds(data))
+
+    filename = str(tmp_path / 'restored.dat')
+    createStorage(filename, history.load(snapshot)).close()
+    assert loadData(filename)[Storage.KEY_ID]==data[Storage.KEY_ID]
+
+
+def test_diff_and_prune(tmp_path, data):
+    history = History(str(tmp_path / 'library.dat'))
+    first = history.commit(withIds(data))
+    data[Storage.KEY_ITEM][3][0] = 'renamed'
+    second = history.commit(data)
+
+    changes = history.diff(first, second)
+    added, removed = changes[Storage.KEY_ITEM]
+    assert [item[0] for item in added]==['renamed'] and [item[0] for item in removed]==['item_3']
+
+    history.prune(keep=1)
+    assert [s['id'] for s in history.snapshots()]==[second]
+    assert history.load(second)[Storage.KEY_ID]==data[Storage.KEY_ID]
+
+
+def test_incremental_commit(tmp_path, data):
+    '''items not changed since the latest snapshot are not serialized again'''
+    rows = [item[:] for item in withIds(data)[Storage.KEY_ITEM]]
+    def snapshot():
+        return dict(data, **{Storage.KEY_ITEM: [row[:] for row in rows]})
+    def changes(dirty=()):
+        return {Storage.KEY_GROUP: ([], []), Storage.KEY_TAG: ([], []), Storage.KEY_ITEM: (list(dirty), [])}
+
+    history = History(str(tmp_path / 'library.dat'))
+    history.commit(snapshot(), rows)
+
+    # edit one row and append one
+    rows[3][0] = 'renamed'
+    rows.append(['item_new', 2, [1], '/path/of/item_new'])
+    data[Storage.KEY_ID] = data[Storage.KEY_ID] + ['uid_new']
+    serialized = []
+    lines = history._lines
+    history._lines = lambda values: serialized.extend(values) or lines(values)
+    second = history.commit(snapshot(), rows, changes([rows[3], rows[-1]]))
+    del history._lines
+    assert [item for item in serialized if item in rows]==[rows[3], rows[-1]]
+
+    # same chunks as a snapshot of all items
+    full = History(str(tmp_path / 'library.dat')).commit(snapshot())
+    assert full is None
+    assert history.load(second)[Storage.KEY_ITEM]==rows
+
+    # nothing changed
+    assert history.commit(snapshot(), rows, changes()) is None
@@ -0,0 +1,103 @@
+# index cache keyed by cheap fingerprint of database
+#
+
+import os
+
+import pytest
+
+from library.Storage import Storage, openStorage, createStorage
+from library.IndexCache import IndexCache, countGroups, countTags
+
+
+def test_fingerprint_of_sqlite(database):
+    cache = IndexCache(database)
+    storage = openStorage(database)
+    data = storage.load()
+    fingerprint = cache.fingerprint(storage)
+    assert fingerprint!=cache.fingerprint() # content is not hashed
+
+    # same when it's opened again
+    other = openStorage(database)
+    assert cache.fingerprint(other)==fingerprint
+    other.close()
+
+    # changed by incremental saving
+    item = data[Storage.KEY_ITEM][0]
+    item[0] = 'renamed'
+    storage.save(data, {Storage.KEY_GROUP: ([], []), Storage.KEY_TAG: ([], []), Storage.KEY_ITEM: ([item], [])})
+    assert cache.fingerprint(storage)!=fingerprint
+    storage.close()
+
+
+def test_fingerprint_of_columnar_database(tmp_path, data):
+    filename = str(tmp_path / 'library.tagc')
+    createStorage(filename, data)
+    cache = IndexCache(filename)
+    storage = openStorage(filename)
+    loaded = storage.load()
+    fingerprint = cache.fingerprint(storage)
+    assert fingerprint==cache.fingerprint(openStorage(filename))
+
+    loaded[Storage.KEY_ITEM][1][0] = 'renamed'
+    storage.save(loaded)
+    assert cache.fingerprint(storage)!=fingerprint
+
+
+def test_indexes_loaded_for_same_fingerprint(database, data):
+    cache = IndexCache(database)
+    items = data[Storage.KEY_ITEM]
+    indexes = {'groups': countGroups(items), 'tags': countTags(items), 'invalid': [1, 2]}
+    cache.save('abc', indexes)
+    assert cache.load('abc')==indexes
+    assert cache.load('other') is None
+
+
+def test_counting_lazy_items_decodes_columns_only(tmp_path, data):
+    filename = str(tmp_path / 'library.tagc')
+    createStorage(filename, data)
+    items = openStorage(filename).load()[Storage.KEY_ITEM]
+    assert countGroups(items)==countGroups(data[Storage.KEY_ITEM])
+    assert countTags(items)==countTags(data[Storage.KEY_ITEM])
+    assert items._count==len(items) # no rows are decoded
+
+    # tags list read from column is the one of row decoded later
+    tags = items.value(3, IndexCache.TAGS)
+    tags.append(9)
+    assert items[3][IndexCache.TAGS] is tags
+
+
+def test_cached_references_are_checked_again(app, tmp_path, data):
+    '''status of source paths is cached for unchanged database, but files may be
+       deleted or restored outside, so they're still checked after opening
+    '''
+    pytest.importorskip('PyQt5')
+    from PyQt5.QtCore import QSettings
+    from Tagit import MainWindow
+    from conftest import waitFor
+
+    for i, item in enumerate(data[Storage.KEY_ITEM]):
+        item[3] = str(tmp_path / 'file_{0}'.format(i))
+        item[1] = 10
+        if i!=3:
+            open(item[3], 'w').close()
+    database = str(tmp_path / 'library.dat')
+    createStorage(database, data).close()
+
+    def groups():
+        setting = QSettings(str(tmp_path / 'tagit.ini'), QSettings.IniFormat)
+        setting.setValue('database', database)
+        window = MainWindow(setting=setting)
+        model = window.itemsView().sourceModel
+        waitFor(app, lambda: not model.isRefreshing())
+        res = [item[1] for item in model.dataList]
+        window.closeJournal()
+        window.closeStorage()
+        window.unlockDatabase()
+        return res
+
+    assert groups()[3]==3 # unreferenced
+    assert os.path.exists(database+'.cache')
+    assert groups()[3]==3 # cached
+
+    open(data[Storage.KEY_ITEM][3][3], 'w').close()
+    assert groups()[3]==2 # ungrouped
@@ -0,0 +1,78 @@
+# integrity of keys referenced by items: checked and repaired in database
+#
+
+import pytest
+
+from library.Storage import Storage, createStorage, loadData
+from library.SQLiteStorage import SQLiteStorage
+from library.Integrity import Integrity, checkDatabase
+
+
+def broken(data):
+    '''item 3 in a group not defined, item 5 with a tag not defined'''
+    items = data[Storage.KEY_ITEM]
+    items[3][1] = 77
+    items[5][2] = [1, 99]
+    return data
+
+
+def test_check(data):
+    integrity = Integrity(data[Storage.KEY_GROUP][2], data[Storage.KEY_TAG])
+    assert list(integrity.check(data[Storage.KEY_ITEM]))==[] and integrity.report()=={}
+
+    integrity = Integrity(data[Storage.KEY_GROUP][2], data[Storage.KEY_TAG])
+    repaired = dict(integrity.check(broken(data)[Storage.KEY_ITEM], repair=True))
+    assert repaired[3][1]==Integrity.UNGROUPED and repaired[5][2]==[1]
+    report = integrity.report()
+    assert report['orphan groups']=={3: 77} and report['orphan tags']=={5: [99]}
+    assert report['group counter']==(12, 77) and report['tag counter']==(2, 99)
+
+
+@pytest.mark.parametrize('filename', ['library.dat', 'library.tagc'])
+def test_repair_database(tmp_path, data, filename):
+    filename = str(tmp_path / filename)
+    createStorage(filename, broken(data)).close()
+    before = loadData(filename)
+
+    report = checkDatabase(filename)
+    assert set(report)=={'orphan groups', 'orphan tags', 'group counter', 'tag counter'}
+    assert loadData(filename)==before # checked only
+
+    assert checkDatabase(filename, repair=True)==report
+    assert checkDatabase(filename)=={}
+
+    # only the broken items are changed, and ids are kept
+    after = loadData(filename)
+    assert after.get(Storage.KEY_ID)==before.get(Storage.KEY_ID)
+    changed = [i for i, (x, y) in enumerate(zip(before[Storage.KEY_ITEM], after[Storage.KEY_ITEM])) if x!=y]
+    assert changed==[3, 5]
+    assert after[Storage.KEY_ITEM][3][1]==Integrity.UNGROUPED and after[Storage.KEY_ITEM][5][2]==[1]
+
+
+def test_repair_recorded(database):
+    '''rows repaired in SQLite database are recorded in change feed'''
+    storage = SQLiteStorage(database)
+    data = broken(storage.load())
+    uid = data[Storage.KEY_ID][3]
+    storage.invalidate()
+    storage.save(data)
+    last = storage.lastChange()
+    storage.close()
+
+    checkDatabase(database, repair=True)
+    storage = SQLiteStorage(database)
+    fields = storage.connection().execute('SELECT uid, field FROM changes WHERE seq>?', (last,)).fetchall()
+    storage.close()
+    assert (uid, 'group') in fields and len(fields)==2
+
+
+def test_repair_duplicated_keys(tmp_path, data):
+    '''items keep the first key, the duplicated one is renumbered after keys in use'''
+    data[Storage.KEY_TAG].append([1, 'green', '#00ff00'])
+    filename = str(tmp_path / 'library.tagc')
+    createStorage(filename, data).close()
+
+    assert checkDatabase(filename, repair=True)['duplicated tags']==[1]
+    tags = loadData(filename)[Storage.KEY_TAG]
+    assert tags[0]==[1, 'red', '#ff0000'] and tags[-1]==[3, 'green', '#00ff00']
+    assert checkDatabase(filename)=={}
@@ -0,0 +1,69 @@
+# JSON Lines and CSV files exported and imported back
+#
+
+import json
+
+import pytest
+
+from library.Interchange import Exporter, Importer
+
+
+GROUPS = [
+    ['All Groups', 1, [['Ungrouped', 2, []], ['Trash', 5, []]]], # default tree stored by database
+    ['x/y', 10, [['sub;group', 11, []]]],
+    ['Papers', 12, []]
+]
+TAGS = [[0, 'Untagged', '#000000'], [1, 'a;b', '#ff0000'], [2, 'c/d', '#00ff00']]
+ITEMS = [
+    ['one', 11, [1, 2], '/path/one', '2020-01-01', 'notes, with "quotes"'],
+    ['two', 5, [0], '/path/two', '2020-01-02', ''],
+    ['three', 2, [1], '/path/three', '2020-01-03', ''],
+    ['four', 12, [2], '/path/four', '2020-01-04', 'multi\nline']
+]
+
+
+def importer(keys):
+    return Importer(GROUPS, TAGS, lambda: next(keys), lambda: next(keys))
+
+
+@pytest.mark.parametrize('ext', ['.jsonl', '.csv'])
+def test_round_trip_into_same_library(tmp_path, ext):
+    filename = str(tmp_path / ('catalog' + ext))
+    assert Exporter(GROUPS, TAGS).export(filename, ITEMS)==len(ITEMS)
+
+    imp = importer(iter(range(100, 200)))
+    assert imp.check(filename)==len(ITEMS)
+    items = [item for batch in imp.read(filename, batch=3) for item in batch]
+    assert items==ITEMS
+    assert imp.takeNew()==([], []) # groups and tags are found by names
+
+
+def test_default_groups_are_referenced_by_name(tmp_path):
+    filename = str(tmp_path / 'catalog.jsonl')
+    Exporter(GROUPS, TAGS).export(filename, ITEMS)
+    with open(filename, encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+
+    groups = [(r['parent'], r['name']) for r in records if r['type']=='group']
+    assert groups==[([], 'x/y'), (['x/y'], 'sub;group'), ([], 'Papers')]
+    items = {r['name']: r['group'] for r in records if r['type']=='item'}
+    assert items['two']==['*Trash'] and items['three']==[] and items['one']==['x/y', 'sub;group']
+
+
+def test_csv_written_by_other_tools(tmp_path):
+    filename = tmp_path / 'catalog.csv'
+    filename.write_text('type,name,group,tags,path\nitem,new,Papers/New,a;new tag,/path/new\n', encoding='utf-8')
+
+    imp = importer(iter(range(100, 200)))
+    items = [item for batch in imp.read(str(filename)) for item in batch]
+    groups, tags = imp.takeNew()
+    assert groups==[(12, 'New', 102)] # tags of item are taken first
+    assert [tag[1] for tag in tags]==['a', 'new tag']
+    assert items[0][:3]==['new', 102, [100, 101]]
+
+
+def test_invalid_file_is_checked_before_importing(tmp_path):
+    filename = tmp_path / 'catalog.jsonl'
+    filename.write_text('{"type": "item", "name": "ok", "tags": ["a;b"]}\n{"type": "item", "tags": "a;b"}\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        importer(iter(range(100, 200))).check(str(filename))
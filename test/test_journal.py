@@ -0,0 +1,71 @@
+# journal recovery: unsaved mutations are replayed on top of the saved database
+#
+
+import os
+
+from library.Storage import Storage, loadData
+from library.Journal import Journal
+
+
+def record(journal, data):
+    '''mutations of items as recorded by models, applied to data also'''
+    items = data[Storage.KEY_ITEM]
+    journal.append(Storage.KEY_ITEM, 'set', 3, 0, 'renamed')
+    items[3][0] = 'renamed'
+    journal.append(Storage.KEY_ITEM, 'append', [['new', 2, [0], '/path/of/new', '2020-01-02', '']])
+    items.append(['new', 2, [0], '/path/of/new', '2020-01-02', ''])
+    journal.append(Storage.KEY_ITEM, 'remove', 0, 2)
+    del items[0:2]
+
+
+def test_recover(database):
+    expected = loadData(database)
+    journal = Journal(database, lambda: loadData(database))
+    assert not journal.hasRecords()
+    record(journal, expected)
+    journal.close() # crashed without saving
+
+    journal = Journal(database, lambda: loadData(database))
+    assert journal.hasRecords()
+    data, count = journal.recover(loadData(database))
+    assert count==3
+    assert data[Storage.KEY_ITEM]==expected[Storage.KEY_ITEM]
+
+    # ids are moved along with items, the new one is taken when loaded into model
+    ids = expected[Storage.KEY_ID]
+    assert data[Storage.KEY_ID]==ids[2:]+[None]
+
+
+def test_recover_compacted(database):
+    '''records folded into checkpoint, followed by new records'''
+    expected = loadData(database)
+    journal = Journal(database, lambda: loadData(database), threshold=1)
+    record(journal, expected)
+    journal.wait()
+    assert os.path.exists(journal.checkpointFilename)
+    journal.append(Storage.KEY_ITEM, 'set', 0, 5, 'notes')
+    expected[Storage.KEY_ITEM][0][5] = 'notes'
+    journal.close()
+
+    data, _ = Journal(database, None).recover(loadData(database))
+    assert data[Storage.KEY_ITEM]==expected[Storage.KEY_ITEM]
+
+
+def test_failed_saving(database):
+    '''records before a failed saving are kept ahead of the later ones'''
+    expected = loadData(database)
+    journal = Journal(database, lambda: loadData(database))
+    journal.append(Storage.KEY_ITEM, 'set', 1, 0, 'first')
+    journal.rotate()
+    journal.append(Storage.KEY_ITEM, 'set', 1, 0, 'second')
+    journal.restore()
+    journal.close()
+    expected[Storage.KEY_ITEM][1][0] = 'second'
+
+    data, count = Journal(database, None).recover(loadData(database))
+    assert count==2 and data[Storage.KEY_ITEM]==expected[Storage.KEY_ITEM]
+
+    # saved: nothing to recover
+    journal.rotate()
+    journal.commit()
+    assert not journal.hasRecords()
@@ -0,0 +1,142 @@
+# SQLite storage: incremental saving with stable ids, and change feed between copies
+#
+
+import shutil
+
+from library.Storage import Storage, openStorage, loadData
+from library.SQLiteStorage import SQLiteStorage
+from library.ChangeFeed import ChangeFeed
+
+
+def changes(dirty=(), removed=()):
+    return {Storage.KEY_GROUP: ([], []), Storage.KEY_TAG: ([], []), Storage.KEY_ITEM: (list(dirty), list(removed))}
+
+
+def edit(database, name='renamed'):
+    '''rename item 3, remove item 5 and append an item, saved incrementally
+       :return: project data saved
+    '''
+    storage = openStorage(database)
+    data = storage.load()
+    items, ids = data[Storage.KEY_ITEM], data[Storage.KEY_ID]
+    items[3][0] = name
+    removed = items.pop(5)
+    del ids[5]
+    items.append(['new', 12, [1, 2], '/path/of/new', '2020-01-02', 'notes'])
+    ids.append('uid_new')
+    storage.save(data, changes([items[3], items[-1]], [removed]), origins=items)
+    storage.close()
+    return data
+
+
+def test_incremental_save(database):
+    before = SQLiteStorage(database)
+    before.load()
+    last = before.lastChange()
+    before.close()
+
+    data = edit(database)
+    res = loadData(database)
+    assert res[Storage.KEY_ITEM]==data[Storage.KEY_ITEM]
+    assert res[Storage.KEY_ID]==data[Storage.KEY_ID]
+
+    # only changed fields are recorded: name, deleted, and all fields of the new item
+    storage = SQLiteStorage(database)
+    fields = storage.connection().execute('SELECT uid, field FROM changes WHERE seq>?', (last,)).fetchall()
+    storage.close()
+    ids = data[Storage.KEY_ID]
+    assert sorted(field for uid, field in fields if uid==ids[3])==['name']
+    assert len([field for uid, field in fields if uid=='uid_new'])==len(SQLiteStorage.ITEM_FIELDS)
+    assert len(fields)==len(SQLiteStorage.ITEM_FIELDS)+2
+
+
+def test_reopen_keeps_ids(database):
+    ids = loadData(database)[Storage.KEY_ID]
+    assert len(set(ids))==len(ids) and all(ids)
+
+    # rewrite all: ids are kept
+    storage = openStorage(database)
+    data = storage.load()
+    storage.invalidate()
+    storage.save(data)
+    storage.close()
+    assert loadData(database)[Storage.KEY_ID]==ids
+
+
+def test_change_feed(tmp_path, database):
+    copy = str(tmp_path / 'copy.dat')
+    shutil.copy(database, copy)
+
+    # changes of database are applied to the copy
+    source = SQLiteStorage(database)
+    source.load()
+    since = source.lastChange()
+    data = edit(database)
+    feed = str(tmp_path / 'changes.tagd')
+    count, last = ChangeFeed(source).export(feed, since)
+    assert count>0 and last==source.lastChange()
+
+    target = SQLiteStorage(copy)
+    target.load()
+    copy_since = target.lastChange()
+    applied, conflicts, header = ChangeFeed(target).apply(feed)
+    assert applied==count and conflicts==0 and header['last']==last
+    target.close()
+    res = loadData(copy)
+    assert sorted(res[Storage.KEY_ID])==sorted(data[Storage.KEY_ID])
+    rows = dict(zip(res[Storage.KEY_ID], res[Storage.KEY_ITEM]))
+    assert all(rows[uid]==item for uid, item in zip(data[Storage.KEY_ID], data[Storage.KEY_ITEM]))
+
+    # applied changes are echoed back without changing anything
+    echo = str(tmp_path / 'echo.tagd')
+    ChangeFeed(SQLiteStorage(copy)).export(echo, copy_since)
+    applied, conflicts, _ = ChangeFeed(source).apply(echo)
+    assert applied==0 and conflicts==0
+    source.close()
+    assert loadData(database)[Storage.KEY_ITEM]==data[Storage.KEY_ITEM]
+
+
+def test_change_feed_conflict(tmp_path, database):
+    '''the later change of a field wins'''
+    copy = str(tmp_path / 'copy.dat')
+    shutil.copy(database, copy)
+    source = SQLiteStorage(database)
+    source.load()
+    since = source.lastChange()
+    edit(database, 'remote')
+    edit(copy, 'local') # later
+
+    feed = str(tmp_path / 'changes.tagd')
+    ChangeFeed(source).export(feed, since)
+    source.close()
+    target = SQLiteStorage(copy)
+    _, conflicts, _ = ChangeFeed(target).apply(feed)
+    target.close()
+    assert conflicts>0
+    assert loadData(copy)[Storage.KEY_ITEM][3][0]=='local'
+
+
+def test_change_feed_watermark(tmp_path, database):
+    '''changes applied by the other copy are not exported again'''
+    copy = str(tmp_path / 'copy.dat')
+    shutil.copy(database, copy)
+    source, target = SQLiteStorage(database), SQLiteStorage(copy)
+    source.load()
+    target.load()
+    assert ChangeFeed(source).lastSynced()==0
+
+    edit(database)
+    feed = str(tmp_path / 'changes.tagd')
+    _, last = ChangeFeed(source).export(feed)
+    ChangeFeed(target).apply(feed)
+
+    # the copy reports what it has applied in its own export
+    echo = str(tmp_path / 'echo.tagd')
+    ChangeFeed(target).export(echo)
+    ChangeFeed(source).apply(echo)
+    assert ChangeFeed(source).lastSynced(SQLiteStorage.origin())==last
+    assert ChangeFeed(source).lastSynced()==last
+    count, _ = ChangeFeed(source).export(feed)
+    assert count==0
+    source.close()
+    target.close()
@@ -0,0 +1,71 @@
+# workload trace recorded on the default startup path, i.e. the last database is
+# loaded in background, and replayed headless by TagitReplay
+#
+
+import json
+
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from PyQt5.QtCore import QSettings
+
+import TagitReplay
+from library.Trace import readTrace
+from conftest import waitFor
+
+
+def test_trace_started_while_loading_is_replayed(app, tmp_path, database, capsys):
+    from Tagit import MainWindow
+
+    setting = QSettings(str(tmp_path / 'tagit.ini'), QSettings.IniFormat)
+    setting.setValue('database', database)
+    window = MainWindow(progressive=True, setting=setting)
+
+    # requested before the database is loaded, i.e. by --record-trace on startup
+    filename = str(tmp_path / 'trace.jsonl')
+    window.startTrace(filename)
+    waitFor(app, lambda: window.trace() is not None)
+
+    view = window.itemsView()
+    view.selectAll()
+    view.slot_attachTag(2)
+    view.slot_moveToGroup(12, fromGroups=[10, 11])
+
+    # items imported in session are found by their ids also, see slot_appendRows()
+    rows = [['new', 2, [0], '/path/of/new', '2020-01-01', '']]
+    ids = view.appendItems(rows)
+    view.record('import', items=rows, ids=ids)
+    view.recordItems('move', [view.sourceModel.itemRow(ids[0])], group=12)
+    view.moveItems([view.sourceModel.itemRow(ids[0])], 12)
+    window.stopTrace()
+    window.closeJournal()
+    window.closeStorage()
+    window.unlockDatabase()
+
+    header, operations = readTrace(filename)
+    assert header['database']==database
+    assert header['items']==50
+    assert [op['op'] for op in operations]==['attachTag', 'move', 'import', 'move']
+    assert len(operations[0]['ids'])==50 and 'rows' not in operations[0]
+
+    assert TagitReplay.main([filename, '--json'])==0
+    out, err = capsys.readouterr()
+    assert 'skip' not in err
+    ops = [op for op, ms in json.loads(out.strip().splitlines()[-1])]
+    assert ops==['open', 'attachTag', 'move', 'import', 'move']
+
+
+def test_trace_and_server_end_with_database(app, tmp_path, database):
+    '''opening another database ends trace and local server of current one'''
+    from Tagit import MainWindow
+
+    setting = QSettings(str(tmp_path / 'tagit.ini'), QSettings.IniFormat)
+    setting.setValue('database', database)
+    window = MainWindow(setting=setting)
+    window.startTrace(str(tmp_path / 'trace.jsonl'))
+    window.startServer(str(tmp_path / 'tagit.sock'))
+    assert window.trace() is not None and window.serverAddress() is not None
+
+    assert window.initData()
+    assert window.trace() is None and window.serverAddress() is None
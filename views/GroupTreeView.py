@@ -190,10 +190,11 @@ class GroupTreeView(QTreeView):
         self.groupCleared.emit(keys)
 
 
-    def slot_updateCounter(self, items):
+    def slot_updateCounter(self, changes):
         '''update count of items for each group
-           :param items: the latest items list
+           :param changes: changes of items, see ItemModel.itemsChanged
         '''
-        self.sourceModel.layoutAboutToBeChanged.emit()
-        self.sourceModel.updateItems(items)
-        self.sourceModel.layoutChanged.emit() # update display immediately
+        # only the groups with changed count are repainted, unless counters are rebuilt
+        if not self.sourceModel.updateCounts(changes):
+            self.sourceModel.layoutAboutToBeChanged.emit()
+            self.sourceModel.layoutChanged.emit() # update display immediately
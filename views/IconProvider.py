@@ -0,0 +1,72 @@
+# icons used by menus and toolbars:
+# image files under images/ are loaded when they're requested for the first time,
+# and shared by all widgets
+#
+
+import os
+
+from PyQt5.QtGui import QIcon, QPixmap, QGuiApplication
+
+
+class IconProvider(object):
+
+    PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'images')
+    EXTENSION = '.png'
+
+    # loaded icons/pixmaps: (type, name, device pixel ratio) -> QIcon/QPixmap
+    _cache = {}
+
+    @classmethod
+    def filename(cls, name):
+        '''image file of icon name, e.g. new.png or new'''
+        if not os.path.splitext(name)[1]:
+            name += cls.EXTENSION
+        return os.path.join(cls.PATH, name)
+
+    @staticmethod
+    def devicePixelRatio():
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app else 1.0
+
+    @classmethod
+    def hidpiFilename(cls, name):
+        '''high resolution image for high dpi screen, e.g. new@2x.png'''
+        return '{0}@2x{1}'.format(*os.path.splitext(cls.filename(name)))
+
+    @classmethod
+    def icon(cls, name):
+        '''icon with specified name, null icon if name is empty.
+           image file is read when the icon is painted for the first time
+        '''
+        if not name:
+            return QIcon()
+
+        key = ('icon', name, cls.devicePixelRatio())
+        if key not in cls._cache:
+            icon = QIcon(cls.filename(name))
+            if key[2]>1 and os.path.exists(cls.hidpiFilename(name)):
+                icon.addFile(cls.hidpiFilename(name))
+            cls._cache[key] = icon
+        return cls._cache[key]
+
+    @classmethod
+    def pixmap(cls, name):
+        '''pixmap with specified name: high resolution image is preferred
+           on high dpi screen if it exists
+        '''
+        ratio = cls.devicePixelRatio()
+        key = ('pixmap', name, ratio)
+        if key not in cls._cache:
+            filename, hidpi_filename = cls.filename(name), cls.hidpiFilename(name)
+            if ratio>1 and os.path.exists(hidpi_filename):
+                pixmap = QPixmap(hidpi_filename)
+                pixmap.setDevicePixelRatio(2.0)
+            else:
+                pixmap = QPixmap(filename)
+            cls._cache[key] = pixmap
+        return cls._cache[key]
+
+    @classmethod
+    def clear(cls):
+        '''release all loaded icons'''
+        cls._cache.clear()
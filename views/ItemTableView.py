@@ -6,18 +6,14 @@ import os
 import time
 from functools import partial
 
-from PyQt5.QtCore import QItemSelectionModel, Qt, QPersistentModelIndex, QModelIndex, pyqtSignal, QUrl
+from PyQt5.QtCore import QItemSelection, QItemSelectionModel, Qt, QModelIndex, QUrl
 from PyQt5.QtWidgets import QHeaderView, QTableView, QMenu, QAction, QMessageBox
 from PyQt5.QtGui import QPixmap, QIcon, QColor, QDesktopServices
 
 from models.ItemModel import ItemModel, ItemDelegate, SortFilterProxyModel
 
-from views.CreateItemDialog import SingleItemDialog, MultiItemsDialog
-
 class ItemTableView(QTableView):
 
-    itemsChanged = pyqtSignal(list) # signal for group/tag to update counting
-
     def __init__(self, header, tabViews, parent=None):
         super(ItemTableView, self).__init__(parent)
 
@@ -41,6 +37,9 @@ class ItemTableView(QTableView):
         delegate = ItemDelegate(self)
         self.setItemDelegate(delegate)
 
+        # workload trace recording operations, see library.Trace
+        self.trace = None
+
         # context menu
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.customContextMenu)
@@ -59,16 +58,9 @@ class ItemTableView(QTableView):
         # delete items in trash
         self.groupView.emptyTrash.connect(self.slot_deleteItems) 
 
-        # update group/tag counter when items are changed
-        # emit signal to request updating group counter
-        self.sourceModel.dataChanged.connect(
-            lambda: self.itemsChanged.emit(self.sourceModel.serialize(save=False))
-            )
-        self.sourceModel.layoutChanged.connect(
-            lambda: self.itemsChanged.emit(self.sourceModel.serialize(save=False))
-            )
-        self.itemsChanged.connect(self.groupView.slot_updateCounter)
-        self.itemsChanged.connect(self.tagView.slot_updateCounter)
+        # update group/tag counter with changes of items
+        self.sourceModel.itemsChanged.connect(self.groupView.slot_updateCounter)
+        self.sourceModel.itemsChanged.connect(self.tagView.slot_updateCounter)
 
         # filter items by group/tags
         self.groupView.selectionModel().selectionChanged.connect(self.slot_filterByGroup)
@@ -102,9 +94,9 @@ class ItemTableView(QTableView):
         self.sortByColumn(ItemModel.NAME, Qt.AscendingOrder)
         
 
-    def setup(self, data=[]):
-        '''reset tag table with specified model data'''
-        self.sourceModel.setup(data)
+    def setup(self, data=[], refresh=True, ids=None):
+        '''reset tag table with specified model data and ids of items'''
+        self.sourceModel.setup(data, refresh, ids)
         self.reset()
         self.slot_filterByGroup()
 
@@ -216,6 +208,83 @@ class ItemTableView(QTableView):
         menu.exec_(self.viewport().mapToGlobal(position))
 
     
+    # ---------------------------------------------------
+    # operations on rows of source model
+    # ---------------------------------------------------
+    def record(self, op, **args):
+        '''record operation to workload trace if it's recording'''
+        if self.trace:
+            self.trace.record(op, **args)
+
+    def recordItems(self, op, rows, **args):
+        '''record operation on items at source rows by their ids, which are same in replaying'''
+        if self.trace:
+            self.trace.record(op, ids=[self.sourceModel.itemId(row) for row in rows], **args)
+
+    def selectedSourceRows(self):
+        '''rows of selected items in source model'''
+        return sorted(self.proxyModel.mapToSource(index).row() for index in self.selectionModel().selectedRows())
+
+    def selectedIds(self):
+        '''ids of selected items, which are kept when rows are sorted or reloaded'''
+        return [self.sourceModel.itemId(row) for row in self.selectedSourceRows()]
+
+    def selectIds(self, ids):
+        '''select items with specified ids, the ones filtered out or not exist are ignored'''
+        selection = QItemSelection()
+        for uid in ids:
+            row = self.sourceModel.itemRow(uid)
+            if row<0:
+                continue
+            index = self.proxyModel.mapFromSource(self.sourceModel.index(row, 0))
+            if index.isValid():
+                selection.select(index, index)
+        self.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect|QItemSelectionModel.Rows)
+
+    def appendItems(self, rows, ids=None):
+        '''append items with values [name, group, [tags], path, date, notes]
+           :param ids: ids of items, e.g. replayed from trace, new ids are taken if None
+           :return: ids of new items
+        '''
+        with self.sourceModel.transaction():
+            self.sourceModel.appendRows([list(row) for row in rows], ids)
+        count = self.sourceModel.rowCount()
+        return [self.sourceModel.itemId(row) for row in range(count-len(rows), count)]
+
+    def moveItems(self, rows, toGroup):
+        '''move items at source rows to target group'''
+        with self.sourceModel.transaction():
+            for row in rows:
+                index = self.sourceModel.index(row, ItemModel.GROUP)
+                if index.data()!=toGroup:
+                    self.sourceModel.setData(index, toGroup)
+
+    def attachTag(self, rows, key):
+        '''attach tag to items at source rows, all other tags are removed if key=NOTAG'''
+        NOTAG = self.tagView.model().NOTAG
+
+        with self.sourceModel.transaction():
+            for row in rows:
+                index = self.sourceModel.index(row, ItemModel.TAGS)
+                keys = index.data() or []
+                if key == NOTAG:
+                    # if key=NOTAG, remove all other tags
+                    if keys!=[NOTAG]:
+                        self.sourceModel.setData(index, [NOTAG])
+                elif key not in keys:
+                    # remove NOTAG, then attach target tag
+                    self.sourceModel.setData(index, [k for k in keys if k!=NOTAG] + [key])
+
+    def removeTag(self, rows, tag):
+        '''remove tag from items at source rows, NOTAG is set if no tags left'''
+        with self.sourceModel.transaction():
+            for row in rows:
+                index = self.sourceModel.index(row, ItemModel.TAGS)
+                keys = index.data() or []
+                if tag in keys:
+                    keys = [k for k in keys if k!=tag] or [self.tagView.model().NOTAG]
+                    self.sourceModel.setData(index, keys)
+
     # ---------------------------------------------------
     # slots
     # ---------------------------------------------------
@@ -228,7 +297,8 @@ class ItemTableView(QTableView):
         else:
             group = indexes[0].data()
 
-        # add items        
+        # add items: dialogs are imported when they're used for the first time
+        from views.CreateItemDialog import SingleItemDialog, MultiItemsDialog
         dlg = SingleItemDialog() if single else MultiItemsDialog()
         if dlg.exec_():
             # collect items data
@@ -239,13 +309,9 @@ class ItemTableView(QTableView):
             else:
                 rows = [(os.path.basename(path), group, [self.tagView.model().NOTAG], path, c_time, '') for path in dlg.values()]
 
-            # append to item table
-            num_row = self.sourceModel.rowCount()
-            if self.sourceModel.insertRows(num_row, len(rows)):
-                for i, row in enumerate(rows):
-                    for j, col in enumerate(row):
-                        index = self.sourceModel.index(num_row+i, j)
-                        self.sourceModel.setData(index, col)
+            # append to item table: ids are recorded, so later operations on them are replayed
+            ids = self.appendItems(rows)
+            self.record('import', items=rows, ids=ids)
 
     def slot_navigateTo(self):
         '''open current item'''
@@ -258,33 +324,21 @@ class ItemTableView(QTableView):
     def slot_deleteItems(self, group=None):
         '''delete items by group if group is not empty, otherwise delete selected items'''
 
-        # collect indexes to be removed
-        indexes = []
-        if group:            
-            for i in range(self.sourceModel.rowCount()):
-                index = self.sourceModel.index(i, ItemModel.GROUP)
-                if index.data()==group:
-                    indexes.append(index)
+        # collect ids of items to be removed, so they're found after the confirming dialog
+        if group:
+            ids = [self.sourceModel.itemId(row) for row in self.sourceModel.groupRows([group])]
         else:
-            for proxy_index in self.selectionModel().selectedRows(): # proxy index
-                source_index = self.proxyModel.mapToSource(proxy_index)
-                index = QPersistentModelIndex(source_index)
-                indexes.append(index)
+            ids = self.selectedIds()
 
         # request confirm
         reply = QMessageBox.question(self, 'Confirm', 
-            "Confirm to remove the selected {0} item(s)? Items deleted by this operation can not be restored.".format(len(indexes)),
+            "Confirm to remove the selected {0} item(s)? Items deleted by this operation can not be restored.".format(len(ids)),
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply != QMessageBox.Yes:
             return
 
-        # delete
-        for index in indexes[::-1]:
-            self.sourceModel.removeRow(index.row())
-
-        # emit signal to request updating group/tag counter
-        if indexes:
-            self.itemsChanged.emit(self.sourceModel.serialize(save=False))
+        # delete by ranges of contiguous rows
+        self.sourceModel.removeRowsAt([self.sourceModel.itemRow(uid) for uid in ids])
 
     def slot_moveToGroup(self, toGroup, fromGroups=None):
         '''move items from specified groups to target group
@@ -293,66 +347,23 @@ class ItemTableView(QTableView):
                     if fromGroup is empty, move selected items
         '''
         if fromGroups:
-            for i in range(self.sourceModel.rowCount()):
-                index = self.sourceModel.index(i, ItemModel.GROUP)
-                if index.data() in fromGroups:
-                    self.sourceModel.setData(index, toGroup)
+            rows = self.sourceModel.groupRows(fromGroups)
         else:
-            indexes = self.selectionModel().selectedRows(ItemModel.GROUP)
-            # ATTENTION: performing the moving action in descent order,
-            # try not to destroy the default index of the model.
-            # otherwise, multi-items could not be moved correctly.
-            for index in indexes[::-1]:
-                self.proxyModel.setData(index, toGroup)
+            rows = self.selectedSourceRows()
+        self.recordItems('move', rows, group=toGroup)
+        self.moveItems(rows, toGroup)
 
     def slot_attachTag(self, key):
         '''add tag to current item'''
-        indexes = self.selectionModel().selectedRows(ItemModel.TAGS)
-        NOTAG = self.tagView.model().NOTAG
-
-        self.proxyModel.layoutAboutToBeChanged.emit()
-
-        if key == NOTAG:
-            for index in indexes[::-1]:
-                # if key=NOTAG, remove all other tags
-                self.proxyModel.setData(index, [NOTAG])
-        else:
-            for index in indexes[::-1]: # ATTENTION
-                keys = index.data()
-
-                # remove NOTAG first
-                if NOTAG in keys:
-                    keys.pop(keys.index(NOTAG))
-
-                # then attach target tag
-                if key not in keys:
-                    keys.append(key)
-                    self.proxyModel.setData(index, keys)
-
-        self.proxyModel.layoutChanged.emit()
+        rows = self.selectedSourceRows()
+        self.recordItems('attachTag', rows, tag=key)
+        self.attachTag(rows, key)
 
     def slot_removeTag(self, tag, fromSelected=True):
         '''delete tag from currently selected items by default, otherwise from all items'''
-        if fromSelected:
-            indexes = self.selectionModel().selectedRows(ItemModel.TAGS)
-            for index in indexes[::-1]: # ATTENTION
-                keys = index.data()
-                if tag in keys:
-                    keys.pop(keys.index(tag))
-                    # if item tags are empty, set NOTAG then
-                    if not keys:
-                        keys = [self.tagView.model().NOTAG]
-                    self.proxyModel.setData(index, keys)
-        else:
-            for i in range(self.sourceModel.rowCount()):
-                index = self.sourceModel.index(i, ItemModel.TAGS)
-                keys = index.data()
-                if tag in keys:
-                    keys.pop(keys.index(tag))
-                    # if item tags are empty, set NOTAG then
-                    if not keys:
-                        keys = [self.tagView.model().NOTAG]
-                    self.sourceModel.setData(index, keys)
+        rows = self.selectedSourceRows() if fromSelected else list(range(self.sourceModel.rowCount()))
+        self.recordItems('removeTag', rows, tag=tag)
+        self.removeTag(rows, tag)
     
     def slot_filterByGroup(self):
         '''triggered by group selection changed'''
@@ -362,7 +373,9 @@ class ItemTableView(QTableView):
             return
 
         # get selected group
-        groups = groupIndex.internalPointer().keys()
+        node = groupIndex.internalPointer()
+        self.record('filterGroup', group=node.data(self.groupView.model().KEY))
+        groups = node.keys()
 
         # set filter for column GROUP
         self.proxyModel.setGroupFilter(groups)
@@ -380,6 +393,7 @@ class ItemTableView(QTableView):
 
         # selected tag key
         tag = tagIndex.siblingAtColumn(self.tagView.model().KEY).data()
+        self.record('filterTag', tag=tag)
 
         # set filter for column GROUP
         self.proxyModel.setTagFilter(tag)
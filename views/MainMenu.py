@@ -1,14 +1,16 @@
 # main menu bar and associated toolber for the app
 # 
 import os
+import time
 from functools import partial
 
 from PyQt5.QtCore import Qt, QRegExp
-from PyQt5.QtGui import (QIcon, QKeySequence)
+from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (QApplication, QWidget, QSizePolicy, 
-    QFileDialog, QMessageBox, QAction, QLineEdit)
+    QFileDialog, QMessageBox, QAction, QLineEdit, QInputDialog)
 
-import views.resources
+from views.IconProvider import IconProvider
+from library.Merge import Merge
 
 
 class MainMenu(object):
@@ -30,8 +32,20 @@ class MainMenu(object):
             ('&File',[
                 ('&New', self.new, QKeySequence.New, 'new.png', 'Create new Tagit project'),
                 ('&Open ...', self.open, QKeySequence.Open, 'open.png', 'Open existing project'),
+                ('Open Libraries ...', self.openLibraries, None, None, 'Open several projects read-only at once'),
                 ('&Save', self.save, QKeySequence.Save, 'save.png', 'Save current project'),
                 ('Save as ...', self.saveAs, None, 'Save as new a project'),
+                ('Autosave', self.getAutosaveOptions()),
+                ('History', []), # snapshots are listed when it's shown
+                (),
+                ('Import Catalog ...', self.importCatalog, None, None, 'Import items from JSON Lines or CSV file'),
+                ('Export Catalog ...', self.exportCatalog, None, None, 'Export groups, tags and items to JSON Lines or CSV file'),
+                ('Publish Catalog ...', self.publishCatalog, None, None, 'Publish static HTML pages of current project'),
+                ('Merge Library ...', self.mergeLibrary, None, None, 'Merge items of another project by source path'),
+                ('Check Integrity', self.checkIntegrity, None, None, 'Check and repair keys of groups and tags referenced by items'),
+                ('Export Changes ...', self.exportChanges, None, None, 'Export changes to synchronize another copy of current project'),
+                ('Apply Changes ...', self.applyChanges, None, None, 'Apply changes exported from another copy of current project'),
+                ('Local Server', self.toggleServer, None, None, 'Serve current project to local clients over JSON-RPC', True),
                 (),
                 ('E&xit', self.mainWindow.close, 'Ctrl+Q'),
             ]),
@@ -97,14 +111,23 @@ class MainMenu(object):
                 'Apply style sheet {0}.qss under path {1}'.format(name, qss_path)))
         return res
 
+    def getAutosaveOptions(self):
+        '''autosave intervals: (text, seconds)'''
+        self._autosaveOptions = [('Off', 0), ('1 minute', 60), ('5 minutes', 300), ('10 minutes', 600)]
+        return [(text, partial(self.setAutosave, seconds), None, None,
+                    'Save current project automatically {0} after last editing'.format(text) if seconds else 
+                    'Disable autosave') for text, seconds in self._autosaveOptions]
+
     def createMenus(self):
         '''init menus: common menus + dock widget view menu'''
         # common menu from config dict
         self.createMenusFromConfig()
+        self.refreshAutosave()
+        self.mapActions['history'].aboutToShow.connect(self.refreshHistory)
 
         # add widget converted menu
         self.dockAction = self.mainWindow.propertyView().toggleViewAction()
-        self.dockAction.setIcon(QIcon(':icon/images/edit_item.png'))
+        self.dockAction.setIcon(IconProvider.icon('edit_item.png'))
         self.dockAction.setToolTip('Edit reference item')
         self.dockAction.setStatusTip('Edit reference item')
         self.mapActions['view'].addAction(self.dockAction)
@@ -172,6 +195,9 @@ class MainMenu(object):
         self.mapActions['move to trash'].setEnabled(item_activated and item_selected)
         self.mapActions['open reference'].setEnabled(item_activated and item_selected)
 
+        # local server is stopped when another database is opened
+        self.mapActions['local server'].setChecked(self.mainWindow.serverAddress() is not None)
+
     def createToolBars(self):
         '''create tool bar based on menu items'''
         # files
@@ -214,7 +240,7 @@ class MainMenu(object):
         action = QAction(text, self.mainWindow)
 
         if icon:            
-            action.setIcon(QIcon(':icon/images/{0}'.format(icon)))
+            action.setIcon(IconProvider.icon(icon))
 
         if shortcut:
             action.setShortcut(shortcut)
@@ -247,7 +273,7 @@ class MainMenu(object):
             '''open existing project'''
             filename, _ = QFileDialog.getOpenFileName(self.mainWindow, 
                 'Open Prpject...', '', 
-                'Tagit Project (*.dat);;All Files (*)')
+                'Tagit Project (*.dat *.tagc);;All Files (*)')
             if not filename:
                 return
 
@@ -256,10 +282,26 @@ class MainMenu(object):
 
             self.refreshMenus()
 
+    def openLibraries(self):
+        '''open several projects read-only at once'''
+        if not self.maybeSave():
+            return
+
+        filenames, _ = QFileDialog.getOpenFileNames(self.mainWindow, 
+            'Open Libraries...', '', 
+            'Tagit Project (*.dat *.tagc);;All Files (*)')
+        if not filenames:
+            return
+
+        if not self.mainWindow.openLibraries(filenames):
+            QMessageBox.critical(None, "Error", "Invalid database for Tagit project.")
+
+        self.refreshMenus()
+
     def save(self):
-        '''save current database'''
+        '''save current database, or save as new one if it's opened read-only'''
         filename = self.mainWindow.database()
-        if filename:
+        if filename and not self.mainWindow.readOnly():
             return self.mainWindow.serialize(filename)
         else:
             self.saveAs()
@@ -268,12 +310,215 @@ class MainMenu(object):
         '''save current data as new database'''
         filename, _ = QFileDialog.getSaveFileName(self.mainWindow, 
             'Save Prpject as...', '', 
-            'Tagit Project (*.dat);;All Files (*)')
+            'Tagit Project (*.dat);;Tagit Columnar Project (*.tagc);;All Files (*)')
         if filename:
             return self.mainWindow.serialize(filename)
         else:
             return False
 
+    def setAutosave(self, seconds):
+        self.mainWindow.setAutosaveInterval(seconds)
+        self.refreshAutosave()
+
+    def refreshAutosave(self):
+        '''disable action of current autosave interval'''
+        seconds = self.mainWindow.autosaveInterval()
+        for action, (text, interval) in zip(self.mapActions['autosave'].actions(), self._autosaveOptions):
+            action.setEnabled(interval!=seconds)
+
+    def refreshHistory(self, count=20):
+        '''list the latest snapshots of current database'''
+        menu = self.mapActions['history']
+        menu.clear()
+
+        history = self.mainWindow.history()
+        snapshots = history.snapshots()[-count:] if history else []
+        current = self.mainWindow.snapshot()
+        for snapshot in reversed(snapshots):
+            text = '{0} ({1} items)'.format(
+                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(snapshot['time'])),
+                snapshot['counts'][self.mainWindow.KEY_ITEM])
+            action = self.createAction(text, partial(self.openSnapshot, history.database, snapshot['id']),
+                        tip='Open snapshot {0} read-only'.format(snapshot['id']))
+            action.setEnabled(not current or current[1]!=snapshot['id'])
+            menu.addAction(action)
+
+        if not snapshots:
+            menu.addAction('No snapshots').setEnabled(False)
+
+    def openSnapshot(self, database, snapshot):
+        '''open snapshot read-only, save it as a new database to restore it'''
+        if self.maybeSave():
+            if not self.mainWindow.openSnapshot(database, snapshot):
+                QMessageBox.critical(None, "Error", "Invalid snapshot {0}.".format(snapshot))
+            self.refreshMenus()
+
+    def importCatalog(self):
+        '''import items from JSON Lines or CSV file'''
+        filename, _ = QFileDialog.getOpenFileName(self.mainWindow, 
+            'Import Catalog...', '', 
+            'JSON Lines (*.jsonl);;CSV (*.csv);;All Files (*)')
+        if not filename:
+            return
+
+        try:
+            count = self.mainWindow.importCatalog(filename)
+        except (OSError, ValueError, KeyError):
+            QMessageBox.critical(None, "Error", "Invalid catalog file, nothing is imported:\n {0}.".format(filename))
+            return
+
+        QMessageBox.information(self.mainWindow, "Import Catalog", "{0} items are imported.".format(count))
+        self.refreshMenus()
+
+    def exportCatalog(self):
+        '''export groups, tags and items to JSON Lines or CSV file'''
+        filename, _ = QFileDialog.getSaveFileName(self.mainWindow, 
+            'Export Catalog...', '', 
+            'JSON Lines (*.jsonl);;CSV (*.csv)')
+        if not filename:
+            return
+
+        try:
+            count = self.mainWindow.exportCatalog(filename)
+        except (OSError, ValueError):
+            QMessageBox.critical(None, "Error", "Could not export catalog to\n {0}.".format(filename))
+            return
+
+        self.mainWindow.statusBar().showMessage('{0} items are exported to {1}.'.format(count, filename))
+
+    def publishCatalog(self):
+        '''publish static HTML pages of current project'''
+        folder = QFileDialog.getExistingDirectory(self.mainWindow, 'Publish Catalog...')
+        if not folder:
+            return
+
+        try:
+            written, unchanged, removed = self.mainWindow.publishCatalog(folder)
+        except OSError:
+            QMessageBox.critical(None, "Error", "Could not publish catalog to\n {0}.".format(folder))
+            return
+
+        self.mainWindow.statusBar().showMessage('Catalog published: {0} files written, {1} unchanged, {2} removed.'.format(
+            written, unchanged, removed))
+
+    def mergeLibrary(self):
+        '''merge items of another project into current project'''
+        filename, _ = QFileDialog.getOpenFileName(self.mainWindow, 
+            'Merge Library...', '', 
+            'Tagit Project (*.dat *.tagc);;All Files (*)')
+        if not filename:
+            return
+
+        policies = ['Keep current values', 'Replace with merged values', 'Keep values of newer item']
+        policy, ok = QInputDialog.getItem(self.mainWindow, 'Merge Library',
+            'Conflicted fields of items with same source path:', policies, 0, False)
+        if not ok:
+            return
+
+        try:
+            res = self.mainWindow.mergeLibrary(filename, Merge.POLICIES[policies.index(policy)])
+        except (OSError, ValueError, KeyError):
+            QMessageBox.critical(None, "Error", "Invalid database for Tagit project.")
+            return
+
+        QMessageBox.information(self.mainWindow, "Merge Library",
+            "{0} items are merged, {1} items are appended, {2} fields are conflicted.".format(
+                len(res['updated']), len(res['inserted']), res['conflicts']))
+        self.refreshMenus()
+
+    def checkIntegrity(self):
+        '''check and repair integrity of current project'''
+        report = self.mainWindow.checkIntegrity()
+        if not report:
+            QMessageBox.information(self.mainWindow, "Check Integrity", "No issues are found.")
+            return
+
+        issues = {
+            'orphan groups'    : '{0} items in groups not exist',
+            'orphan tags'      : '{0} items with tags not exist',
+            'duplicated groups': '{0} duplicated group keys',
+            'duplicated tags'  : '{0} duplicated tag keys',
+            'group counter'    : 'group key counter {0[0]} is lower than key {0[1]} in use',
+            'tag counter'      : 'tag key counter {0[0]} is lower than key {0[1]} in use'
+        }
+        msg = '\n'.join(issues[name].format(len(issue) if isinstance(issue, (list, dict)) else issue) 
+                            for name, issue in report.items())
+        ret = QMessageBox.question(self.mainWindow, "Check Integrity",
+                "{0}\n\nDo you want to repair them?".format(msg), QMessageBox.Yes | QMessageBox.No)
+        if ret == QMessageBox.Yes:
+            self.mainWindow.checkIntegrity(repair=True)
+            self.refreshMenus()
+
+    def exportChanges(self):
+        '''export changes not applied by other copies yet'''
+        feed = self.mainWindow.changeFeed()
+        if not feed:
+            QMessageBox.information(self.mainWindow, "Export Changes",
+                "Changes are recorded for saved project (*.dat) only.")
+            return
+
+        since = feed.lastSynced()
+        filename, _ = QFileDialog.getSaveFileName(self.mainWindow, 
+            'Export Changes as...', '', 'Tagit Changes (*.tagd);;All Files (*)')
+        if not filename:
+            return
+
+        try:
+            count, last = feed.export(filename, since)
+        except OSError:
+            QMessageBox.critical(None, "Error", "Could not export changes to\n {0}.".format(filename))
+        else:
+            QMessageBox.information(self.mainWindow, "Export Changes",
+                "{0} changes after sequence number {1} are exported, up to {2}.".format(count, since, last))
+
+    def applyChanges(self):
+        '''apply changes exported from another copy of current project'''
+        if self.mainWindow.readOnly():
+            QMessageBox.information(self.mainWindow, "Apply Changes",
+                "Current project is opened read-only since it's being edited in another window.")
+            return
+
+        if not self.maybeSave():
+            return
+
+        filename, _ = QFileDialog.getOpenFileName(self.mainWindow, 
+            'Apply Changes...', '', 'Tagit Changes (*.tagd);;All Files (*)')
+        if not filename:
+            return
+
+        try:
+            res = self.mainWindow.applyChanges(filename)
+        except (OSError, ValueError):
+            QMessageBox.critical(None, "Error", "Invalid changes file:\n {0}.".format(filename))
+            return
+
+        if res is None:
+            QMessageBox.information(self.mainWindow, "Apply Changes",
+                "Changes could be applied to saved project (*.dat) only.")
+        else:
+            applied, conflicts, header = res
+            QMessageBox.information(self.mainWindow, "Apply Changes",
+                "{0} changes from {1} are applied, {2} changes are kept since they're edited here later.".format(
+                    applied, header['origin'], conflicts))
+        self.refreshMenus()
+
+    def toggleServer(self, checked):
+        '''start/stop serving current project to local clients, e.g. editor plugins'''
+        if not checked:
+            self.mainWindow.stopServer()
+            self.mainWindow.statusBar().showMessage('Local server is stopped.')
+            return
+
+        try:
+            address = self.mainWindow.startServer()
+        except OSError as e:
+            self.mapActions['local server'].setChecked(False)
+            QMessageBox.critical(None, "Error", "Could not start local server:\n {0}.".format(e))
+            return
+
+        address = address if isinstance(address, str) else '{0}:{1}'.format(*address)
+        self.mainWindow.statusBar().showMessage('Local server is listening on {0}'.format(address))
+
     def maybeSave(self):
         '''show message dialog if the application is not saved'''
         if self.mainWindow.saveRequired():
@@ -281,8 +526,9 @@ class MainMenu(object):
                     "Current project has been modified.\nDo you want to save your changes?",
                     QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel)
 
-            if ret == QMessageBox.Save:                
-                return self.save()
+            if ret == QMessageBox.Save:
+                # saved in background, so wait for the result
+                return bool(self.save()) and self.mainWindow.waitForSaving()
 
             if ret == QMessageBox.Cancel:
                 return False
@@ -352,6 +598,13 @@ class MainMenu(object):
         index = self.itemsView.model().mapToSource(index)
         self.mainWindow.propertyView().widget().setup(index, (name, groups, path, note))
 
+        # source database of item when several databases are mounted
+        federation = self.mainWindow.federation()
+        library = federation.library(self.itemsView.sourceModel.itemId(index.row())) if federation else None
+        if library:
+            self.mainWindow.statusBar().showMessage('{0}  (library: {1})'.format(path, library))
+
     def slot_search(self):
+        self.mainWindow.record('search', text=self.searchEdit.text())
         regExp = QRegExp(self.searchEdit.text(), Qt.CaseInsensitive, QRegExp.Wildcard)
         self.itemsView.model().setFilterRegExp(regExp)
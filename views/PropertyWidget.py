@@ -7,7 +7,7 @@ import os
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtWidgets import (QWidget, QFileDialog, QMessageBox,
     QLabel, QGridLayout, QLineEdit, QTextEdit, QHeaderView,
-    QFileSystemModel, QTreeView, QToolButton, QMenu, QTabWidget)
+    QTreeView, QToolButton, QMenu, QTabWidget)
 from PyQt5.QtGui import QDesktopServices
 
 from models.ItemModel import ItemModel
@@ -17,7 +17,7 @@ class PropertyWidget(QWidget):
     def __init__(self, itemView, parent=None):
         super(PropertyWidget, self).__init__(parent)
         self.itemView = itemView
-        self.currentRow = None
+        self.currentId = None # id of current item, which is kept when rows are changed
 
         # labels
         nameLabel = QLabel("Title")
@@ -42,16 +42,12 @@ class PropertyWidget(QWidget):
         menu.addAction('Browse file', lambda: self.slot_browse(1))
         self.browseButton.setMenu(menu)
 
-        # dir tree
+        # dir tree: file system model is created when a directory is shown, see updateTree()
         self.tree = QTreeView()
         self.tree.setAnimated(False)
         self.tree.setIndentation(20)
         self.tree.setSortingEnabled(True)
 
-        model = QFileSystemModel()
-        self.tree.setModel(model)
-        self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
-
         # tree and comments tabs
         self.tabWidget = QTabWidget()
         self.tabWidget.addTab(self.tree, "Navigation")
@@ -98,7 +94,7 @@ class PropertyWidget(QWidget):
         '''
         self.setEditorsEnbaled(True)
 
-        self.currentRow = index.row() if index else None
+        self.currentId = index.model().itemId(index.row()) if index else None
         name, group, path, comments = data
         self.setTextSafely(self.nameEdit, name)
         self.setTextSafely(self.pathEdit, path)
@@ -122,18 +118,20 @@ class PropertyWidget(QWidget):
         else:
             return
 
-        # update values
+        # update values: current item might be removed
         model = self.itemView.model().sourceModel()
-        index = model.index(self.currentRow, col)
-        if index.isValid():
-            model.setData(index, value)
+        row = model.itemRow(self.currentId)
+        if row<0:
+            return
+        with model.transaction():
+            model.setData(model.index(row, col), value)
 
-        # update unreferenced status if path is updated:
-        # move item to UNGROUPED if current group is UNREFERENCED 
-        if editor==self.pathEdit:
-            group_index = model.index(self.currentRow, ItemModel.GROUP)
-            if group_index.data() == GroupModel.UNREFERENCED:
-                model.setData(group_index, GroupModel.UNGROUPED)
+            # update unreferenced status if path is updated:
+            # move item to UNGROUPED if current group is UNREFERENCED 
+            if editor==self.pathEdit:
+                group_index = model.index(row, ItemModel.GROUP)
+                if group_index.data() == GroupModel.UNREFERENCED:
+                    model.setData(group_index, GroupModel.UNGROUPED)
 
     def slot_openSource(self, index):
         '''open source file/folder from navigation tree'''
@@ -154,11 +152,18 @@ class PropertyWidget(QWidget):
             # update dir tree
             self.updateTree(path)
 
+    def createFileSystemModel(self):
+        from PyQt5.QtWidgets import QFileSystemModel
+        model = QFileSystemModel(self)
+        self.tree.setModel(model)
+        self.tree.header().setSectionResizeMode(QHeaderView.ResizeToContents)
+        return model
+
     def updateTree(self, path):
         '''show dir tree if directory else set disabled'''
         if os.path.isdir(path):
             # set root path
-            model = self.tree.model()
+            model = self.tree.model() or self.createFileSystemModel()
             model.setRootPath(path)
             self.tree.setRootIndex(model.index(path))
             # activate tree tab
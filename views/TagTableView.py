@@ -166,10 +166,11 @@ class TagTableView(QTableView):
         key = self.sourceModel.index(index.row(), TagModel.KEY).data()
         self.tagCleared.emit(key)
 
-    def slot_updateCounter(self, items):
-        '''update count of items for each group
-           :param items: the latest items list
+    def slot_updateCounter(self, changes):
+        '''update count of items for each tag
+           :param changes: changes of items, see ItemModel.itemsChanged
         '''
-        self.sourceModel.layoutAboutToBeChanged.emit()
-        self.sourceModel.updateItems(items)
-        self.sourceModel.layoutChanged.emit() # update display immediately
+        # only the tags with changed count are repainted, unless counters are rebuilt
+        if not self.sourceModel.updateCounts(changes):
+            self.sourceModel.layoutAboutToBeChanged.emit()
+            self.sourceModel.layoutChanged.emit() # update display immediately
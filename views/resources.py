@@ -1,996 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x07\x31\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x06\xc6\x49\x44\x41\x54\x58\x47\xb5\x57\x7b\x4c\
-\x53\x57\x18\xef\xde\xd9\xb2\x2d\xd9\x96\x2d\x5b\xb2\xc4\x3d\xdd\
-\xe6\x9e\xd9\xfe\xdc\x92\x25\x53\xa0\x28\x02\x6a\x0b\x2c\x06\x8c\
-\xc6\x6c\xd9\xe6\x94\x89\x4e\x74\x2a\xdb\x1c\xb4\x40\xdf\x45\x41\
-\x71\x43\x87\x0c\x04\xd1\x25\x3e\x50\x74\x73\x32\xfa\xbc\xf7\x82\
-\x44\xc0\xf2\xa6\xbc\x6c\x4b\xa5\x28\x20\xb4\xd0\x9e\x7d\xdf\xe5\
-\x5c\xac\x50\x33\x07\xf3\x97\x9c\x40\xfa\x9d\x73\x7e\xdf\xfd\xde\
-\x47\x74\x37\xf1\x71\xda\xf9\xfb\x17\x65\x9a\x5e\x15\xa7\x9b\x17\
-\xc0\xff\x8f\xd2\x9f\xef\x3e\xc4\xe9\x55\x4f\xc7\x69\xd9\xc2\x04\
-\x1d\xe7\x4c\x3e\xd4\xe8\xdc\x5c\x7c\xd9\x99\x98\x57\xeb\x8c\xd3\
-\xb3\x86\x70\x99\xf9\x5d\xba\xed\xee\x20\x42\x6e\x79\x53\xaa\x65\
-\x7b\xcb\x39\xf7\x44\xfb\x60\x80\x74\x04\xad\xaa\xd6\x21\xb2\x2a\
-\xaf\xd6\xbd\x4c\xc5\xae\xa4\xdb\xff\x5f\x88\xb3\x4c\xef\xc4\xeb\
-\x39\x87\xb9\x73\x84\x27\x3c\xcc\xb8\xbc\xc9\x85\x0d\x8e\xb5\xfb\
-\xeb\x9c\x9a\x4a\xfb\x50\x93\x7b\x82\xd8\x60\xad\xca\xbb\xd8\x1f\
-\x96\x6e\x78\x8b\x1e\xfb\x7f\x10\x96\x55\xfd\x5e\x7c\x0e\xe7\xb0\
-\xd8\x6f\x90\x36\x8f\x9f\x6c\x29\xb9\xec\x91\x68\x99\xa2\xb0\x6c\
-\xf3\x8b\x4b\x64\x7f\x3f\x11\xab\x64\xd6\x25\xe5\xd6\xf6\xa3\x02\
-\x7f\xb5\x0c\x91\x38\x2d\x57\x45\x8f\xce\x1d\x11\x99\xc6\xf7\x13\
-\xf4\xac\xcb\xda\x35\x4a\xda\x06\xfc\x64\xe3\x6f\x8d\x9e\x15\x1a\
-\xe6\x07\x2a\x9e\xc2\x32\x85\xf5\x2b\x4d\x65\xd7\x75\xb4\xce\xca\
-\xdd\x9c\x53\xac\x3d\xf5\x10\x15\xcd\x1e\x91\x32\xe3\xdb\x09\x39\
-\xac\x8b\xed\x1e\x25\xad\x57\x81\xbc\xa8\xc1\x23\x51\x33\xdb\xa9\
-\xf8\x16\xa0\x25\x3e\xfb\xb9\xce\x81\x0a\x6c\x80\xe0\xc4\x0c\xa1\
-\xa2\xd9\x41\x9a\x56\xff\x20\x98\xd9\x8e\x66\x47\xf2\xe4\x43\x0d\
-\x9e\xe5\x6a\x76\x2b\x15\xcf\xc0\x42\x99\xf5\xa5\xf5\x85\x0d\x4e\
-\x54\xe0\xcb\x03\xf5\x0e\xb1\xdc\xfc\x3c\x15\xcd\x0e\x31\x0a\xcb\
-\x5a\xed\x59\xfb\x08\x5e\xf8\xe3\xef\xad\x9e\x58\x8d\x25\x95\x8a\
-\x42\x22\x4e\xc7\x1c\x2e\x63\x5c\xbe\x76\x4f\x80\x48\x75\xac\x33\
-\x2d\x8d\xdc\x4b\x45\xb3\x43\x42\x0e\x77\xde\xd2\x79\x83\xa0\xef\
-\xe3\x74\x6c\x2d\xfd\x39\x24\x96\xab\x99\xf4\xad\x87\x6d\x1e\x54\
-\xb6\xc8\xe4\xf0\x49\xb5\xcc\x6e\x2a\x9a\x3d\xa0\xd8\xb4\xa0\xe9\
-\x8f\xd5\xba\xc9\x32\x8d\x25\x63\xb9\x86\x49\x59\xa1\x62\x76\xa0\
-\x6b\xe8\x16\x1e\x12\x0d\x2b\x4f\x2d\xb9\x3c\x88\xd9\x51\xdd\x3e\
-\x4c\x80\xbc\x53\x9c\x66\x7e\x9c\x8a\x67\x8f\x38\x3d\x57\x53\xd7\
-\xe7\x25\xe7\x6c\xd7\x88\x44\xc7\x3a\xb2\x2b\x3a\x46\x14\x15\x9d\
-\x63\x90\x01\x3b\xe8\x16\x11\xfc\xae\xdc\x56\x6a\xe3\xc9\xab\xda\
-\x86\x80\x9c\xed\x0d\xcf\x30\xbe\x42\xc5\x73\x03\x5c\x2e\x2f\xb1\
-\x3a\xfd\x5b\x4b\x9b\xc8\xee\x3f\xba\x03\x68\xde\x8c\xe3\x6d\xc3\
-\x31\x2a\xe6\x6b\xf4\xaf\x44\x6d\xd5\x6f\x3f\xd2\x3c\x88\x3e\xbf\
-\x00\x55\x10\xf6\xf7\x60\x20\xd2\xe3\x73\xc7\xe2\x5d\x86\x79\x52\
-\x1d\xe7\xdb\x77\xa1\x97\xaf\x7c\xaa\xd3\x1d\x01\xa9\x9e\x75\x48\
-\x73\xb8\x7c\xf8\xd2\x36\xcd\x19\xfb\x10\x96\xe3\xf3\xcd\xd7\x03\
-\x40\xde\x1d\x21\x33\xbd\x40\x8f\xce\x1d\xd8\xe9\x56\x68\xd9\xca\
-\x3d\x7f\xf6\x78\x91\x3c\xe7\x5c\x17\xf9\xfe\x58\x0b\xa9\x06\x33\
-\x57\x34\x0c\x92\x7a\x87\x8f\x57\xaa\xa2\xc1\xe3\x87\x18\xe8\x5e\
-\x9c\x6d\x98\x47\x8f\xde\x39\x90\x64\x89\xc2\xb2\x12\x4a\xec\x59\
-\x88\xf2\x16\xe8\x66\x75\x2b\xd4\xac\x3e\x52\x61\x99\x3f\x49\xde\
-\xcd\xa7\xa0\xea\x8c\x7d\x0c\x64\x63\x05\x86\xbe\x71\x63\xc7\x08\
-\xa9\xed\x1b\x43\x62\xf2\x5d\x59\xd3\x00\xa4\x9b\x35\x2c\xdb\xf0\
-\x0c\xbd\xf2\xce\x81\xbe\x02\xb3\x35\x67\x9d\x6a\x1f\x32\xc0\xa5\
-\x2d\x57\x27\x48\xbd\xd3\x47\x8e\x70\xfd\x01\x08\x3e\x1f\xf8\xdc\
-\x87\xe4\x68\x66\x89\x8e\x39\xba\x38\xeb\xfc\xb3\x31\x4a\xcb\x96\
-\x4f\x75\x5c\x65\x82\x9e\xb3\x80\x2b\x0e\x86\xc9\xcc\x9f\xd0\xeb\
-\xfe\x1b\xc2\xd3\x0d\xaf\xc7\xe9\xb8\x3e\x6c\x9f\x48\x82\x65\xb6\
-\x9c\xeb\x27\x27\xeb\x3d\x24\x15\x02\x4e\xf0\xb9\xfa\x4c\xa7\x17\
-\xc9\xa5\xa5\xa5\xf7\xd1\xa3\x53\x90\x28\x8d\x0f\xa3\x02\xe1\x32\
-\x63\x52\x98\xdc\x2c\xb9\xe3\xee\x17\x91\x59\xfd\x5a\xbc\x96\xbb\
-\x62\x6c\x1f\xe1\xbb\x9a\xfc\x44\xfb\x35\x08\xa8\x4b\xcb\x55\xe6\
-\x34\x89\x96\xed\x11\xa2\x1d\x7d\x0e\x0d\xc8\x1b\xa9\xa8\x9a\x4f\
-\x8f\xf2\x58\x98\x61\x79\x2a\x46\xc5\x1e\x8c\xd5\x70\xae\xcf\x0b\
-\x5b\x07\x36\x1f\xeb\xf5\x25\x97\x76\x8d\x24\xe6\x37\xb8\x20\x3b\
-\xec\x51\x99\xe6\x44\xba\x75\x26\x90\x1c\x7c\x3d\x45\x0e\xe9\xe5\
-\x81\xe2\x92\x2d\x22\xe4\x9e\x18\x95\x75\x9b\xfa\xb4\x7d\x18\xc9\
-\x95\x15\x1d\x81\x9d\x47\x5b\x48\x79\x4d\x7f\x00\x72\x5e\x4d\x8f\
-\x8b\x16\xc9\x4d\x6f\x44\xab\xd8\xee\x6d\xc7\x9d\xe3\xb9\xac\x9f\
-\xe4\x4d\x5b\x3a\x93\x97\xac\x29\x68\x1a\x5c\xaa\x60\x8f\xcc\xb0\
-\x5a\x28\x72\x08\xb4\x4c\x2a\x16\xc5\xaa\xac\x0a\xfd\xb9\x2e\x9f\
-\x0c\xf2\x1c\x1a\x50\xfb\x89\x4b\x57\xc9\xa5\x2b\x5e\x12\xaf\x9f\
-\x2c\xc1\xf8\xe5\x48\x9e\x7d\x61\x78\x06\xf1\xf4\xb5\xae\xb8\x63\
-\x24\x5a\x15\x54\x8a\xf1\xb0\x14\x52\x05\x83\x2d\x14\x39\x02\x7d\
-\x8a\x25\x55\x02\xe5\x36\x5a\x61\x4a\x2d\xb1\xba\xf8\xc0\x84\x72\
-\xdc\x84\xf2\x68\x25\x7b\x60\xfb\x09\xe7\x84\x40\x72\xba\x35\x40\
-\xf6\x72\x37\x49\x8b\x2f\xf9\x49\x59\xc3\xe4\xff\x68\x9d\xf8\x3d\
-\x75\xee\xa9\xb8\x88\xd7\xb2\xbf\x94\xb1\xae\x09\x34\xef\xb6\xb2\
-\x99\xe4\xd3\x01\x96\x62\x70\xec\xc2\xba\x0e\x16\xa8\x40\xe5\xd0\
-\xe7\x82\xd9\x91\x1c\x61\x73\x4f\x2a\x81\xe4\xc3\x5e\x42\xae\xc3\
-\xda\x5f\x33\xb9\x67\x57\xa5\x87\xc4\xaa\xd8\x12\xd1\x07\x7b\xd9\
-\x07\xe0\x42\x17\x56\xac\xa3\x35\xfd\xe3\x10\x70\xe5\x94\x27\x24\
-\xa0\xdf\xef\xc4\xd6\x8b\xca\xca\x4f\x76\x5c\x5f\x9c\x6d\x89\xc3\
-\x68\xc7\x80\x13\xbe\x16\x49\x91\x1c\xd1\x3e\x10\xe0\xc9\xc7\xfd\
-\x84\x9c\x68\x0e\xf0\x72\x5c\xb9\xec\x04\x01\x97\xf5\x88\x70\x2a\
-\xd9\x70\x68\x72\x48\x48\x29\xbe\xec\x88\xcc\xb0\xdc\x12\xd5\xc1\
-\xc0\x49\x67\x63\x51\xa3\x07\xc7\x2e\x5a\xdb\x6d\x58\xf3\x31\xd5\
-\x36\x1d\xed\xf5\x09\x97\x0b\x4a\x20\x39\xc2\x0f\x7f\x4e\x06\x91\
-\x0b\x2b\x56\xcd\xba\x60\x86\x37\x2f\xf8\xb6\xc4\xc6\x2b\xf0\x45\
-\x41\xbd\x23\xe2\x27\xe6\x39\xca\x77\x0b\x82\xc9\x31\x50\x31\x55\
-\x71\xe0\x44\x19\xe6\x39\xa6\x5a\xf0\xe5\x82\xd9\x91\x1c\x21\xb8\
-\x23\x78\x0f\xb8\xad\x4f\x14\x9d\x59\xfd\x58\x12\x3c\x1a\x50\x01\
-\xc8\xf1\xe1\x18\x25\x93\xc2\x33\x06\x21\x14\x39\x16\x2b\x2a\xe6\
-\xe7\xc2\xa4\xfc\x46\xd7\x74\x72\x34\x3b\x7e\xb9\xe0\x8e\x60\x25\
-\x30\x25\xc1\x05\x8d\xfc\x05\x50\xf5\xcc\x06\x08\xa8\x66\x18\x99\
-\x57\xef\xbd\xe8\x86\x14\xf9\x26\x5c\x69\x7c\x12\xbb\x17\x44\xfe\
-\xaf\x9b\x4a\x6c\x03\xb7\x23\x17\x00\x45\xa6\x13\x2f\xc5\xcb\x31\
-\xda\x31\xe0\x04\x9f\x0b\x31\x81\x6d\x79\x1f\x55\x20\xa5\xbc\x67\
-\x74\xa9\xd2\x3a\x39\x3f\xe2\x4c\xbf\x7a\xdf\x45\x37\x3e\x1c\x9a\
-\x21\xb5\xf4\xe7\xec\x43\x38\xbd\xae\x2f\xac\x77\x16\x5b\x5d\x7c\
-\xb7\xc3\x14\xc5\x3a\x81\xf5\x82\x3f\x34\x0d\x51\xd9\xd6\xc4\x35\
-\x05\xb6\x41\xbc\x1c\x57\x3e\x8d\x76\x61\xa1\x12\x02\xb9\xda\x30\
-\x4a\xa0\x5a\xf6\x46\xa5\xb1\x8f\xd0\xe3\x10\xdd\x2a\x6b\x22\x2a\
-\x81\xa9\x85\x84\xc2\xc2\xec\x80\xa1\x03\xb3\xa3\xeb\x76\xe4\x02\
-\x96\xaa\xd9\x32\x28\x32\xc3\xa1\xaa\xa0\xb0\x34\xd5\xa3\x10\xbc\
-\xb5\xee\xc8\x2c\xe3\x87\xf4\xd8\x4d\xf0\xaf\x1b\x1d\x67\x4a\xcc\
-\xad\xe1\x1f\x94\xf0\xb0\x74\xc0\x57\x3b\xa1\x07\xec\xc7\x99\x9e\
-\x6e\xbb\x2d\xb0\xbc\x82\xfb\xf6\x60\x91\xd9\x55\x39\xc8\xa7\x9a\
-\x40\x8c\xee\xd9\x54\xde\x33\x16\xad\x64\xfa\xc4\x72\xd3\x47\xf4\
-\x48\x68\xe0\x53\x1a\xb3\x43\x9c\x55\xfd\x72\xa8\x4e\xf7\x6f\xc0\
-\x07\x6a\x8c\x9a\x2d\xc6\xd2\x0c\x91\xee\x8c\x55\x73\x57\x30\xe0\
-\xa2\x54\x96\x54\x2c\x5a\x74\x1b\x40\x24\xfa\x07\xc7\x55\x39\x76\
-\x22\xb2\xb2\xd5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x03\x36\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\xcb\x49\x44\x41\x54\x58\x47\xed\x97\xdf\x4b\
-\x53\x61\x18\xc7\x07\x5d\xd5\x65\xf7\xdd\x07\xd5\x5f\x50\x5d\x45\
-\x2b\x69\xce\x91\x8b\x6e\x8c\x48\xca\x9b\x8c\xa0\x41\xd6\x45\x79\
-\x21\xa2\x33\xf7\x43\x21\xa7\x68\x14\x4d\x31\x96\x5a\x90\x23\x53\
-\xc8\x7e\x39\xf7\xe3\xd8\xdc\x74\x96\x0d\x99\xe2\x36\x71\x9b\xa9\
-\xa5\x5b\xd3\xb6\xa7\xf3\xac\xd7\x9d\xce\x3c\x27\xf0\x3d\x5b\x44\
-\xf4\x81\xe7\x62\x63\x3c\xdf\xcf\x79\xde\xf7\x19\x1c\xd9\x5f\x87\
-\x5c\x67\xdb\x2b\xaf\xb3\x57\xd0\x95\xa3\x55\x51\x3b\xb2\x9f\xb4\
-\xa2\xa3\xa8\xce\x76\xe8\xca\x83\x89\x35\xab\x7b\x11\x76\x5a\x65\
-\x2d\xef\x41\xdd\xe4\xda\x90\x24\x81\x02\x0d\xcf\xfc\x31\xa0\xe0\
-\x52\x87\x07\xac\x93\xcb\xd2\x24\xa4\x0a\x04\x56\xd2\xd2\x24\xf2\
-\x21\x20\x49\x22\x5f\x02\xd4\x12\xf9\x14\xa0\x92\x90\x2a\xf0\xca\
-\xff\x75\x5b\x99\x86\x83\x50\x6a\x70\x6d\xc8\x1b\x9d\xfb\x48\x8c\
-\x38\x52\x04\x1e\xbe\x9d\x07\xc3\xf3\x19\xc1\xaa\xb8\x37\x9e\x64\
-\xa7\x70\x8c\xc4\x88\x23\x45\xe0\x77\x60\x4f\xec\x4d\x62\xc4\xf9\
-\x2f\xf0\xcf\x0a\x68\xba\x26\xbf\x9c\xd2\xda\x8f\x92\x18\x71\x0a\
-\x25\xd0\x34\x30\x93\xaa\xee\xf9\x50\x41\x62\xc4\x29\x94\x00\xd2\
-\xe7\x0c\x9f\x26\x31\xe2\xe4\x4b\x20\xb9\x99\x02\xf7\xec\x2a\x0c\
-\x4d\x44\xe0\xcd\xc7\x25\x08\x44\xd6\xff\x8c\xc0\x6a\x7c\x13\x8c\
-\x03\x01\x38\xdf\xe6\x85\x6b\x96\x00\x54\x3d\x0d\xc3\xf5\xbe\x20\
-\x5c\xee\x9c\x86\x52\xa3\x2b\xaa\xd0\xda\xcf\x91\x28\x61\xa4\x08\
-\xcc\xc5\xe2\x50\xde\xee\x85\x5b\xd6\x08\x98\x98\x14\xb4\xe6\x54\
-\xf3\x68\x12\xca\xef\x4f\xaf\x14\x37\x32\x3d\x67\x2c\x96\x5d\x24\
-\x92\x0f\xad\x00\x3e\xf9\x05\x36\xfc\xce\xeb\x35\x5e\x68\xef\x54\
-\x0a\x3a\xbd\x7c\x91\xca\xee\xc0\xba\x52\xef\xba\x4b\x22\xf9\xd0\
-\x0a\xe0\xd8\x6f\x5b\xa3\xbc\x20\x2c\xc4\x17\x49\xf3\xbe\xc3\xe9\
-\x9c\x6d\xf1\xc4\x8e\xd7\x8e\x1c\x24\xb1\x1c\x34\x02\x78\xe1\xf0\
-\xcc\x85\xc6\x8e\xe4\x0a\x60\xd5\x0c\x2e\x83\x4a\xcf\x3c\x22\xb1\
-\x1c\x34\x02\x78\xdb\xf1\xc2\xe5\x86\x60\x21\x42\x02\x26\xe6\x3b\
-\x28\xf5\x4c\x90\xc4\x72\xd0\x08\xe0\xaa\x55\x3d\x09\x67\x1a\x5b\
-\x7c\x3f\x43\xc5\x58\x8a\x43\x56\x42\x65\x60\x22\x24\x96\x83\x46\
-\x00\xf7\x1c\x57\x0d\x9b\x9a\x3d\x29\x98\x8a\xa6\xb3\x85\x7c\x4e\
-\x40\xf6\xb3\x2b\xc4\x4d\x43\x65\x1c\x0b\x93\x58\x0e\x1a\x01\xfc\
-\x93\xc1\x3d\xdf\x6a\xfc\x6b\x21\x42\x47\x80\x2b\xc9\x1e\xc1\x14\
-\x89\xe5\xa0\x11\x40\x2e\x76\x78\x33\x4d\x73\x83\x10\x21\x01\x4d\
-\x6f\x30\x51\xac\x73\xde\x24\xb1\x1c\xb4\x02\x2f\x7d\x31\xa8\xec\
-\xf2\x6f\x0b\x62\x87\x03\xf6\x20\x5f\xc0\x30\x92\x80\x12\x3d\x13\
-\x52\x54\x33\x7b\x48\x2c\x07\x0a\xec\xe4\xd5\xcc\x34\x14\x80\x4f\
-\x0b\x6b\x19\x09\x6d\xff\x0c\x68\x1e\xcf\x09\xae\xe3\x56\x19\xdf\
-\x25\x40\xdd\xec\x8e\x15\x35\xd8\x0e\x93\x48\x3e\x3b\x7d\x39\x55\
-\xeb\x1d\xe6\xf6\xe1\xb9\xfe\x41\x4f\xc4\xfc\x62\x7c\xb1\xf3\xaa\
-\xd9\x37\x5d\xd6\xe6\xfd\x56\x33\xb8\x92\x59\xb5\xad\x60\x3c\x1e\
-\x4d\x5f\x28\xa9\xd4\xb9\xc2\x27\xeb\x47\x8f\x90\xb8\xc2\x70\xa2\
-\xde\x71\xa0\xc4\xc0\x74\xb3\x97\x6c\x9e\xbd\xe9\x8b\x2a\xc3\xd8\
-\x02\x5e\x38\x85\xde\x71\x43\xad\xb3\xed\x26\x3f\x63\x91\xc9\x7e\
-\x00\xeb\x8c\x1d\xbd\x97\x00\xab\x8f\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x02\x07\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x01\x9c\x49\x44\x41\x54\x58\x47\x63\x08\xe9\x3d\
-\xc6\xe9\xd6\x7e\xc2\x18\x86\x3d\xdb\x8f\xe9\x32\xd0\x13\x80\x2c\
-\x0c\x9e\x74\xf6\x63\xee\x92\x9b\xaf\x41\x38\x6e\xe6\xc5\xb7\x01\
-\x13\x4e\x77\x43\xa5\x69\x0f\x40\x0e\x28\x58\x7e\xfb\xcd\xb6\x3b\
-\xff\xfe\x83\xf0\xd6\xdb\x7f\xff\xe7\x2c\xbe\xf9\x3e\x78\xc2\x99\
-\x27\xe1\x53\xce\x3c\x45\xc6\x81\x13\x4e\xdd\x87\x6a\xa3\x1e\x70\
-\x6f\x3f\xea\x1d\x3e\xf9\xec\x9f\xc4\xd9\x97\xfe\xc3\x70\xd4\xd4\
-\xf3\xff\xa7\xee\x7b\xf2\xff\xc0\xed\xcf\x28\x38\x64\xe2\xe9\x7f\
-\x50\x6d\xd4\x03\x5e\x1d\xc7\x83\x6a\xd7\xde\xfa\x77\xff\xc3\xbf\
-\xff\x84\x70\xf8\xe4\x33\xa3\x0e\x18\x75\x00\x6d\x1c\x90\x36\xf7\
-\xf2\xff\x45\xc7\x5e\x10\xc4\x01\xfd\xa7\x08\x3a\x00\x58\x98\xa5\
-\x21\x63\x8f\xd6\x43\xa2\x50\x29\xec\xc0\xa3\xeb\x88\xb2\x5b\xdb\
-\x89\xc5\x18\xb8\xfd\xf8\x4d\xf7\xf6\x13\x9b\xd1\xc5\xa1\xda\x70\
-\x02\xdf\xbe\x53\x5f\x3a\x77\xbd\xf8\x0f\xc2\xcd\x5b\x9e\xfc\x0d\
-\xe8\x3f\x73\x8b\xa0\x23\xb0\x01\xf7\xf6\x63\xd3\xc8\x29\x96\x83\
-\x27\x9e\x85\x17\x6a\x20\x3c\xf5\xd0\xdb\xbf\xc1\x13\xcf\xfc\x0c\
-\x99\x78\xe6\x37\x32\x0e\xea\x3f\xf5\xcb\xa3\xf5\xa8\x33\x54\x1b\
-\x26\x20\xd7\x01\x9e\x9d\x27\xfe\x27\x01\x0b\x33\x64\x3c\xf7\xc8\
-\x33\x8c\xf4\x04\x4a\x77\xa0\xe8\x87\x6a\xc3\x04\xe4\x3a\x00\x94\
-\x50\xd1\x2d\xc3\x86\x07\xbf\x03\x80\x89\xf0\xb8\x7b\xc7\xb1\xab\
-\x40\x7c\x86\x14\x0c\xac\x57\xb0\x5a\x88\x8e\x47\xa3\x80\x66\x0e\
-\xf0\xe9\x3e\xf9\xbf\x6a\xcd\xcd\xbf\x84\x70\xc4\x94\x33\xb4\x71\
-\x80\x6b\xfb\xf1\x18\x62\x31\xb0\x39\x28\x04\xd5\x86\x09\xc8\x75\
-\x00\xd5\x00\xb9\x0e\x20\xb9\x2e\xc0\x05\xc8\x75\xc0\x68\x5d\x30\
-\x5a\x17\x50\xd5\x01\x6e\x03\x59\x17\x90\x0b\xa8\x16\x02\xe4\x82\
-\x01\x77\x00\xd5\xea\x02\x72\x01\xb6\x32\x1f\x17\x0e\xe9\x3d\x26\
-\x04\x00\xe8\x0a\xc2\x39\x71\x96\x5f\xae\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x16\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\xab\x49\x44\x41\x54\x58\x47\xed\x97\xef\x6b\
-\x52\x51\x18\xc7\x85\x5e\xd5\xfb\xfe\x82\x7a\x17\xfd\x05\xf5\x2e\
-\xd8\x5c\x6d\xfe\x18\xc6\xa0\xa2\xda\x5e\x04\x42\xd0\xa2\x56\xbd\
-\x48\x7a\xb1\xe6\xc4\xd0\xeb\x16\xcc\xfd\xe8\x07\x6c\x81\xe4\x70\
-\x45\xcc\x8a\xf5\xaa\xd0\x6b\x7a\xaf\xab\x29\x8b\xe9\x9a\x2e\x26\
-\xce\xad\x3b\x67\x61\xec\x97\xfa\x74\x1f\xbd\xc7\xdc\x0f\x61\xb0\
-\x73\xe9\x8d\x0f\x7c\xbd\x57\x7c\xce\xf9\x7e\xce\x39\xcf\x39\x07\
-\x15\xb5\xf8\xef\x51\x67\x64\x8f\xab\x2d\xdc\x9c\xd6\xc6\xcd\x57\
-\x17\xef\x57\x76\x7d\x3a\x2a\x35\xa1\x1b\x0d\xdd\xec\xc9\x76\xc7\
-\xac\xf0\xf6\x7b\x01\xaa\xc9\xee\x49\xe7\x35\x0c\x17\x95\x05\x62\
-\x3f\x00\xa8\x12\x04\x1f\xab\x33\x7e\x1e\xa1\x25\xa5\xd9\x73\x6c\
-\x5f\x00\x6e\x51\xe6\x0f\x29\xb8\x3a\x38\x05\xcf\x3d\x8b\x30\xcc\
-\xa6\x0e\xac\x6b\x4f\xc3\x70\xd6\xe4\x6b\x56\xd4\x77\x7b\xcf\xb5\
-\x3c\x0e\xe6\x5a\x87\x42\x50\x4d\x17\xed\x5f\xc1\x34\x3e\x0f\x11\
-\x21\x07\xf1\x4c\x81\x8a\x0c\xae\x68\xa1\x08\x80\x1f\xf8\x65\xaf\
-\x24\x39\x55\x03\xa8\x01\xd4\x00\x6a\x00\xb2\x03\x44\x57\x72\xf0\
-\x6e\x3a\x03\x8e\xc0\x12\xb8\x26\x05\xf0\xc6\xb2\xdb\x7e\x97\x0d\
-\x20\x9c\xda\x84\x87\x6f\xe2\x70\xa9\x3f\x04\x37\x5e\xc6\xe1\xee\
-\xeb\x24\x74\xb8\x12\xa0\x1f\x89\x88\x77\x49\x08\x9c\xdc\x72\x31\
-\x4f\x16\x00\x36\xfe\x07\xae\x0c\x84\xe0\xbe\x7b\x19\xec\x7c\x1e\
-\xfa\x77\xa8\xd7\xb7\x01\xfa\x17\xb3\x60\x18\x9b\x13\x01\x22\x74\
-\x01\x70\xe4\x97\x45\xf3\x47\x1f\xb3\xbb\x8c\x77\xea\xa6\xf3\x07\
-\xb4\x89\x97\x1c\x55\x00\x9c\x76\x83\xfb\x67\xd9\xe4\xbd\x78\x85\
-\x0f\x04\xff\x99\x3a\xc2\x79\x18\x9d\x2e\xbd\xe3\xec\x5c\xb0\x87\
-\x40\x69\x64\xdb\xa9\x00\x60\xc1\xe1\x9a\x93\x69\x47\x73\x8c\x19\
-\xa1\x04\x81\xe6\xd9\x0d\x80\xdf\xa2\x9e\x4c\x96\x72\x3a\x27\x56\
-\x41\x6d\xe1\x3d\x54\x00\xb0\xda\xb1\xe0\xc8\x68\xd1\x14\xcd\x31\
-\x62\xe9\x42\xd1\x7c\x2b\x0f\x30\x1e\x2d\x94\x73\xec\x7c\x0e\x54\
-\x56\x6e\x85\x0a\x00\x6e\xb5\x3b\xaf\x92\xe5\xce\x09\x04\x9a\x63\
-\xe4\xc5\x87\xbb\xc2\x9c\x48\xcd\x04\x7f\x51\x01\xc0\x7d\xde\x31\
-\x96\xd8\xd6\x39\x99\x76\x34\xc7\x20\xcb\x51\x99\xa3\x65\xf8\x34\
-\x15\x00\x3c\x64\xf4\xc3\x91\x5d\xe6\x38\xed\x38\x72\xb2\x1c\x95\
-\x10\xb8\x25\x55\x56\x7e\x81\x0a\x00\xaa\x55\x3c\x64\xb0\x53\xec\
-\x1c\xab\x1d\x0b\x8e\xac\x39\xa9\x89\xd8\x6a\x01\x06\x25\x80\x5b\
-\xae\x05\x68\xb2\x04\xec\x0a\x65\x97\xf7\x4c\x33\x13\xd8\xd4\xf5\
-\xf0\x5b\x07\x91\x96\xe1\x72\x6d\xcf\x66\x8a\x9d\xa3\x86\xa4\x6a\
-\x27\x42\x08\x62\xce\x78\xd7\x40\x6d\xe5\xd7\x1b\x1f\xf0\x47\xa4\
-\x7f\x07\x74\xa2\x89\xe1\x47\xaf\x3b\xe2\xd9\xbd\x4e\x41\x22\x9b\
-\x67\x0d\x74\xbd\x5f\x84\x06\x33\x7b\x4a\x6a\x46\x2f\xce\x3b\x9d\
-\x87\xc4\xad\xd5\xd7\xd2\x37\x25\x74\x4e\x64\x8a\x5b\x8d\x18\xe3\
-\xf2\xdc\x76\x25\xd6\x55\x16\x2e\xa9\x34\xf9\x4e\x4b\x4d\xe4\x89\
-\x7a\x93\xff\x84\x9a\xe1\x1d\x58\x64\x1a\x5b\x70\x49\xc3\x04\x17\
-\xc5\xf7\x6f\x8d\x56\xff\x3d\x9d\x85\x3d\x2c\xa5\x89\xa1\x50\xfc\
-\x05\xd9\xf3\xfe\x4d\xbd\x57\xfc\x53\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x02\xed\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\x82\x49\x44\x41\x54\x58\x47\xed\x97\x4f\x6b\
-\x13\x41\x18\xc6\x03\x9e\xf4\xee\x27\xd0\x9b\xf8\x09\xf4\x26\xb4\
-\xa9\xb6\xf9\x53\x22\x05\x15\xb5\x3d\x08\x01\xc1\x8a\x56\x3d\x18\
-\x3c\xd4\xa6\x21\x92\x6c\x5a\xa1\x5b\x15\x15\x9a\x42\x30\xb2\x55\
-\xc4\x28\xd4\x93\x92\x6c\x9a\xec\x46\xcd\x96\x04\x93\xda\xa6\xd2\
-\x98\xa6\x69\x12\x2b\xa4\xa6\xd6\x24\xaf\xfb\xa6\x69\x74\x63\x16\
-\x0a\x9d\xc5\x4b\x1e\x78\x96\x9d\xdd\x99\x79\x7f\x3b\x33\xef\x0c\
-\xab\x6a\xe9\xbf\xab\xcd\xcc\x1e\xd4\xda\xb8\x79\xbd\x83\x5b\x94\
-\x37\x1f\x50\x0f\xbd\xdb\x5f\x6b\x42\x56\x1d\xc3\xec\xe1\x7e\xd7\
-\x5c\xf6\xd5\xe7\x0a\xc8\x99\xf6\xe6\xcb\x3a\x8a\x8b\x2b\x02\xb1\
-\x13\x00\xf4\x16\x04\xbf\xd0\x66\x9e\x71\x92\xb2\xda\xea\x3d\xb0\
-\x23\x00\x8f\x68\xeb\x9b\x34\x9c\xbf\x1f\x86\xc7\xde\x65\x98\x60\
-\xd3\xbb\xf6\x85\x87\xb3\x70\xdc\xe2\xef\x56\xb5\x0f\xfb\x4e\xf4\
-\xdc\x0d\x95\x7a\x1f\x08\x20\xe7\xd3\xf4\x47\xb0\xbc\x5c\x84\x58\
-\xb6\x04\x89\xb5\x0a\x11\x9b\x98\x78\xa5\x0a\x80\x17\x2c\x34\xab\
-\xa4\xa4\x5b\x00\x2d\x80\x16\x40\x0b\x40\x71\x80\x78\xae\x04\xaf\
-\x23\x6b\xe0\x0a\xae\x00\xf3\x3e\x0b\xbe\x85\x82\xe4\xbd\x62\x00\
-\xb3\xe9\x4d\xb8\xfd\x22\x01\x67\xc6\x05\xb8\xf4\x24\x01\xd7\x9f\
-\xa7\x60\x80\x49\x82\xd1\x19\x13\xcf\x12\x01\xdc\x5c\xa6\x5a\x4f\
-\x11\x00\x36\xb1\x0e\xe7\xee\x09\x70\xd3\x93\x01\x9a\x2f\xc3\x78\
-\x83\x47\xfd\x3f\xc1\x38\x39\x07\xa6\xa9\x79\x11\x20\x46\x16\x00\
-\xbf\xfc\xac\x18\xfc\xce\xdb\x82\x24\x28\x13\x2d\xc3\xa4\x20\x05\
-\xb9\xec\xfe\x02\x7d\xe2\x21\x47\x14\x00\x87\xdd\xe4\x59\x95\x04\
-\x42\xa3\x22\x99\x8a\xe4\x19\x8e\xce\x29\x5a\x00\xb5\x99\xed\x27\
-\x02\x80\x0b\x0e\xe7\xbc\xd9\xb0\x37\x03\x40\x0f\x4e\x7f\x03\xad\
-\x8d\xf7\x12\x01\xc0\xd5\x8e\x0b\xae\x31\x08\x5a\x0e\x80\xe6\x4b\
-\xa0\xb1\x73\x39\x22\x00\x98\x6a\xd7\x9e\xa5\xaa\x1d\xbb\x23\x5b\
-\x41\xe5\x94\xfb\x01\x75\x08\x2d\x15\xfa\x4e\x04\x00\xf3\x7c\x60\
-\x2a\x59\xed\xd4\x19\x2e\x43\x74\xb5\x52\x37\x2a\x5f\x84\x7a\x99\
-\xfb\xfa\x67\x34\xf4\x14\x9f\x27\x02\x80\x9b\x8c\x71\x22\x56\xef\
-\xf8\x6f\xa3\x9a\x4d\x01\xa6\xa4\xc6\xce\x2f\x11\x01\x40\xf7\x8a\
-\x9b\x0c\x76\xda\x18\x48\x0e\xe0\x0a\xb3\x04\x5d\xb6\x20\xad\x52\
-\x0f\xf9\x8e\x75\x53\xc1\x4d\xc3\x08\xff\x6b\x37\xd6\x53\x5c\xa9\
-\xef\xd1\xa7\x7f\x02\x65\xd6\x01\x66\x92\x52\x00\xca\x57\x04\xad\
-\x9d\xdf\xe8\xbc\xc5\xef\xab\xfd\x1d\x90\x51\x17\xc5\x3f\xbd\xe8\
-\x4a\x14\x9a\xa5\xe3\xb6\x1d\xde\x22\x18\x46\x3f\x64\x3b\xac\xec\
-\x91\x5a\x33\x72\x3a\xe9\x76\xef\x11\x53\x6b\xac\x67\x2c\x9c\x1d\
-\x9c\x5e\xab\xa6\xda\x76\x60\x9c\x9e\xab\x4c\x72\x43\x63\xe3\x52\
-\x6a\x8b\xff\x68\xad\x89\x32\x6a\xb7\x04\x0e\x69\x29\xde\x85\x8b\
-\x4c\xe7\x08\xad\xe8\xa8\xd0\xb2\x78\x1f\xed\xb4\x07\x6e\x18\x6c\
-\xec\xde\x5a\x35\x51\x2a\xd5\x6f\xe2\x06\xfe\x63\x71\xc2\x7e\x60\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\xc2\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x01\x57\x49\x44\x41\x54\x58\x47\x63\x18\x05\xc8\
-\xc0\xb5\xeb\x88\x41\xe4\x94\x33\x33\x63\xa6\x9d\x59\x4b\x0b\x0c\
-\x32\xdb\xa3\xeb\xb8\x1e\xd4\x3a\x54\xe0\xd6\x7e\x42\x3f\x71\xe6\
-\xf9\x37\x67\xef\x7f\xf8\x7f\xeb\xf9\x17\x9a\x60\x90\xd9\x09\x33\
-\xce\xbf\xc6\xea\x08\x90\xeb\xce\x01\x15\xd0\x1a\x80\xec\x00\xda\
-\x35\x1d\x6a\x2d\x02\xc4\x4c\x3d\xbb\xf2\xfe\xab\xaf\x50\x65\xb4\
-\x03\x20\x3b\x40\x76\x41\xad\x45\x80\x51\x07\x0c\x5a\x07\x6c\x3d\
-\xff\x12\x05\xaf\x3d\xf5\xfc\xff\xec\x7d\x0f\x31\xc4\x71\x61\x74\
-\x40\xb2\x03\x42\x26\x9d\xfd\x5f\xbe\xe1\x05\x1c\xe7\xaf\x7c\xf4\
-\x3f\x7a\xc6\x55\x14\x31\x5c\x18\xa4\x17\x1d\x90\xec\x80\x98\x19\
-\x17\xff\xcf\x38\xf3\x17\x8e\xbb\x0e\x7c\xfe\x9f\xb9\xe4\x2e\x8a\
-\x18\x2e\x0c\xd2\x8b\x0e\x86\x9e\x03\x82\x27\x92\x1f\x05\x20\xbd\
-\xe8\x80\x64\x07\xc4\xce\xb8\xf0\x7f\xce\xe1\x17\x70\xdc\xbb\xf3\
-\xd1\xff\xac\x05\x57\x51\xc4\x70\x61\x90\x5e\x74\x40\xb2\x03\x2a\
-\x57\xdd\x84\xb2\x20\x00\xa4\x66\xf2\xce\x7b\x50\x1e\x7e\x80\xae\
-\x17\x04\x86\x9e\x03\x4a\x57\xdc\x40\xc9\xd7\x8b\x0e\x3d\xfe\x5f\
-\xba\xf4\x2a\x8a\x18\x2e\x0c\xd2\x8b\x0e\x86\x9e\x03\x46\xd3\x40\
-\xda\xbc\x4b\xff\x4f\xde\xff\x06\xc7\x9b\x2f\xbc\xfb\x5f\xbb\xe6\
-\x16\x8a\x18\x2e\x0c\xd2\x8b\x0e\x48\x76\x00\x7a\xbc\xd2\xbd\x32\
-\xa2\x36\x18\x75\xc0\xe0\x75\x40\xc4\xe4\x33\x33\x06\xb4\x59\x0e\
-\xee\x98\x00\x3b\x0d\xf4\xe8\x98\x78\xb6\x1f\xd3\x85\x5a\x8b\x0a\
-\x40\x12\xb4\xee\x9a\xe1\xb4\x7c\x84\x02\x06\x06\x00\x99\x93\xdb\
-\x2d\x3e\xe8\x24\x5b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x02\xe5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\x7a\x49\x44\x41\x54\x58\x47\xed\x97\xdb\x6b\
-\xd3\x50\x00\xc6\xfb\xe0\x3f\xe1\xbf\xa1\xef\xfa\xe4\x3a\x15\xf6\
-\xd0\xea\x44\x51\x18\x38\x10\x65\x4c\xf0\x45\x50\x70\x3e\x88\xa5\
-\x63\xda\xae\x56\xd1\xad\xd6\xcb\xdc\x4d\x50\xec\x64\x6e\x15\xeb\
-\x7c\x98\x69\xb5\x49\xeb\xb2\xd5\x6d\xb5\x17\x3b\xe7\xa5\x17\xda\
-\x4c\x6d\xb7\x5a\x9a\xcf\x9c\xf6\xe8\x86\xbd\xb8\x96\x36\x22\xf4\
-\x83\x0f\x0e\x49\xc8\xef\x97\x73\x72\x02\x51\x34\x42\xd2\xac\x65\
-\x76\x1e\xbe\xc6\x3e\x90\xb3\x84\x49\xf1\x0a\x45\x93\xc6\x7e\xdc\
-\xc4\xc4\x31\x34\x93\x91\xa5\x84\x45\x98\x14\x9f\x17\x18\xe0\x92\
-\xb8\xce\x66\x65\x29\x61\x35\x04\x0a\x04\x1e\xb9\xa2\x88\x24\x21\
-\x4b\x09\xab\x40\xe0\xb1\xeb\x0b\xe4\x0a\x61\x35\x04\xfe\x0f\x01\
-\x21\xf9\x83\x8e\xf2\x63\xef\xe7\xef\x15\x37\xbc\xb2\x46\xef\xb0\
-\x9e\x4d\x0b\xd8\x3c\x51\x3a\x02\x1c\xbe\x38\x7a\x27\xfd\x15\x77\
-\x8c\x2b\xbc\xef\x30\xf3\x11\x4a\x8d\xe3\x0c\xc5\xcb\xbf\x04\x17\
-\x2d\x5e\x69\x06\x98\x61\x8a\x97\x5f\xc0\x34\x15\xc2\xd9\xfb\x0b\
-\xcf\x29\xbe\xb4\xc0\x43\xe7\x27\x3a\x02\xac\x7c\x04\x1d\xb7\xf9\
-\x8a\xdb\x2f\xc1\xfe\x0c\xbf\xb4\x82\xa7\x7c\xf8\xdf\xcc\x40\x3a\
-\x93\xc5\xe0\xf4\x32\xae\x4c\x06\x6c\x14\x2f\x9f\x40\x30\x9a\x44\
-\x7b\xdf\x1b\x9c\x1f\x5b\x42\xe7\xa0\x37\xad\xd2\x71\x57\xcb\x0a\
-\xd4\x72\x09\xe2\xd2\x36\x3e\x2a\xc1\x0f\x1a\x39\x98\x1c\x5f\xf1\
-\xc4\x27\x42\xad\x67\xc3\x65\x05\x6a\x95\x50\x2c\x85\xd6\x5e\x0e\
-\xd6\x79\x01\xdc\xf2\x2a\x91\x10\xf5\x53\x51\xa8\xf4\xec\x62\xdd\
-\x05\x12\xd2\x93\x1f\xbb\xc9\xa3\xdd\xec\x81\xd1\xf6\x01\x41\x41\
-\x84\xf5\xad\x80\x96\x1e\x87\xa8\xd4\x32\xdb\xca\x0a\x54\xfb\x21\
-\x22\xd7\x92\xfc\x82\x9b\x1c\x02\xc6\xdf\x65\xd1\x31\xb0\x80\xee\
-\xf1\x20\x0e\x18\xd9\xc4\x2e\xcd\xcb\x1d\x39\x38\x49\x29\x81\x6a\
-\x3f\xc5\xe4\xda\x8d\x70\xb2\xde\xa4\x43\x7c\x0a\x2a\x9d\x73\xb5\
-\xa9\x9b\x39\x44\xd1\xf9\xd4\x7a\x09\x72\x70\xf3\x2c\xfa\xed\xeb\
-\xf0\x91\x99\x55\xec\x33\x70\xe1\xdf\xd3\xbe\x31\xb5\x14\x88\x7d\
-\x4b\x17\x85\xab\xf5\x5c\xa4\x28\x9c\xa4\x56\x02\xa1\x58\x12\x6a\
-\xe9\x6d\xef\x63\x0a\x9f\x7c\x6f\x8f\x63\x3b\xc5\x15\xa6\x16\x02\
-\x59\x51\x94\xb6\x97\x0b\xa7\x46\x7c\x95\xc1\x49\x88\x80\xf9\x45\
-\xa8\xe8\x0b\x55\xaa\x5c\x50\xc0\xb3\xb9\x28\xdc\xef\x85\xdc\x3e\
-\xb7\xf2\x61\x5c\xb0\xf8\x71\x7a\x74\x11\xe7\x2c\x21\x8c\xf2\xd2\
-\xb4\x1b\xb8\xb5\xbf\xc2\x49\xaa\xf9\x35\x53\xeb\x9d\x4c\xcb\xa5\
-\x57\x01\xdd\x84\x3f\xc6\x06\x84\x40\xe7\xdd\xb9\xd4\x84\x27\x91\
-\xdb\xe7\x27\xef\xcd\x43\x3a\x27\xee\xd1\xbe\x3e\x42\x11\xf5\x4d\
-\x57\x17\xb6\x28\xb5\xf6\xec\x89\x5b\xb3\x99\xb6\x1b\xee\x70\xab\
-\x81\x75\x37\x6b\x98\xfd\xf4\x74\xfd\xa3\xd4\x4c\xb7\xed\xd6\xda\
-\xe3\xcd\x5a\xfb\x1d\xe5\x65\xe7\x56\x7a\x78\x13\x51\x28\x7e\x02\
-\x7f\x37\x46\x31\x9d\x28\xfb\x14\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x04\x4e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x03\xe3\x49\x44\x41\x54\x58\x47\xbd\x96\xc9\x4f\
-\x53\x41\x1c\xc7\x51\x4f\x9a\xe8\x49\x13\x35\xc6\x7f\x40\x8d\x07\
-\x8f\x7a\x54\x41\x85\xd2\x28\x4b\xe2\x82\x82\x5c\x48\x4c\xd4\xb8\
-\x6f\x69\x22\x10\x0a\xb4\xaf\xa5\xc8\xae\xe1\xa0\x88\x2c\x65\x31\
-\xb2\x44\xbd\xa8\x6c\xe5\x0d\x20\x20\x8b\x08\x2d\x48\x45\x68\x2b\
-\x6b\x15\x15\xda\x71\x7e\xaf\x33\xa5\xd6\x07\xb4\xa5\xf2\x4d\xbe\
-\x01\x1e\x33\xf3\xf9\xbe\x99\xdf\xcc\xbc\x00\x7f\x28\x4c\xd9\xb0\
-\xfe\x70\x52\xd3\x5e\xe2\x7d\xcb\xf9\x60\x72\xdd\x76\xda\xcd\x0f\
-\xc2\x78\x4d\x98\x9a\x4f\x3d\xf9\xa0\xd5\x7c\xb3\xa8\xd7\x74\xa7\
-\xf4\xa3\x79\x39\xc7\xe5\x7f\x18\x25\x7d\x3a\x0e\xca\xdf\xed\xa4\
-\xa3\xf8\x28\x80\xa7\xa3\xe2\xe4\x6a\xfd\x8c\x7e\xc2\x8e\x0d\x93\
-\x9e\xfb\x55\xcf\x14\x0e\xd7\xf0\xed\x74\x24\x1f\x44\xe0\x27\xd4\
-\xa8\x44\x51\x33\x38\x2d\x06\x70\x75\x97\xe9\x37\xbe\x5f\xd1\x3f\
-\x1e\x9d\xdb\x36\xa6\x79\xf5\x79\x66\x60\xdc\x26\x3c\x8f\xcb\xef\
-\x1c\x0d\x4c\xe0\xb7\xd1\x11\xbd\x10\x83\x57\x1b\x66\xdc\x61\x62\
-\xbe\xf4\xa4\xcb\x2c\x51\xe8\x4e\x49\x92\xeb\x36\x1e\x57\x37\x6b\
-\x32\x5e\x0f\x0b\xfd\x64\xe5\x9f\x2c\x47\x92\x1a\xf6\xd0\x51\x3d\
-\x14\x4c\x7b\x1a\x2a\x55\xd4\x78\x06\x07\x47\xa4\xa3\x61\xda\x3b\
-\x20\x48\xd6\xb4\x29\x26\xaf\x7d\x0c\x9e\x7b\x1f\x00\xe0\x1a\xef\
-\xe0\xe0\x58\x02\x64\xa0\x10\x85\xee\x5c\x42\x65\xff\x04\x3c\xf7\
-\x2e\x80\x8f\x70\xb0\x6e\xe8\x07\x3e\x9f\xfb\xde\x14\x91\x86\x8c\
-\x97\x0b\x7a\x2c\xdd\xa6\x39\xe1\xb9\xc7\x01\x64\x32\xbc\xd6\x57\
-\xf8\x52\xf6\x28\x00\x83\x2b\xfd\x0c\x07\x2f\x1b\x60\x01\x3e\xe8\
-\x77\x38\x78\xc9\x00\x02\x5c\xcd\x6b\xb9\xda\xa1\xff\x02\x07\x2f\
-\x1a\x40\x80\xa7\xf1\x65\xff\x13\x0e\x16\x0d\x10\x5e\x5c\xbc\x6e\
-\x35\xe0\xe0\xdb\x25\x7d\xe6\x40\xb9\x6e\x17\x45\xaf\x2e\x1c\xee\
-\x0e\xb8\xc0\xe0\x16\xfd\x0b\xae\x5a\x05\x38\x58\x51\x3b\x38\x43\
-\x4e\x54\x4e\x80\x83\xc8\x21\xf1\x58\x55\x3b\x68\x15\x6b\xec\x6f\
-\x2b\x01\x4e\x0a\x1c\x6a\x4d\x80\x07\xc9\x9b\x76\xc4\x3e\xec\x30\
-\x89\x35\x5e\x89\xfb\xbe\xcd\xe3\x9a\xae\x49\x5c\xd8\x3c\x86\xb5\
-\xad\x16\x5c\xaf\xb7\x3a\xe0\x64\x6b\x3b\xe1\xa0\xa3\x29\xba\xad\
-\xd1\xd9\x6d\x66\xbd\xc8\x20\xbe\xb8\x73\xf4\x37\x4e\x78\x6e\xc0\
-\xa7\xb3\x3b\xf0\xa5\x22\x03\xbe\x51\x31\x82\xaf\x69\x8d\x38\xfa\
-\x51\xb7\x5d\xca\xf1\xdf\x8f\xa5\x34\x45\x51\xf4\x82\xc8\x7a\xa4\
-\x27\x54\x0e\x4c\xad\x34\x44\x83\xe1\x3b\x3e\x9b\xd3\x81\xef\x56\
-\x99\x70\x16\xb2\xe1\x6c\x37\x6b\x1a\x7f\xe1\xe8\xfc\xde\xc9\x10\
-\x05\x2a\x85\xba\xa3\x78\x87\xc2\xd4\xe8\xd1\x4a\x42\xc0\x9b\x47\
-\x11\x78\xea\x1b\xeb\x3f\x60\x77\x5f\x28\x34\x58\x25\x1c\x9f\x41\
-\xd1\x54\x70\xe3\xad\x20\x04\x4c\xfb\xbd\x2a\xb3\x13\x52\xdb\x6f\
-\xc7\x39\x2d\x0b\xd0\xc2\x4e\x1b\x2e\xe9\x72\xfc\x0e\xb3\x13\x99\
-\xf1\xde\x72\x28\xb1\x7e\x37\xa5\x53\xf9\x18\x02\x0a\x0e\xd6\x9c\
-\x4d\x3b\xc0\x41\xbd\x16\x47\x08\x80\x5b\x7f\x61\x3c\x4d\xfc\xb0\
-\xd5\xd1\x26\xfe\xe5\x04\x96\x72\xe8\x19\x25\xbb\xc8\x87\x10\x50\
-\xed\x17\x49\xc1\xb1\xb7\x05\x28\xc0\x41\xfa\x71\xbb\x00\x9f\xb3\
-\x61\xfc\xa2\xcf\xee\x6c\x93\x85\xe6\xb1\x84\x43\x46\x4a\x75\x93\
-\x97\x21\x60\xab\x5d\x2f\x1f\x71\x0e\xce\x42\x00\x1c\x64\x23\x3f\
-\xaa\x5c\xe0\xcc\x52\x15\x32\x51\xa2\x88\xbc\x08\x01\xfb\xfc\x5a\
-\x99\xf1\xaf\xc1\xd9\xb4\x03\x1c\xc4\x96\xc3\xb5\x8d\x54\xdd\x32\
-\x42\x69\x8b\xc8\xc3\x10\x70\xc8\xc0\x3e\x77\x87\xc3\xb4\xc3\x9b\
-\xb3\xe5\x70\x0d\x01\x5b\x92\x2c\x41\x37\x25\x2d\x21\x0f\x42\xa4\
-\x54\xeb\xa7\x43\x55\xbc\x15\x06\x85\xc1\xa1\xda\xa1\xe0\xd8\x9a\
-\xb3\x9a\x80\x4b\x28\x97\x06\xb8\xa2\x35\xce\x86\x28\x9b\x6f\x51\
-\xca\x32\x5a\x22\x84\xbc\xca\x30\x4d\x0e\xb2\xa7\xc1\x5c\xf3\x99\
-\x18\x72\xc8\xc0\xe0\xe0\x3c\x5a\xed\xcc\x10\x82\xc1\x55\xf5\xb3\
-\x38\x94\x43\x5f\x82\x65\x68\x03\x25\x78\x20\x91\x10\x0e\x38\x5f\
-\x00\xff\x83\x26\x64\x4a\x8b\xe1\x90\x11\x3b\x05\x99\xd5\x75\xb3\
-\x38\x4c\xd3\x66\x39\x92\xd2\xb0\x5f\x18\xd7\x2b\x11\x50\xa4\x06\
-\x69\xce\x91\xbb\x23\x26\xa7\x9d\x7c\x6a\xf3\xb9\x0c\x0e\x82\xe3\
-\x95\x9c\x70\x99\x91\x99\xed\x96\xf8\x97\x93\xc2\x56\x63\x60\x58\
-\x9e\xab\x5a\xe3\x4f\x89\x92\x1f\x09\x92\x37\x1e\xa0\x5d\x7c\x53\
-\xb0\x02\x6d\x0e\x4a\x7c\xbb\x85\xfe\xf9\x8f\xe0\x4b\x27\x54\x85\
-\x0a\xc9\x8c\x0c\x93\x4a\x1f\x93\xaa\x5a\xbe\x42\xc1\x05\x73\xba\
-\x9b\xce\x8f\x10\x41\x01\x01\x7f\x00\x88\x3a\x1a\xa0\xb1\xcc\xfc\
-\x12\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x72\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\x07\x49\x44\x41\x54\x58\x47\xed\x94\xdd\x2b\
-\x83\x51\x1c\xc7\x77\xe7\x2f\xf0\x1f\xb8\x95\x6b\x7f\x80\x99\x5c\
-\xcc\x6b\x09\x31\x11\x2e\x28\xa5\xb8\x75\x81\x4d\xc2\xe6\x6d\xe6\
-\x2d\x79\xbf\x50\xde\x4a\xa1\x25\xe2\x69\xf6\x6c\x6c\xf2\x32\xf3\
-\x9a\x4d\x43\x9b\x97\x15\xcb\xcb\xf6\xf3\x9c\x36\x8f\x9d\x3a\x13\
-\x73\x3c\xa4\x7d\xeb\x73\xb1\x3a\xbf\x9d\xcf\x73\x3a\xdf\x23\x8a\
-\xe4\xd7\x23\xae\x67\x62\xa4\x4d\xec\x51\xaa\x92\x3d\x0d\x8d\x61\
-\x5d\x52\xb7\x12\x1d\x18\xa1\x9b\x24\x39\x13\x5b\x31\x76\xe0\x9c\
-\x3b\xf4\x41\x28\xd4\xab\xd7\xde\x94\x16\xd6\xfa\x23\x12\x9f\x11\
-\x40\xf8\x25\x0c\x56\xb1\x5c\x57\xfc\x1d\x12\x14\xba\x8c\xc0\xd6\
-\xfe\x7c\x56\x00\xd1\xaf\x77\x43\xc3\xc2\xc5\xb7\x90\x36\xb3\xe7\
-\x81\xad\xfd\xf9\x8a\x00\x0d\xfe\x8f\xc0\xd4\xde\x33\x34\x2e\x92\
-\x8f\xf9\x23\x92\x1b\xf5\x37\x6f\xf7\x41\xa2\x60\x0a\xc3\x12\xe8\
-\x5a\xbb\x01\x59\xf7\x16\xa8\x97\xec\x30\xc8\x5c\x84\x89\x03\xd2\
-\x95\xec\x25\x26\x30\xc9\x7d\x15\xfa\xe3\x82\x9e\xd0\xe4\x69\xcc\
-\x50\x39\x66\x01\xd3\xf9\x23\x9c\xdc\xfa\xc2\x86\xb5\x79\x20\xab\
-\xcd\xb8\x86\x09\xf4\xea\xee\xa0\x76\xe6\x84\x38\x40\x9b\x19\xf3\
-\x35\x64\x2a\x0d\xad\x98\x80\x62\xde\x01\x43\xdc\xf1\x90\x06\x68\
-\xd3\xa9\xb5\x79\xc4\x72\x26\x1b\x13\xa8\x9e\x38\x82\x25\xab\x9b\
-\x38\x40\x9b\xaa\x71\xcb\x15\x77\x11\xe3\x30\x81\xa2\xbe\x6d\xb0\
-\x38\x5f\x88\x03\xb4\xc9\x55\x1b\xaf\x24\xaa\xb9\xa8\x77\x81\x03\
-\x1f\x14\x70\x17\x90\xb4\x98\x36\xc7\x1c\x19\x2a\x83\x1d\x7b\x07\
-\x46\x4d\x0f\xdc\xb1\xec\x13\x07\x68\xc3\x37\x20\x58\x40\xb5\xec\
-\x84\x76\xad\x8d\x38\x40\x1b\xbe\x01\xc1\x02\x35\xb3\x36\x98\x36\
-\xbb\x88\x03\xb4\xe1\x1b\x10\x2c\x50\x36\x64\x01\xa3\xdd\x43\x1c\
-\xa0\x0d\xdf\x80\x60\x01\x99\x46\x98\x0b\x88\xe0\x1b\xf0\x26\x50\
-\x3e\x62\x75\x95\x0e\xec\x10\x17\xd3\x06\x6b\x00\x0a\x12\x28\x19\
-\xd8\xbd\x15\xea\x09\xc6\x1a\x80\x82\x04\xf2\x7b\xb6\xee\x87\x05\
-\x7a\x82\xb1\x06\xa0\x20\x01\x59\xb7\xe9\x51\xa8\x27\xb8\x5d\x7b\
-\xe6\xe3\x1b\x80\x82\x04\xb2\x3b\x36\x5f\x84\x7a\x82\x2b\x47\xf7\
-\xbc\x7c\x03\x50\x92\xb9\x1f\x39\x9d\x1b\x5e\xd2\xe2\x9f\x00\xed\
-\xc5\x37\x00\x25\xb1\x7e\x3d\x3e\xa5\x59\xff\xc4\xdd\xcc\x67\x21\
-\x48\x6b\x61\x5d\x81\xad\x23\xf9\x0b\x11\x89\x5e\x01\x3e\xa0\x21\
-\x79\x31\x21\x27\x9a\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x04\x26\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x03\xbb\x49\x44\x41\x54\x58\x47\xbd\x96\xcb\x4f\
-\x13\x51\x18\xc5\x51\x57\x9a\xe8\x4a\x13\x35\xc6\x7f\x40\x8d\x0b\
-\x97\xba\x44\x45\x85\xd2\x28\x60\xe2\x13\x90\x8d\x89\x89\x1a\xc5\
-\xb7\x69\x22\x10\x0a\xb4\xd3\x52\xe4\x21\x4a\x58\xa0\x22\x8f\x82\
-\x9a\xf0\x88\xb8\x51\x01\xdb\xce\x05\x6c\xb1\xe5\x21\xb4\x28\x15\
-\x61\x5a\xa0\x42\x01\x45\xe0\x7a\xbf\xe1\xb6\xd0\x3a\x85\xb6\x54\
-\x4e\x72\x16\x73\x3b\xf7\xfb\x9d\xde\xe7\x84\x85\x42\x31\xf2\xe6\
-\xf5\x87\xd2\x35\x7b\x89\xf7\x2d\xe7\xf0\x8c\xc6\xed\xb4\x5b\x08\
-\x84\xf1\x9a\x18\x25\x9b\x75\xea\x61\xab\xed\x56\x59\x27\x77\xb7\
-\xb2\xcb\xb6\x9c\x2f\x16\x7f\x1e\x24\x7d\x0c\xe1\xd2\x0f\x3b\x69\
-\x95\x20\x05\xf0\x1c\x54\x9e\x51\x6b\x1e\x37\x8f\xce\x61\x8b\xc3\
-\x7f\x37\x74\xfc\xc4\xb1\x2a\x56\x4f\x2b\x05\x21\x02\x3f\xa1\x44\
-\x15\xb2\xba\xbe\x31\x21\xc0\x62\x1b\xb9\x69\xfc\xe0\x65\xcf\x48\
-\x42\x61\xdb\x90\xaa\xe1\xdb\x78\xef\xc8\x2c\xdf\x7e\xb1\xb8\x7d\
-\xf0\x70\x2a\xbb\x8d\x56\x0c\x40\x2e\x78\xad\x65\xdc\x1b\x26\xe4\
-\x2b\x4f\x8d\x36\x91\x4c\x7b\x5a\x94\xd1\xb8\xf1\xb8\x52\xa7\xca\
-\x7d\xdb\xcf\xf7\x93\x54\x7f\xb1\x1f\x49\x6f\xde\x43\xab\xfa\x29\
-\x18\xf6\x6c\x54\x29\xab\xf3\x0f\x0e\x8e\xcb\x41\xfd\xb4\x77\x58\
-\x84\x44\xb3\x29\xf1\xb1\x7e\x08\xda\x03\x0f\x00\x70\x55\x60\x70\
-\x70\x12\x01\xba\x40\x51\x32\x6d\x7c\xea\xab\x9e\x51\x68\x0f\x2c\
-\x40\x90\x70\xb0\xf6\xeb\x24\xbe\x50\xf8\x89\x8b\xcb\x46\xd6\xab\
-\xcf\x3a\xec\x26\xee\x0f\xdf\xee\x77\x00\x89\x04\xaf\x0d\x16\xbe\
-\x94\xfd\x0a\xe0\x82\xcb\x43\x0c\x07\x2f\x1b\x60\x01\xde\x17\x72\
-\x38\x78\xc9\x00\x3c\x5c\xc9\xaa\x99\xfa\xaf\xff\x05\x0e\xf6\x19\
-\x80\x87\x67\xb3\x55\xff\x13\x0e\x16\x0c\x10\x5b\x5e\xbe\x6e\x35\
-\xe0\xe0\x3b\x15\xdd\xb6\xc3\x52\xed\x2e\x8a\x5e\x5d\x38\xdc\x1d\
-\x70\x81\xc1\x2d\xea\x01\x57\xac\x02\x1c\x2c\xab\xef\x1b\x27\x27\
-\x2a\xc3\xc3\x41\xe4\x90\x28\x51\xd4\xf7\x39\x85\x5e\x0e\xb5\xe5\
-\x00\x27\x0b\x1c\xd6\x1a\x0f\x8f\x90\x6a\x76\x24\x3d\x31\x70\x42\
-\x2f\xaf\xc4\xdd\xc3\x33\xb8\xce\xe8\xc0\xa5\xba\x21\xac\x6e\xb5\
-\xe3\x26\xb3\x73\x1e\x4e\xb6\xb6\x1b\x0e\x3a\x9a\xa9\xdd\x9a\x50\
-\xd0\x66\x33\x0b\x14\x09\xc6\xed\x83\xd3\x38\xf5\xb5\x05\x9f\x29\
-\x30\xe0\xcb\x65\x16\x7c\xf3\xe5\x00\x4e\x56\x5b\x71\x42\x91\x69\
-\x4e\xcc\xb0\x13\xc7\x32\x35\xe7\x28\x7a\x41\x64\x3e\x72\x52\x5f\
-\xf5\xfe\x5c\x69\x88\x66\xcb\x04\x3e\xff\xc8\x80\xef\xd5\x70\x38\
-\x1f\xcd\xe2\x02\x2f\xab\x3e\xfe\xc6\x89\xc5\x5d\x8e\x28\x19\xaa\
-\x84\x75\x47\xf1\xf3\x8a\x51\xa2\xa2\x95\x84\x80\x7f\x7e\x8e\xc0\
-\xb3\xde\x39\x3d\xa0\x6a\xd3\x2c\x7e\x6a\xf0\x0c\x72\xa9\xd4\x32\
-\x21\x62\xd8\x5c\x8a\xa6\x82\x1b\x6f\x05\x21\x60\xd8\xef\xd7\xd8\
-\x3c\x40\x60\x90\x91\x9b\xf3\x68\x83\xd1\x39\x99\xa7\xb7\x1f\x4c\
-\x6b\xda\x4d\xe9\x54\x41\x86\x80\x05\x07\x73\x2e\x34\xec\x42\x01\
-\xc0\x29\x6f\x46\xb1\x98\x41\x2f\x28\x79\x91\x82\x08\x01\xab\x1d\
-\x16\x9c\x37\x04\xec\x2b\x40\x3e\x9a\xc1\x22\x06\x59\x29\xd5\x4b\
-\x01\x86\x80\xad\x76\xa3\x7a\x80\x2f\x5c\x6e\x9c\x87\xfa\xd2\xf0\
-\x24\x76\x87\x10\x2b\x10\x47\x89\x02\x0a\x20\x04\xec\xf3\xe4\x2a\
-\x2b\x5f\xb4\x44\x3f\x8b\x4d\xb6\x39\xb7\x41\x23\x53\xd8\xfd\xcc\
-\x7e\x5f\x18\x0d\xb1\xb2\x65\x80\xd2\x7c\xc8\xcf\x10\x70\xc8\xc0\
-\x3e\x77\x15\x5e\x6c\x90\xd0\x14\xc0\x96\x24\x53\x60\xa2\xa4\x25\
-\xe4\x47\x88\xcc\x5a\xf3\x58\xb4\x82\x75\x42\x51\x6f\x90\xaf\x00\
-\xd7\xd4\xd6\xa9\x28\xb9\xee\x36\xa5\x2c\xa3\x25\x42\x48\x6b\x2c\
-\x63\xe4\x20\x7b\x1e\xc9\xe8\xce\x26\x16\x77\x3a\xbc\x41\xdc\x04\
-\xc6\x1a\xab\x67\x00\x45\xd3\x14\x8e\x66\xd0\xf7\x48\x09\xda\x40\
-\x09\x7e\x48\x20\xc4\x3c\x9c\x7d\x06\xbf\xc1\x2b\x51\x0a\x54\x41\
-\x0e\x19\xa7\xd0\x76\x74\x59\xd9\x38\x85\x63\x54\x6d\xf6\x23\x99\
-\xcd\xfb\xf9\xba\x01\x89\x80\x4e\xaa\x90\x2a\x9e\xdc\x1d\x89\x8f\
-\xf4\xe4\x53\x9b\x2d\x74\xc1\x41\x70\xbc\x92\x13\x2e\x0f\x0e\x99\
-\x94\x37\x0e\x7e\xab\xb9\xc0\x30\x3d\xd7\xd5\xd6\x5f\x22\x39\x3b\
-\x10\x21\xfd\x78\x80\x76\x09\x4e\x91\x32\xb4\x39\x22\xed\xfd\x16\
-\xfa\xf8\x8f\xe0\x4b\x27\x5a\x81\x4a\xc9\x22\xeb\x27\x2b\x7d\x48\
-\xac\x68\xf9\x01\x0b\x2e\x92\xd1\xde\x72\x7f\x84\xf0\x0a\x0b\xfb\
-\x0b\xa6\xb9\x1a\xbb\x3b\x23\xb7\x6a\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x02\xca\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\x5f\x49\x44\x41\x54\x58\x47\xed\x95\x4d\x6b\
-\x13\x51\x14\x86\x03\xae\xf4\x2f\xf8\x13\xc4\x5f\xa0\xab\x42\xd5\
-\x62\x4c\x22\x44\x0a\xa2\x51\x8a\xe0\xa2\x2e\xfc\x28\x7e\xa0\xe2\
-\xa2\x42\x62\x4b\x26\xa1\x68\xda\x98\x82\x0b\x95\xc8\x48\x8a\x10\
-\x0b\xa5\x82\xa0\xd8\xe9\x47\x6e\x8c\x4d\x35\xc4\xb6\x36\xa9\xa6\
-\x29\x9d\x8e\x6d\x2a\x69\xd3\xb4\x66\x8e\xf7\x4c\xee\xc5\x21\xba\
-\x9b\x24\xab\x79\xe0\x90\xc0\xdc\x7b\xde\x77\xce\x3d\xf7\x8c\xc5\
-\xc4\xc4\xc4\xc4\xe4\xf8\x7d\x69\xff\xe9\x87\x44\x3c\x13\x20\x91\
-\x66\x06\x6a\xa2\xb6\xa5\xcd\x2d\x1d\xbc\x23\xa6\x0a\xb3\xcb\x45\
-\x68\x66\xa0\x26\x6a\x6b\x06\x7a\xa2\x73\x0a\x34\x19\xd4\x34\x0d\
-\x98\x06\x1a\x6a\xa0\xbc\x5b\x81\x44\x76\x03\xde\xcc\xc8\xf0\x3e\
-\xfd\x13\x32\xf2\x26\x7b\x52\xa5\x61\x06\x36\xb6\x76\xc1\x3f\x92\
-\x81\x73\xc1\x24\x5c\x15\x33\x70\xe3\x55\x1e\xae\x0f\xe5\xa0\xf3\
-\xd9\x57\xb8\x30\x98\x84\xb7\x9f\x57\xb5\x75\x0d\x31\xb0\xa8\x6c\
-\x41\x47\x28\x09\x77\x87\x65\xe8\x27\x15\x18\xa8\x89\xbe\xf1\x32\
-\x74\x3e\x9f\x03\x4f\xf4\x1b\x3c\xd0\x1b\xa8\xc7\x20\xc2\x72\xbb\
-\x06\xa6\xa1\xf7\x5d\xf1\x1f\xe1\xda\xb8\x22\x2e\xc2\xf9\x60\xa2\
-\xac\x19\xa8\xd7\x28\x3e\xe9\x27\xd9\xdb\xd1\x15\x95\x8b\x8c\xcc\
-\xab\x10\x8c\xff\x15\x0d\xcf\x54\xe0\xe5\x97\xea\x7f\xac\x4e\xfb\
-\xa3\x4f\xd4\xc0\x58\x0b\xfb\x22\x18\xc3\xe9\x95\xf6\x3a\x7c\x71\
-\x99\x97\x1d\xc5\x91\xb4\x52\x35\x81\xe2\xc5\x32\xc0\x2f\x1a\x83\
-\x1f\xab\x6b\xba\x47\xd7\xc1\x21\x90\x17\x2c\x85\x31\x5a\xdd\x13\
-\x2d\x17\x9f\xce\xaf\xf1\xb7\x45\x51\x14\x47\x16\xd6\x54\x4d\x9c\
-\x5e\x0a\x78\x3d\xab\x6a\xcf\x31\xfa\xc9\x6f\xb0\x09\x24\xc7\x52\
-\x18\xe3\x88\x5b\x72\x75\x0d\x2d\xed\xf0\xe4\xdc\x04\x8a\x23\x15\
-\xfa\x33\xac\x13\xe7\xe1\xf0\x11\x99\xa5\x30\x46\xab\x67\xc2\x79\
-\x59\xfc\xbe\xa9\x4f\xce\xcb\x8e\xe2\x08\x3f\x0e\xfd\x1a\x87\x3f\
-\x9e\x67\x29\x8c\x81\xdd\xec\x0a\xa5\xe4\x5a\x71\x2c\x3b\xbe\x39\
-\x3f\x0e\xbd\x09\xbc\x92\xf4\x08\x52\x2c\x85\x71\xec\x42\x2c\x8b\
-\x49\x31\x39\x76\x3b\x36\x1c\x3f\x73\xde\x13\x0b\xeb\x2a\x3c\x66\
-\x06\xae\x45\x72\xa5\x13\xde\xa9\x5b\x6c\xbb\x71\xac\xbd\x53\x67\
-\x3b\x9e\xa4\x0b\x98\x1c\x23\xc4\xba\x9d\x07\x9a\xe0\xe2\xbe\xb1\
-\x12\xd8\x05\xb2\x64\xbd\x47\xf6\xb1\xed\xf5\x81\x96\x54\xbc\x14\
-\xce\x14\xff\x37\x05\x79\xf8\x3f\x94\xc0\xd9\x97\x50\xda\x7a\xa4\
-\x43\x6c\x5b\xfd\x38\x25\x8a\x7b\x6c\x42\x2c\xd0\x1e\x98\x56\xba\
-\x47\x0b\xda\x55\xe3\xc2\x78\x3c\x5d\x91\xdc\xb6\xcd\x1b\xcb\x1f\
-\xf3\x8c\x1f\x66\x5b\x1a\xc3\x51\xcf\xe4\x01\xbb\x8f\x84\x69\x45\
-\x7e\xd0\x4e\x5f\xa1\x43\x6a\x19\x1b\xce\x2a\x4c\xde\xc4\xa1\xc5\
-\x96\x51\x2c\x96\x3f\xad\x6b\xdf\xf3\x0c\xcd\xa4\x7d\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x5b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\xf0\x49\x44\x41\x54\x58\x47\xed\x56\x5b\x4f\
-\x13\x41\x14\xe6\x1f\xe8\xab\xfa\x1b\x4c\xfc\x07\xbe\x40\x88\x31\
-\xb6\x31\x22\xc4\x44\x12\x13\x94\xe8\x83\xe9\x93\x28\xc6\x44\xa3\
-\x24\x20\x08\xad\x1b\x2c\x97\x78\x69\xf0\x5a\x6a\x23\x51\xb1\x5c\
-\x54\x30\x81\x9a\x74\xa7\xa9\x50\x8a\x05\x92\x9a\xb6\x5c\x5b\x6e\
-\x8a\xb1\x82\xd8\xe3\x9c\x75\x77\x3b\xd0\x5d\xc1\x76\xfa\xa4\x27\
-\xf9\xd2\xed\xec\xcc\x7c\xdf\x39\x73\xe6\xec\xc9\xfb\x6f\xac\x15\
-\xd4\x0e\xec\x33\x5a\xbc\xad\x87\x2d\xc4\xc9\x0b\x87\xea\x49\xc3\
-\xc1\x2a\xf7\x1e\x99\x42\xdf\x90\xfc\x88\xe0\x8b\x5f\xed\x59\x82\
-\x9a\xb7\x5f\xb8\xe1\xd2\xcb\x58\xd2\xd0\x40\x26\xf7\x9b\xfb\x76\
-\xca\x54\xda\x66\xa8\x27\x2d\xd7\x7a\x96\xa1\x99\xfc\xe4\x0e\x53\
-\x7b\x24\x51\x58\xe3\x2e\x96\xa9\xb4\xcd\x68\xf6\xda\x6b\xfb\x57\
-\xd4\x45\x56\x71\x1d\x2e\xbb\x16\xe0\x7c\xc7\x6c\xd6\x28\xb3\x4d\
-\x40\x41\xf5\xfb\x87\x28\x42\x37\x12\xac\x00\xab\x67\x1d\x4e\xdc\
-\x0e\x40\x5d\x57\x18\xda\xdc\xb3\xdc\xd0\xf8\x3a\x9a\x28\xba\x49\
-\x26\x0b\xab\xc4\x5d\x32\x6d\xca\x58\x01\x57\xba\x16\xa0\xce\x15\
-\x86\x4f\xcb\x49\xee\x68\x27\xb1\x64\x91\x20\xd6\xc9\xb4\x29\x63\
-\x05\x54\x74\xcc\x80\x6d\x70\x46\x73\x83\x6c\x31\x18\xfa\x0a\x25\
-\x82\xd7\x2e\xd3\xa6\x8c\x97\x80\xd0\x52\x12\x7a\x83\x9f\xc1\x41\
-\xe2\xe0\x09\x7f\x4b\x7b\x9f\x53\x01\xc3\x33\xab\x60\xba\x3f\x0a\
-\x55\xcf\x43\xd0\xfa\x6e\x0a\x4c\x0f\x46\xe9\xb9\x47\x36\xcc\xc9\
-\x99\x80\xa1\xe9\x55\x28\xbf\x33\x0c\x3d\x1f\x97\xd5\xb1\x10\x45\
-\xa5\x63\x7c\xc3\x58\x4e\x04\xf8\xa9\xe7\x9b\xc9\x15\x74\xfa\x17\
-\xc1\xdc\x9d\x8a\x42\x4e\x04\x9c\x7b\x1c\x84\x57\x23\x4b\x9a\xef\
-\x9c\xde\x38\x34\xf5\x4d\xaa\xff\xb9\x0b\x40\xef\xf1\xac\xf1\x39\
-\x10\x5b\x83\x47\x9e\x39\xf5\x5d\x70\x7e\x1d\x4e\xdf\xf3\x83\x18\
-\x4d\xa8\x63\xdc\x05\x10\xba\xf9\x05\xfb\x98\x44\x7e\xc6\x36\x02\
-\x2f\x86\x17\xa5\x71\x24\x3f\xdb\x16\x80\xa7\x34\x02\xec\x7c\x6e\
-\x02\xd0\x73\xc5\xb3\x93\xf4\xfc\x4f\x51\xa8\xe4\xf1\x1f\x9a\xe4\
-\x88\xac\x05\xe0\x55\xab\x78\x12\x94\xc2\x5e\xd9\x3e\x26\x91\x97\
-\x36\xfb\xa0\xb4\xc9\x07\x96\xde\x08\x58\xdf\x44\xa5\x84\x7c\xf6\
-\x61\x5e\x73\x7d\x56\x02\x94\xab\xd6\xe9\xff\x9d\x70\x18\x76\xf4\
-\x1c\xc9\x87\xa6\xbf\x4b\x11\x40\xe2\x91\xb9\xb5\xb4\xb5\x0a\x32\
-\x16\x80\x9e\xb3\x57\x8d\x3d\x73\xf4\x5c\x09\xff\x56\xc8\x48\x00\
-\x96\x57\xac\x70\xec\x3d\xc7\x6c\x57\x48\x31\xec\x7a\x21\xdf\x8c\
-\x8c\x04\x60\x6d\xc7\xf2\xca\x6e\xa4\x00\x13\xae\xfc\xae\x1f\xfc\
-\xb3\xfa\x61\x67\x91\x91\x00\xbb\x18\x93\x6a\x3b\xbb\x11\x42\xb9\
-\x6a\xdb\xf5\x1e\x91\x91\x00\xfc\xaa\x61\xd6\x63\x6d\x57\xc6\xf4\
-\xee\xf9\x56\xd0\x15\x60\x68\x10\x6f\x60\x03\xa9\x97\x84\xb7\xe8\
-\x39\x5f\xa4\x1f\x16\x2c\xb9\x58\x5e\xb1\xc2\xe1\x2f\x3b\x67\x3b\
-\xd0\x15\x90\x7f\x7d\x60\xb7\x91\x76\xaf\xd8\x40\x96\xd9\xc6\xd3\
-\x04\x20\x30\x09\xcd\xdd\x61\x5a\xdb\xa3\xe0\x89\xa4\xca\xeb\xdf\
-\x40\x57\x00\x5a\x7e\x0d\xd9\x81\x8d\x23\x36\x90\x5a\x02\x78\xe0\
-\x8f\x02\x14\x43\x11\xb4\x91\x48\x68\x6d\x90\x2d\x5c\xf4\x08\x4b\
-\x04\xd2\x24\x53\x69\x1b\xb6\xce\x47\x05\x12\x75\xd0\x06\xb2\x7f\
-\x62\x05\x78\x01\xf3\xe7\xb8\xd5\x17\x3f\x50\xed\xde\x2b\x53\xe9\
-\x1b\xb6\xce\xd8\xbd\x1e\x6b\x24\x4e\x5e\x28\x16\x48\xcb\xb6\xc8\
-\xff\x21\xcb\xcb\xfb\x05\x1c\xea\x02\x49\x7e\xd7\xd3\x66\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\xbe\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x04\x53\x49\x44\x41\x54\x58\x47\xbd\x57\x5b\x88\
-\x55\x55\x18\x3e\x25\x19\x09\xd1\x85\x2e\x04\x25\x41\x41\x94\x08\
-\x5d\x28\xeb\x25\x71\x98\xb3\xf7\xae\xc4\x07\x71\x1e\x2a\xc2\x27\
-\xa1\x08\x33\xec\x82\x08\x71\x40\x9b\xb3\xd6\x99\x71\x50\x83\x6e\
-\x26\x05\x96\x58\x62\xa5\x50\xd1\xc5\x4b\xe4\x39\x6b\xed\x19\x0f\
-\xc6\x58\x50\x52\x3e\x19\x95\xbd\xa4\x60\x89\x60\x8d\xdf\xf7\xef\
-\x7f\x6f\xf7\x39\xd3\x9c\xb3\x9d\x19\xfb\x60\x31\x67\x7f\x6b\xed\
-\xff\xfe\xff\x7b\x4d\xe9\x42\xa3\xa7\xdf\x5f\xff\x90\x71\x73\x83\
-\x21\x77\xb5\x52\xff\x03\xc6\xc6\x2e\x0a\xab\x8d\x47\x43\xe3\x0e\
-\x84\xd6\x8f\x71\x05\xc6\x9f\xc1\xf3\xde\xa0\x16\x2f\xd0\x53\x17\
-\x06\x7d\xdb\xb7\xcf\x08\xac\x7b\x57\x15\xff\x10\x18\xb7\x06\x6b\
-\x79\x60\xfd\x00\xf8\x5f\x61\xc4\xbf\xa1\x75\x2f\xea\xf1\x29\x00\
-\x5e\xc2\xab\x5a\x60\xe3\xe7\x95\x11\x40\xf8\x3a\xf5\x78\xf3\x3d\
-\x6f\x36\x2f\x51\x5a\xd0\x6b\x9b\x57\x80\xff\x9a\x46\x4c\x39\x12\
-\xf0\x68\x95\x28\xb2\x6e\x83\x52\x25\x08\x7f\x2a\x51\xee\x76\x55\
-\x2a\x63\x17\x2b\xdd\x82\xc4\x08\xf7\x1b\xce\xee\x56\xea\xfc\x11\
-\xd4\xdc\xe3\x1a\xca\x3d\x7d\x95\xef\x67\x92\x2b\x9b\xb8\x07\xc6\
-\x9c\x06\xd7\x5c\x58\x69\xce\x92\x83\x13\x00\xef\x0e\xc2\x80\x33\
-\x8f\x98\xfd\x57\x29\x55\x1c\xa9\x22\x08\x38\x44\x6f\xc8\xf5\x5a\
-\x7f\x3b\x14\x1f\x87\x67\x47\x23\x1b\xdf\x28\x07\x3b\x20\x34\x7e\
-\x05\x23\x15\xf5\xc7\x77\x28\x55\x0c\x61\xad\x7e\x1b\x15\x41\xc0\
-\xb1\x54\x51\xd4\xff\xcd\xb5\x10\xf6\x13\x8c\xfa\xab\x3c\x50\xbf\
-\x53\x0e\x76\x01\x0c\x1d\x62\x04\x17\xd5\xea\x97\x2b\xd5\x1d\x2d\
-\x8a\xaa\x7e\x1e\x39\x86\x1f\x5c\x9d\xe1\x0c\x6b\x7e\x91\x1c\x54\
-\x70\x0f\xfc\xe7\x50\xb4\x49\x29\xc1\x92\x21\x77\x19\xea\xe7\x17\
-\x38\xf1\xad\x52\xdd\xc1\x9c\xc2\xf3\xb8\x45\x11\x7b\xdd\xf8\xf7\
-\x18\x4a\xec\x8d\x6b\x2b\x28\x7e\x9b\x7b\x30\xf8\x59\xa5\x04\x50\
-\xfe\x3a\xf9\xc8\xb8\x3e\xa5\x3a\x43\xfa\x1a\x55\x2d\xc2\x50\xe5\
-\x4a\x53\xc1\x6a\xe5\xde\x50\x2a\x03\xb8\xe7\x92\x3d\xb7\x45\x29\
-\x41\x58\x75\x4f\x92\x87\xc1\x3b\xe8\x80\xd2\x9d\xc1\x8a\x4d\x5e\
-\xf2\xaf\x28\x05\x41\x32\xe5\x5a\xba\x20\x45\x54\xf5\x0f\x33\x52\
-\x50\xee\xf3\x7b\x59\xf1\x5a\x7f\xb0\x5b\x97\x64\xa0\xc7\xea\xc9\
-\x2e\x46\x82\x1c\xf3\xcf\x3a\xc0\x3a\x9c\x76\x41\x8a\xd0\x0e\xcf\
-\x61\x91\xe2\xfc\xd1\xf2\x60\xe3\x3a\xa5\x4b\x41\xd5\xdd\x0a\xc5\
-\x7f\x60\xef\xf7\x22\x5d\x22\x60\xae\xe9\x09\x5e\x8a\x53\x8b\x83\
-\xb5\x23\x37\x51\x90\x2c\x08\x95\x83\x8a\x85\xeb\x9a\xd7\xc0\xd8\
-\x71\xdd\x40\x23\xc1\x7f\x47\xef\xd3\xe2\xed\x8a\xa8\xda\xb8\x97\
-\x82\xa0\xfc\x08\xab\x9f\x9c\x8e\xd1\x43\x22\xc8\x34\x1e\x94\x83\
-\x8a\xa4\x1b\xdc\x9e\x24\x2d\x7e\xb1\xd2\x69\xfd\x7c\xc2\x28\x86\
-\xb5\xf8\x09\xa5\x3b\x83\x21\x62\x08\x19\x4a\x7e\x46\xc9\xe9\x07\
-\xe6\x53\x49\x07\xa6\xa0\x1c\xcc\x01\x8a\x5f\x13\x25\xd6\xbf\xa4\
-\x94\xe0\x5c\xfd\x38\xab\x54\x67\xb4\x7a\x19\xf7\x28\xcd\xc1\xf1\
-\xaa\x08\x32\xce\x28\x95\x21\x34\xf1\xd3\x62\x98\x71\xdb\xf2\x95\
-\x5d\xb6\x6e\xa9\xf2\x59\xfd\x74\x44\x3e\x8c\x79\x2f\xcf\x15\xa2\
-\xff\xa0\xbd\x75\xa4\xb2\x59\xf1\xd6\x8f\xe4\x2b\x3b\xac\xd6\x1f\
-\xa0\x13\x74\xa6\xbd\x50\x27\x04\x14\xa7\x83\xa3\xa2\x14\x0a\xd1\
-\xdd\x8d\xe7\x7f\x60\x58\x56\x88\x29\x58\x84\x18\x44\x7f\x32\x5d\
-\xf9\xca\xce\x17\x6a\x34\x50\xbf\x45\xe9\xce\x80\x80\xfb\x55\xf9\
-\xce\xbc\x97\x78\x7e\x07\xfc\xa9\xf6\xd6\xd1\x54\xfd\x88\xfd\x6c\
-\x2c\x13\x34\x12\x06\x8d\x82\x3f\x1d\xd5\xdc\x7c\xa5\xbb\x03\x9e\
-\x7c\x0c\x81\x7f\x87\x2f\x1f\xb8\x41\x29\x01\x04\xed\xc3\x3a\xac\
-\x8f\x02\xe6\x13\x11\xf9\x42\x52\x65\xdc\x63\x4a\x27\x17\x14\xeb\
-\x3f\x4a\x1c\xf1\xcb\x94\xed\x8e\x24\xf7\xfe\x14\x84\xb5\x8c\x4d\
-\x02\xca\x37\x30\xc7\x91\x69\xdc\xc5\x67\x5e\x32\xa0\x78\x93\x2a\
-\xe9\x97\x43\x0a\x9c\x5d\x2b\xbc\x71\x1b\x95\x2a\x86\xe4\x13\x2b\
-\x2d\xb4\x52\xa9\x0c\xbd\x76\xff\x6c\x08\x3e\x01\xa5\x27\xe1\xf5\
-\xfb\xac\x05\x55\xf2\x61\x3e\x55\xd9\x68\x36\xee\xcb\x42\x15\x9f\
-\x47\x72\x99\x60\x8b\xf9\x15\x4a\xb5\x80\xfb\x30\x62\x27\x94\x1f\
-\xc7\x3a\x02\x25\x2f\xe4\xaf\x5b\xd8\xbb\x0f\xeb\x3f\x47\x73\x21\
-\xcc\x5f\xbf\xef\x4a\xb5\x7e\x50\xa9\xc2\xc8\x0f\xad\xf6\xd1\x7c\
-\x5e\x40\x3e\x47\x20\x68\x54\x1f\x0b\x81\x15\xcf\x94\xb0\x46\x60\
-\x7c\xaf\xd2\x93\x43\x3a\xcd\xb0\xb2\x39\xde\x11\xc8\x3f\x52\xb6\
-\x55\xeb\x61\xb9\xb2\x93\x47\xb4\xf1\xb3\x4b\xe1\xc9\xcf\x49\x9e\
-\x87\xe7\x28\x3d\x21\xd8\x01\x89\xf2\xf1\x97\x91\x49\x83\xad\x86\
-\x50\x9e\xe4\x74\x2b\xdb\x78\x89\xd2\x2d\x60\xbd\x40\xf9\x5b\xa2\
-\xdc\xfa\xaf\xda\x2f\x23\x53\x86\x18\x81\x6f\xba\x86\x76\x94\x85\
-\x89\xdf\xcf\xe0\xef\x6a\x3c\x6f\xa1\x71\xf8\x8d\x01\xe4\x37\x33\
-\x6a\xfa\xda\xf4\x42\x06\x13\x6b\xc2\xf8\x61\x2a\xa3\x31\x89\xc7\
-\xee\x04\x8c\xd8\x56\xf8\x52\x31\x1d\x60\x5f\xcb\x35\xcb\xf8\x9b\
-\xdb\xff\xcf\x9b\x1e\x94\x4a\x67\x01\x2e\x6a\x1a\xda\xaa\x8c\x8d\
-\x37\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\x47\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x01\xdc\x49\x44\x41\x54\x58\x47\xed\x97\xdf\x2b\
-\x43\x61\x18\xc7\x57\xfe\x1b\xff\xc7\x36\xae\xb8\xe0\x52\x71\x81\
-\x89\x15\xa1\xa4\xed\xc2\xc5\x76\x70\x41\xb8\x62\xd1\x18\xc5\x4c\
-\xca\xaf\x16\x22\x69\x3b\x27\x23\x35\x34\x9b\xed\x8c\x25\xe6\x57\
-\xb9\x98\xe5\x86\xc7\x79\x4e\xe7\xd5\xb4\x73\x76\xec\x75\x36\xd4\
-\xbe\xf5\xb9\x78\xeb\x7d\x9e\xef\xa7\x53\xe7\xd4\xd1\xfd\x89\x54\
-\xd8\xb8\x72\x03\xc3\x35\xc9\x62\xe7\x5c\x7a\x3b\xbb\x6c\x60\x58\
-\xbf\x70\xe6\x54\xe9\xe7\xf6\x70\x46\x84\x61\x5b\x6a\xdd\xee\x32\
-\xa9\x46\x39\x78\xd1\xba\x74\x01\x33\xfe\x64\x16\xc6\x7e\x16\xaa\
-\x87\x03\x60\xf3\xde\xc0\xc0\x66\xf2\xdb\x34\x38\x4e\xa1\xd7\x1d\
-\x7a\xad\x19\x0e\xac\xaa\x4a\xa0\x80\xd3\x77\x0b\xf1\xe7\xf7\x2c\
-\x50\xa0\xd5\x15\x81\x8d\xe8\x7b\x5e\xf4\x78\x78\xf0\xf1\x29\x18\
-\xdb\x4e\xa4\x54\x25\xd4\x04\xcc\xb3\x61\xd9\x92\x4c\xba\x17\x79\
-\xf1\x2e\x39\x13\x01\xdc\xa1\x2a\x51\x68\x01\x24\xa7\x44\x31\x04\
-\x10\x45\x89\x62\x09\x20\xb2\x12\x5a\x08\xf4\xad\x5d\x43\xdd\x78\
-\xf0\xf3\xac\x24\x80\xd8\x56\x62\x69\x23\xc3\xd6\x4b\xf5\xb9\x05\
-\x2a\x07\x39\x30\x4d\x87\xbe\x94\x7d\x87\xae\x85\x28\xf8\xe2\x2f\
-\xb2\x3b\xb1\x0b\x3b\xa5\xfa\xdc\x02\x16\x4f\x04\xaa\x86\x02\xd0\
-\xec\x0c\x09\xaf\xe3\xb9\x2a\xe6\xb9\x30\x74\x0a\xe5\x8d\x93\x27\
-\x10\x7d\x7a\x93\xdd\x99\x97\x00\x2f\xb0\x1f\x4b\x81\xfb\xf0\x01\
-\xe6\x0f\xee\x55\xf1\x1c\x3d\x8a\xf7\x95\xca\x91\xbc\x04\x0a\x41\
-\x49\x20\xa7\xc0\xc1\x55\x1a\x4c\x53\xc1\x82\x80\xbb\x55\x05\xf0\
-\xdd\x1d\xf1\xf2\xa0\x75\x70\x27\xf9\x2e\x94\x04\xf2\x12\xb0\x2c\
-\x86\xa0\xcd\x19\xa4\xc2\x2a\xcc\x92\xfc\xdf\x27\xa0\x55\xa8\x05\
-\x26\x76\x2e\x85\x73\x8c\x0a\x87\x30\x4b\x42\x2d\x70\xf5\x98\x86\
-\xc8\x6d\x8a\x8a\x84\x30\x4b\x42\x2d\xa0\x55\xa8\x05\x76\xce\x1e\
-\x60\xfd\xf8\x8e\x0a\x9c\x25\xa1\x16\xd8\xfd\x81\x00\xce\x92\x50\
-\x0b\x68\x95\xbf\x2f\x40\x7e\xcd\x46\xb7\x12\xd0\xee\x3a\x95\x7d\
-\xa4\x3f\x01\x77\xe2\x6e\xec\xc0\xae\x2f\x02\x99\x3f\xa7\x7a\xc6\
-\xdf\xf1\xf9\x73\xa9\x31\xe2\x6e\xa9\x07\x3b\xa5\xfa\xdf\x8c\x4e\
-\xf7\x01\x8f\x3e\x96\x0e\xc7\xa9\x40\xba\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xa1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x02\x36\x49\x44\x41\x54\x58\x47\xed\x95\xdf\x4b\
-\x5a\x61\x18\xc7\x85\x5d\xad\x7f\x61\x7f\xc2\xd8\x5f\xd0\xae\x82\
-\xb6\x62\x4e\x0d\x1c\xc1\xd8\x6c\xc4\x60\x17\xed\x62\xad\xd8\x0f\
-\xda\xd8\x45\x81\x4e\xf1\x28\xd1\xac\x68\xd0\x45\x45\xe3\x05\x23\
-\x90\x60\x34\x18\x6c\xac\x93\xe5\x1b\x4e\x57\x87\xb6\x36\xb4\xed\
-\x68\x74\xb2\x32\x30\x9d\x2b\x7d\x3a\x8f\xbd\x3a\x15\xbd\x3a\xea\
-\xd5\xf9\xc0\x73\x71\x3c\xe7\xfd\x7e\xbf\x3c\xef\xfb\x3e\x6a\x54\
-\x54\x54\x54\x54\x6e\x0c\xf1\x97\x6e\x8f\x50\x72\xc7\x45\xdd\x8d\
-\x2c\xf4\x44\x6f\x4d\xbb\x99\xbf\xf2\x82\x08\xf1\x1f\x3b\x09\x68\
-\x64\xa1\x27\x7a\xe7\x02\x58\x3d\x5b\x31\x68\x30\xe8\xa9\x06\x50\
-\x03\xd4\x35\x40\xfa\x24\x03\xfe\xf0\x11\x7c\xf8\x26\xc1\xe7\xcd\
-\x7d\x08\x49\xc7\xec\xcd\x39\x75\x0b\x70\x94\x3c\x01\xe7\xfb\x10\
-\x74\x8d\x07\xe1\x31\x09\xc1\xd3\xf9\x28\x3c\x99\x13\xa1\x67\xfa\
-\x3b\xdc\x7f\x1b\x84\x8f\xeb\x7b\xb9\xef\xea\x12\x60\x3b\x96\x84\
-\xee\x89\x20\xbc\x5c\x90\x60\x94\x66\x60\xac\xac\x86\x97\xd3\xd0\
-\x33\xb3\x05\x16\xcf\x2f\x78\x5d\x1c\xa0\x16\x83\x08\xdb\x6d\x1a\
-\x0b\x80\xed\x53\xa2\xc4\xd4\x2d\x64\x60\x3a\x58\x1a\xa4\x97\x6c\
-\xc3\xbd\x71\x7f\x3a\x17\xa0\x56\xa3\xb8\xc3\x49\xc3\x03\x9e\xdd\
-\x6c\xb1\x11\x16\xb2\x21\x65\x4b\x7e\xc3\xee\x74\xbe\xf9\x2a\x07\
-\x58\x6a\x61\xff\x08\xca\x30\xda\xf9\x8b\x06\xc7\x9a\x54\xa9\xed\
-\x95\x02\x60\x0d\x2e\x1e\x82\x81\xa3\xef\x98\x84\x32\x5a\xcd\xde\
-\x96\x07\x53\x3f\x0f\xca\x4d\xb0\xaa\x05\x18\xa5\xa7\xa0\xe3\xa8\
-\xc8\x24\x94\x71\xcd\xcc\x9b\xfa\xe7\x22\xff\x50\x98\x6c\x9c\x9b\
-\x56\x63\x3f\x09\x85\x10\x06\x07\x95\x98\x84\x32\x5a\x2d\x5e\xe3\
-\x23\xf2\xfb\x18\x45\xa7\x02\x19\x10\xf6\xb2\x85\x42\x0e\x52\x50\
-\x78\xf6\x45\xfe\x77\xc3\xe0\x5c\x8b\x32\x09\x65\xe0\x69\x36\x4d\
-\x08\x52\x5e\xb8\xb8\x90\x4a\x5b\x80\x57\x52\xde\x02\x81\x49\x28\
-\x47\xcf\xf9\xc2\x28\x5a\x6e\x54\x2d\x40\x9f\x5b\x4c\xdd\xb4\xaf\
-\x3e\x67\xcb\x95\xa3\xb5\xad\xde\xed\x9e\xdc\x8c\x97\x1b\xe1\x04\
-\xf6\x8a\xa5\x01\x1c\x4b\x29\xd0\x73\x34\xa2\x7d\x45\x9b\xd8\xf2\
-\xda\x20\xb7\x94\x3c\x9c\x0d\x25\x2a\x5d\xc7\x7c\x39\xbf\xa4\xc0\
-\x38\xec\x8f\xb5\x5b\xf9\x66\xb6\xac\x76\xdc\x22\xe4\x82\x8e\xf3\
-\xb9\x3a\x5d\x81\xd8\xe0\x62\x3c\x77\xd5\xf2\xc6\xb8\x3d\xfd\x6e\
-\xf1\xaf\xce\xee\x8b\xb6\x59\x96\xaf\xb2\x25\xf5\xe1\xba\x65\xe5\
-\xb2\xde\x41\x67\xe5\x8e\xfc\x91\x4f\xfa\xae\x3c\xa4\x76\xf0\xc0\
-\x69\xb9\x95\x67\x38\xb4\xd8\x67\x32\x1a\xcd\x19\xb5\x7e\xe0\x09\
-\xc2\x59\x15\xca\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-"
-
-qt_resource_name = b"\
-\x00\x04\
-\x00\x06\xfa\x5e\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x15\
-\x0e\xf7\xdc\x87\
-\x00\x69\
-\x00\x74\x00\x65\x00\x6d\x00\x5f\x00\x75\x00\x6e\x00\x72\x00\x65\x00\x66\x00\x65\x00\x72\x00\x65\x00\x6e\x00\x63\x00\x65\x00\x64\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x04\xca\x57\xa7\
-\x00\x6e\
-\x00\x65\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x03\xb3\xeb\x87\
-\x00\x73\
-\x00\x75\x00\x62\x00\x5f\x00\x67\x00\x72\x00\x6f\x00\x75\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x03\x47\xeb\xc7\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x5f\x00\x67\x00\x72\x00\x6f\x00\x75\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x06\xc3\x8a\x67\
-\x00\x67\
-\x00\x72\x00\x6f\x00\x75\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x04\x6f\x5a\x47\
-\x00\x69\
-\x00\x6d\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x5f\x00\x69\x00\x74\x00\x65\x00\x6d\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0d\xe1\x1a\xe7\
-\x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x5f\x00\x69\x00\x74\x00\x65\x00\x6d\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0a\xaf\xd3\x87\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x5f\x00\x74\x00\x61\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\xc1\x59\x87\
-\x00\x6f\
-\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x0a\x7a\x57\xa7\
-\x00\x74\
-\x00\x61\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\xe8\x1b\x47\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x5f\x00\x69\x00\x74\x00\x65\x00\x6d\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x00\xe2\x71\x27\
-\x00\x69\
-\x00\x74\x00\x65\x00\x6d\x00\x5f\x00\x64\x00\x75\x00\x70\x00\x6c\x00\x69\x00\x63\x00\x61\x00\x74\x00\x65\x00\x64\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x0f\
-\x00\xfd\x58\x67\
-\x00\x69\
-\x00\x74\x00\x65\x00\x6d\x00\x5f\x00\x73\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\xc8\x58\x67\
-\x00\x73\
-\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0a\xc0\x59\x47\
-\x00\x69\
-\x00\x74\x00\x65\x00\x6d\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x03\
-\x00\x00\x01\x64\x00\x00\x00\x00\x00\x01\x00\x00\x24\xf4\
-\x00\x00\x01\x90\x00\x00\x00\x00\x00\x01\x00\x00\x28\x53\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x7a\
-\x00\x00\x00\x64\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x6f\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x12\x85\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x07\x35\
-\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x86\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x94\
-\x00\x00\x01\x46\x00\x00\x00\x00\x00\x01\x00\x00\x22\x26\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x15\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xfc\
-\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x17\x34\
-\x00\x00\x01\xca\x00\x00\x00\x00\x00\x01\x00\x00\x2f\x60\
-\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x14\x4b\
-\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x64\x00\x00\x00\x00\x00\x01\x00\x00\x24\xf4\
-\x00\x00\x01\x69\xba\xbb\x5f\x84\
-\x00\x00\x01\x90\x00\x00\x00\x00\x00\x01\x00\x00\x28\x53\
-\x00\x00\x01\x69\x72\xe4\xc5\xa6\
-\x00\x00\x00\x84\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x7a\
-\x00\x00\x01\x69\x3a\xb3\xf2\x63\
-\x00\x00\x00\x64\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x6f\
-\x00\x00\x01\x69\x3a\xb3\xc7\xc1\
-\x00\x00\x00\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x12\x85\
-\x00\x00\x01\x69\xba\xc5\xd9\xae\
-\x00\x00\x00\x50\x00\x00\x00\x00\x00\x01\x00\x00\x07\x35\
-\x00\x00\x01\x69\x3a\xae\xdd\x6c\
-\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x86\
-\x00\x00\x01\x69\x3a\xaf\x36\x61\
-\x00\x00\x00\xa4\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x94\
-\x00\x00\x01\x69\x3a\xb3\x92\xaa\
-\x00\x00\x01\x46\x00\x00\x00\x00\x00\x01\x00\x00\x22\x26\
-\x00\x00\x01\x69\x3a\xb0\x07\xce\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x15\
-\x00\x00\x01\x69\x3a\xae\x0e\x19\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xfc\
-\x00\x00\x01\x69\x3a\xb0\x9f\xd6\
-\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x17\x34\
-\x00\x00\x01\x69\x3a\xb0\xdb\xbf\
-\x00\x00\x01\xca\x00\x00\x00\x00\x00\x01\x00\x00\x2f\x60\
-\x00\x00\x01\x69\x3a\xaf\xca\x07\
-\x00\x00\x00\xe0\x00\x00\x00\x00\x00\x01\x00\x00\x14\x4b\
-\x00\x00\x01\x69\x72\xe3\x46\xbc\
-\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x69\xba\xb7\x7d\x2a\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()